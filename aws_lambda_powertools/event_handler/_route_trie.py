@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.api_gateway import Route
+
+_PARAM_SEGMENT_PATTERN = re.compile(r"^<\w+>$")
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()<>")
+
+# Static routes (no named groups) take precedence over dynamic routes, regardless of registration order
+_STATIC_PRECEDENCE = 0
+_DYNAMIC_PRECEDENCE = 1
+
+# (precedence, registration sequence, route)
+_RouteEntry = Tuple[int, int, "Route"]
+
+
+class _TrieNode:
+    __slots__ = ("children", "param_child", "routes")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.param_child: _TrieNode | None = None
+        self.routes: list[_RouteEntry] = []
+
+
+class RouteTrie:
+    """Per-method trie of path segments used to narrow down which routes can match a request path
+
+    Each rule is split into segments: literal segments become child nodes, and segments that are exactly a
+    dynamic route parameter (`<name>`) become a single parameter node that captures any non-empty segment.
+    Rules using custom regex patterns (e.g. `.+` or `<id>.json`) can't be indexed, so they are kept aside in
+    registration order and always returned as candidates.
+
+    The trie is only an index: the compiled route regex remains the source of truth and is still used to
+    verify each candidate and extract route parameters. Candidates are returned in the same precedence order
+    used by the sequential matcher (static before dynamic, then registration order), so the first candidate
+    whose regex matches is the same route the sequential matcher would pick.
+    """
+
+    def __init__(self):
+        self._roots: dict[str, _TrieNode] = {}
+        self._unindexed: dict[str, list[_RouteEntry]] = {}
+        self._sequence = 0
+
+    def insert(self, route: Route) -> None:
+        """Index a route by its method and original rule (e.g. `/todos/<todo_id>`)"""
+        precedence = _DYNAMIC_PRECEDENCE if route.rule.groups > 0 else _STATIC_PRECEDENCE
+        entry = (precedence, self._sequence, route)
+        self._sequence += 1
+
+        segments = self._split(route.path)
+        if not all(self._is_indexable(segment) for segment in segments):
+            self._unindexed.setdefault(route.method, []).append(entry)
+            return
+
+        node = self._roots.setdefault(route.method, _TrieNode())
+        for segment in segments:
+            if _PARAM_SEGMENT_PATTERN.match(segment):
+                if node.param_child is None:
+                    node.param_child = _TrieNode()
+                node = node.param_child
+            else:
+                node = node.children.setdefault(segment, _TrieNode())
+
+        node.routes.append(entry)
+
+    def candidates(self, method: str, path: str) -> list[Route]:
+        """Return routes that may match `method` and `path`, sorted by matching precedence"""
+        entries: list[_RouteEntry] = list(self._unindexed.get(method, ()))
+
+        root = self._roots.get(method)
+        if root is not None:
+            self._collect(root, self._split(path), 0, entries)
+
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        return [route for _, _, route in entries]
+
+    def _collect(self, node: _TrieNode, segments: list[str], depth: int, entries: list[_RouteEntry]) -> None:
+        if depth == len(segments):
+            entries.extend(node.routes)
+            return
+
+        segment = segments[depth]
+
+        child = node.children.get(segment)
+        if child is not None:
+            self._collect(child, segments, depth + 1, entries)
+
+        # Dynamic route parameters never match an empty segment (e.g. /users//orders)
+        if segment and node.param_child is not None:
+            self._collect(node.param_child, segments, depth + 1, entries)
+
+    @staticmethod
+    def _split(path: str) -> list[str]:
+        # Leading and trailing slashes are dropped so that resolvers ignoring trailing slashes (REST API)
+        # still get their candidates; the route regex decides whether they're accepted or not
+        path = path.strip("/")
+        return path.split("/") if path else []
+
+    @staticmethod
+    def _is_indexable(segment: str) -> bool:
+        if _PARAM_SEGMENT_PATTERN.match(segment):
+            return True
+        return not any(char in _REGEX_SPECIAL_CHARS for char in segment)
@@ -11,12 +11,27 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from functools import partial
 from http import HTTPStatus
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Mapping, Match, Pattern, Sequence, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Literal,
+    Mapping,
+    Match,
+    Pattern,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 from typing_extensions import override
 
 from aws_lambda_powertools.event_handler import content_types
+from aws_lambda_powertools.event_handler._route_trie import RouteTrie
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError, ServiceError
 from aws_lambda_powertools.event_handler.openapi.constants import DEFAULT_API_VERSION, DEFAULT_OPENAPI_VERSION
 from aws_lambda_powertools.event_handler.openapi.exceptions import RequestValidationError, SchemaValidationError
@@ -1474,6 +1489,7 @@ class ApiGatewayResolver(BaseRouter):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        enable_compiled_routing: bool = False,
     ):
         """
         Parameters
@@ -1493,11 +1509,16 @@ class ApiGatewayResolver(BaseRouter):
             Each prefix can be a static string or a compiled regex pattern
         enable_validation: bool | None
             Enables validation of the request body against the route schema, by default False.
+        enable_compiled_routing: bool
+            Indexes routes in a per-method trie of path segments as they're registered, by default False.
+            Lookup cost no longer grows with the number of routes; rules using custom regex patterns are still
+            matched sequentially.
         """
         self._proxy_type = proxy_type
         self._dynamic_routes: list[Route] = []
         self._static_routes: list[Route] = []
         self._route_keys: list[str] = []
+        self._route_trie: RouteTrie | None = RouteTrie() if enable_compiled_routing else None
         self._exception_handlers: dict[type, Callable] = {}
         self._cors = cors
         self._cors_enabled: bool = cors is not None
@@ -1989,6 +2010,9 @@ class ApiGatewayResolver(BaseRouter):
                 else:
                     self._static_routes.append(_route)
 
+                if self._route_trie is not None:
+                    self._route_trie.insert(_route)
+
                 self._create_route_key(item, rule)
 
                 if cors_enabled:
@@ -2155,7 +2179,11 @@ class ApiGatewayResolver(BaseRouter):
         method = self.current_event.http_method.upper()
         path = self._remove_prefix(self.current_event.path)
 
-        registered_routes = self._static_routes + self._dynamic_routes
+        registered_routes: Iterable[Route]
+        if self._route_trie is not None:
+            registered_routes = self._route_trie.candidates(method, path)
+        else:
+            registered_routes = chain(self._static_routes, self._dynamic_routes)
 
         for route in registered_routes:
             if method != route.method:
@@ -2556,6 +2584,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        enable_compiled_routing: bool = False,
     ):
         """Amazon API Gateway REST and HTTP API v1 payload resolver"""
         super().__init__(
@@ -2565,6 +2594,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            enable_compiled_routing,
         )
 
     def _get_base_path(self) -> str:
@@ -2634,6 +2664,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        enable_compiled_routing: bool = False,
     ):
         """Amazon API Gateway HTTP API v2 payload resolver"""
         super().__init__(
@@ -2643,6 +2674,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            enable_compiled_routing,
         )
 
     def _get_base_path(self) -> str:
@@ -2669,9 +2701,18 @@ class ALBResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        enable_compiled_routing: bool = False,
     ):
         """Amazon Application Load Balancer (ALB) resolver"""
-        super().__init__(ProxyEventType.ALBEvent, cors, debug, serializer, strip_prefixes, enable_validation)
+        super().__init__(
+            ProxyEventType.ALBEvent,
+            cors,
+            debug,
+            serializer,
+            strip_prefixes,
+            enable_validation,
+            enable_compiled_routing,
+        )
 
     def _get_base_path(self) -> str:
         # ALB doesn't have a stage variable, so we just return an empty string
@@ -57,6 +57,7 @@ class LambdaFunctionUrlResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        enable_compiled_routing: bool = False,
     ):
         super().__init__(
             ProxyEventType.LambdaFunctionUrlEvent,
@@ -65,6 +66,7 @@ class LambdaFunctionUrlResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            enable_compiled_routing,
         )
 
     def _get_base_path(self) -> str:
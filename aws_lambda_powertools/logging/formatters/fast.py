@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Tuple, Union
+
+from aws_lambda_powertools.logging.formatter import RESERVED_LOG_ATTRS, LambdaPowertoolsFormatter
+from aws_lambda_powertools.shared import constants
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.logging.types import LogRecord
+
+_RESERVED_LOG_ATTRS = frozenset(RESERVED_LOG_ATTRS)
+
+# keys computed by the formatter on every record, overriding any value set in the log structure
+_MESSAGE_KEY = "message"
+_XRAY_TRACE_ID_KEY = "xray_trace_id"
+_EXCEPTION_KEYS = frozenset(("exception", "exception_name", "stack_trace"))
+
+# only immutable values can be serialized once, when the log structure changes
+_PRESERIALIZABLE_TYPES = (str, int, float, bool)
+
+# pre-encoded "key":value fragment, or (encoded key, render function returning the value for a record)
+# where a None value omits the key
+_TemplateItem = Union[str, Tuple[str, Callable[[logging.LogRecord], Any]]]
+# items rendered before extra keys (log structure), and after them (computed keys missing from log structure)
+_Template = Tuple[List[_TemplateItem], List[_TemplateItem]]
+
+
+class LambdaPowertoolsFastFormatter(LambdaPowertoolsFormatter):
+    """Powertools for AWS Lambda (Python) Logging formatter optimized for throughput.
+
+    The log structure (`log_record_order` and appended keys) is compiled into a template whenever it changes,
+    rather than being interpreted for every record:
+
+    - keys with immutable values are serialized once, and reserved log attributes (e.g. `%(levelname)s`)
+      are read directly from the record
+    - the formatted timestamp is cached per millisecond
+    - string messages are not speculatively JSON decoded, unless `decode_json_message` is set
+    - the JSON line is written directly from serialized fragments, without building an intermediate dict
+
+    Output is the same as `LambdaPowertoolsFormatter`. Records with exceptions, extra keys overriding
+    keys in the log structure, or formatters using a custom `json_serializer` or pretty-printing
+    (`POWERTOOLS_DEV`) are formatted by `LambdaPowertoolsFormatter` as usual.
+
+    Example
+    -------
+    ```python
+    from aws_lambda_powertools import Logger
+    from aws_lambda_powertools.logging.formatters.fast import LambdaPowertoolsFastFormatter
+
+    logger = Logger(service="payment", logger_formatter=LambdaPowertoolsFastFormatter())
+    ```
+    """
+
+    def __init__(
+        self,
+        json_serializer: Callable[[LogRecord], str] | None = None,
+        json_deserializer: Callable[[dict | str | bool | int | float], str] | None = None,
+        json_default: Callable[[Any], Any] | None = None,
+        datefmt: str | None = None,
+        use_datetime_directive: bool = False,
+        log_record_order: list[str] | None = None,
+        utc: bool = False,
+        use_rfc3339: bool = False,
+        serialize_stacktrace: bool = True,
+        decode_json_message: bool = False,
+        **kwargs,
+    ) -> None:
+        """Return a LambdaPowertoolsFastFormatter instance.
+
+        Parameters
+        ----------
+        decode_json_message : bool, optional
+            Whether to attempt decoding string messages as JSON, by default False.
+            `LambdaPowertoolsFormatter` always attempts it.
+
+        See `LambdaPowertoolsFormatter` for the remaining parameters.
+        """
+        self.decode_json_message = decode_json_message
+        self._template: _Template | None = None
+        self._timestamp_cache_key: tuple[int, float] | None = None
+        self._timestamp_cache_value = ""
+        self._xray_trace_id_env: str | None = None
+        self._xray_trace_id: str | None = None
+
+        super().__init__(
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+            json_default=json_default,
+            datefmt=datefmt,
+            use_datetime_directive=use_datetime_directive,
+            log_record_order=log_record_order,
+            utc=utc,
+            use_rfc3339=use_rfc3339,
+            serialize_stacktrace=serialize_stacktrace,
+            **kwargs,
+        )
+
+        # fragments are only equivalent to the default serializer when it's compact
+        self._encode: Callable[[Any], str] | None = None
+        if json_serializer is None and self.json_indent is None:
+            self._encode = json.JSONEncoder(
+                default=self.json_default,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode
+
+        # a timestamp with microseconds can't be cached per millisecond
+        self._cache_timestamp = not (use_datetime_directive and datefmt and "%f" in datefmt)
+
+    def format(self, record: logging.LogRecord) -> str:  # noqa: A003
+        """Format logging record as structured JSON str"""
+        if self._encode is None or record.exc_info:
+            return super().format(record)
+
+        template = self._template
+        if template is None:
+            template = self._template = self._compile_template(encode=self._encode)
+
+        encode = self._encode
+        head, tail = template
+        fragments: list[str] = []
+        self._render_items(head, record, encode, fragments)
+
+        # extra keys are appended after the log structure, as long as they don't replace keys from it
+        log_format = self.log_format
+        for key, value in record.__dict__.items():
+            if key in _RESERVED_LOG_ATTRS:
+                continue
+            if key in log_format or key in _EXCEPTION_KEYS or key == _XRAY_TRACE_ID_KEY:
+                return super().format(record)
+            if value is not None:
+                fragments.append(f"{encode(key)}:{encode(value)}")
+
+        self._render_items(tail, record, encode, fragments)
+
+        return "{" + ",".join(fragments) + "}"
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if not self._cache_timestamp:
+            return super().formatTime(record, datefmt)
+
+        cache_key = (int(record.created), record.msecs)
+        if cache_key != self._timestamp_cache_key:
+            self._timestamp_cache_value = super().formatTime(record, datefmt)
+            self._timestamp_cache_key = cache_key
+
+        return self._timestamp_cache_value
+
+    def append_keys(self, **additional_keys) -> None:
+        super().append_keys(**additional_keys)
+        self._template = None
+
+    def remove_keys(self, keys: Iterable[str]) -> None:
+        super().remove_keys(keys)
+        self._template = None
+
+    def clear_state(self) -> None:
+        super().clear_state()
+        self._template = None
+
+    @staticmethod
+    def _render_items(
+        items: list[_TemplateItem],
+        record: logging.LogRecord,
+        encode: Callable[[Any], str],
+        fragments: list[str],
+    ) -> None:
+        for item in items:
+            if isinstance(item, str):
+                fragments.append(item)
+                continue
+
+            encoded_key, render = item
+            value = render(record)
+            if value is not None:
+                fragments.append(f"{encoded_key}:{encode(value)}")
+
+    def _compile_template(self, encode: Callable[[Any], str]) -> _Template:
+        """Compile the current log structure into pre-encoded fragments and per record fields"""
+        head: list[_TemplateItem] = []
+        for key, value in self.log_format.items():
+            field = self._compile_field(key, value, encode)
+            if field is None:
+                continue
+            if isinstance(field, str):
+                head.append(f"{encode(key)}:{field}")
+            else:
+                head.append((encode(key), field))
+
+        # computed keys not present in the log structure are added after extra keys
+        tail: list[_TemplateItem] = []
+        if _MESSAGE_KEY not in self.log_format:
+            tail.append((encode(_MESSAGE_KEY), self._extract_log_message))
+        if _XRAY_TRACE_ID_KEY not in self.log_format:
+            tail.append((encode(_XRAY_TRACE_ID_KEY), self._render_xray_trace_id))
+
+        return head, tail
+
+    def _compile_field(
+        self,
+        key: str,
+        value: Any,
+        encode: Callable[[Any], str],
+    ) -> str | Callable[[logging.LogRecord], Any] | None:
+        """Return a pre-encoded value, a render function, or None when the key is always omitted"""
+        if key == _MESSAGE_KEY:
+            return self._extract_log_message
+
+        if key == _XRAY_TRACE_ID_KEY:
+            return None if value is None else self._render_xray_trace_id
+
+        # records with exceptions use the default formatter, so stack traces are never set here
+        if value is None or (key == "stack_trace" and self.serialize_stacktrace):
+            return None
+
+        if value and key in _RESERVED_LOG_ATTRS:
+            return self._compile_log_attribute(value)
+
+        if type(value) in _PRESERIALIZABLE_TYPES:
+            return encode(value)
+
+        # mutable values might change after being appended, e.g. a dict updated in place
+        return lambda record: value
+
+    def _compile_log_attribute(self, fmt: str) -> Callable[[logging.LogRecord], str]:
+        """Specialize common std logging attribute format strings, e.g. %(levelname)s"""
+        if fmt == "%(levelname)s":
+            return lambda record: record.levelname
+        if fmt == "%(asctime)s":
+            return self.formatTime
+        if fmt == "%(funcName)s:%(lineno)d":
+            return lambda record: f"{record.funcName}:{record.lineno:d}"
+
+        if "%(asctime)" in fmt:
+            return lambda record: fmt % {**record.__dict__, "asctime": self.formatTime(record)}
+
+        return lambda record: fmt % record.__dict__
+
+    def _extract_log_message(self, log_record: logging.LogRecord) -> dict[str, Any] | str | bool | Iterable:
+        if self.decode_json_message:
+            return super()._extract_log_message(log_record=log_record)
+
+        if log_record.args and not isinstance(log_record.msg, dict):
+            return log_record.getMessage()
+
+        return log_record.msg
+
+    def _render_xray_trace_id(self, record: logging.LogRecord) -> str | None:
+        # X-Ray trace header only changes between invocations, so we only parse it again when it does
+        xray_trace_id = os.getenv(constants.XRAY_TRACE_ID_ENV)
+        if xray_trace_id != self._xray_trace_id_env:
+            self._xray_trace_id_env = xray_trace_id
+            self._xray_trace_id = xray_trace_id.split(";")[0].replace("Root=", "") if xray_trace_id else None
+
+        return self._xray_trace_id
@@ -458,6 +458,10 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        # skip building extra keys when the record would be discarded anyway
+        if not self._logger.isEnabledFor(logging.INFO):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -480,6 +484,9 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -502,6 +509,9 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -524,6 +534,9 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.CRITICAL):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -546,6 +559,9 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -568,6 +584,9 @@ class Logger:
         extra: Mapping[str, object] | None = None,
         **kwargs: object,
     ) -> None:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return None
+
         extra = extra or {}
         extra = {**extra, **kwargs}
 
@@ -669,6 +688,9 @@ class Logger:
     def removeFilter(self, filter: logging._FilterType) -> None:  # noqa: A002 # filter built-in usage
         return self._logger.removeFilter(filter)
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
     @property
     def registered_handler(self) -> logging.Handler:
         """Convenience property to access the first logger handler"""
@@ -9,6 +9,7 @@ from aws_lambda_powertools.metrics.exceptions import (
     SchemaValidationError,
 )
 from aws_lambda_powertools.metrics.metrics import EphemeralMetrics, Metrics
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import MetricAggregation
 
 __all__ = [
     "single_metric",
@@ -20,4 +21,5 @@ __all__ = [
     "EphemeralMetrics",
     "MetricResolution",
     "MetricUnit",
+    "MetricAggregation",
 ]
@@ -7,7 +7,9 @@ from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import Ama
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.metrics.base import MetricResolution, MetricUnit
+    from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import MetricAggregation
     from aws_lambda_powertools.metrics.provider.cloudwatch_emf.types import CloudWatchEMFOutput
+    from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
     from aws_lambda_powertools.shared.types import AnyCallableT
 
 
@@ -56,6 +58,13 @@ class Metrics:
         Namespace for metrics
     provider: AmazonCloudWatchEMFProvider, optional
         Pre-configured AmazonCloudWatchEMFProvider provider
+    emf_writer: EMFWriter, optional
+        Buffers EMF documents and writes them in batches when metrics are flushed.
+        Ignored when a pre-configured provider is used.
+    metric_aggregation: MetricAggregation | str, optional
+        Fold values added to the same metric into distinct values and counts (`MetricAggregation.Values`),
+        or into minimum, maximum, sum and count (`MetricAggregation.StatisticSet`), by default None.
+        Ignored when a pre-configured provider is used.
 
     Raises
     ------
@@ -84,6 +93,8 @@ class Metrics:
         service: str | None = None,
         namespace: str | None = None,
         provider: AmazonCloudWatchEMFProvider | None = None,
+        emf_writer: EMFWriter | None = None,
+        metric_aggregation: MetricAggregation | str | None = None,
     ):
         self.metric_set = self._metrics
         self.metadata_set = self._metadata
@@ -100,6 +111,8 @@ class Metrics:
                 dimension_set=self.dimension_set,
                 metadata_set=self.metadata_set,
                 default_dimensions=self._default_dimensions,
+                emf_writer=emf_writer,
+                metric_aggregation=metric_aggregation,
             )
         else:
             self.provider = provider
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import MetricAggregation
+
+
+class MetricAggregate:
+    """Folds values added to a metric into a fixed size representation, serialized in place of the raw values"""
+
+    __slots__ = ()
+
+    def add(self, value: float) -> int:
+        """Fold a value into the aggregate, returning the number of values EMF will need to represent it"""
+        raise NotImplementedError()
+
+    def serialize(self) -> dict[str, Any]:
+        raise NotImplementedError()
+
+
+class ValuesAggregate(MetricAggregate):
+    """Distinct values and their counts, in the order they were first added"""
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts: dict[float, int] = {}
+
+    def add(self, value: float) -> int:
+        counts = self.counts
+        counts[value] = counts.get(value, 0) + 1
+        return len(counts)
+
+    def serialize(self) -> dict[str, Any]:
+        return {"Values": list(self.counts), "Counts": list(self.counts.values())}
+
+
+class StatisticSetAggregate(MetricAggregate):
+    """Minimum, maximum, sum, and count of all values added, using constant memory"""
+
+    __slots__ = ("minimum", "maximum", "total", "count")
+
+    def __init__(self):
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: float) -> int:
+        # plain comparisons are cheaper than min/max calls, and this runs for every value added
+        if value < self.minimum:  # noqa: PLR1730
+            self.minimum = value
+        if value > self.maximum:  # noqa: PLR1730
+            self.maximum = value
+        self.total += value
+        self.count += 1
+        return 1
+
+    def serialize(self) -> dict[str, Any]:
+        return {"Min": self.minimum, "Max": self.maximum, "Sum": self.total, "Count": self.count}
+
+
+def build_metric_aggregate(aggregation: MetricAggregation, values: Iterable[float] = ()) -> MetricAggregate:
+    """Create an empty aggregate for the given aggregation, folding any values added before aggregating"""
+    aggregate: MetricAggregate = (
+        ValuesAggregate() if aggregation is MetricAggregation.Values else StatisticSetAggregate()
+    )
+    for value in values:
+        aggregate.add(value)
+
+    return aggregate
@@ -5,6 +5,7 @@ import json
 import logging
 import numbers
 import os
+import threading
 import warnings
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any
@@ -18,19 +19,27 @@ from aws_lambda_powertools.metrics.functions import (
     validate_emf_timestamp,
 )
 from aws_lambda_powertools.metrics.provider.base import BaseProvider
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.aggregation import MetricAggregate, build_metric_aggregate
 from aws_lambda_powertools.metrics.provider.cloudwatch_emf.constants import MAX_DIMENSIONS, MAX_METRICS
-from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import MetricResolution, MetricUnit
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.metric_properties import (
+    MetricAggregation,
+    MetricResolution,
+    MetricUnit,
+)
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.shared.functions import resolve_env_var_choice
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.metrics.provider.cloudwatch_emf.types import CloudWatchEMFOutput
+    from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
     from aws_lambda_powertools.metrics.types import MetricNameUnitResolution
     from aws_lambda_powertools.shared.types import AnyCallableT
     from aws_lambda_powertools.utilities.typing import LambdaContext
 
 logger = logging.getLogger(__name__)
 
+_METRIC_SET_LOCK = threading.Lock()
+
 
 class AmazonCloudWatchEMFProvider(BaseProvider):
     """
@@ -60,6 +69,17 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         When metric value isn't a number
     SchemaValidationError
         When metric object fails EMF schema validation
+
+    Parameters
+    ----------
+    emf_writer : EMFWriter, optional
+        Buffers EMF documents and writes them in batches when metrics are flushed, instead of
+        printing each document as soon as it's serialized
+    metric_aggregation : MetricAggregation | str, optional
+        Fold values added to the same metric instead of keeping each of them, by default None.
+
+        `MetricAggregation.Values` keeps up to 100 distinct values and how many times each was added,
+        while `MetricAggregation.StatisticSet` only keeps their minimum, maximum, sum and count.
     """
 
     def __init__(
@@ -70,6 +90,8 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         metadata_set: dict[str, Any] | None = None,
         service: str | None = None,
         default_dimensions: dict[str, Any] | None = None,
+        emf_writer: EMFWriter | None = None,
+        metric_aggregation: MetricAggregation | str | None = None,
     ):
         self.metric_set = metric_set if metric_set is not None else {}
         self.dimension_set = dimension_set if dimension_set is not None else {}
@@ -78,6 +100,8 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         self.service = resolve_env_var_choice(choice=service, env=os.getenv(constants.SERVICE_NAME_ENV))
         self.metadata_set = metadata_set if metadata_set is not None else {}
         self.timestamp: int | None = None
+        self.emf_writer = emf_writer
+        self.metric_aggregation = MetricAggregation(metric_aggregation) if metric_aggregation is not None else None
 
         self._metric_units = [unit.value for unit in MetricUnit]
         self._metric_unit_valid_options = list(MetricUnit.__members__)
@@ -138,21 +162,38 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
             metric_resolutions=self._metric_resolutions,
             resolution=resolution,
         )
-        metric: dict = self.metric_set.get(name, defaultdict(list))
-        metric["Unit"] = unit
-        metric["StorageResolution"] = resolution
-        metric["Value"].append(float(value))
-        logger.debug(f"Adding metric: {name} with {metric}")
-        self.metric_set[name] = metric
-
-        if len(self.metric_set) == MAX_METRICS or len(metric["Value"]) == MAX_METRICS:
-            logger.debug(f"Exceeded maximum of {MAX_METRICS} metrics - Publishing existing metric set")
-            metrics = self.serialize_metric_set()
-            print(json.dumps(metrics))
-
-            # clear metric set only as opposed to metrics and dimensions set
-            # since we could have more than 100 metrics
-            self.metric_set.clear()
+        # metric sets can be shared across instances, and metrics added from worker threads
+        with _METRIC_SET_LOCK:
+            metric: dict = self.metric_set.get(name, defaultdict(list))
+            metric["Unit"] = unit
+            metric["StorageResolution"] = resolution
+
+            values = metric["Value"]
+            if isinstance(values, MetricAggregate):
+                value_count = values.add(float(value))
+            elif self.metric_aggregation is None:
+                values.append(float(value))
+                value_count = len(values)
+            else:
+                # values added before aggregating (e.g. by another Metrics instance) are folded too
+                values = metric["Value"] = build_metric_aggregate(self.metric_aggregation, values)
+                value_count = values.add(float(value))
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Adding metric: {name} with {metric}")
+            self.metric_set[name] = metric
+
+            if len(self.metric_set) == MAX_METRICS or value_count == MAX_METRICS:
+                logger.debug(f"Exceeded maximum of {MAX_METRICS} metrics - Publishing existing metric set")
+                metrics = self.serialize_metric_set()
+                if self.emf_writer is None:
+                    print(json.dumps(metrics))
+                else:
+                    self.emf_writer.write(metrics)
+
+                # clear metric set only as opposed to metrics and dimensions set
+                # since we could have more than 100 metrics
+                self.metric_set.clear()
 
     def serialize_metric_set(
         self,
@@ -220,7 +261,9 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
 
         for metric_name in metrics:
             metric: dict = metrics[metric_name]
-            metric_value: int = metric.get("Value", 0)
+            metric_value: Any = metric.get("Value", 0)
+            if isinstance(metric_value, MetricAggregate):
+                metric_value = metric_value.serialize()
             metric_unit: str = metric.get("Unit", "")
             metric_resolution: int = metric.get("StorageResolution", 60)
 
@@ -351,17 +394,25 @@ class AmazonCloudWatchEMFProvider(BaseProvider):
         raise_on_empty_metrics : bool, optional
             raise exception if no metrics are emitted, by default False
         """
-        if not raise_on_empty_metrics and not self.metric_set:
-            warnings.warn(
-                "No application metrics to publish. The cold-start metric may be published if enabled. "
-                "If application metrics should never be empty, consider using 'raise_on_empty_metrics'",
-                stacklevel=2,
-            )
-        else:
-            logger.debug("Flushing existing metrics")
-            metrics = self.serialize_metric_set()
-            print(json.dumps(metrics, separators=(",", ":")))
-            self.clear_metrics()
+        try:
+            if not raise_on_empty_metrics and not self.metric_set:
+                warnings.warn(
+                    "No application metrics to publish. The cold-start metric may be published if enabled. "
+                    "If application metrics should never be empty, consider using 'raise_on_empty_metrics'",
+                    stacklevel=2,
+                )
+            else:
+                logger.debug("Flushing existing metrics")
+                metrics = self.serialize_metric_set()
+                if self.emf_writer is None:
+                    print(json.dumps(metrics, separators=(",", ":")))
+                else:
+                    self.emf_writer.write(metrics)
+                self.clear_metrics()
+        finally:
+            # metric sets serialized earlier, when reaching the maximum number of metrics, are buffered too
+            if self.emf_writer is not None:
+                self.emf_writer.flush()
 
     def log_metrics(
         self,
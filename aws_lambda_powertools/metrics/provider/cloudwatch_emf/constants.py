@@ -1,2 +1,6 @@
 MAX_DIMENSIONS = 29
 MAX_METRICS = 100
+# CloudWatch Logs limits: 256 KiB per log event (including 26 bytes of overhead), and 1 MiB per batch of events
+# See: https://docs.aws.amazon.com/AmazonCloudWatchLogs/latest/APIReference/API_PutLogEvents.html
+MAX_EMF_DOCUMENT_BYTES = 262_118
+MAX_EMF_BUFFER_BYTES = 1_048_576
@@ -36,3 +36,10 @@ class MetricUnit(Enum):
 class MetricResolution(Enum):
     Standard = 60
     High = 1
+
+
+class MetricAggregation(Enum):
+    # distinct values and how many times each was added, e.g. {"Values": [1.0, 5.0], "Counts": [10, 2]}
+    Values = "Values"
+    # minimum, maximum, sum, and number of values added, e.g. {"Min": 1.0, "Max": 5.0, "Sum": 20.0, "Count": 12}
+    StatisticSet = "StatisticSet"
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import warnings
+from typing import IO, TYPE_CHECKING, Any
+
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.constants import (
+    MAX_EMF_BUFFER_BYTES,
+    MAX_EMF_DOCUMENT_BYTES,
+)
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.metrics.provider.cloudwatch_emf.types import CloudWatchEMFOutput
+
+logger = logging.getLogger(__name__)
+
+
+class EMFWriter:
+    """
+    Buffers serialized EMF documents and writes them in batches, one document per line.
+
+    Documents are kept in memory until `flush` is called, or until adding another document would exceed
+    `max_buffer_bytes`. Each batch is written with a single call to the sink, instead of one `print` per document.
+
+    Example
+    -------
+    **Buffer EMF documents emitted by Metrics, and write them once at the end of the invocation**
+
+        from aws_lambda_powertools import Metrics
+        from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
+
+        metrics = Metrics(namespace="ServerlessAirline", service="payment", emf_writer=EMFWriter())
+
+        @metrics.log_metrics
+        def lambda_handler(event, context):
+            for record in event["Records"]:
+                metrics.add_metric(name="RecordProcessed", unit="Count", value=1)
+
+    Parameters
+    ----------
+    sink : IO[str] | int | None, optional
+        Where EMF documents are written to: a text stream (e.g. `io.StringIO`), or a file descriptor.
+        By default, `sys.stdout` at the time documents are written.
+    max_buffer_bytes : int, optional
+        Maximum size of a batch of documents, by default 1 MiB (CloudWatch Logs maximum batch size)
+    """
+
+    def __init__(self, sink: IO[str] | int | None = None, max_buffer_bytes: int = MAX_EMF_BUFFER_BYTES):
+        self.sink = sink
+        self.max_buffer_bytes = max_buffer_bytes
+
+        self.bytes_emitted = 0
+        self.blobs_emitted = 0
+        self.writes = 0
+
+        self._buffer: list[str] = []
+        self._buffer_bytes = 0
+
+    @property
+    def pending_blobs(self) -> int:
+        """Number of EMF documents buffered and not yet written"""
+        return len(self._buffer)
+
+    def write(self, metrics: CloudWatchEMFOutput | dict[str, Any]) -> None:
+        """Serialize and buffer an EMF document, writing existing documents first if the buffer is full
+
+        Parameters
+        ----------
+        metrics : CloudWatchEMFOutput | dict[str, Any]
+            Serialized metric set, as returned by `serialize_metric_set`
+        """
+        # ensure_ascii (default) guarantees the number of characters is the number of bytes
+        document = json.dumps(metrics, separators=(",", ":"))
+        document_bytes = len(document) + 1  # newline
+
+        if document_bytes > MAX_EMF_DOCUMENT_BYTES:
+            warnings.warn(
+                f"EMF document has {document_bytes} bytes and exceeds the CloudWatch Logs maximum event size "
+                f"({MAX_EMF_DOCUMENT_BYTES} bytes). It will be truncated and metrics will not be created.",
+                stacklevel=2,
+            )
+
+        if self._buffer and self._buffer_bytes + document_bytes > self.max_buffer_bytes:
+            self.flush()
+
+        self._buffer.append(document)
+        self._buffer_bytes += document_bytes
+
+    def flush(self) -> None:
+        """Write all buffered EMF documents to the sink with a single write"""
+        if not self._buffer:
+            return
+
+        payload = "\n".join(self._buffer) + "\n"
+        blobs = len(self._buffer)
+        logger.debug(f"Writing {blobs} EMF documents ({self._buffer_bytes} bytes)")
+
+        self._write_to_sink(payload)
+
+        self.bytes_emitted += self._buffer_bytes
+        self.blobs_emitted += blobs
+        self.writes += 1
+
+        self._buffer.clear()
+        self._buffer_bytes = 0
+
+    def _write_to_sink(self, payload: str) -> None:
+        if self.sink is None:
+            # resolved on every write, as sys.stdout can be replaced at any time (e.g. output capturing)
+            sys.stdout.write(payload)
+        elif isinstance(self.sink, int):
+            data = payload.encode()
+            while data:
+                written = os.write(self.sink, data)
+                data = data[written:]
+        else:
+            self.sink.write(payload)
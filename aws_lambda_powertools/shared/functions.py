@@ -137,8 +137,9 @@ def powertools_debug_is_set() -> bool:
 
 
 def slice_dictionary(data: dict, chunk_size: int) -> Generator[dict, None, None]:
+    keys = iter(data)
     for _ in range(0, len(data), chunk_size):
-        yield {dict_key: data[dict_key] for dict_key in itertools.islice(data, chunk_size)}
+        yield {dict_key: data[dict_key] for dict_key in itertools.islice(keys, chunk_size)}
 
 
 def extract_event_from_common_models(data: Any) -> dict | Any:
@@ -21,6 +21,9 @@ from aws_lambda_powertools.utilities.batch.exceptions import ExceptionInfo
 from aws_lambda_powertools.utilities.batch.sqs_fifo_partial_processor import (
     SqsFifoPartialProcessor,
 )
+from aws_lambda_powertools.utilities.batch.threaded_batch_processor import (
+    ThreadedBatchProcessor,
+)
 from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
 
 __all__ = (
@@ -38,4 +41,5 @@ __all__ = (
     "FailureResponse",
     "SuccessResponse",
     "SqsFifoPartialProcessor",
+    "ThreadedBatchProcessor",
 )
@@ -10,13 +10,17 @@ import inspect
 import logging
 import os
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Tuple, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union, overload
 
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.utilities.batch.exceptions import (
     BatchProcessingError,
+    DeadlineCircuitBreakerError,
     ExceptionInfo,
 )
 from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
@@ -51,6 +55,50 @@ EventSourceDataClassTypes = Union[SQSRecord, KinesisStreamRecord, DynamoDBRecord
 BatchEventTypes = Union[EventSourceDataClassTypes, BatchTypeModels]
 SuccessResponse = Tuple[str, Any, BatchEventTypes]
 FailureResponse = Tuple[str, str, BatchEventTypes]
+# Record converted to its batch type (None if conversion failed), handler result, and exception raised if any
+RecordOutcome = Tuple[Optional[BatchEventTypes], Any, Optional[ExceptionInfo]]
+
+
+class _RateLimiter:
+    """Spaces out calls to `acquire` evenly, so they complete at most `rate` times per second, without bursts"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.next_start = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.interval
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class RecordLatencyStats:
+    """Duration of record handler calls for a batch, in milliseconds, safe to update from worker threads"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
 
 
 class BasePartialProcessor(ABC):
@@ -60,10 +108,32 @@ class BasePartialProcessor(ABC):
 
     lambda_context: LambdaContext
 
+    # Limits for async processing, unbounded by default
+    max_concurrency: int | None = None
+    max_records_per_second: float | None = None
+
+    # Time left in the invocation below which no record is started, disabled by default
+    remaining_time_margin_ms: int | None = None
+    _deadline: float | None = None
+
+    # Thread pool of processors handling records concurrently, created on first use
+    _executor: ThreadPoolExecutor | None = None
+
     def __init__(self):
         self.success_messages: list[BatchEventTypes] = []
         self.fail_messages: list[BatchEventTypes] = []
         self.exceptions: list[ExceptionInfo] = []
+        self.record_latency = RecordLatencyStats()
+
+    def _get_executor(self, max_workers: int | None) -> ThreadPoolExecutor:
+        # Worker threads are kept across invocations, so warm invocations don't pay for creating them again
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="powertools-batch",
+            )
+
+        return self._executor
 
     @abstractmethod
     def _prepare(self):
@@ -112,10 +182,16 @@ class BasePartialProcessor(ABC):
         We also handle edge cases like Lambda container thaw by getting an existing or creating an event loop.
 
         See: https://docs.aws.amazon.com/lambda/latest/dg/lambda-runtime-environment.html#runtimes-lifecycle-shutdown
+
+        When `max_concurrency` or `max_records_per_second` are set, records are processed by a bounded number of
+        workers instead of all at once. Results are returned in the order of records either way.
         """
 
         async def async_process_closure():
-            return list(await asyncio.gather(*[self._async_process_record(record) for record in self.records]))
+            if self.max_concurrency is None and self.max_records_per_second is None:
+                return list(await asyncio.gather(*[self._async_process_record(record) for record in self.records]))
+
+            return await self._async_process_bounded()
 
         # WARNING
         # Do not use "asyncio.run(async_process())" due to Lambda container thaws/freeze, otherwise we might get "Event Loop is closed" # noqa: E501
@@ -135,6 +211,29 @@ class BasePartialProcessor(ABC):
         # Non-Lambda environment, run coroutine as usual
         return asyncio.run(coro)
 
+    async def _async_process_bounded(self) -> list[tuple]:
+        """
+        Async call instance's handler for each record, with at most `max_concurrency` records in flight,
+        and starting at most `max_records_per_second` records every second.
+        """
+        results: list = [None] * len(self.records)
+
+        # Workers share a lazy iterator, so a coroutine is only created when a worker is free to run it,
+        # instead of one for every record upfront. The event loop is single-threaded: no lock needed.
+        records = enumerate(self.records)
+        rate_limiter = _RateLimiter(self.max_records_per_second) if self.max_records_per_second else None
+
+        async def worker():
+            for index, record in records:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                results[index] = await self._async_process_record(record)
+
+        workers = min(self.max_concurrency or len(self.records), len(self.records))
+        await asyncio.gather(*[worker() for _ in range(workers)])
+
+        return results
+
     def __enter__(self):
         self._prepare()
         return self
@@ -180,8 +279,27 @@ class BasePartialProcessor(ABC):
             self.lambda_context = lambda_context
             self._handler_accepts_lambda_context = "lambda_context" in inspect.signature(self.handler).parameters
 
+        self._deadline = self._get_deadline(lambda_context)
+
         return self
 
+    def _get_deadline(self, lambda_context: LambdaContext | None) -> float | None:
+        """Monotonic time after which no record is started, or None when there's no time budget"""
+        get_remaining_time_in_millis = getattr(lambda_context, "get_remaining_time_in_millis", None)
+        if self.remaining_time_margin_ms is None or get_remaining_time_in_millis is None:
+            return None
+
+        return time.monotonic() + (get_remaining_time_in_millis() - self.remaining_time_margin_ms) / 1000
+
+    def _has_time_for_record(self) -> bool:
+        """
+        Whether a record can start within the time budget, assuming it lasts as long as the slowest record so far
+        """
+        if self._deadline is None:
+            return True
+
+        return time.monotonic() + self.record_latency.max_ms / 1000 < self._deadline
+
     def success_handler(self, record, result: Any) -> SuccessResponse:
         """
         Keeps track of batch records that were processed successfully
@@ -229,11 +347,18 @@ class BasePartialProcessor(ABC):
 class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
     DEFAULT_RESPONSE: PartialItemFailureResponse = {"batchItemFailures": []}
 
+    deadline_exc = (
+        DeadlineCircuitBreakerError,
+        DeadlineCircuitBreakerError("Not enough time left in the invocation to process this record"),
+        None,
+    )
+
     def __init__(
         self,
         event_type: EventType,
         model: BatchTypeModels | None = None,
         raise_on_entire_batch_failure: bool = True,
+        remaining_time_margin_ms: int | None = None,
     ):
         """Process batch and partially report failed items
 
@@ -246,12 +371,22 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         raise_on_entire_batch_failure: bool
             Raise an exception when the entire batch has failed processing.
             When set to False, partial failures are reported in the response
+        remaining_time_margin_ms: int | None
+            Time to keep before the invocation times out, in milliseconds. Records that can't start without eating
+            into it, based on the slowest record so far, are reported as failed items without being processed.
+            Requires a Lambda context. By default, all records are processed regardless of the remaining time
 
         Exceptions
         ----------
         BatchProcessingError
             Raised when the entire batch has failed processing
+        ValueError
+            Raised when remaining_time_margin_ms is negative
         """
+        if remaining_time_margin_ms is not None and remaining_time_margin_ms < 0:
+            raise ValueError("remaining_time_margin_ms must not be negative")
+
+        self.remaining_time_margin_ms = remaining_time_margin_ms
         self.event_type = event_type
         self.model = model
         self.raise_on_entire_batch_failure = raise_on_entire_batch_failure
@@ -280,6 +415,7 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         self.success_messages.clear()
         self.fail_messages.clear()
         self.exceptions.clear()
+        self.record_latency.clear()
         self.batch_response = copy.deepcopy(self.DEFAULT_RESPONSE)
 
     def _clean(self):
@@ -371,7 +507,41 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
             return model.model_validate(record)
         return self._DATA_CLASS_MAPPING[event_type](record)
 
-    def _register_model_validation_error_record(self, record: dict):
+    def _handle_record_exception(
+        self,
+        record: dict,
+        data: BatchEventTypes | None,
+        exception: ExceptionInfo,
+    ) -> FailureResponse:
+        """
+        Register a record that failed processing, including poison pills failing model validation
+
+        Parameters
+        ----------
+        record: dict
+            Original batch record
+        data: BatchEventTypes | None
+            Record converted to its batch type, or None if conversion failed
+        exception: ExceptionInfo
+            Exception information containing type, value, and traceback (sys.exc_info())
+        """
+        # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
+        # we need to handle that exception differently.
+        # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
+        # and we compare if it's coming from the same model that trigger the exception in the first place
+
+        # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
+        # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
+        model = getattr(exception[1], "model", None) or getattr(exception[1], "title", None)
+        model_name = getattr(self.model, "__name__", None)
+
+        # Records short-circuited without being converted, e.g. failing model validation, are converted without model
+        if data is None or model in (self.model, model_name):
+            return self._register_model_validation_error_record(record, exception=exception)
+
+        return self.failure_handler(record=data, exception=exception)
+
+    def _register_model_validation_error_record(self, record: dict, exception: ExceptionInfo | None = None):
         """Convert and register failure due to poison pills where model failed validation early"""
         # Parser will fail validation if record is a poison pill (malformed input)
         # this means we can't collect the message id if we try transforming again
@@ -380,7 +550,7 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         # see https://github.com/aws-powertools/powertools-lambda-python/issues/2091
         logger.debug("Record cannot be converted to customer's model; converting without model")
         failed_record: EventSourceDataClassTypes = self._to_batch_type(record=record, event_type=self.event_type)
-        return self.failure_handler(record=failed_record, exception=sys.exc_info())
+        return self.failure_handler(record=failed_record, exception=exception or sys.exc_info())
 
 
 class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibility
@@ -506,30 +676,42 @@ class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibil
         record: dict
             A batch record to be processed.
         """
-        data: BatchTypeModels | None = None
+        return self._register_record_outcome(record, self._execute_record(record))
+
+    def _execute_record(self, record: dict) -> RecordOutcome:
+        """
+        Call instance's handler with a record, capturing its result or exception to be registered later
+
+        Parameters
+        ----------
+        record: dict
+            A batch record to be processed.
+        """
+        data: BatchEventTypes | None = None
         try:
             data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
-            if self._handler_accepts_lambda_context:
-                result = self.handler(record=data, lambda_context=self.lambda_context)
-            else:
-                result = self.handler(record=data)
-
+            if not self._has_time_for_record():
+                return data, None, self.deadline_exc
+
+            started_at = time.perf_counter()
+            try:
+                if self._handler_accepts_lambda_context:
+                    result = self.handler(record=data, lambda_context=self.lambda_context)
+                else:
+                    result = self.handler(record=data)
+            finally:
+                self.record_latency.add((time.perf_counter() - started_at) * 1000)
+
+            return data, result, None
+        except Exception:
+            return data, None, sys.exc_info()
+
+    def _register_record_outcome(self, record: dict, outcome: RecordOutcome) -> SuccessResponse | FailureResponse:
+        data, result, exception = outcome
+        if exception is None:
             return self.success_handler(record=record, result=result)
-        except Exception as exc:
-            # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
-            # we need to handle that exception differently.
-            # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
-            # and we compare if it's coming from the same model that trigger the exception in the first place
-
-            # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
-            # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
-            model = getattr(exc, "model", None) or getattr(exc, "title", None)
-            model_name = getattr(self.model, "__name__", None)
-
-            if model in (self.model, model_name):
-                return self._register_model_validation_error_record(record)
 
-            return self.failure_handler(record=data, exception=sys.exc_info())
+        return self._handle_record_exception(record=record, data=data, exception=exception)
 
 
 class AsyncBatchProcessor(BasePartialBatchProcessor):
@@ -643,6 +825,56 @@ class AsyncBatchProcessor(BasePartialBatchProcessor):
     * Sync record handler not supported, use BatchProcessor instead.
     """
 
+    def __init__(
+        self,
+        event_type: EventType,
+        model: BatchTypeModels | None = None,
+        raise_on_entire_batch_failure: bool = True,
+        max_concurrency: int | None = None,
+        max_records_per_second: float | None = None,
+        remaining_time_margin_ms: int | None = None,
+    ):
+        """Process batch asynchronously and partially report failed items
+
+        Parameters
+        ----------
+        event_type: EventType
+            Whether this is a SQS, DynamoDB Streams, or Kinesis Data Stream event
+        model: BatchTypeModels | None
+            Parser's data model using either SqsRecordModel, DynamoDBStreamRecordModel, KinesisDataStreamRecord
+        raise_on_entire_batch_failure: bool
+            Raise an exception when the entire batch has failed processing.
+            When set to False, partial failures are reported in the response
+        max_concurrency: int | None
+            Maximum number of records processed at the same time. By default, all records are processed at once
+        max_records_per_second: float | None
+            Maximum number of records started every second, evenly spaced. By default, there's no rate limit
+        remaining_time_margin_ms: int | None
+            Time to keep before the invocation times out, in milliseconds. Records that can't start without eating
+            into it are reported as failed items without being processed. As all records start at once by default,
+            use it along with max_concurrency
+
+        Raises
+        ------
+        ValueError
+            When max_concurrency is lower than 1, max_records_per_second isn't greater than 0,
+            or remaining_time_margin_ms is negative
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        if max_records_per_second is not None and max_records_per_second <= 0:
+            raise ValueError("max_records_per_second must be greater than 0")
+
+        self.max_concurrency = max_concurrency
+        self.max_records_per_second = max_records_per_second
+
+        super().__init__(
+            event_type=event_type,
+            model=model,
+            raise_on_entire_batch_failure=raise_on_entire_batch_failure,
+            remaining_time_margin_ms=remaining_time_margin_ms,
+        )
+
     def _process_record(self, record: dict):
         raise NotImplementedError()
 
@@ -658,24 +890,18 @@ class AsyncBatchProcessor(BasePartialBatchProcessor):
         data: BatchTypeModels | None = None
         try:
             data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
-            if self._handler_accepts_lambda_context:
-                result = await self.handler(record=data, lambda_context=self.lambda_context)
-            else:
-                result = await self.handler(record=data)
+            if not self._has_time_for_record():
+                return self.failure_handler(record=data, exception=self.deadline_exc)
+
+            started_at = time.perf_counter()
+            try:
+                if self._handler_accepts_lambda_context:
+                    result = await self.handler(record=data, lambda_context=self.lambda_context)
+                else:
+                    result = await self.handler(record=data)
+            finally:
+                self.record_latency.add((time.perf_counter() - started_at) * 1000)
 
             return self.success_handler(record=record, result=result)
-        except Exception as exc:
-            # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
-            # we need to handle that exception differently.
-            # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
-            # and we compare if it's coming from the same model that trigger the exception in the first place
-
-            # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
-            # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
-            model = getattr(exc, "model", None) or getattr(exc, "title", None)
-            model_name = getattr(self.model, "__name__", None)
-
-            if model in (self.model, model_name):
-                return self._register_model_validation_error_record(record)
-
-            return self.failure_handler(record=data, exception=sys.exc_info())
+        except Exception:
+            return self._handle_record_exception(record=record, data=data, exception=sys.exc_info())
@@ -52,3 +52,19 @@ class SQSFifoMessageGroupCircuitBreakerError(Exception):
     """
 
     pass
+
+
+class PartitionKeyCircuitBreakerError(Exception):
+    """
+    Signals a stream record not processed due to a previous record with the same partition key failing processing
+    """
+
+    pass
+
+
+class DeadlineCircuitBreakerError(Exception):
+    """
+    Signals a record not processed due to the Lambda invocation running out of time
+    """
+
+    pass
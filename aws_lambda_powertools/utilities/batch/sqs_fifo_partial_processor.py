@@ -8,8 +8,10 @@ from aws_lambda_powertools.utilities.batch.exceptions import (
     SQSFifoCircuitBreakerError,
     SQSFifoMessageGroupCircuitBreakerError,
 )
+from aws_lambda_powertools.utilities.batch.threaded_batch_processor import ThreadContext
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.batch.base import BatchEventTypes, RecordOutcome
     from aws_lambda_powertools.utilities.batch.types import BatchSqsTypeModel
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,8 @@ class SqsFifoPartialProcessor(BatchProcessor):
     """Process native partial responses from SQS FIFO queues.
 
     Stops processing records when the first record fails. The remaining records are reported as failed items.
+    With `skip_group_on_error`, only the remaining records from the same message group are reported as failed items,
+    and message groups can be processed concurrently with `max_concurrent_groups`.
 
     Example
     _______
@@ -52,6 +56,12 @@ class SqsFifoPartialProcessor(BatchProcessor):
     def lambda_handler(event, context: LambdaContext):
         return processor.response()
     ```
+
+    ## Process message groups concurrently, keeping the order of records within each group
+
+    ```python
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=10)
+    ```
     """
 
     circuit_breaker_exc = (
@@ -66,7 +76,12 @@ class SqsFifoPartialProcessor(BatchProcessor):
         None,
     )
 
-    def __init__(self, model: BatchSqsTypeModel | None = None, skip_group_on_error: bool = False):
+    def __init__(
+        self,
+        model: BatchSqsTypeModel | None = None,
+        skip_group_on_error: bool = False,
+        max_concurrent_groups: int | None = None,
+    ):
         """
         Initialize the SqsFifoProcessor.
 
@@ -77,15 +92,91 @@ class SqsFifoPartialProcessor(BatchProcessor):
         skip_group_on_error: bool
             Determines whether to exclusively skip messages from the MessageGroupID that encountered processing failures
             Default is False.
-
+        max_concurrent_groups: int | None
+            Maximum number of message groups processed at the same time, on a thread pool. Records within a message
+            group are still processed one at a time, in order. Requires `skip_group_on_error`.
+            Default is None, processing all records one at a time.
+
+        Raises
+        ------
+        ValueError
+            When max_concurrent_groups is lower than 1, or set without skip_group_on_error
         """
+        if max_concurrent_groups is not None:
+            if max_concurrent_groups < 1:
+                raise ValueError("max_concurrent_groups must be greater than 0")
+            # Records from other groups may be processed before a failure, and can no longer be short-circuited
+            if not skip_group_on_error:
+                raise ValueError("max_concurrent_groups requires skip_group_on_error=True")
+
         self._skip_group_on_error: bool = skip_group_on_error
-        self._current_group_id = None
+        self._current_group_id: str | None = None
         self._failed_group_ids: set[str] = set()
+        self.max_concurrent_groups = max_concurrent_groups
         super().__init__(EventType.SQS, model)
 
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record, processing message groups concurrently if max_concurrent_groups is set
+        """
+        if self.max_concurrent_groups is None:
+            return super().process()
+
+        groups: dict[str | None, list[tuple[int, dict]]] = {}
+        for index, record in enumerate(self.records):
+            groups.setdefault(self._get_group_id(record), []).append((index, record))
+
+        thread_context = ThreadContext()
+        outcomes: dict[int, RecordOutcome] = {}
+        for group_outcomes in self._get_executor(self.max_concurrent_groups).map(
+            lambda group: thread_context.run(self._execute_message_group, group),
+            groups.values(),
+        ):
+            outcomes.update(group_outcomes)
+
+        # Records are registered from this thread, in the order of the batch, as BatchProcessor would
+        results: list[tuple] = []
+        for index, record in enumerate(self.records):
+            self._current_group_id = self._get_group_id(record)
+            results.append(self._register_record_outcome(record, outcomes[index]))
+
+        return results
+
+    def _execute_message_group(self, group: list[tuple[int, dict]]) -> list[tuple[int, RecordOutcome]]:
+        """
+        Call instance's handler for each record of a message group in order, short-circuiting the group on failure
+
+        Parameters
+        ----------
+        group: list[tuple[int, dict]]
+            Records of a message group, with their position in the batch.
+        """
+        group_failed = False
+        outcomes: list[tuple[int, RecordOutcome]] = []
+        for index, record in group:
+            if group_failed:
+                data: BatchEventTypes | None = None
+                try:
+                    data = self._to_batch_type(record, event_type=self.event_type, model=self.model)
+                except Exception:
+                    # Poison pills are short-circuited too, and registered without model as usual
+                    logger.debug("Short-circuited record cannot be converted to customer's model")
+                outcomes.append((index, (data, None, self.group_circuit_breaker_exc)))
+                continue
+
+            outcome = self._execute_record(record)
+            # Records without a message group aren't short-circuited, as in sequential processing
+            group_failed = outcome[2] is not None and bool(self._get_group_id(record))
+            outcomes.append((index, outcome))
+
+        return outcomes
+
+    @staticmethod
+    def _get_group_id(record: dict) -> str | None:
+        return record.get("attributes", {}).get("MessageGroupId")
+
     def _process_record(self, record):
-        self._current_group_id = record.get("attributes", {}).get("MessageGroupId")
+        self._current_group_id = self._get_group_id(record)
 
         # Short-circuits the process if:
         #     - There are failed messages, OR
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.utilities.batch.base import BatchProcessor, EventType
+from aws_lambda_powertools.utilities.batch.exceptions import PartitionKeyCircuitBreakerError
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.batch.base import BatchEventTypes, RecordOutcome
+    from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _get_kinesis_partition_key(record: dict) -> str | None:
+    return record.get("kinesis", {}).get("partitionKey")
+
+
+def _get_dynamodb_partition_key(record: dict) -> str | None:
+    keys = record.get("dynamodb", {}).get("Keys")
+    # Keys is a map of attribute names to typed values, e.g. {"id": {"S": "1"}}
+    return json.dumps(keys, sort_keys=True) if keys is not None else None
+
+
+# Ordering of stream records only matters within a partition key
+PARTITION_KEY_GETTERS: dict[EventType, Callable[[dict], str | None]] = {
+    EventType.KinesisDataStreams: _get_kinesis_partition_key,
+    EventType.DynamoDBStreams: _get_dynamodb_partition_key,
+}
+
+
+class ThreadContext:
+    """
+    Context of the thread processing a batch, to run record handlers in worker threads as if they were called from it.
+
+    Context variables are copied for every call. When tracing with X-Ray in Lambda, the current trace entity is also
+    set in the worker thread, as the X-Ray SDK keeps it in a thread local. Subsegments created by record handlers are
+    then added to the subsegment of the function processing the batch, instead of being discarded.
+    """
+
+    def __init__(self):
+        self.context = contextvars.copy_context()
+        self.trace_entity = self._get_xray_trace_entity()
+
+    def run(self, function: Callable[..., T], *args: Any) -> T:
+        return self.context.copy().run(self._run, function, *args)
+
+    def _run(self, function: Callable[..., T], *args: Any) -> T:
+        if self.trace_entity is None:
+            return function(*args)
+
+        from aws_xray_sdk.core import xray_recorder  # type: ignore
+
+        xray_recorder.context.set_trace_entity(self.trace_entity)
+        try:
+            return function(*args)
+        finally:
+            # worker threads are reused, and must not keep trace entities from a previous invocation
+            xray_recorder.context.clear_trace_entities()
+
+    @staticmethod
+    def _get_xray_trace_entity() -> Any:
+        # Only when the X-Ray SDK is already in use; outside Lambda, a missing segment would be reported as an error
+        if constants.XRAY_SDK_MODULE not in sys.modules or not os.getenv(constants.LAMBDA_TASK_ROOT_ENV):
+            return None
+
+        from aws_xray_sdk import global_sdk_config  # type: ignore
+        from aws_xray_sdk.core import xray_recorder
+
+        if not global_sdk_config.sdk_enabled():
+            return None
+
+        return xray_recorder.context.get_trace_entity()
+
+
+class ThreadedBatchProcessor(BatchProcessor):
+    """Process native partial responses from SQS, Kinesis Data Streams, and DynamoDB, running sync record handlers
+    concurrently on a bounded thread pool.
+
+    Suited to record handlers spending most of their time waiting on I/O, e.g. calling AWS services or HTTP APIs.
+    Results, `success_messages`, and `fail_messages` keep the order of records in the batch, so partial failures
+    (and stream checkpoints) are reported exactly as `BatchProcessor` would.
+
+    For Kinesis Data Streams and DynamoDB Streams, `preserve_key_order` processes records sharing a partition key
+    (Kinesis `partitionKey`, DynamoDB `Keys`) one at a time, in order, while different keys run concurrently.
+    Once a record fails, the remaining records with the same key are reported as failed without being processed, so
+    they are retried in order from the checkpoint: the lowest sequence number of failed records.
+
+    Example
+    -------
+
+    ## Process batch triggered by SQS with up to 10 records at a time
+
+    ```python
+    import boto3
+
+    from aws_lambda_powertools.utilities.batch import EventType, ThreadedBatchProcessor, process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=10)
+    table = boto3.resource("dynamodb").Table("orders")
+
+
+    def record_handler(record: SQSRecord):
+        table.put_item(Item=record.json_body)
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
+    ## Process batch triggered by Kinesis Data Streams, keeping the order of records with the same partition key
+
+    ```python
+    processor = ThreadedBatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=10, preserve_key_order=True)
+    ```
+
+    Raises
+    ------
+    BatchProcessingError
+        When all batch records fail processing and raise_on_entire_batch_failure is True
+
+    Limitations
+    -----------
+    * Record handlers must be thread-safe. Use `extra` instead of `Logger.append_keys` to add per-record keys.
+    * Async record handlers are not supported, use AsyncBatchProcessor instead.
+    * `preserve_key_order` is not supported for SQS, use SqsFifoPartialProcessor with `max_concurrent_groups` instead.
+    """
+
+    key_circuit_breaker_exc = (
+        PartitionKeyCircuitBreakerError,
+        PartitionKeyCircuitBreakerError("A previous record with this partition key failed processing"),
+        None,
+    )
+
+    def __init__(
+        self,
+        event_type: EventType,
+        model: BatchTypeModels | None = None,
+        raise_on_entire_batch_failure: bool = True,
+        max_workers: int | None = None,
+        preserve_key_order: bool = False,
+        remaining_time_margin_ms: int | None = None,
+    ):
+        """Process batch records concurrently, and partially report failed items
+
+        Parameters
+        ----------
+        event_type: EventType
+            Whether this is a SQS, DynamoDB Streams, or Kinesis Data Stream event
+        model: BatchTypeModels | None
+            Parser's data model using either SqsRecordModel, DynamoDBStreamRecordModel, KinesisDataStreamRecord
+        raise_on_entire_batch_failure: bool
+            Raise an exception when the entire batch has failed processing.
+            When set to False, partial failures are reported in the response
+        max_workers: int | None
+            Maximum number of records processed at the same time.
+            By default, it's the `ThreadPoolExecutor` default: min(32, os.cpu_count() + 4)
+        preserve_key_order: bool
+            Process stream records sharing a partition key one at a time, in order, short-circuiting the remaining
+            ones after a failure. Default is False, processing any record concurrently.
+        remaining_time_margin_ms: int | None
+            Time to keep before the invocation times out, in milliseconds. Records that can't start without eating
+            into it, based on the slowest record so far, are reported as failed items without being processed
+
+        Raises
+        ------
+        ValueError
+            When max_workers is lower than 1, preserve_key_order is set for SQS,
+            or remaining_time_margin_ms is negative
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        if preserve_key_order and event_type not in PARTITION_KEY_GETTERS:
+            raise ValueError("preserve_key_order is only supported for Kinesis Data Streams and DynamoDB Streams")
+
+        self.max_workers = max_workers
+        self.preserve_key_order = preserve_key_order
+
+        super().__init__(
+            event_type=event_type,
+            model=model,
+            raise_on_entire_batch_failure=raise_on_entire_batch_failure,
+            remaining_time_margin_ms=remaining_time_margin_ms,
+        )
+
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record concurrently, returning results in the order of records.
+        """
+        thread_context = ThreadContext()
+        if self.preserve_key_order:
+            outcomes = self._execute_records_by_key(thread_context)
+        else:
+            outcomes = list(
+                self._get_executor(self.max_workers).map(
+                    lambda record: thread_context.run(self._execute_record, record),
+                    self.records,
+                ),
+            )
+
+        # Once every record has been processed, their outcomes are registered from this thread, in the order of records.
+        # This keeps success/failure handlers single-threaded, and reports the same partial failures as BatchProcessor
+        return [self._register_record_outcome(record, outcome) for record, outcome in zip(self.records, outcomes)]
+
+    def _execute_records_by_key(self, thread_context: ThreadContext) -> list[RecordOutcome]:
+        """
+        Call instance's handler for each record, one partition key at a time, returning outcomes in the order of records
+        """
+        keys: dict[str | None, list[tuple[int, dict]]] = {}
+        get_partition_key = PARTITION_KEY_GETTERS[self.event_type]
+        for index, record in enumerate(self.records):
+            keys.setdefault(get_partition_key(record), []).append((index, record))
+
+        outcomes: dict[int, RecordOutcome] = {}
+        for key_outcomes in self._get_executor(self.max_workers).map(
+            lambda key_records: thread_context.run(self._execute_key_records, key_records),
+            keys.values(),
+        ):
+            outcomes.update(key_outcomes)
+
+        return [outcomes[index] for index in range(len(self.records))]
+
+    def _execute_key_records(self, key_records: list[tuple[int, dict]]) -> list[tuple[int, RecordOutcome]]:
+        """
+        Call instance's handler for each record sharing a partition key in order, short-circuiting them on failure
+
+        Parameters
+        ----------
+        key_records: list[tuple[int, dict]]
+            Records sharing a partition key, with their position in the batch.
+        """
+        key_failed = False
+        outcomes: list[tuple[int, RecordOutcome]] = []
+        for index, record in key_records:
+            if key_failed:
+                data: BatchEventTypes | None = None
+                try:
+                    data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
+                except Exception:
+                    # Poison pills are short-circuited too, and registered without model as usual
+                    logger.debug("Short-circuited record cannot be converted to customer's model")
+                outcomes.append((index, (data, None, self.key_circuit_breaker_exc)))
+                continue
+
+            outcome = self._execute_record(record)
+            key_failed = outcome[2] is not None
+            outcomes.append((index, outcome))
+
+        return outcomes
@@ -1,5 +1,7 @@
 from aws_lambda_powertools.utilities.data_masking.base import DataMasking
+from aws_lambda_powertools.utilities.data_masking.plan import MaskingPlan
 
 __all__ = [
     "DataMasking",
+    "MaskingPlan",
 ]
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import functools
+import json
 import logging
 import warnings
 from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence, overload
 
-from jsonpath_ng.ext import parse
-
 from aws_lambda_powertools.utilities.data_masking.exceptions import (
     DataMaskingFieldNotFoundError,
     DataMaskingUnsupportedTypeError,
 )
+from aws_lambda_powertools.utilities.data_masking.plan import MaskingPlan, get_masking_plan
 from aws_lambda_powertools.utilities.data_masking.provider import BaseProvider
 
 if TYPE_CHECKING:
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class _NotJsonNativeError(Exception):
+    """Data contains non-string keys or types that need a JSON round-trip to be normalized"""
+
 
 class DataMasking:
     """
@@ -86,21 +92,56 @@ class DataMasking:
     def erase(self, data, fields: None) -> str: ...
 
     @overload
-    def erase(self, data: list, fields: list[str]) -> list[str]: ...
+    def erase(self, data: list, fields: list[str] | MaskingPlan) -> list[str]: ...
 
     @overload
-    def erase(self, data: tuple, fields: list[str]) -> tuple[str]: ...
+    def erase(self, data: tuple, fields: list[str] | MaskingPlan) -> tuple[str]: ...
 
     @overload
-    def erase(self, data: dict, fields: list[str]) -> dict: ...
+    def erase(self, data: dict, fields: list[str] | MaskingPlan) -> dict: ...
 
-    def erase(self, data: Sequence | Mapping, fields: list[str] | None = None) -> str | list[str] | tuple[str] | dict:
+    def erase(
+        self,
+        data: Sequence | Mapping,
+        fields: list[str] | MaskingPlan | None = None,
+    ) -> str | list[str] | tuple[str] | dict:
         return self._apply_action(data=data, fields=fields, action=self.provider.erase)
 
+    def compile(self, fields: list[str]) -> MaskingPlan:
+        """
+        Compile field expressions once into a reusable masking plan.
+
+        Field expressions are otherwise compiled on first use and kept in a bounded cache. Compiling them
+        upfront, e.g. outside the Lambda handler, avoids parsing them during an invocation.
+
+        Parameters
+        ----------
+        fields : list[str]
+            A list of fields to apply the action to
+
+        Returns
+        -------
+        MaskingPlan
+            Compiled fields that can be passed as `fields` argument, e.g. `erase(data, fields=plan)`
+
+        Example
+        -------
+        ```python
+        from aws_lambda_powertools.utilities.data_masking import DataMasking
+
+        data_masker = DataMasking()
+        plan = data_masker.compile(fields=["customer.email", "customer.address.street"])
+
+        def lambda_handler(event, context):
+            return [data_masker.erase(record, fields=plan) for record in event["records"]]
+        ```
+        """
+        return get_masking_plan(fields)
+
     def _apply_action(
         self,
         data,
-        fields: list[str] | None,
+        fields: list[str] | MaskingPlan | None,
         action: Callable,
         provider_options: dict | None = None,
         **encryption_context: str,
@@ -113,8 +154,9 @@ class DataMasking:
         ----------
         data : str | dict
             The input data to process.
-        fields : list[str] | None
-            A list of fields to apply the action to. If 'None', the action is applied to the entire 'data'.
+        fields : list[str] | MaskingPlan | None
+            A list of fields, or a compiled masking plan, to apply the action to.
+            If 'None', the action is applied to the entire 'data'.
         action : Callable
             The action to apply to the data. It should be a callable that performs an operation on the data
             and returns the modified value.
@@ -130,7 +172,8 @@ class DataMasking:
         """
 
         if fields is not None:
-            logger.debug(f"Running action {action.__name__} with fields {fields}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Running action {action.__name__} with fields {fields}")
             return self._apply_action_to_fields(
                 data=data,
                 fields=fields,
@@ -145,7 +188,7 @@ class DataMasking:
     def _apply_action_to_fields(
         self,
         data: dict | str,
-        fields: list,
+        fields: list | MaskingPlan,
         action: Callable,
         provider_options: dict | None = None,
         **encryption_context: str,
@@ -158,9 +201,10 @@ class DataMasking:
         ----------
             data : dict | str)
                 The input data to process. It can be either a dictionary or a JSON string.
-            fields : list
+            fields : list | MaskingPlan
                 A list of fields to apply the action to. Each field can be specified as a string or
                 a list of strings representing nested keys in the dictionary.
+                Lists are compiled into a MaskingPlan and cached for subsequent calls.
             action : Callable
                 The action to apply to the fields. It should be a callable that takes the current
                 value of the field as the first argument and any additional arguments that might be required
@@ -196,8 +240,9 @@ class DataMasking:
         """
 
         data_parsed: dict = self._normalize_data_to_parse(fields, data)
+        plan = fields if isinstance(fields, MaskingPlan) else get_masking_plan(fields)
 
-        # For in-place updates, json_parse accepts a callback function
+        # For in-place updates, the plan accepts a callback function
         # this function must receive 3 args: field_value, fields, field_name
         # We create a partial callback to pre-populate known options (action, provider opts, enc ctx)
         update_callback = functools.partial(
@@ -207,35 +252,14 @@ class DataMasking:
             **encryption_context,  # type: ignore[arg-type]
         )
 
-        # Iterate over each field to be parsed.
-        for field_parse in fields:
-            # Parse the field expression using a 'parse' function.
-            json_parse = parse(field_parse)
-            # Find the corresponding keys in the normalized data using the parsed expression.
-            result_parse = json_parse.find(data_parsed)
-
-            if not result_parse:
-                if self.raise_on_missing_field:
-                    # If the data for the field is not found, raise an exception.
-                    raise DataMaskingFieldNotFoundError(f"Field or expression {field_parse} not found in {data_parsed}")
-                else:
-                    # If the data for the field is not found, warning.
-                    warnings.warn(f"Field or expression {field_parse} not found in {data_parsed}", stacklevel=2)
-
-            # For in-place updates, json_parse accepts a callback function
-            # that receives 3 args: field_value, fields, field_name
-            # We create a partial callback to pre-populate known provider options (action, provider opts, enc ctx)
-            update_callback = functools.partial(
-                self._call_action,
-                action=action,
-                provider_options=provider_options,
-                **encryption_context,  # type: ignore[arg-type]
-            )
-
-            json_parse.update(
-                data_parsed,
-                lambda field_value, fields, field_name: update_callback(field_value, fields, field_name),  # type: ignore[misc] # noqa: B023
-            )
+        # Apply the action to every field found, then report fields not found in the original order
+        for field_parse in plan.apply(data_parsed, update_callback):
+            if self.raise_on_missing_field:
+                # If the data for the field is not found, raise an exception.
+                raise DataMaskingFieldNotFoundError(f"Field or expression {field_parse} not found in {data_parsed}")
+            else:
+                # If the data for the field is not found, warning.
+                warnings.warn(f"Field or expression {field_parse} not found in {data_parsed}", stacklevel=2)
 
         return data_parsed
 
@@ -266,7 +290,7 @@ class DataMasking:
         fields[field_name] = action(field_value, provider_options=provider_options, **encryption_context)
         return fields[field_name]
 
-    def _normalize_data_to_parse(self, fields: list, data: str | dict) -> dict:
+    def _normalize_data_to_parse(self, fields: list | MaskingPlan, data: str | dict) -> dict:
         if not fields:
             raise ValueError("No fields specified.")
 
@@ -274,12 +298,40 @@ class DataMasking:
             # Parse JSON string as dictionary
             data_parsed = self.json_deserializer(data)
         elif isinstance(data, dict):
-            # Convert the data to a JSON string in case it contains non-string keys (e.g., ints)
-            # Parse the JSON string back into a dictionary
-            data_parsed = self.json_deserializer(self.json_serializer(data))
+            try:
+                # Fast path: data made of string keys and JSON types only is copied as is,
+                # since a JSON round-trip would yield the exact same data
+                if self.json_deserializer is not json.loads:
+                    raise _NotJsonNativeError
+                data_parsed = self._copy_json_native(data)
+            except _NotJsonNativeError:
+                # Convert the data to a JSON string in case it contains non-string keys (e.g., ints)
+                # Parse the JSON string back into a dictionary
+                data_parsed = self.json_deserializer(self.json_serializer(data))
         else:
             raise DataMaskingUnsupportedTypeError(
                 f"Unsupported data type. Expected a traversable type (dict or str), but got {type(data)}.",
             )
 
         return data_parsed
+
+    @classmethod
+    def _copy_json_native(cls, data: Any) -> Any:
+        """Deep copy data made of dicts with string keys, lists and JSON scalars, or raise _NotJsonNativeError"""
+        data_type = type(data)
+
+        if data_type is dict:
+            copied = {}
+            for key, value in data.items():
+                if type(key) is not str:
+                    raise _NotJsonNativeError
+                copied[key] = cls._copy_json_native(value)
+            return copied
+
+        if data_type is list:
+            return [cls._copy_json_native(value) for value in data]
+
+        if data_type in _JSON_SCALAR_TYPES:
+            return data
+
+        raise _NotJsonNativeError
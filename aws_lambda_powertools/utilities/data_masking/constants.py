@@ -12,3 +12,6 @@ MAX_MESSAGES_ENCRYPTED: int = 4294967296
 MAX_BYTES_ENCRYPTED: int = 9223372036854775807
 
 ENCRYPTED_DATA_KEY_CTX_KEY = "aws-crypto-public-key"
+
+# The maximum number of compiled masking plans (parsed field expressions) retained in memory
+MASKING_PLAN_CACHE_MAX_ITEMS: int = 128
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from jsonpath_ng.ext import parse
+from jsonpath_ng.jsonpath import Child, Fields, Root
+
+from aws_lambda_powertools.shared.cache_dict import LRUDict
+from aws_lambda_powertools.utilities.data_masking.constants import MASKING_PLAN_CACHE_MAX_ITEMS
+
+CACHE_MASKING_PLAN = LRUDict(max_items=MASKING_PLAN_CACHE_MAX_ITEMS)
+
+
+class _KeyNode:
+    __slots__ = ("children", "field_index")
+
+    def __init__(self):
+        self.children: dict[str, _KeyNode] = {}
+        # position of the field expression ending at this node, if any
+        self.field_index: int | None = None
+
+
+class MaskingPlan:
+    """
+    Field expressions compiled once, ready to be applied to any number of records.
+
+    Expressions are parsed with jsonpath-ng when the plan is created. When every expression is a plain key path
+    (e.g. `address.street`) and none of them is a prefix of another, the plan builds a tree of keys and applies
+    all field actions in a single traversal of the data. Otherwise, each expression is applied in order through
+    jsonpath-ng, in a single pass per expression.
+
+    Example
+    -------
+    ```python
+    from aws_lambda_powertools.utilities.data_masking import DataMasking
+
+    data_masker = DataMasking()
+    plan = data_masker.compile(fields=["customer.email", "customer.address.street"])
+
+    def lambda_handler(event, context):
+        return [data_masker.erase(record, fields=plan) for record in event["records"]]
+    ```
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        if not fields:
+            raise ValueError("No fields specified.")
+
+        self.fields: tuple[str, ...] = tuple(fields)
+        self._expressions = [parse(field) for field in self.fields]
+        self._key_tree = self._build_key_tree()
+
+    def __repr__(self) -> str:
+        return f"MaskingPlan(fields={list(self.fields)})"
+
+    def apply(self, data: dict, update_callback: Callable[[Any, dict, str], Any]) -> list[str]:
+        """
+        Apply `update_callback` in-place to every field found in `data`.
+
+        Parameters
+        ----------
+        data: dict
+            Data to update in-place
+        update_callback: Callable[[Any, dict, str], Any]
+            Callback receiving the field value, its parent container, and the field name;
+            it's responsible for updating the parent container
+
+        Returns
+        -------
+        list[str]
+            Field expressions not found in the data, in the same order they were specified
+        """
+        if self._key_tree is not None:
+            missing: list[int] = []
+            self._apply_key_tree(self._key_tree, data, update_callback, missing)
+            return [self.fields[index] for index in sorted(missing)]
+
+        missing_fields: list[str] = []
+        for field, expression in zip(self.fields, self._expressions):
+            updated = 0
+
+            def counting_callback(field_value, fields, field_name):
+                nonlocal updated
+                updated += 1
+                return update_callback(field_value, fields, field_name)
+
+            expression.update(data, counting_callback)
+
+            # a second traversal only happens in the rare case nothing was updated, to confirm the field is missing
+            if not updated and not expression.find(data):
+                missing_fields.append(field)
+
+        return missing_fields
+
+    def _apply_key_tree(
+        self,
+        node: _KeyNode,
+        data: Any,
+        update_callback: Callable[[Any, dict, str], Any],
+        missing: list[int],
+    ) -> None:
+        for key, child in node.children.items():
+            if not isinstance(data, dict) or key not in data:
+                missing.extend(self._collect_field_indexes(child))
+            elif child.field_index is not None:
+                update_callback(data[key], data, key)
+            else:
+                self._apply_key_tree(child, data[key], update_callback, missing)
+
+    def _collect_field_indexes(self, node: _KeyNode) -> list[int]:
+        if node.field_index is not None:
+            return [node.field_index]
+
+        indexes: list[int] = []
+        for child in node.children.values():
+            indexes.extend(self._collect_field_indexes(child))
+        return indexes
+
+    def _build_key_tree(self) -> _KeyNode | None:
+        root = _KeyNode()
+
+        for index, expression in enumerate(self._expressions):
+            keys = self._extract_keys(expression)
+            if not keys:
+                return None
+
+            node = root
+            for key in keys:
+                # a field nested under another field would depend on the order actions are applied
+                if node.field_index is not None:
+                    return None
+                node = node.children.setdefault(key, _KeyNode())
+
+            # duplicated fields or fields with nested fields must be applied one at a time
+            if node.field_index is not None or node.children:
+                return None
+
+            node.field_index = index
+
+        return root
+
+    @classmethod
+    def _extract_keys(cls, expression: Any) -> list[str] | None:
+        """Return the list of keys for plain key paths like `a.b.c` or `$.a.b`, or None for any other expression"""
+        if isinstance(expression, Root):
+            return []
+
+        if isinstance(expression, Fields):
+            if len(expression.fields) == 1 and expression.fields[0] != "*":
+                return [expression.fields[0]]
+            return None
+
+        if isinstance(expression, Child):
+            left = cls._extract_keys(expression.left)
+            right = cls._extract_keys(expression.right)
+            if left is None or right is None:
+                return None
+            return left + right
+
+        return None
+
+
+def get_masking_plan(fields: Sequence[str]) -> MaskingPlan:
+    """
+    Retrieves a compiled MaskingPlan for the given fields from cache, or compiles and caches a new one.
+
+    Parameters
+    ----------
+    fields: Sequence[str]
+        Field expressions to compile
+
+    Returns
+    -------
+    MaskingPlan
+        The compiled masking plan
+    """
+    cache_key = tuple(fields)
+
+    plan = CACHE_MASKING_PLAN.get(cache_key)
+    if plan is None:
+        plan = MaskingPlan(fields)
+        CACHE_MASKING_PLAN[cache_key] = plan
+
+    return plan
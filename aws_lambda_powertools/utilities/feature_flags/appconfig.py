@@ -37,6 +37,7 @@ class AppConfigStore(StoreProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: AppConfigDataClient | None = None,
+        background_refresh: bool = False,
     ):
         """This class fetches JSON schemas from AWS AppConfig
 
@@ -64,6 +65,9 @@ class AppConfigStore(StoreProvider):
             Boto3 session to use for AWS API communication
         boto3_client : AppConfigDataClient, optional
             Boto3 AppConfigDataClient Client to use, boto3_session and boto_config will be ignored if both are provided
+        background_refresh: bool
+            Poll AppConfig in a background thread at the interval it returns, instead of when the configuration
+            expires while evaluating feature flags, by default False
         """
         super().__init__()
         self.logger = logger or logging.getLogger(__name__)
@@ -80,6 +84,7 @@ class AppConfigStore(StoreProvider):
             config=sdk_config or boto_config,
             boto3_client=boto3_client,
             boto3_session=boto3_session,
+            background_refresh=background_refresh,
         )
 
     @property
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, NamedTuple
+
+from aws_lambda_powertools.utilities.feature_flags import schema
+
+# time based rule actions have no user context. the context is the condition key
+TIME_BASED_ACTIONS = frozenset(
+    (
+        schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
+    ),
+)
+
+# actions checking whether context value(s) are contained in the condition value
+MEMBERSHIP_ACTIONS = frozenset(
+    (
+        schema.RuleAction.IN.value,
+        schema.RuleAction.NOT_IN.value,
+        schema.RuleAction.KEY_IN_VALUE.value,
+        schema.RuleAction.KEY_NOT_IN_VALUE.value,
+        schema.RuleAction.ALL_IN_VALUE.value,
+        schema.RuleAction.ANY_IN_VALUE.value,
+        schema.RuleAction.NONE_IN_VALUE.value,
+    ),
+)
+
+
+def _no_match(context_value: Any, condition_value: Any) -> bool:
+    return False
+
+
+class ValueSet:
+    """List of condition values with constant time membership checks.
+
+    Falls back to the original list when either the list items or the looked up value aren't hashable,
+    so results are always the same as checking membership against the list itself.
+    """
+
+    __slots__ = ("_values", "_lookup")
+
+    def __init__(self, values: list):
+        self._values = values
+        try:
+            self._lookup: frozenset | None = frozenset(values)
+        except TypeError:
+            self._lookup = None
+
+    def __contains__(self, item: Any) -> bool:
+        if self._lookup is not None:
+            try:
+                return item in self._lookup
+            except TypeError:
+                pass
+        return item in self._values
+
+    def __repr__(self) -> str:
+        return repr(self._values)
+
+
+class CompiledCondition(NamedTuple):
+    key: str
+    action: str
+    value: Any
+    match: Callable[[Any, Any], bool]
+    context_from_key: bool
+
+
+class CompiledRule(NamedTuple):
+    name: str
+    match_value: Any
+    conditions: tuple[CompiledCondition, ...]
+
+
+class CompiledFeature(NamedTuple):
+    name: str
+    default: Any
+    boolean_feature: bool
+    rules: tuple[CompiledRule, ...]
+
+
+def compile_condition(condition: dict[str, Any], actions: dict[str, Callable[[Any, Any], bool]]) -> CompiledCondition:
+    key = condition.get(schema.CONDITION_KEY, "")
+    action = condition.get(schema.CONDITION_ACTION, "")
+    value = condition.get(schema.CONDITION_VALUE)
+
+    if action in MEMBERSHIP_ACTIONS and isinstance(value, list):
+        value = ValueSet(value)
+
+    return CompiledCondition(
+        key=key,
+        action=action,
+        value=value,
+        match=actions.get(action, _no_match),
+        context_from_key=action in TIME_BASED_ACTIONS,
+    )
+
+
+def compile_features(
+    features: dict[str, Any],
+    actions: dict[str, Callable[[Any, Any], bool]],
+) -> dict[str, CompiledFeature]:
+    """Compile a validated feature flags schema into ready to evaluate features
+
+    Parameters
+    ----------
+    features: dict[str, Any]
+        Feature flags schema, already validated by `SchemaValidator`
+    actions: dict[str, Callable[[Any, Any], bool]]
+        Mapping of rule actions to their comparator, receiving context value and condition value
+
+    Returns
+    -------
+    dict[str, CompiledFeature]
+        Compiled features, in the same order they were defined in the schema
+    """
+    compiled: dict[str, CompiledFeature] = {}
+
+    for name, feature in features.items():
+        rules = feature.get(schema.RULES_KEY) or {}
+        compiled[name] = CompiledFeature(
+            name=name,
+            default=feature.get(schema.FEATURE_DEFAULT_VAL_KEY),
+            # backwards compatibility, assume feature flag
+            boolean_feature=feature.get(schema.FEATURE_DEFAULT_VAL_TYPE_KEY, True),
+            rules=tuple(
+                CompiledRule(
+                    name=rule_name,
+                    match_value=rule.get(schema.RULE_MATCH_VALUE),
+                    conditions=tuple(
+                        compile_condition(condition, actions) for condition in rule.get(schema.CONDITIONS_KEY) or []
+                    ),
+                )
+                for rule_name, rule in rules.items()
+            ),
+        )
+
+    return compiled
+
+
+def get_configuration_version(features: dict[str, Any]) -> str | None:
+    """Calculate a stable hash of the feature flags schema, or None if it can't be serialized"""
+    try:
+        payload = json.dumps(features, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha256(payload.encode()).hexdigest()
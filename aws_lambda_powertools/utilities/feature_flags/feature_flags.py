@@ -13,11 +13,17 @@ from aws_lambda_powertools.utilities.feature_flags.comparators import (
     compare_none_in_list,
     compare_time_range,
 )
+from aws_lambda_powertools.utilities.feature_flags.compiler import (
+    TIME_BASED_ACTIONS,
+    compile_features,
+    get_configuration_version,
+)
 from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.logging import Logger
     from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
+    from aws_lambda_powertools.utilities.feature_flags.compiler import CompiledFeature
     from aws_lambda_powertools.utilities.feature_flags.types import JSONType, P, T
 
 
@@ -47,7 +53,12 @@ RULE_ACTION_MAPPING = {
 
 
 class FeatureFlags:
-    def __init__(self, store: StoreProvider, logger: logging.Logger | Logger | None = None):
+    def __init__(
+        self,
+        store: StoreProvider,
+        logger: logging.Logger | Logger | None = None,
+        enable_compiled_rules: bool = False,
+    ):
         """Evaluates whether feature flags should be enabled based on a given context.
 
         It uses the provided store to fetch feature flag rules before evaluating them.
@@ -75,24 +86,35 @@ class FeatureFlags:
             Store to use to fetch feature flag schema configuration.
         logger: A logging object
             Used to log messages. If None is supplied, one will be created.
+        enable_compiled_rules: bool
+            Compile rules once per configuration version instead of interpreting the schema on every evaluation,
+            by default False. Schema validation and compilation only happen again when the configuration changes.
         """
         self.store = store
         self.logger = logger or logging.getLogger(__name__)
         self._exception_handlers: dict[Exception, Callable] = {}
+        self._enable_compiled_rules = enable_compiled_rules
+        self._compiled_features: dict[str, CompiledFeature] = {}
+        self._compiled_version: str | None = None
+        self._compiled_source: dict | None = None
+        self._validated_source: dict | None = None
 
     def _match_by_action(self, action: str, condition_value: Any, context_value: Any) -> bool:
         try:
             func = RULE_ACTION_MAPPING.get(action, lambda a, b: False)
             return func(context_value, condition_value)
         except Exception as exc:
-            self.logger.debug(f"caught exception while matching action: action={action}, exception={str(exc)}")
+            return self._handle_action_exception(action=action, exc=exc)
 
-            handler = self._lookup_exception_handler(exc)
-            if handler:
-                self.logger.debug("Exception handler found! Delegating response.")
-                return handler(exc)
+    def _handle_action_exception(self, action: str, exc: Exception) -> bool:
+        self.logger.debug(f"caught exception while matching action: action={action}, exception={str(exc)}")
 
-            return False
+        handler = self._lookup_exception_handler(exc)
+        if handler:
+            self.logger.debug("Exception handler found! Delegating response.")
+            return handler(exc)
+
+        return False
 
     def _evaluate_conditions(
         self,
@@ -118,11 +140,7 @@ class FeatureFlags:
             cond_value = condition.get(schema.CONDITION_VALUE)
 
             # time based rule actions have no user context. the context is the condition key
-            if cond_action in (
-                schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
-            ):
+            if cond_action in TIME_BASED_ACTIONS:
                 context_value = condition.get(schema.CONDITION_KEY)  # e.g., CURRENT_TIME
 
             if not self._match_by_action(action=cond_action, condition_value=cond_value, context_value=context_value):
@@ -207,11 +225,97 @@ class FeatureFlags:
         # parse result conf as JSON, keep in cache for max age defined in store
         self.logger.debug(f"Fetching schema from registered store, store={self.store}")
         config: dict = self.store.get_configuration()
-        validator = schema.SchemaValidator(schema=config, logger=self.logger)
-        validator.validate()
+
+        # stores return the same object while their configuration is unchanged, which was validated already
+        if config is not self._validated_source:
+            validator = schema.SchemaValidator(schema=config, logger=self.logger)
+            validator.validate()
+            self._validated_source = config
 
         return config
 
+    def _get_compiled_features(self) -> dict[str, CompiledFeature]:
+        """Get compiled features from configured store, validating and compiling only when configuration changes"""
+        config: dict = self.store.get_configuration()
+
+        # stores return the same object while their cache is valid, so there's no need to hash it again
+        if config is self._compiled_source:
+            return self._compiled_features
+
+        version = get_configuration_version(config)
+        if version is None or version != self._compiled_version:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Compiling feature flags rules, store={self.store}, version={version}")
+
+            validator = schema.SchemaValidator(schema=config, logger=self.logger)
+            validator.validate()
+
+            self._compiled_features = compile_features(config, actions=RULE_ACTION_MAPPING)
+            self._compiled_version = version
+
+        self._compiled_source = config
+        return self._compiled_features
+
+    def _evaluate_compiled(self, *, name: str, context: dict[str, Any], default: JSONType) -> JSONType:
+        try:
+            compiled_features = self._get_compiled_features()
+        except ConfigurationStoreError as err:
+            self.logger.debug(f"Failed to fetch feature flags from store, returning default provided, reason={err}")
+            return default
+
+        compiled_feature = compiled_features.get(name)
+        if compiled_feature is None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Feature not found; returning default provided, name={name}, default={default}")
+            return default
+
+        return self._evaluate_compiled_feature(compiled_feature, context)
+
+    def _evaluate_compiled_feature(self, feature: CompiledFeature, context: dict[str, Any]) -> Any:
+        """Evaluates compiled rules in order, returning the first matching rule value or the feature default"""
+        # Context might contain PII data; do not log its value
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        if not feature.rules:
+            if debug:
+                self.logger.debug(
+                    f"no rules found, returning feature default, name={feature.name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+                )
+            return bool(feature.default) if feature.boolean_feature else feature.default
+
+        for rule in feature.rules:
+            if not rule.conditions:
+                if debug:
+                    self.logger.debug(
+                        f"rule did not match, no conditions to match, rule_name={rule.name}, name={feature.name}",
+                    )
+                continue
+
+            for condition in rule.conditions:
+                context_value = condition.key if condition.context_from_key else context.get(condition.key)
+
+                try:
+                    matched = condition.match(context_value, condition.value)
+                except Exception as exc:
+                    matched = self._handle_action_exception(action=condition.action, exc=exc)
+
+                if not matched:
+                    if debug:
+                        self.logger.debug(
+                            f"rule did not match action, rule_name={rule.name}, name={feature.name}, action={condition.action}",  # noqa: E501
+                        )
+                    break
+            else:
+                if debug:
+                    self.logger.debug(f"rule matched, rule_name={rule.name}, name={feature.name}")
+                return bool(rule.match_value) if feature.boolean_feature else rule.match_value
+
+        if debug:
+            self.logger.debug(
+                f"no rule matched, returning feature default, default={str(feature.default)}, name={feature.name}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+            )
+        return feature.default
+
     def evaluate(self, *, name: str, context: dict[str, Any] | None = None, default: JSONType) -> JSONType:
         """Evaluate whether a feature flag should be enabled according to stored schema and input context
 
@@ -288,6 +392,9 @@ class FeatureFlags:
         if context is None:
             context = {}
 
+        if self._enable_compiled_rules:
+            return self._evaluate_compiled(name=name, context=context, default=default)
+
         try:
             features = self.get_configuration()
         except ConfigurationStoreError as err:
@@ -359,6 +466,20 @@ class FeatureFlags:
 
         features_enabled: list[str] = []
 
+        if self._enable_compiled_rules:
+            try:
+                compiled_features = self._get_compiled_features()
+            except ConfigurationStoreError as err:
+                self.logger.debug(f"Failed to fetch feature flags from store, returning empty list, reason={err}")
+                return features_enabled
+
+            # a feature is enabled when its calculated value is truthy, whether it has rules or not
+            return [
+                name
+                for name, compiled_feature in compiled_features.items()
+                if self._evaluate_compiled_feature(compiled_feature, context)
+            ]
+
         try:
             features: dict[str, Any] = self.get_configuration()
         except ConfigurationStoreError as err:
@@ -2,6 +2,9 @@
 Utility for adding idempotency to lambda functions
 """
 
+from aws_lambda_powertools.utilities.idempotency.batch import (
+    IdempotentBatchProcessor,
+)
 from aws_lambda_powertools.utilities.idempotency.hook import (
     IdempotentHookFunction,
 )
@@ -21,4 +24,5 @@ __all__ = (
     "idempotent_function",
     "IdempotencyConfig",
     "IdempotentHookFunction",
+    "IdempotentBatchProcessor",
 )
@@ -126,14 +126,39 @@ class IdempotencyHandler:
                 if i == MAX_RETRIES:
                     raise  # Bubble up when exceeded max tries
 
-    def _process_idempotency(self):
+    def handle_saved_inprogress(self, save_inprogress_error: Exception | None) -> Any:
+        """
+        Handle idempotent execution of a function whose in progress record was saved beforehand,
+        e.g. for every record in a batch with `save_inprogress_many`.
+
+        Parameters
+        ----------
+        save_inprogress_error: Exception | None
+            Exception raised saving the in progress record, or None when it was saved
+
+        Returns
+        -------
+        Any
+            Function response
+        """
         try:
-            # We call save_inprogress first as an optimization for the most common case where no idempotent record
-            # already exists. If it succeeds, there's no need to call get_record.
-            self.persistence_store.save_inprogress(
-                data=self.data,
-                remaining_time_in_millis=self._get_remaining_time_in_millis(),
-            )
+            return self._process_idempotency(saved_inprogress=True, save_inprogress_error=save_inprogress_error)
+        except IdempotencyInconsistentStateError:
+            # the record changed since it was saved, so we start over as any other invocation
+            return self.handle()
+
+    def _process_idempotency(self, saved_inprogress: bool = False, save_inprogress_error: Exception | None = None):
+        try:
+            if saved_inprogress:
+                if save_inprogress_error is not None:
+                    raise save_inprogress_error
+            else:
+                # We call save_inprogress first as an optimization for the most common case where no idempotent
+                # record already exists. If it succeeds, there's no need to call get_record.
+                self.persistence_store.save_inprogress(
+                    data=self.data,
+                    remaining_time_in_millis=self._get_remaining_time_in_millis(),
+                )
         except (IdempotencyKeyError, IdempotencyValidationError):
             raise
         except IdempotencyItemAlreadyExistsError as exc:
@@ -0,0 +1,243 @@
+"""
+Idempotent processing of batch records, claiming all records at once before processing them
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import warnings
+from typing import TYPE_CHECKING, Any, cast
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared.functions import strtobool
+from aws_lambda_powertools.utilities.batch.base import BatchProcessor
+from aws_lambda_powertools.utilities.idempotency.base import IdempotencyHandler
+from aws_lambda_powertools.utilities.idempotency.config import IdempotencyConfig
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.batch.base import EventType, RecordOutcome
+    from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
+    from aws_lambda_powertools.utilities.idempotency.persistence.base import (
+        BasePersistenceLayer,
+    )
+    from aws_lambda_powertools.utilities.idempotency.serialization.base import (
+        BaseIdempotencySerializer,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotentBatchProcessor(BatchProcessor):
+    """Process records from SQS, Kinesis Data Streams, and DynamoDB Streams idempotently, reporting partial failures.
+
+    In progress records for the whole batch are saved with a single call to the persistence layer
+    (`save_inprogress_many`), instead of one or two requests per record. Records already processed successfully
+    aren't processed again, and their saved result is used instead. Records in progress elsewhere, or failing
+    processing, are reported as batch item failures. Records sharing an idempotency key within the batch are
+    processed once, and the others get the same result or failure.
+
+    Example
+    -------
+
+    ## Process batch triggered by SQS idempotently
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+    from aws_lambda_powertools.utilities.batch import EventType
+    from aws_lambda_powertools.utilities.idempotency import (
+        DynamoDBPersistenceLayer,
+        IdempotencyConfig,
+        IdempotentBatchProcessor,
+    )
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+    persistence_layer = DynamoDBPersistenceLayer(table_name="IdempotencyTable")
+    config = IdempotencyConfig(event_key_jmespath="messageId")
+    processor = IdempotentBatchProcessor(event_type=EventType.SQS, persistence_store=persistence_layer, config=config)
+
+
+    def record_handler(record: SQSRecord):
+        return {"message": record.body}
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
+    Raises
+    ------
+    BatchProcessingError
+        When all batch records fail processing and raise_on_entire_batch_failure is True
+    """
+
+    def __init__(
+        self,
+        event_type: EventType,
+        persistence_store: BasePersistenceLayer,
+        config: IdempotencyConfig | None = None,
+        model: BatchTypeModels | None = None,
+        raise_on_entire_batch_failure: bool = True,
+        output_serializer: BaseIdempotencySerializer | None = None,
+    ):
+        """Process batch records idempotently, and partially report failed items
+
+        Parameters
+        ----------
+        event_type: EventType
+            Whether this is a SQS, DynamoDB Streams, or Kinesis Data Stream event
+        persistence_store: BasePersistenceLayer
+            Instance of BasePersistenceLayer to store idempotency records
+        config: IdempotencyConfig | None
+            Idempotency configuration, where `event_key_jmespath` selects the idempotency key from each record
+        model: BatchTypeModels | None
+            Parser's data model using either SqsRecordModel, DynamoDBStreamRecordModel, KinesisDataStreamRecord
+        raise_on_entire_batch_failure: bool
+            Raise an exception when the entire batch has failed processing.
+            When set to False, partial failures are reported in the response
+        output_serializer: BaseIdempotencySerializer | None
+            Serializer to transform the record handler result to and from a dictionary.
+            If not supplied, no serialization is done via the NoOpSerializer
+        """
+        self.persistence_store = persistence_store
+        self.config = config or IdempotencyConfig()
+        self.output_serializer = output_serializer
+
+        super().__init__(
+            event_type=event_type,
+            model=model,
+            raise_on_entire_batch_failure=raise_on_entire_batch_failure,
+        )
+
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record, after saving in progress records for the whole batch.
+        """
+        # Skip idempotency controls when POWERTOOLS_IDEMPOTENCY_DISABLED has a truthy value
+        # Raises a warning if not running in development mode
+        if strtobool(os.getenv(constants.IDEMPOTENCY_DISABLED_ENV, "false")):
+            warnings.warn(
+                message="Disabling idempotency is intended for development environments only "
+                "and should not be used in production.",
+                category=PowertoolsUserWarning,
+                stacklevel=2,
+            )
+            return super().process()
+
+        lambda_context = getattr(self, "lambda_context", None)
+        if lambda_context is not None:
+            self.config.register_lambda_context(lambda_context)
+
+        handlers: list[IdempotencyHandler | None] = [self._build_idempotency_handler(record) for record in self.records]
+
+        # Records sharing an idempotency key, e.g. delivered twice in the same batch, are claimed and processed once
+        first_with_key: dict[str, int] = {}
+        duplicate_of: dict[int, int] = {}
+        claimed: list[int] = []
+        for position, handler in enumerate(handlers):
+            if handler is None:
+                continue
+
+            idempotency_key = self._get_idempotency_key(handler)
+            if idempotency_key is not None:
+                if idempotency_key in first_with_key:
+                    duplicate_of[position] = first_with_key[idempotency_key]
+                    continue
+                first_with_key[idempotency_key] = position
+            claimed.append(position)
+
+        save_inprogress_errors: list[Exception | None] = []
+        if claimed:
+            claimed_handlers = [cast(IdempotencyHandler, handlers[position]) for position in claimed]
+            remaining_time_in_millis = claimed_handlers[0]._get_remaining_time_in_millis()
+            try:
+                save_inprogress_errors = self.persistence_store.save_inprogress_many(
+                    data=[handler.data for handler in claimed_handlers],
+                    remaining_time_in_millis=remaining_time_in_millis,
+                )
+            except Exception as exc:
+                # every record fails the same way it would have saving it on its own
+                save_inprogress_errors = [exc] * len(claimed_handlers)
+        errors_by_position = dict(zip(claimed, save_inprogress_errors))
+
+        results: list[tuple] = []
+        outcomes: dict[int, RecordOutcome] = {}
+        for position, (record, handler) in enumerate(zip(self.records, handlers)):
+            if handler is None:
+                # records failing to parse are reported as usual, without an idempotency record
+                results.append(self._process_record(record))
+                continue
+
+            if position in duplicate_of:
+                # duplicates get the result, or the failure, of the first record with the same idempotency key
+                _, result, exception = outcomes[duplicate_of[position]]
+                outcome: RecordOutcome = (self._get_record_data(handler), result, exception)
+            else:
+                outcome = self._execute_idempotent_record(handler, errors_by_position[position])
+                outcomes[position] = outcome
+
+            results.append(self._register_record_outcome(record, outcome))
+
+        return results
+
+    def _build_idempotency_handler(self, record: dict) -> IdempotencyHandler | None:
+        try:
+            data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
+        except Exception:
+            return None
+
+        function_kwargs: dict[str, Any] = {"record": data}
+        if self._handler_accepts_lambda_context:
+            function_kwargs["lambda_context"] = self.lambda_context
+
+        return IdempotencyHandler(
+            function=self.handler,
+            function_payload=data,
+            config=self.config,
+            persistence_store=self.persistence_store,
+            output_serializer=self.output_serializer,
+            function_args=(),
+            function_kwargs=function_kwargs,
+        )
+
+    def _get_idempotency_key(self, handler: IdempotencyHandler) -> str | None:
+        # Records without a valid idempotency key are reported when saving them, as with any other record
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                return self.persistence_store._get_hashed_idempotency_key(data=handler.data)
+            except Exception:
+                return None
+
+    @staticmethod
+    def _get_record_data(handler: IdempotencyHandler) -> Any:
+        return handler.fn_kwargs["record"] if handler.fn_kwargs else None
+
+    def _execute_idempotent_record(
+        self,
+        handler: IdempotencyHandler,
+        save_inprogress_error: Exception | None,
+    ) -> RecordOutcome:
+        """
+        Call instance's handler with a record unless it was already processed, capturing its result or exception
+
+        Parameters
+        ----------
+        handler: IdempotencyHandler
+            Idempotency handler for the record
+        save_inprogress_error: Exception | None
+            Exception raised saving the in progress record, or None when it was saved
+        """
+        data = self._get_record_data(handler)
+        try:
+            return data, handler.handle_saved_inprogress(save_inprogress_error=save_inprogress_error), None
+        except Exception:
+            return data, None, sys.exc_info()
@@ -11,7 +11,7 @@ import logging
 import os
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 import jmespath
 
@@ -292,6 +292,72 @@ class BasePersistenceLayer(ABC):
             If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
         """
 
+        data_record = self._build_inprogress_record(data=data, remaining_time_in_millis=remaining_time_in_millis)
+        if data_record is None:
+            return None
+
+        if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
+            raise IdempotencyItemAlreadyExistsError
+
+        self._put_record(data_record=data_record)
+
+    def save_inprogress_many(
+        self,
+        data: Sequence[dict[str, Any]],
+        remaining_time_in_millis: int | None = None,
+    ) -> list[Exception | None]:
+        """
+        Save records of many executions being in progress at once, e.g. for every record in a batch
+
+        Persistence layers supporting it save all records with as few requests as possible,
+        otherwise records are saved one by one.
+
+        Parameters
+        ----------
+        data: Sequence[dict[str, Any]]
+            Payloads
+        remaining_time_in_millis: int | None
+            If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
+
+        Returns
+        -------
+        list[Exception | None]
+            One result per payload, in the same order: None when the in progress record was saved (or the payload has
+            no idempotency key), otherwise the exception `save_inprogress` would raise for it,
+            e.g. `IdempotencyItemAlreadyExistsError` with the existing record when available.
+        """
+        results: list[Exception | None] = [None] * len(data)
+        data_records: list[DataRecord] = []
+        positions: list[int] = []
+
+        for position, payload in enumerate(data):
+            try:
+                data_record = self._build_inprogress_record(
+                    data=payload,
+                    remaining_time_in_millis=remaining_time_in_millis,
+                )
+                if data_record is None:
+                    continue
+
+                if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
+                    raise IdempotencyItemAlreadyExistsError
+            except Exception as exc:
+                results[position] = exc
+                continue
+
+            data_records.append(data_record)
+            positions.append(position)
+
+        for position, result in zip(positions, self._put_records(data_records=data_records)):
+            results[position] = result
+
+        return results
+
+    def _build_inprogress_record(
+        self,
+        data: dict[str, Any],
+        remaining_time_in_millis: int | None = None,
+    ) -> DataRecord | None:
         idempotency_key = self._get_hashed_idempotency_key(data=data)
         if idempotency_key is None:
             # If the idempotency key is None, no data will be saved in the Persistence Layer.
@@ -317,15 +383,12 @@ class BasePersistenceLayer(ABC):
             warnings.warn(
                 "Couldn't determine the remaining time left. "
                 "Did you call register_lambda_context on IdempotencyConfig?",
-                stacklevel=2,
+                stacklevel=3,
             )
 
         logger.debug(f"Saving in progress record for idempotency key: {data_record.idempotency_key}")
 
-        if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
-            raise IdempotencyItemAlreadyExistsError
-
-        self._put_record(data_record=data_record)
+        return data_record
 
     def delete_record(self, data: dict[str, Any], exception: Exception):
         """
@@ -431,6 +494,33 @@ class BasePersistenceLayer(ABC):
 
         raise NotImplementedError
 
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        """
+        Add many DataRecords to persistence store, as `_put_record` does for each of them.
+
+        Persistence layers able to save many records with fewer requests should override this method.
+
+        Parameters
+        ----------
+        data_records: list[DataRecord]
+            DataRecord instances
+
+        Returns
+        -------
+        list[Exception | None]
+            One result per DataRecord, in the same order: None when saved, or the exception raised saving it
+        """
+        results: list[Exception | None] = []
+        for data_record in data_records:
+            try:
+                self._put_record(data_record=data_record)
+            except Exception as exc:
+                results.append(exc)
+            else:
+                results.append(None)
+
+        return results
+
     @abstractmethod
     def _update_record(self, data_record: DataRecord) -> None:
         """
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import boto3
@@ -28,6 +29,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of keys in a single BatchGetItem request
+# See: https://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_BatchGetItem.html
+MAX_BATCH_GET_ITEM_KEYS = 100
+# Maximum number of conditional PutItem requests in flight when saving many records at once
+MAX_CONCURRENT_PUT_ITEM_REQUESTS = 10
+
 
 class DynamoDBPersistenceLayer(BasePersistenceLayer):
     def __init__(
@@ -122,6 +129,7 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
         )
 
         self._deserializer = TypeDeserializer()
+        self._executor: ThreadPoolExecutor | None = None
 
         super().__init__()
 
@@ -183,6 +191,19 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
         return self._item_to_data_record(item)
 
     def _put_record(self, data_record: DataRecord) -> None:
+        try:
+            self._put_item(data_record=data_record)
+        except IdempotencyItemAlreadyExistsError as exc:
+            if exc.old_data_record is not None:
+                self._validate_payload(data_payload=data_record, stored_data_record=exc.old_data_record)
+                self._save_to_cache(data_record=exc.old_data_record)
+            raise
+
+    def _put_item(self, data_record: DataRecord) -> None:
+        """
+        Save a record with a conditional write, raising IdempotencyItemAlreadyExistsError with the existing record
+        when it's returned. Neither validates its payload nor caches it, so it can be called from any thread.
+        """
         item = {
             # get simple or composite primary key
             **self._get_key(data_record.idempotency_key),
@@ -264,17 +285,89 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
                         f"expiry_timestamp: {old_data_record.expiry_timestamp}, "
                         f"and in_progress_expiry_timestamp: {old_data_record.in_progress_expiry_timestamp}",
                     )
-
-                    try:
-                        self._validate_payload(data_payload=data_record, stored_data_record=old_data_record)
-                        self._save_to_cache(data_record=old_data_record)
-                    except IdempotencyValidationError as idempotency_validation_error:
-                        raise idempotency_validation_error from exc
-
                     raise IdempotencyItemAlreadyExistsError(old_data_record=old_data_record) from exc
 
             raise
 
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        # DynamoDB has no conditional batch write, so records are claimed with concurrent conditional writes instead.
+        # Failed writes return the existing record when supported, otherwise existing records are retrieved
+        # in bulk afterwards, instead of with a GetItem each.
+        if len(data_records) > 1:
+            results = list(self._get_executor().map(self._claim_record, data_records))
+        else:
+            results = [self._claim_record(data_record) for data_record in data_records]
+
+        without_old_record = [
+            data_record.idempotency_key
+            for data_record, result in zip(data_records, results)
+            if isinstance(result, IdempotencyItemAlreadyExistsError) and result.old_data_record is None
+        ]
+        existing_records = self._batch_get_records(without_old_record) if without_old_record else {}
+
+        # Existing records are validated and cached from this thread, as the local cache isn't thread-safe
+        for position, (data_record, result) in enumerate(zip(data_records, results)):
+            if not isinstance(result, IdempotencyItemAlreadyExistsError):
+                continue
+
+            existing_record = result.old_data_record or existing_records.get(data_record.idempotency_key)
+            if existing_record is None:
+                continue
+
+            try:
+                self._validate_payload(data_payload=data_record, stored_data_record=existing_record)
+                self._save_to_cache(data_record=existing_record)
+            except IdempotencyValidationError as exc:
+                results[position] = exc
+            else:
+                results[position] = IdempotencyItemAlreadyExistsError(old_data_record=existing_record)
+
+        return results
+
+    def _claim_record(self, data_record: DataRecord) -> Exception | None:
+        try:
+            self._put_item(data_record=data_record)
+        except Exception as exc:
+            return exc
+
+        return None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Worker threads are kept across invocations, so warm invocations don't pay for creating them again
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_PUT_ITEM_REQUESTS,
+                thread_name_prefix="powertools-idempotency",
+            )
+
+        return self._executor
+
+    def _batch_get_records(self, idempotency_keys: list[str]) -> dict[str, DataRecord]:
+        """
+        Retrieve existing records for many idempotency keys with BatchGetItem, by idempotency key.
+
+        This is an optimization only: records that couldn't be retrieved (e.g. throttling, missing permissions)
+        are retrieved one by one as usual.
+        """
+        key_attr = self.sort_key_attr or self.key_attr
+        unique_keys = list(dict.fromkeys(idempotency_keys))  # BatchGetItem rejects duplicate keys
+
+        records: dict[str, DataRecord] = {}
+        for start in range(0, len(unique_keys), MAX_BATCH_GET_ITEM_KEYS):
+            keys = [self._get_key(key) for key in unique_keys[start : start + MAX_BATCH_GET_ITEM_KEYS]]
+            try:
+                response = self.client.batch_get_item(
+                    RequestItems={self.table_name: {"Keys": keys, "ConsistentRead": True}},
+                )
+            except ClientError as exc:
+                logger.debug(f"Failed to retrieve existing records in bulk, retrieving them one by one: {exc}")
+                return records
+
+            for item in response.get("Responses", {}).get(self.table_name, []):
+                records[item[key_attr]["S"]] = self._item_to_data_record(item)
+
+        return records
+
     @staticmethod
     def boto3_supports_condition_check_failure(boto3_version: str) -> bool:
         """
@@ -24,6 +24,15 @@ from aws_lambda_powertools.utilities.idempotency.persistence.base import (
 
 logger = logging.getLogger(__name__)
 
+# Saves an in progress record if the idempotency key doesn't exist, otherwise returns the existing record,
+# in a single round trip. KEYS[1]: idempotency key, ARGV[1]: encoded record, ARGV[2]: TTL in seconds
+PUT_IN_PROGRESS_RECORD_SCRIPT = """
+if redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2], "NX") then
+    return false
+end
+return redis.call("GET", KEYS[1])
+"""
+
 
 class RedisClientProtocol(Protocol):
     """
@@ -221,6 +230,7 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
         status_attr: str = "status",
         data_attr: str = "data",
         validation_key_attr: str = "validation",
+        enable_lua_script: bool = False,
     ):
         """
         Initialize the Redis Persistence Layer
@@ -256,6 +266,10 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             Redis json attribute name for response data, by default "data"
         validation_key_attr: str, optional
             Redis json attribute name for hashed representation of the parts of the event used for validation
+        enable_lua_script: bool, optional
+            Save in progress records with a Lua script, by default False. It saves the record or returns the existing
+            one in a single round trip, and saves records for many payloads at once with a pipeline
+            (`save_inprogress_many`). Requires a client supporting scripts and pipelines, e.g. `redis.Redis`
 
         Examples
         --------
@@ -313,6 +327,17 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
         super().__init__()
         self._orphan_lock_timeout = min(10, self.expires_after_seconds)
 
+        self._put_in_progress_script: Any = None
+        self._put_in_progress_script_loaded = False
+        if enable_lua_script:
+            # RedisClientProtocol doesn't include scripts and pipelines, as they're only needed here
+            script_client: Any = self.client
+            if not all(hasattr(script_client, method) for method in ("register_script", "script_load", "pipeline")):
+                raise IdempotencyPersistenceConfigError(
+                    "enable_lua_script requires a Redis client supporting register_script, script_load and pipeline",
+                )
+            self._put_in_progress_script = script_client.register_script(PUT_IN_PROGRESS_RECORD_SCRIPT)
+
     def _get_expiry_second(self, expiry_timestamp: int | None = None) -> int:
         """
         Calculates the number of seconds remaining until a specified expiry time
@@ -337,6 +362,9 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
         # See: https://redis.io/commands/get/
         response = self.client.get(idempotency_key)
 
+        return self._response_to_data_record(idempotency_key, response)
+
+    def _response_to_data_record(self, idempotency_key: str, response: Any) -> DataRecord:
         # key not found
         if not response:
             raise IdempotencyItemNotFoundError
@@ -356,22 +384,24 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
 
         return self._item_to_data_record(idempotency_key, item)
 
-    def _put_in_progress_record(self, data_record: DataRecord) -> None:
-        item: dict[str, Any] = {
-            "name": data_record.idempotency_key,
-            "mapping": {
-                self.status_attr: data_record.status,
-                self.expiry_attr: data_record.expiry_timestamp,
-            },
+    def _encode_in_progress_record(self, data_record: DataRecord) -> tuple[str, int]:
+        """Return the encoded in progress record, and its time-to-live (TTL) in seconds"""
+        mapping: dict[str, Any] = {
+            self.status_attr: data_record.status,
+            self.expiry_attr: data_record.expiry_timestamp,
         }
 
         if data_record.in_progress_expiry_timestamp is not None:
-            item["mapping"][self.in_progress_expiry_attr] = data_record.in_progress_expiry_timestamp
+            mapping[self.in_progress_expiry_attr] = data_record.in_progress_expiry_timestamp
 
         if self.payload_validation_enabled:
-            item["mapping"][self.validation_key_attr] = data_record.payload_hash
+            mapping[self.validation_key_attr] = data_record.payload_hash
+
+        return self._json_serializer(mapping), self._get_expiry_second(expiry_timestamp=data_record.expiry_timestamp)
+
+    def _put_in_progress_record(self, data_record: DataRecord) -> None:
+        encoded_item, ttl = self._encode_in_progress_record(data_record)
 
-        now = datetime.datetime.now()
         try:
             # |     LOCKED     |         RETRY if status = "INPROGRESS"                |     RETRY
             # |----------------|-------------------------------------------------------|-------------> .... (time)
@@ -387,32 +417,58 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             #    - SET see https://redis.io/commands/set/
 
             logger.debug(f"Putting record on Redis for idempotency key: {data_record.idempotency_key}")
-            encoded_item = self._json_serializer(item["mapping"])
-            ttl = self._get_expiry_second(expiry_timestamp=data_record.expiry_timestamp)
 
-            redis_response = self.client.set(name=data_record.idempotency_key, value=encoded_item, ex=ttl, nx=True)
+            if self._put_in_progress_script is not None:
+                # The script either saves the record and returns None, or returns the existing record,
+                # so we don't need another round trip to retrieve it.
+                response = self._put_in_progress_script(
+                    keys=[data_record.idempotency_key],
+                    args=[encoded_item, ttl],
+                )
+                if response is None:
+                    return
+            else:
+                redis_response = self.client.set(
+                    name=data_record.idempotency_key,
+                    value=encoded_item,
+                    ex=ttl,
+                    nx=True,
+                )
 
-            # If redis_response is True, the Redis SET operation was successful and the idempotency key was not
-            # previously set. This indicates that we can safely proceed to the handler execution phase.
-            # Most invocations should successfully proceed past this point.
-            if redis_response:
-                return
+                # If redis_response is True, the Redis SET operation was successful and the idempotency key was not
+                # previously set. This indicates that we can safely proceed to the handler execution phase.
+                # Most invocations should successfully proceed past this point.
+                if redis_response:
+                    return
+
+                # If redis_response is None, it indicates an existing record in Redis for the given idempotency key.
+                # We proceed to retrieve the record for further inspection.
+                # See: https://redis.io/commands/get/
+                response = self.client.get(data_record.idempotency_key)
+
+            self._handle_existing_record(data_record, response, encoded_item, ttl)
+        except (redis.exceptions.RedisError, redis.exceptions.RedisClusterException) as e:
+            raise e
+        except Exception as e:
+            logger.debug(f"encountered non-Redis exception: {e}")
+            raise e
 
-            # If redis_response is None, it indicates an existing record in Redis for the given idempotency key.
-            # This could be due to:
+    def _handle_existing_record(self, data_record: DataRecord, response: Any, encoded_item: str, ttl: int) -> None:
+        """Raise for an existing record still valid, or overwrite it when it's an orphan record"""
+        now = datetime.datetime.now()
+        try:
+            # An existing record in Redis for the given idempotency key could be due to:
             # - An active idempotency record from a previous invocation that has not yet expired.
             # - An orphan record where a previous invocation has timed out.
             # - An expired idempotency record that has not been deleted by Redis.
-            # In any case, we proceed to retrieve the record for further inspection.
-
-            idempotency_record = self._get_record(data_record.idempotency_key)
+            idempotency_record = self._response_to_data_record(data_record.idempotency_key, response)
 
             # If the status of the idempotency record is 'COMPLETED' and the record has not expired
             # (i.e., the expiry timestamp is greater than the current timestamp), then a valid completed
             # record exists. We raise an error to prevent duplicate processing of a request that has already
             # been completed successfully.
             if idempotency_record.status == STATUS_CONSTANTS["COMPLETED"] and not idempotency_record.is_expired:
-                raise IdempotencyItemAlreadyExistsError
+                self._raise_item_already_exists(data_record, idempotency_record)
 
             # If the idempotency record has a status of 'INPROGRESS' and has a valid in_progress_expiry_timestamp
             # (meaning the timestamp is greater than the current timestamp in milliseconds), then we have encountered
@@ -423,7 +479,7 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
                 and idempotency_record.in_progress_expiry_timestamp
                 and idempotency_record.in_progress_expiry_timestamp > int(now.timestamp() * 1000)
             ):
-                raise IdempotencyItemAlreadyExistsError
+                self._raise_item_already_exists(data_record, idempotency_record)
 
             # Reaching this point indicates that the idempotency record found is an orphan record. An orphan record is
             # one that is neither completed nor in-progress within its expected time frame. It may result from a
@@ -436,17 +492,113 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             # The purpose of acquiring the lock is to prevent race conditions with other processes that might
             # also be trying to handle the same orphan record. Once the lock is acquired, we set a new value
             # for the idempotency record in Redis with the appropriate time-to-live (TTL).
-            with self._acquire_lock(name=item["name"]):
-                self.client.set(name=item["name"], value=encoded_item, ex=ttl)
+            with self._acquire_lock(name=data_record.idempotency_key):
+                self.client.set(name=data_record.idempotency_key, value=encoded_item, ex=ttl)
 
             # Not removing the lock here serves as a safeguard against race conditions,
             # preventing another operation from mistakenly treating this record as an orphan while the
             # current operation is still in progress.
-        except (redis.exceptions.RedisError, redis.exceptions.RedisClusterException) as e:
-            raise e
-        except Exception as e:
-            logger.debug(f"encountered non-Redis exception: {e}")
-            raise e
+
+    def _raise_item_already_exists(self, data_record: DataRecord, idempotency_record: DataRecord) -> None:
+        logger.debug(
+            f"Failed to put record for already existing idempotency key: "
+            f"{data_record.idempotency_key} with status: {idempotency_record.status}, "
+            f"expiry_timestamp: {idempotency_record.expiry_timestamp}, "
+            f"and in_progress_expiry_timestamp: {idempotency_record.in_progress_expiry_timestamp}",
+        )
+
+        # The existing record is returned with the error, so it doesn't need to be retrieved again
+        self._validate_payload(data_payload=data_record, stored_data_record=idempotency_record)
+        self._save_to_cache(data_record=idempotency_record)
+
+        raise IdempotencyItemAlreadyExistsError(old_data_record=idempotency_record)
+
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        if self._put_in_progress_script is None and not hasattr(self.client, "pipeline"):
+            return super()._put_records(data_records=data_records)
+
+        encoded_records = [self._encode_in_progress_record(data_record) for data_record in data_records]
+        if self._put_in_progress_script is not None:
+            responses = self._execute_put_in_progress_pipeline(data_records, encoded_records)
+        else:
+            responses = self._execute_set_and_get_pipeline(data_records, encoded_records)
+
+        results: list[Exception | None] = []
+        for data_record, (encoded_item, ttl), response in zip(data_records, encoded_records, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                if response is not None:
+                    self._handle_existing_record(data_record, response, encoded_item, ttl)
+            except Exception as exc:
+                results.append(exc)
+            else:
+                results.append(None)
+
+        return results
+
+    def _execute_put_in_progress_pipeline(
+        self,
+        data_records: list[DataRecord],
+        encoded_records: list[tuple[str, int]],
+    ) -> list[Any]:
+        """Run the put in progress script for all records in a single round trip, once the script is loaded"""
+        script = self._put_in_progress_script
+        client: Any = self.client  # supports scripts and pipelines, checked when enabling the Lua script
+
+        if not self._put_in_progress_script_loaded:
+            client.script_load(script.script)
+            self._put_in_progress_script_loaded = True
+
+        responses: list[Any] = []
+        # the script cache is emptied when Redis restarts, so we load it again and retry once
+        for _ in range(2):
+            pipeline = client.pipeline(transaction=False)
+            for data_record, (encoded_item, ttl) in zip(data_records, encoded_records):
+                pipeline.evalsha(script.sha, 1, data_record.idempotency_key, encoded_item, ttl)
+
+            responses = pipeline.execute(raise_on_error=False)
+            if not any(isinstance(response, redis.exceptions.NoScriptError) for response in responses):
+                break
+
+            logger.debug("Put in progress script not found in Redis script cache, loading it again")
+            client.script_load(script.script)
+
+        return responses
+
+    def _execute_set_and_get_pipeline(
+        self,
+        data_records: list[DataRecord],
+        encoded_records: list[tuple[str, int]],
+    ) -> list[Any]:
+        """
+        SET NX each record, followed by a GET of the same key, for all records in a single round trip.
+
+        Responses match the put in progress script: None when the record was saved, or the existing record.
+        """
+        client: Any = self.client  # pipeline isn't part of RedisClientProtocol, checked before calling this
+
+        pipeline = client.pipeline(transaction=False)
+        for data_record, (encoded_item, ttl) in zip(data_records, encoded_records):
+            pipeline.set(name=data_record.idempotency_key, value=encoded_item, ex=ttl, nx=True)
+            pipeline.get(data_record.idempotency_key)
+
+        responses = pipeline.execute(raise_on_error=False)
+
+        results: list[Any] = []
+        for set_response, get_response in zip(responses[::2], responses[1::2]):
+            if isinstance(set_response, Exception):
+                results.append(set_response)
+            elif set_response:
+                # the record was saved, so the GET returned it and there's nothing to handle
+                results.append(None)
+            elif get_response is None:
+                # the existing record expired in between, which fails the same way as SET and GET one at a time
+                results.append(IdempotencyItemNotFoundError())
+            else:
+                results.append(get_response)
+
+        return results
 
     @contextmanager
     def _acquire_lock(self, name: str):
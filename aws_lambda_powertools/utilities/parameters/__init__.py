@@ -4,15 +4,17 @@ Parameter retrieval and caching utility
 
 from .appconfig import AppConfigProvider, get_app_config
 from .base import BaseProvider, clear_caches
+from .cache import ParameterCache
 from .dynamodb import DynamoDBProvider
 from .exceptions import GetParameterError, TransformParameterError
-from .secrets import SecretsProvider, get_secret, set_secret
+from .secrets import SecretsProvider, get_secret, get_secrets_by_name, set_secret
 from .ssm import SSMProvider, get_parameter, get_parameters, get_parameters_by_name, set_parameter
 
 __all__ = [
     "AppConfigProvider",
     "BaseProvider",
     "GetParameterError",
+    "ParameterCache",
     "DynamoDBProvider",
     "SecretsProvider",
     "SSMProvider",
@@ -23,6 +25,7 @@ __all__ = [
     "get_parameters",
     "get_parameters_by_name",
     "get_secret",
+    "get_secrets_by_name",
     "set_secret",
     "clear_caches",
 ]
@@ -4,9 +4,12 @@ AWS App Config configuration retrieval and caching utility
 
 from __future__ import annotations
 
+import logging
 import os
+import threading
 import warnings
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
 import boto3
 
@@ -17,14 +20,18 @@ from aws_lambda_powertools.shared.functions import (
 )
 from aws_lambda_powertools.utilities.parameters.base import BaseProvider
 from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS
+from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_appconfigdata.client import AppConfigDataClient
 
+    from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue, ParameterCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
+logger = logging.getLogger(__name__)
+
 
 class AppConfigProvider(BaseProvider):
     """
@@ -42,6 +49,23 @@ class AppConfigProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: AppConfigDataClient, optional
             Boto3 AppConfigData Client to use, boto3_session will be ignored if both are provided
+    stale_while_revalidate: int, optional
+        Number of seconds an expired value is still served while it's refreshed in the background, disabled by default
+    max_age_jitter: float, optional
+        Fraction of `max_age` by which cached values randomly expire earlier, to spread their refreshes over time
+    cache: ParameterCache, optional
+        Cache of parameter values, e.g. bounded to a number of values or to a memory size. Unbounded by default
+    background_refresh: bool, optional
+        Poll each configuration again in a background thread once the poll interval returned by AppConfig has
+        elapsed, instead of when it expires on the request path. Values are then cached until they've missed a poll,
+        and for no less than this interval. Configurations are no longer polled once they haven't been read since
+        their last poll, or after 3 consecutive failed polls, until they're fetched again on the request path.
+        Ignored for values that aren't cached, i.e. with `max_age=0`. Disabled by default
+
+    Note
+    ----
+    AppConfig returns an empty configuration when it hasn't changed since the last poll. The value transformed from
+    it is then kept as is, so it's neither transformed again nor a different object.
 
     Example
     -------
@@ -71,6 +95,9 @@ class AppConfigProvider(BaseProvider):
 
     """
 
+    # Consecutive failed polls after which a configuration is no longer polled in the background
+    MAX_FAILED_POLLS = 3
+
     def __init__(
         self,
         environment: str,
@@ -79,6 +106,10 @@ class AppConfigProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: AppConfigDataClient | None = None,
+        stale_while_revalidate: int = 0,
+        max_age_jitter: float = 0.0,
+        cache: ParameterCache | None = None,
+        background_refresh: bool = False,
     ):
         """
         Initialize the App Config client
@@ -110,8 +141,26 @@ class AppConfigProvider(BaseProvider):
         self._next_token: dict[str, str] = {}  # nosec - token for get_latest_configuration executions
         # Dict to store the recently retrieved value for a specific configuration.
         self.last_returned_value: dict[str, bytes] = {}
-
-        super().__init__(client=self.client)
+        # Tokens can only be used once, so configurations aren't polled concurrently
+        self._session_lock = threading.Lock()
+        # Minimum number of seconds to wait before polling a configuration again, as returned by AppConfig
+        self._poll_intervals: dict[str, int] = {}
+        # Last value returned for each key, along with the raw value it was transformed from
+        self._last_transformed: dict[tuple, tuple[bytes, Any]] = {}
+
+        self.background_refresh = background_refresh
+        self._poll_timers: dict[tuple, threading.Timer] = {}
+        # Number of consecutive failed polls of each key
+        self._failed_polls: dict[tuple, int] = {}
+        # Keys read since their last poll
+        self._read_since_poll: set[tuple] = set()
+
+        super().__init__(
+            client=self.client,
+            stale_while_revalidate=stale_while_revalidate,
+            max_age_jitter=max_age_jitter,
+            cache=cache,
+        )
 
     def _get(self, name: str, **sdk_options) -> bytes:
         """
@@ -124,19 +173,23 @@ class AppConfigProvider(BaseProvider):
         sdk_options: dict, optional
             SDK options to propagate to `start_configuration_session` API call
         """
-        if name not in self._next_token:
-            sdk_options["ConfigurationProfileIdentifier"] = name
-            sdk_options["ApplicationIdentifier"] = self.application
-            sdk_options["EnvironmentIdentifier"] = self.environment
-            response_configuration = self.client.start_configuration_session(**sdk_options)
-            self._next_token[name] = response_configuration["InitialConfigurationToken"]
-
-        # The new AppConfig APIs require two API calls to return the configuration
-        # First we start the session and after that we retrieve the configuration
-        # We need to store the token to use in the next execution
-        response = self.client.get_latest_configuration(ConfigurationToken=self._next_token[name])
-        return_value = response["Configuration"].read()
-        self._next_token[name] = response["NextPollConfigurationToken"]
+        with self._session_lock:
+            if name not in self._next_token:
+                sdk_options["ConfigurationProfileIdentifier"] = name
+                sdk_options["ApplicationIdentifier"] = self.application
+                sdk_options["EnvironmentIdentifier"] = self.environment
+                response_configuration = self.client.start_configuration_session(**sdk_options)
+                self._next_token[name] = response_configuration["InitialConfigurationToken"]
+
+            # The new AppConfig APIs require two API calls to return the configuration
+            # First we start the session and after that we retrieve the configuration
+            # We need to store the token to use in the next execution
+            response = self.client.get_latest_configuration(ConfigurationToken=self._next_token[name])
+            return_value = response["Configuration"].read()
+            self._next_token[name] = response["NextPollConfigurationToken"]
+
+        if "NextPollIntervalInSeconds" in response:
+            self._poll_intervals[name] = response["NextPollIntervalInSeconds"]
 
         # The return of get_latest_configuration can be null because this value is supposed to be cached
         # on the customer side.
@@ -147,6 +200,147 @@ class AppConfigProvider(BaseProvider):
 
         return self.last_returned_value[name]
 
+    def _get_from_cache(
+        self,
+        name: str,
+        key: tuple,
+        transform: TransformOptions = None,
+        is_nested: bool = False,
+        raise_on_transform_error: bool = True,
+    ) -> ExpirableValue | None:
+        if self.background_refresh:
+            self._read_since_poll.add(key)
+        return super()._get_from_cache(name, key, transform, is_nested, raise_on_transform_error)
+
+    def _fetch(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        sdk_options: dict[str, Any],
+    ) -> str | bytes | dict | None:
+        """
+        Poll a configuration, then schedule its next poll when refreshing it in the background
+        """
+        if not self.background_refresh or max_age <= 0:
+            return self._poll(name, key, max_age, transform, sdk_options)
+
+        # Fetching a configuration on the request path reads it too
+        self._read_since_poll.add(key)
+        return self._poll_and_schedule(name, key, max_age, transform, sdk_options)
+
+    def _poll_and_schedule(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        sdk_options: dict[str, Any],
+    ) -> str | bytes | dict | None:
+        """
+        Poll a configuration, then schedule its next poll unless it failed too many times in a row
+        """
+        poll = partial(self._poll_and_schedule, name, key, max_age, transform, sdk_options)
+        try:
+            value = self._poll(name, key, max_age, transform, sdk_options)
+        except Exception:
+            self._failed_polls[key] = self._failed_polls.get(key, 0) + 1
+            if self._failed_polls[key] < self.MAX_FAILED_POLLS:
+                self._schedule_poll(key, interval=self._poll_intervals.get(name, max_age), fetch=poll)
+            else:
+                logger.warning("Stopped polling configuration %s after %d failed polls", name, self._failed_polls[key])
+                self._cancel_poll(key)
+            raise
+
+        self._failed_polls.pop(key, None)
+        self._schedule_poll(key, interval=self._poll_intervals.get(name, max_age), fetch=poll)
+        return value
+
+    def _poll(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        sdk_options: dict[str, Any],
+    ) -> str | bytes | dict | None:
+        """
+        Poll a configuration, keeping the value transformed from it when it's unchanged
+        """
+        try:
+            value = self._get(name, **sdk_options)
+        # Encapsulate all errors into a generic GetParameterError
+        except Exception as exc:
+            raise GetParameterError(str(exc))
+
+        ttl = max_age
+        if self.background_refresh and max_age > 0:
+            # Values must outlive the next poll, or invocations would poll too while it's in flight
+            ttl = max(max_age, 2 * self._poll_intervals.get(name, max_age))
+
+        # An empty configuration means it's unchanged, and _get returns the very same raw value again
+        last_raw, last_transformed = self._last_transformed.get(key, (None, None))
+        if last_raw is value and last_transformed is not None:
+            if transform:
+                self.add_to_cache(key=self._build_cache_key(name=name), value=value, max_age=ttl)
+            self.add_to_cache(key=key, value=last_transformed, max_age=ttl)
+            return last_transformed
+
+        transformed = self._transform_and_cache(name, key, ttl, transform, value)
+        self._last_transformed[key] = (value, transformed)
+        return transformed
+
+    def _schedule_poll(self, key: tuple, interval: int, fetch: Callable[[], Any]) -> None:
+        # Polling continuously isn't a refresh strategy
+        if interval <= 0:
+            return
+
+        timer = threading.Timer(interval, self._run_scheduled_poll, args=(key, fetch))
+        # Pending polls must not keep the interpreter alive
+        timer.daemon = True
+
+        with self._refresh_lock:
+            previous = self._poll_timers.pop(key, None)
+            if previous is not None:
+                previous.cancel()
+            self._poll_timers[key] = timer
+        timer.start()
+
+    def _run_scheduled_poll(self, key: tuple, fetch: Callable[[], Any]) -> None:
+        # Configurations no longer read aren't worth polling, they're fetched again on the request path instead
+        with self._refresh_lock:
+            read = key in self._read_since_poll
+            self._read_since_poll.discard(key)
+        if not read:
+            self._cancel_poll(key)
+            return
+
+        self._refresh_in_background(key, fetch)
+
+    def _cancel_poll(self, key: tuple) -> None:
+        with self._refresh_lock:
+            timer = self._poll_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+    def stop_background_refresh(self) -> None:
+        """
+        Cancel the polls scheduled for every configuration, until they're fetched again on the request path
+        """
+        with self._refresh_lock:
+            timers = list(self._poll_timers.values())
+            self._poll_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        self._failed_polls.clear()
+        self._read_since_poll.clear()
+
+    def clear_cache(self):
+        self.stop_background_refresh()
+        self._last_transformed.clear()
+        super().clear_cache()
+
     def _get_multiple(self, path: str, **sdk_options) -> dict[str, str]:
         """
         Retrieving multiple parameter values is not supported with AWS App Config Provider
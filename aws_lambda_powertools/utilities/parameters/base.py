@@ -4,13 +4,19 @@ Base for Parameter providers
 
 from __future__ import annotations
 
+import logging
 import os
+import random
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, cast, overload
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, cast, overload
 
 from aws_lambda_powertools.shared import constants, user_agent
 from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.utilities.parameters.cache import CacheStats, ExpirableValue, ParameterCache
 from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, TransformParameterError
 
 if TYPE_CHECKING:
@@ -18,37 +24,118 @@ if TYPE_CHECKING:
 
 
 from aws_lambda_powertools.utilities.parameters.constants import (
+    CACHE_SWEEP_INTERVAL_SECS,
     DEFAULT_MAX_AGE_SECS,
     DEFAULT_PROVIDERS,
+    MAX_REFRESH_WORKERS,
     TRANSFORM_METHOD_MAPPING,
 )
 
-
-class ExpirableValue(NamedTuple):
-    value: str | bytes | dict[str, Any]
-    ttl: datetime
+logger = logging.getLogger(__name__)
 
 
 class BaseProvider(ABC):
     """
     Abstract Base Class for Parameter providers
+
+    Parameters
+    ----------
+    stale_while_revalidate: int, optional
+        Number of seconds an expired value is still served from cache while it's refreshed in a background
+        thread, so that invocations hitting the expiry don't wait for the underlying API call. Disabled by default
+    max_age_jitter: float, optional
+        Fraction of `max_age` by which the expiry of each cached value is randomly shortened, e.g. with 0.1
+        values expire between 90% and 100% of `max_age`, so that parameters fetched together aren't refreshed together
+    cache: ParameterCache, optional
+        Cache of parameter values, e.g. bounded to a number of values or to a memory size. Unbounded by default
     """
 
-    store: dict[tuple, ExpirableValue]
+    store: ParameterCache
 
-    def __init__(self, *, client=None, resource=None):
+    def __init__(
+        self,
+        *,
+        client=None,
+        resource=None,
+        stale_while_revalidate: int = 0,
+        max_age_jitter: float = 0.0,
+        cache: ParameterCache | None = None,
+    ):
         """
         Initialize the base provider
         """
+        if stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must be greater than or equal to 0")
+        if not 0 <= max_age_jitter < 1:
+            raise ValueError("max_age_jitter must be between 0 and 1")
+
         if client is not None:
             user_agent.register_feature_to_client(client=client, feature="parameters")
         if resource is not None:
             user_agent.register_feature_to_resource(resource=resource, feature="parameters")
 
-        self.store: dict[tuple, ExpirableValue] = {}
+        self.store = cache if cache is not None else ParameterCache()
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_age_jitter = max_age_jitter
+        self._next_sweep = datetime.now() + timedelta(seconds=CACHE_SWEEP_INTERVAL_SECS)
+
+        # Background refreshes in flight, by cache key, so that a value is only refreshed once at a time
+        self._pending_refreshes: dict[tuple, Future] = {}
+        self._refresh_lock = threading.Lock()
+        # Created on first use, as most providers never serve stale values nor prefetch
+        self._refresh_executor: ThreadPoolExecutor | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of cache hits, misses, stale serves, background refreshes and evictions"""
+        return self.store.stats
 
     def has_not_expired_in_cache(self, key: tuple) -> bool:
-        return key in self.store and self.store[key].ttl >= datetime.now()
+        cached = self.store.get(key)
+        return cached is not None and cached.ttl >= datetime.now()
+
+    def can_serve_stale(self, key: tuple) -> bool:
+        """Whether an expired value can still be served while it's refreshed in the background"""
+        cached = self.store.get(key)
+        return cached is not None and self._is_within_stale_window(cached)
+
+    def _is_within_stale_window(self, cached: ExpirableValue) -> bool:
+        return bool(self.stale_while_revalidate) and (
+            cached.ttl + timedelta(seconds=self.stale_while_revalidate) >= datetime.now()
+        )
+
+    def _get_from_cache(
+        self,
+        name: str,
+        key: tuple,
+        transform: TransformOptions = None,
+        is_nested: bool = False,
+        raise_on_transform_error: bool = True,
+    ) -> ExpirableValue | None:
+        """
+        Cached value, possibly expired, or a transformed view of the cached raw value expiring along with it
+        """
+        cached = self.store.get(key)
+        if not transform or (cached is not None and cached.ttl >= datetime.now()):
+            return cached
+
+        raw = self.store.get(self._build_cache_key(name=name, is_nested=is_nested))
+        if raw is None or raw.ttl < datetime.now():
+            return cached
+
+        value: str | bytes | dict[str, Any] | None
+        if is_nested:
+            values = cast(dict, raw.value)
+            value = {**values, **transform_value(values, transform, raise_on_transform_error)}
+        else:
+            value = transform_value(key=name, value=raw.value, transform=transform, raise_on_transform_error=True)
+
+        if value is None:
+            return cached
+
+        view = ExpirableValue(value, raw.ttl)
+        self.store[key] = view
+        return view
 
     def get(
         self,
@@ -85,38 +172,69 @@ class BaseProvider(ABC):
             When the parameter provider fails to transform a parameter value.
         """
 
-        # If there are multiple calls to the same parameter but in a different
-        # transform, they will be stored multiple times. This allows us to
-        # optimize by transforming the data only once per retrieval, thus there
-        # is no need to transform cached values multiple times. However, this
-        # means that we need to make multiple calls to the underlying parameter
-        # store if we need to return it in different transforms. Since the number
-        # of supported transform is small and the probability that a given
-        # parameter will always be used in a specific transform, this should be
-        # an acceptable tradeoff.
-        value: str | bytes | dict | None = None
+        # The raw value of a parameter is cached once, and each transformed value is cached separately.
+        # Getting a parameter in another transform transforms the cached raw value, rather than
+        # calling the underlying parameter store again, and values are only transformed once per retrieval.
         key = self._build_cache_key(name=name, transform=transform)
 
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
 
-        if not force_fetch and self.has_not_expired_in_cache(key):
-            return self.fetch_from_cache(key)
+        cached = None if force_fetch else self._get_from_cache(name=name, key=key, transform=transform)
+
+        if cached is not None and cached.ttl >= datetime.now():
+            self.stats.increment("hits")
+            return cached.value
+
+        if cached is not None and self._is_within_stale_window(cached):
+            self.stats.increment("stale_serves")
+            self._refresh_in_background(key, partial(self._fetch, name, key, max_age, transform, sdk_options))
+            return cached.value
+
+        self.stats.increment("misses")
+        return self._fetch(name, key, max_age, transform, sdk_options)
 
+    def _fetch(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        sdk_options: dict[str, Any],
+    ) -> str | bytes | dict | None:
+        """
+        Retrieve a parameter value from the underlying parameter store, transform and cache it
+        """
         try:
             value = self._get(name, **sdk_options)
         # Encapsulate all errors into a generic GetParameterError
         except Exception as exc:
             raise GetParameterError(str(exc))
 
+        return self._transform_and_cache(name, key, max_age, transform, value)
+
+    def _transform_and_cache(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        value: str | bytes | dict[str, Any],
+    ) -> str | bytes | dict | None:
+        """
+        Transform a parameter value retrieved from the underlying parameter store, and cache it
+        """
+        transformed: str | bytes | dict | None = value
         if transform:
-            value = transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
+            # Shared with other transforms of the same parameter
+            self.add_to_cache(key=self._build_cache_key(name=name), value=value, max_age=max_age)
+            transformed = transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
 
         # NOTE: don't cache None, as they might've been failed transforms and may be corrected
-        if value is not None:
-            self.add_to_cache(key=key, value=value, max_age=max_age)
+        if transformed is not None:
+            self.add_to_cache(key=key, value=transformed, max_age=max_age)
 
-        return value
+        return transformed
 
     @abstractmethod
     def _get(self, name: str, **sdk_options) -> str | bytes | dict[str, Any]:
@@ -174,9 +292,45 @@ class BaseProvider(ABC):
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
 
-        if not force_fetch and self.has_not_expired_in_cache(key):
-            return self.fetch_from_cache(key)
-
+        cached = (
+            None
+            if force_fetch
+            else self._get_from_cache(
+                name=path,
+                key=key,
+                transform=transform,
+                is_nested=True,
+                raise_on_transform_error=raise_on_transform_error,
+            )
+        )
+
+        if cached is not None and cached.ttl >= datetime.now():
+            self.stats.increment("hits")
+            return cached.value  # type: ignore[return-value]
+
+        if cached is not None and self._is_within_stale_window(cached):
+            self.stats.increment("stale_serves")
+            self._refresh_in_background(
+                key,
+                partial(self._fetch_multiple, path, key, max_age, transform, raise_on_transform_error, sdk_options),
+            )
+            return cached.value  # type: ignore[return-value]
+
+        self.stats.increment("misses")
+        return self._fetch_multiple(path, key, max_age, transform, raise_on_transform_error, sdk_options)
+
+    def _fetch_multiple(
+        self,
+        path: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        raise_on_transform_error: bool,
+        sdk_options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Retrieve multiple parameter values from the underlying parameter store, transform and cache them
+        """
         try:
             values = self._get_multiple(path, **sdk_options)
         # Encapsulate all errors into a generic GetParameterError
@@ -184,7 +338,9 @@ class BaseProvider(ABC):
             raise GetParameterError(str(exc))
 
         if transform:
-            values.update(transform_value(values, transform, raise_on_transform_error))
+            # Shared with other transforms of the same path, so it's transformed into a new dict
+            self.add_to_cache(key=self._build_cache_key(name=path, is_nested=True), value=values, max_age=max_age)
+            values = {**values, **transform_value(values, transform, raise_on_transform_error)}
 
         self.add_to_cache(key=key, value=values, max_age=max_age)
 
@@ -197,6 +353,85 @@ class BaseProvider(ABC):
         """
         raise NotImplementedError()
 
+    def prefetch(
+        self,
+        names: Iterable[str],
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        **sdk_options,
+    ) -> dict[str, Any]:
+        """
+        Retrieve and cache parameter values concurrently, e.g. during the init phase, so that
+        invocations are served from cache
+
+        Values already cached and not expired aren't retrieved again.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            Parameter names
+        max_age: int, optional
+            Maximum age of the cached values
+        transform: str, optional
+            Optional transformation of the parameter values. Supported values
+            are "json" for JSON strings, "binary" for base 64 encoded
+            values or "auto" which looks at the name to determine the type.
+        sdk_options: dict, optional
+            Arguments that will be passed to `get`, e.g. `decrypt=True` for SSM, or directly to the underlying API call
+
+        Returns
+        -------
+        dict[str, Any]
+            Parameter values, by name
+
+        Raises
+        ------
+        GetParameterError
+            When the parameter provider fails to retrieve a parameter value for
+            a given name.
+        TransformParameterError
+            When the parameter provider fails to transform a parameter value.
+        """
+        executor = self._get_refresh_executor()
+        futures = {
+            name: executor.submit(self.get, name, max_age=max_age, transform=transform, **sdk_options)
+            for name in dict.fromkeys(names)
+        }
+
+        return {name: future.result() for name, future in futures.items()}
+
+    def _get_refresh_executor(self) -> ThreadPoolExecutor:
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=MAX_REFRESH_WORKERS,
+                    thread_name_prefix="powertools-parameters",
+                )
+            return self._refresh_executor
+
+    def _refresh_in_background(self, key: tuple, fetch: Callable[[], Any]) -> None:
+        """
+        Refresh a cached value in a background thread, unless it's already being refreshed
+        """
+        executor = self._get_refresh_executor()
+
+        with self._refresh_lock:
+            if key in self._pending_refreshes:
+                return
+            self._pending_refreshes[key] = executor.submit(self._refresh, key, fetch)
+
+    def _refresh(self, key: tuple, fetch: Callable[[], Any]) -> None:
+        try:
+            fetch()
+            self.stats.increment("refreshes")
+        except Exception:
+            # The stale value is served until it can be refreshed, or it's too old to be served
+            self.stats.increment("refresh_errors")
+            logger.warning("Failed to refresh cached parameter %s", key[0], exc_info=True)
+        finally:
+            with self._refresh_lock:
+                self._pending_refreshes.pop(key, None)
+
     def clear_cache(self):
         self.store.clear()
 
@@ -207,7 +442,16 @@ class BaseProvider(ABC):
         if max_age <= 0:
             return
 
-        self.store[key] = ExpirableValue(value, datetime.now() + timedelta(seconds=max_age))
+        # Spread the expiry of values cached at the same time, so they aren't all refreshed on the same invocation
+        jitter = random.random() * self.max_age_jitter if self.max_age_jitter else 0  # nosec - not used for security
+
+        now = datetime.now()
+        self.store[key] = ExpirableValue(value, now + timedelta(seconds=max_age * (1 - jitter)))
+
+        # Values that can't be served anymore are removed once in a while, as they may never be read again
+        if now >= self._next_sweep:
+            self._next_sweep = now + timedelta(seconds=CACHE_SWEEP_INTERVAL_SECS)
+            self.store.sweep(expired_before=now - timedelta(seconds=self.stale_while_revalidate))
 
     def _build_cache_key(
         self,
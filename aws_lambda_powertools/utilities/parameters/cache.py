@@ -0,0 +1,192 @@
+"""
+In-memory cache of parameter values
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Iterator, MutableMapping, NamedTuple
+
+
+class ExpirableValue(NamedTuple):
+    value: str | bytes | dict[str, Any]
+    ttl: datetime
+
+
+class CacheStats:
+    """Counters of how a provider served parameter values, safe to update from background refresh threads"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale_serves = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_serves": self.stale_serves,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.stale_serves = 0
+            self.refreshes = 0
+            self.refresh_errors = 0
+            self.evictions = 0
+            self.expirations = 0
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory held by a cached value, in bytes, including the items of dicts and lists
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+
+    return size
+
+
+class ParameterCache(MutableMapping[tuple, ExpirableValue]):
+    """
+    In-memory cache of parameter values used by providers, safe to use from background refresh threads.
+
+    The cache is unbounded by default. With `max_entries` or `max_bytes`, least recently used values are
+    evicted once the cache is full, so that long-lived execution environments reading many different parameters,
+    e.g. secrets per tenant, don't grow without limit.
+
+    Parameters
+    ----------
+    max_entries: int, optional
+        Maximum number of cached values
+    max_bytes: int, optional
+        Maximum approximate memory held by cached values, in bytes. A value larger than this isn't cached
+
+    Example
+    -------
+    **Caches up to 500 secrets, using up to 4 MiB**
+
+        >>> from aws_lambda_powertools.utilities.parameters import ParameterCache, SecretsProvider
+        >>>
+        >>> secrets_provider = SecretsProvider(cache=ParameterCache(max_entries=500, max_bytes=4 * 1024 * 1024))
+        >>>
+        >>> value = secrets_provider.get(f"tenants/{tenant_id}/api-key")
+        >>>
+        >>> print(secrets_provider.stats.as_dict())
+        {"hits": 120, "misses": 3, "stale_serves": 0, "refreshes": 0, "refresh_errors": 0, "evictions": 1, ...}
+    """
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be greater than 0")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.size_bytes = 0
+
+        # Least recently used values first
+        self._entries: OrderedDict[tuple, ExpirableValue] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: tuple) -> ExpirableValue:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: tuple, value: ExpirableValue) -> None:
+        size = estimate_size(value.value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.size_bytes += size
+            self._evict()
+
+    def __delitem__(self, key: tuple) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        # Checking a key doesn't count as using its value
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[tuple]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.size_bytes = 0
+
+    def sweep(self, expired_before: datetime | None = None) -> int:
+        """
+        Remove values that expired before a given time, defaulting to now
+
+        Parameters
+        ----------
+        expired_before: datetime, optional
+            Values expiring before this time are removed
+
+        Returns
+        -------
+        int
+            Number of values removed
+        """
+        expired_before = expired_before or datetime.now()
+
+        with self._lock:
+            expired = [key for key, value in self._entries.items() if value.ttl < expired_before]
+            for key in expired:
+                self._remove(key)
+
+        self.stats.increment("expirations", len(expired))
+        return len(expired)
+
+    def _remove(self, key: tuple) -> None:
+        del self._entries[key]
+        self.size_bytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        """Evict least recently used values until the cache is within its limits"""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.size_bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.increment("evictions")
@@ -9,6 +9,12 @@ SSM_PARAMETER_TIER = Literal["Standard", "Advanced", "Intelligent-Tiering"]
 
 DEFAULT_MAX_AGE_SECS = "300"
 
+# Threads refreshing stale values in the background, or prefetching values
+MAX_REFRESH_WORKERS = 4
+
+# Interval between removals of expired values from a provider cache
+CACHE_SWEEP_INTERVAL_SECS = 60
+
 # These providers will be dynamically initialized on first use of the helper functions
 DEFAULT_PROVIDERS: dict[str, Any] = {}
 TRANSFORM_METHOD_JSON = "json"
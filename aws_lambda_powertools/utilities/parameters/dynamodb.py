@@ -4,19 +4,30 @@ Amazon DynamoDB parameter retrieval and caching utility
 
 from __future__ import annotations
 
+import os
+import random
+import time
 import warnings
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import boto3
 from boto3.dynamodb.conditions import Key
 
-from aws_lambda_powertools.utilities.parameters.base import BaseProvider
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider, transform_value
+from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_MAX_AGE_SECS
+from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
 
+    from aws_lambda_powertools.utilities.parameters.cache import ParameterCache
+    from aws_lambda_powertools.utilities.parameters.types import TransformOptions
+
 
 class DynamoDBProvider(BaseProvider):
     """
@@ -40,6 +51,12 @@ class DynamoDBProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: DynamoDBServiceResource, optional
             Boto3 DynamoDB Resource Client to use; boto3_session will be ignored if both are provided
+    stale_while_revalidate: int, optional
+        Number of seconds an expired value is still served while it's refreshed in the background, disabled by default
+    max_age_jitter: float, optional
+        Fraction of `max_age` by which cached values randomly expire earlier, to spread their refreshes over time
+    cache: ParameterCache, optional
+        Cache of parameter values, e.g. bounded to a number of values or to a memory size. Unbounded by default
 
     Example
     -------
@@ -149,8 +166,23 @@ class DynamoDBProvider(BaseProvider):
         a   Parameter value a
         b   Parameter value b
         c   Parameter value c
+
+    **Retrieves several parameter values from a DynamoDB table at once**
+
+        >>> from aws_lambda_powertools.utilities.parameters import DynamoDBProvider
+        >>> ddb_provider = DynamoDBProvider("ParametersTable")
+        >>>
+        >>> values = ddb_provider.get_many(["tenant-a", "tenant-b"])
+        >>>
+        >>> print(values)
+        {"tenant-a": "Parameter value a", "tenant-b": "Parameter value b"}
     """
 
+    _MAX_BATCH_GET_ITEM_KEYS = 100
+    _MAX_BATCH_GET_ITEM_RETRIES = 5
+    _BATCH_GET_ITEM_BACKOFF_SECS = 0.05
+    _ERRORS_KEY = "_errors"
+
     def __init__(
         self,
         table_name: str,
@@ -162,6 +194,9 @@ class DynamoDBProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: DynamoDBServiceResource | None = None,
+        stale_while_revalidate: int = 0,
+        max_age_jitter: float = 0.0,
+        cache: ParameterCache | None = None,
     ):
         """
         Initialize the DynamoDB client
@@ -178,12 +213,18 @@ class DynamoDBProvider(BaseProvider):
             boto3_session = boto3_session or boto3.session.Session()
             boto3_client = boto3_session.resource("dynamodb", config=boto_config or config, endpoint_url=endpoint_url)
 
+        self.resource = boto3_client
         self.table = boto3_client.Table(table_name)
         self.key_attr = key_attr
         self.sort_attr = sort_attr
         self.value_attr = value_attr
 
-        super().__init__(resource=boto3_client)
+        super().__init__(
+            resource=boto3_client,
+            stale_while_revalidate=stale_while_revalidate,
+            max_age_jitter=max_age_jitter,
+            cache=cache,
+        )
 
     def _get(self, name: str, **sdk_options) -> str:
         """
@@ -231,3 +272,138 @@ class DynamoDBProvider(BaseProvider):
         # maintenance: look for better ways to correctly type DynamoDB multiple return types
         # without a breaking change within ABC return type
         return {item[self.sort_attr]: item[self.value_attr] for item in items}
+
+    def get_many(
+        self,
+        names: list[str],
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        force_fetch: bool = False,
+        raise_on_error: bool = True,
+        **sdk_options,
+    ) -> dict[str, Any]:
+        """
+        Retrieve several parameter values by name from Amazon DynamoDB or cache, using BatchGetItem.
+
+        Raise_on_error decides on error handling strategy:
+
+        - A) Default to fail-fast. Raises GetParameterError upon any error
+        - B) Gracefully aggregate all parameters that failed under "_errors" key
+
+        Items are fetched by chunks of up to 100 keys, only retrieving their value attribute. Keys DynamoDB didn't
+        process, e.g. when throttled, are retried with exponential backoff. Each value is cached on its own, as is,
+        and transformed values are cached the first time they're retrieved, e.g. by a later `get()` call.
+
+        Parameters
+        ----------
+        names: list[str]
+            Parameter names, i.e. values of the hash key
+        max_age: int, optional
+            Maximum age of the cached value
+        transform: str, optional
+            Optional transformation of the parameter value. Supported values
+            are "json" for JSON strings, "binary" for base 64 encoded
+            values or "auto" which looks at the attribute key to determine the type.
+        force_fetch: bool, optional
+            Force update even before a cached item has expired, defaults to False
+        raise_on_error: bool
+            Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+        sdk_options: dict, optional
+            Options added to the request of the table in the DynamoDB batch_get_item API call, e.g. ConsistentRead
+
+        Raises
+        ------
+        GetParameterError
+            When the provider fails to retrieve a parameter value for a given name, e.g. when its item doesn't exist.
+
+            When "_errors" reserved key is in parameters to be fetched from DynamoDB.
+        """
+
+        # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
+        max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+
+        # NOTE: We fail early to avoid unintended graceful errors being replaced with their '_errors' values
+        if not raise_on_error and self._ERRORS_KEY in names:
+            raise GetParameterError(f"You cannot fetch a parameter named '{self._ERRORS_KEY}' in graceful error mode.")
+
+        response: dict[str, Any] = {}
+        errors: list[str] = []
+        missing: list[str] = []
+
+        # Duplicate keys are rejected by BatchGetItem
+        for name in dict.fromkeys(names):
+            key = self._build_cache_key(name=name, transform=transform)
+            cached = None if force_fetch else self._get_from_cache(name=name, key=key, transform=transform)
+            if cached is not None and cached.ttl >= datetime.now():
+                self.stats.increment("hits")
+                response[name] = cached.value
+            else:
+                missing.append(name)
+
+        self.stats.increment("misses", len(missing))
+
+        for start in range(0, len(missing), self._MAX_BATCH_GET_ITEM_KEYS):
+            chunk = missing[start : start + self._MAX_BATCH_GET_ITEM_KEYS]
+            values = self._get_many_in_batch(chunk, raise_on_error, **sdk_options)
+
+            for name in chunk:
+                if name not in values:
+                    errors.append(name)
+                    continue
+
+                # Transformed values are cached from the raw value once they're retrieved again
+                value = values[name]
+                self.add_to_cache(key=self._build_cache_key(name=name), value=value, max_age=max_age)
+                if transform:
+                    value = transform_value(
+                        key=name,
+                        value=value,
+                        transform=transform,
+                        raise_on_transform_error=raise_on_error,
+                    )
+
+                response[name] = value
+
+        if errors and raise_on_error:
+            raise GetParameterError(f"Failed to fetch parameters: {errors}")
+
+        # Fail-fast disabled, let's aggregate errors under "_errors" key so they can handle gracefully
+        if not raise_on_error:
+            return {self._ERRORS_KEY: errors, **response}
+
+        return response
+
+    def _get_many_in_batch(self, names: list[str], raise_on_error: bool, **sdk_options) -> dict[str, Any]:
+        """
+        Use BatchGetItem to fetch up to 100 items, retrying unprocessed keys with exponential backoff and jitter
+
+        Returns the values found by name. Items that don't exist, or that couldn't be fetched, are left out.
+        """
+        # "value" is a DynamoDB reserved word, so attribute names are always replaced with placeholders
+        sdk_options["ProjectionExpression"] = "#key, #value"
+        sdk_options["ExpressionAttributeNames"] = {"#key": self.key_attr, "#value": self.value_attr}
+        sdk_options["Keys"] = [{self.key_attr: name} for name in names]
+        request_items: Any = {self.table.name: sdk_options}
+
+        values: dict[str, Any] = {}
+        for attempt in range(self._MAX_BATCH_GET_ITEM_RETRIES + 1):
+            if attempt:
+                backoff = self._BATCH_GET_ITEM_BACKOFF_SECS * 2 ** (attempt - 1)
+                time.sleep(random.uniform(0, backoff))  # nosec - not used for security
+
+            try:
+                response = self.resource.batch_get_item(RequestItems=request_items)
+            # Encapsulate all errors into a generic GetParameterError
+            except Exception as exc:
+                if raise_on_error:
+                    raise GetParameterError(str(exc)) from exc
+                return values
+
+            for item in response.get("Responses", {}).get(self.table.name, []):
+                values[str(item[self.key_attr])] = item[self.value_attr]
+
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                break
+
+        return values
@@ -8,23 +8,29 @@ import json
 import logging
 import os
 import warnings
-from typing import TYPE_CHECKING, Literal, overload
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterator, Literal, overload
 
 import boto3
 
 from aws_lambda_powertools.shared import constants
-from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.shared.functions import resolve_max_age, slice_dictionary
 from aws_lambda_powertools.shared.json_encoder import Encoder
-from aws_lambda_powertools.utilities.parameters.base import BaseProvider
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider, transform_value
 from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS
-from aws_lambda_powertools.utilities.parameters.exceptions import SetSecretError
+from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, SetSecretError
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_secretsmanager.client import SecretsManagerClient
-    from mypy_boto3_secretsmanager.type_defs import CreateSecretResponseTypeDef
+    from mypy_boto3_secretsmanager.type_defs import (
+        BatchGetSecretValueResponseTypeDef,
+        CreateSecretResponseTypeDef,
+        SecretValueEntryTypeDef,
+    )
 
+    from aws_lambda_powertools.utilities.parameters.cache import ParameterCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 logger = logging.getLogger(__name__)
@@ -42,6 +48,12 @@ class SecretsProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: SecretsManagerClient, optional
             Boto3 SecretsManager Client to use, boto3_session will be ignored if both are provided
+    stale_while_revalidate: int, optional
+        Number of seconds an expired value is still served while it's refreshed in the background, disabled by default
+    max_age_jitter: float, optional
+        Fraction of `max_age` by which cached values randomly expire earlier, to spread their refreshes over time
+    cache: ParameterCache, optional
+        Cache of parameter values, e.g. bounded to a number of values or to a memory size. Unbounded by default
 
     Example
     -------
@@ -77,14 +89,30 @@ class SecretsProvider(BaseProvider):
         >>>
         >>> print(value)
         My parameter value
+
+    **Retrieves multiple secrets by name from Secrets Manager, in batches**
+
+        >>> from aws_lambda_powertools.utilities.parameters import SecretsProvider
+        >>> secrets_provider = SecretsProvider()
+        >>>
+        >>> values = secrets_provider.get_secrets_by_name({"tenants/a/api-key": {}, "tenants/b/api-key": {}})
+        >>>
+        >>> print(values)
+        {"tenants/a/api-key": "api key a", "tenants/b/api-key": "api key b"}
     """
 
+    _MAX_BATCH_GET_SECRET_VALUE_ITEMS = 20
+    _ERRORS_KEY = "_errors"
+
     def __init__(
         self,
         config: Config | None = None,
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: SecretsManagerClient | None = None,
+        stale_while_revalidate: int = 0,
+        max_age_jitter: float = 0.0,
+        cache: ParameterCache | None = None,
     ):
         """
         Initialize the Secrets Manager client
@@ -102,7 +130,12 @@ class SecretsProvider(BaseProvider):
             boto3_client = boto3_session.client("secretsmanager", config=boto_config or config)
         self.client = boto3_client
 
-        super().__init__(client=self.client)
+        super().__init__(
+            client=self.client,
+            stale_while_revalidate=stale_while_revalidate,
+            max_age_jitter=max_age_jitter,
+            cache=cache,
+        )
 
     def _get(self, name: str, **sdk_options) -> str | bytes:
         """
@@ -126,11 +159,189 @@ class SecretsProvider(BaseProvider):
 
         return secret_value["SecretBinary"]
 
-    def _get_multiple(self, path: str, **sdk_options) -> dict[str, str]:
+    def _get_multiple(self, path: str, **sdk_options) -> dict[str, Any]:
         """
-        Retrieving multiple parameter values is not supported with AWS Secrets Manager
+        Retrieve secrets whose name starts with a prefix from AWS Secrets Manager
+
+        Parameters
+        ----------
+        path: str
+            Prefix of the secret names
+        sdk_options: dict, optional
+            Dictionary of options that will be passed to the Secrets Manager batch_get_secret_value API call,
+            e.g. additional Filters
+        """
+
+        # Explicit arguments will take precedence over keyword arguments
+        name_filters: list = [{"Key": "name", "Values": [path]}] if path else []
+        sdk_options["Filters"] = [*name_filters, *sdk_options.get("Filters", [])]
+
+        values: dict[str, Any] = {}
+        for page in self._paginate_batch_get_secret_value(**sdk_options):
+            if page.get("Errors"):
+                raise GetParameterError(f"Failed to fetch secrets: {self._get_batch_errors(page)}")
+
+            for secret in page.get("SecretValues", []):
+                values[secret["Name"]] = self._get_secret_entry_value(secret)
+
+        return values
+
+    def _fetch_multiple(
+        self,
+        path: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        raise_on_transform_error: bool,
+        sdk_options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Retrieve secrets by prefix, caching each of them as is too, so that they're transformed when first used
+        """
+        raw_key = self._build_cache_key(name=path, is_nested=True)
+        values = super()._fetch_multiple(path, raw_key, max_age, None, raise_on_transform_error, sdk_options)
+
+        for name, value in values.items():
+            self.add_to_cache(key=self._build_cache_key(name=name), value=value, max_age=max_age)
+
+        if transform:
+            values = {**values, **transform_value(values, transform, raise_on_transform_error)}
+            self.add_to_cache(key=key, value=values, max_age=max_age)
+
+        return values
+
+    def get_secrets_by_name(
+        self,
+        secrets: dict[str, dict],
+        transform: TransformOptions = None,
+        max_age: int | None = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
         """
-        raise NotImplementedError()
+        Retrieve multiple secrets by name from AWS Secrets Manager or cache, using BatchGetSecretValue.
+
+        Raise_on_error decides on error handling strategy:
+
+        - A) Default to fail-fast. Raises GetParameterError upon any error
+        - B) Gracefully aggregate all secrets that failed under "_errors" key
+
+        Secrets are fetched in batches of up to 20, and each secret is cached as is, whatever its transform.
+        Transformed values are cached the first time they're retrieved, e.g. by a later `get()` call.
+
+        Parameters
+        ----------
+        secrets: dict[str, dict]
+            List of secret names or full ARNs, and any optional overrides of transform and max_age
+        transform: str, optional
+            Transforms the content from a JSON object ('json') or base64 binary string ('binary')
+        max_age: int, optional
+            Maximum age of the cached value
+        raise_on_error: bool
+            Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+
+        Raises
+        ------
+        GetParameterError
+            When the provider fails to retrieve a secret value for a given name.
+
+            When "_errors" reserved key is in secrets to be fetched from Secrets Manager.
+        """
+
+        # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
+        max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+
+        # NOTE: We fail early to avoid unintended graceful errors being replaced with their '_errors' secret values
+        if not raise_on_error and self._ERRORS_KEY in secrets:
+            raise GetParameterError(f"You cannot fetch a secret named '{self._ERRORS_KEY}' in graceful error mode.")
+
+        response: dict[str, Any] = {}
+        errors: list[str] = []
+        missing: dict[str, dict] = {}
+
+        for name, overrides in secrets.items():
+            options = {"transform": transform, "max_age": max_age, **(overrides or {})}
+
+            cache_key = self._build_cache_key(name=name, transform=options["transform"])
+            cached = self._get_from_cache(name=name, key=cache_key, transform=options["transform"])
+            if cached is not None and cached.ttl >= datetime.now():
+                self.stats.increment("hits")
+                response[name] = cached.value
+            else:
+                missing[name] = options
+
+        self.stats.increment("misses", len(missing))
+
+        for batch in slice_dictionary(data=missing, chunk_size=self._MAX_BATCH_GET_SECRET_VALUE_ITEMS):
+            batch_ret, batch_err = self._get_secrets_batch_by_name(batch, raise_on_error)
+            response.update(batch_ret)
+            errors.extend(batch_err)
+
+        # Fail-fast disabled, let's aggregate errors under "_errors" key so they can handle gracefully
+        if not raise_on_error:
+            return {self._ERRORS_KEY: errors, **response}
+
+        return response
+
+    def _get_secrets_batch_by_name(self, batch: dict[str, dict], raise_on_error: bool) -> tuple[dict, list]:
+        """Use BatchGetSecretValue to fetch up to 20 secrets, hydrate cache, and handle partial failure"""
+        response: dict[str, Any] = {}
+        errors: list[str] = []
+        secret_ids = list(batch.keys())
+
+        try:
+            pages = list(self._paginate_batch_get_secret_value(SecretIdList=secret_ids))
+        except Exception as exc:
+            if raise_on_error:
+                raise GetParameterError(str(exc)) from exc
+            return response, secret_ids
+
+        for page in pages:
+            errors.extend(self._get_batch_errors(page))
+
+            for secret in page.get("SecretValues", []):
+                # Secrets can be requested by name or ARN
+                name = secret["Name"] if secret["Name"] in batch else secret["ARN"]
+                options = batch[name]
+                value = self._get_secret_entry_value(secret)
+
+                # Transformed values are cached from the raw value once they're retrieved again
+                self.add_to_cache(key=self._build_cache_key(name=name), value=value, max_age=options["max_age"])
+                if options["transform"]:
+                    value = transform_value(  # type: ignore[assignment]
+                        key=name,
+                        value=value,
+                        transform=options["transform"],
+                        raise_on_transform_error=raise_on_error,
+                    )
+
+                response[name] = value
+
+        if errors and raise_on_error:
+            raise GetParameterError(f"Failed to fetch secrets: {errors}")
+
+        return response, errors
+
+    def _paginate_batch_get_secret_value(self, **sdk_options) -> Iterator[BatchGetSecretValueResponseTypeDef]:
+        """Pages of BatchGetSecretValue results, as the SDK doesn't provide a paginator for it"""
+        while True:
+            page = self.client.batch_get_secret_value(**sdk_options)
+            yield page
+
+            if not page.get("NextToken"):
+                return
+            sdk_options["NextToken"] = page["NextToken"]
+
+    @staticmethod
+    def _get_batch_errors(page: BatchGetSecretValueResponseTypeDef) -> list[str]:
+        """BatchGetSecretValue is non-atomic. Failures don't reflect in exceptions so we need to collect."""
+        return [error["SecretId"] for error in page.get("Errors", [])]
+
+    @staticmethod
+    def _get_secret_entry_value(secret: SecretValueEntryTypeDef) -> str | bytes:
+        if "SecretString" in secret:
+            return secret["SecretString"]
+
+        return secret["SecretBinary"]
 
     def _create_secret(self, name: str, **sdk_options) -> CreateSecretResponseTypeDef:
         """
@@ -369,6 +580,93 @@ def get_secret(
     )
 
 
+@overload
+def get_secrets_by_name(
+    secrets: dict[str, dict],
+    transform: None = None,
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, str]: ...
+
+
+@overload
+def get_secrets_by_name(
+    secrets: dict[str, dict],
+    transform: Literal["binary"],
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, bytes]: ...
+
+
+@overload
+def get_secrets_by_name(
+    secrets: dict[str, dict],
+    transform: Literal["json"],
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, dict[str, Any]]: ...
+
+
+@overload
+def get_secrets_by_name(
+    secrets: dict[str, dict],
+    transform: Literal["auto"],
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, str] | dict[str, dict]: ...
+
+
+def get_secrets_by_name(
+    secrets: dict[str, Any],
+    transform: TransformOptions = None,
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
+    """
+    Retrieve multiple secrets by name from AWS Secrets Manager, fetching up to 20 secrets per call
+
+    Parameters
+    ----------
+    secrets: dict[str, Any]
+        List of secret names or full ARNs, and any optional overrides of transform and max_age
+    transform: str, optional
+        Transforms the content from a JSON object ('json') or base64 binary string ('binary')
+    max_age: int, optional
+        Maximum age of the cached value
+    raise_on_error: bool, optional
+        Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+
+    Raises
+    ------
+    GetParameterError
+        When the provider fails to retrieve a secret value for a given name.
+
+    Example
+    -------
+    **Retrieves the secrets of several tenants at once**
+
+        >>> from aws_lambda_powertools.utilities.parameters import get_secrets_by_name
+        >>>
+        >>> secrets = {"tenants/a/credentials": {}, "tenants/b/credentials": {"max_age": 60}}
+        >>>
+        >>> values = get_secrets_by_name(secrets=secrets, transform="json")
+    """
+
+    # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
+    max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+
+    # Only create the provider if this function is called at least once
+    if "secrets" not in DEFAULT_PROVIDERS:
+        DEFAULT_PROVIDERS["secrets"] = SecretsProvider()
+
+    return DEFAULT_PROVIDERS["secrets"].get_secrets_by_name(
+        secrets=secrets,
+        transform=transform,
+        max_age=max_age,
+        raise_on_error=raise_on_error,
+    )
+
+
 def set_secret(
     name: str,
     value: str | bytes,
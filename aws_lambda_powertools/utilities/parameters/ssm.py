@@ -7,7 +7,10 @@ from __future__ import annotations
 import logging
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Literal, overload
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, cast, overload
 
 import boto3
 
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
     from mypy_boto3_ssm.client import SSMClient
     from mypy_boto3_ssm.type_defs import GetParametersResultTypeDef, PutParameterResultTypeDef
 
+    from aws_lambda_powertools.utilities.parameters.cache import ParameterCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,12 @@ class SSMProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: SSMClient, optional
             Boto3 SSM Client to use, boto3_session will be ignored if both are provided
+    stale_while_revalidate: int, optional
+        Number of seconds an expired value is still served while it's refreshed in the background, disabled by default
+    max_age_jitter: float, optional
+        Fraction of `max_age` by which cached values randomly expire earlier, to spread their refreshes over time
+    cache: ParameterCache, optional
+        Cache of parameter values, e.g. bounded to a number of values or to a memory size. Unbounded by default
 
     Example
     -------
@@ -114,6 +124,9 @@ class SSMProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: SSMClient | None = None,
+        stale_while_revalidate: int = 0,
+        max_age_jitter: float = 0.0,
+        cache: ParameterCache | None = None,
     ):
         """
         Initialize the SSM Parameter Store client
@@ -131,7 +144,12 @@ class SSMProvider(BaseProvider):
             boto3_client = boto3_session.client("ssm", config=boto_config or config)
         self.client = boto3_client
 
-        super().__init__(client=self.client)
+        super().__init__(
+            client=self.client,
+            stale_while_revalidate=stale_while_revalidate,
+            max_age_jitter=max_age_jitter,
+            cache=cache,
+        )
 
     def get_multiple(  # type: ignore[override]
         self,
@@ -185,10 +203,116 @@ class SSMProvider(BaseProvider):
             choice=decrypt,
         )
 
+        # Parameters under an ancestor path already fetched recursively are served from memory
+        if not force_fetch and not sdk_options and max_age > 0:
+            values = self._get_from_hierarchy(path, decrypt=decrypt, recursive=recursive)
+            if values is not None:
+                self.stats.increment("hits")
+                if transform:
+                    values = {**values, **transform_value(values, transform, raise_on_transform_error)}
+                return values
+
         sdk_options["decrypt"] = decrypt
         sdk_options["recursive"] = recursive
 
-        return super().get_multiple(path, max_age, transform, force_fetch, raise_on_transform_error, **sdk_options)
+        return super().get_multiple(
+            path,
+            max_age=max_age,
+            transform=transform,
+            raise_on_transform_error=raise_on_transform_error,
+            force_fetch=force_fetch,
+            **sdk_options,
+        )
+
+    def get_multiple_by_paths(
+        self,
+        paths: list[str],
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        raise_on_transform_error: bool = False,
+        decrypt: bool | None = None,
+        force_fetch: bool = False,
+        recursive: bool = True,
+        max_concurrency: int | None = None,
+    ) -> dict[str, dict[str, str] | dict[str, bytes] | dict[str, dict]]:
+        """
+        Retrieve multiple parameters for each of several path prefixes, e.g. the branches of a large hierarchy
+
+        `GetParametersByPath` returns up to 10 parameters per page, one page after another. Fetching the branches of
+        a hierarchy with thousands of parameters concurrently, rather than its root, reduces the time to fetch it.
+
+        Paths under another one of the paths are fetched once their ancestor is, and served from memory.
+
+        Parameters
+        ----------
+        paths: list[str]
+            Parameter paths used to retrieve multiple parameters
+        max_age: int, optional
+            Maximum age of the cached value
+        transform: str, optional
+            Optional transformation of the parameter value. Supported values
+            are "json" for JSON strings, "binary" for base 64 encoded
+            values or "auto" which looks at the attribute key to determine the type.
+        raise_on_transform_error: bool, optional
+            Raises an exception if any transform fails, otherwise this will
+            return a None value for each transform that failed
+        decrypt: bool, optional
+            If the parameter values should be decrypted
+        force_fetch: bool, optional
+            Force update even before a cached item has expired, defaults to False
+        recursive: bool, optional
+            If this should retrieve the parameter values recursively or not, defaults to True
+        max_concurrency: int, optional
+            Maximum number of paths fetched at once. Paths are fetched one after another by default
+
+        Returns
+        -------
+        dict[str, dict]
+            Parameter values by path, each by parameter name relative to its path
+
+        Raises
+        ------
+        GetParameterError
+            When the parameter provider fails to retrieve parameter values for
+            a given path.
+        TransformParameterError
+            When the parameter provider fails to transform a parameter value.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        get_path = partial(
+            self.get_multiple,
+            max_age=max_age,
+            transform=transform,
+            raise_on_transform_error=raise_on_transform_error,
+            decrypt=decrypt,
+            force_fetch=force_fetch,
+            recursive=recursive,
+        )
+
+        # Ancestors are fetched first, so that paths under them don't fetch the same parameters again
+        unique_paths = list(dict.fromkeys(paths))
+        ancestor_paths = [path for path in unique_paths if not recursive or not self._has_ancestor(path, unique_paths)]
+
+        executor = (
+            ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="powertools-parameters")
+            if max_concurrency
+            else None
+        )
+
+        try:
+            values = dict(zip(ancestor_paths, _map_in_order(get_path, ancestor_paths, executor)))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        # Descendants are served from the ancestors, unless those weren't cached
+        for path in unique_paths:
+            if path not in values:
+                values[path] = get_path(path, force_fetch=False)
+
+        return values
 
     # We break Liskov substitution principle due to differences in signatures of this method and superclass get method
     # We ignore mypy error, as changes to the signature here or in a superclass is a breaking change to users
@@ -427,6 +551,70 @@ class SSMProvider(BaseProvider):
 
         return parameters
 
+    def _fetch_multiple(
+        self,
+        path: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions,
+        raise_on_transform_error: bool,
+        sdk_options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Retrieve parameters by path, also caching those fetched recursively as a hierarchy serving their sub-paths
+        """
+        raw_key = self._build_cache_key(name=path, is_nested=True)
+        values = super()._fetch_multiple(path, raw_key, max_age, None, raise_on_transform_error, sdk_options)
+
+        # Only complete hierarchies can serve sub-paths, which filters would break
+        if sdk_options.get("recursive") and set(sdk_options) == {"decrypt", "recursive"}:
+            hierarchy_key = self._build_hierarchy_key(path, decrypt=bool(sdk_options["decrypt"]))
+            self.add_to_cache(key=hierarchy_key, value=values, max_age=max_age)
+
+        if transform:
+            values = {**values, **transform_value(values, transform, raise_on_transform_error)}
+            self.add_to_cache(key=key, value=values, max_age=max_age)
+
+        return values
+
+    def _get_from_hierarchy(self, path: str, decrypt: bool, recursive: bool) -> dict[str, str] | None:
+        """
+        Parameters under a path, if the path or one of its ancestors was fetched recursively and hasn't expired
+
+        Returns
+        -------
+        dict, optional
+            Parameter values by name relative to the path, or None if no hierarchy fetched can serve the path
+        """
+        segments = _split_path(path)
+        now = datetime.now()
+
+        # The closest hierarchy was fetched last, as fetching a path replaces what its ancestors know about it
+        for depth in range(len(segments), -1, -1):
+            try:
+                cached = self.store[self._build_hierarchy_key("/".join(segments[:depth]), decrypt=decrypt)]
+            except KeyError:
+                continue
+
+            if cached.ttl >= now:
+                return _get_sub_path(cast(dict, cached.value), "/".join(segments[depth:]), recursive)
+
+        return None
+
+    @staticmethod
+    def _build_hierarchy_key(path: str, decrypt: bool) -> tuple:
+        # Unlike other keys, it's never served by get() nor get_multiple() as is
+        return ("/" + "/".join(_split_path(path)), decrypt, "hierarchy")
+
+    @staticmethod
+    def _has_ancestor(path: str, paths: list[str]) -> bool:
+        """Whether a path is under another one of the paths"""
+        segments = _split_path(path)
+        return any(
+            len(other_segments) < len(segments) and segments[: len(other_segments)] == other_segments
+            for other_segments in map(_split_path, paths)
+        )
+
     # NOTE: When bandwidth permits, allocate a week to refactor to lower cognitive load
     def get_parameters_by_name(
         self,
@@ -435,6 +623,7 @@ class SSMProvider(BaseProvider):
         decrypt: bool | None = None,
         max_age: int | None = None,
         raise_on_error: bool = True,
+        max_concurrency: int | None = None,
     ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
         """
         Retrieve multiple parameter values by name from SSM or cache.
@@ -471,6 +660,9 @@ class SSMProvider(BaseProvider):
             Maximum age of the cached value
         raise_on_error: bool
             Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+        max_concurrency: int, optional
+            Maximum number of concurrent GetParameters and GetParameter calls, sharing the same client.
+            Parameters are fetched one call at a time by default
 
         Raises
         ------
@@ -479,6 +671,8 @@ class SSMProvider(BaseProvider):
 
             When "_errors" reserved key is in parameters to be fetched from SSM.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
 
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
@@ -507,11 +701,36 @@ class SSMProvider(BaseProvider):
         ## GetParameters API -> When decrypt is used for all parameters in the the batch
         ## GetParameter  API -> When decrypt is used for one or more in the batch
 
-        if len(decrypt_params) != len(parameters):
-            decrypt_ret, decrypt_err = self._get_parameters_by_name_with_decrypt_option(decrypt_params, raise_on_error)
-            batch_ret, batch_err = self._get_parameters_batch_by_name(batch_params, raise_on_error, decrypt=False)
-        else:
-            batch_ret, batch_err = self._get_parameters_batch_by_name(decrypt_params, raise_on_error, decrypt=True)
+        # Calls are made one at a time, unless concurrency is opted-in
+        executor = (
+            ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="powertools-parameters")
+            if max_concurrency
+            else None
+        )
+
+        try:
+            if len(decrypt_params) != len(parameters):
+                decrypt_ret, decrypt_err = self._get_parameters_by_name_with_decrypt_option(
+                    decrypt_params,
+                    raise_on_error,
+                    executor,
+                )
+                batch_ret, batch_err = self._get_parameters_batch_by_name(
+                    batch_params,
+                    raise_on_error,
+                    decrypt=False,
+                    executor=executor,
+                )
+            else:
+                batch_ret, batch_err = self._get_parameters_batch_by_name(
+                    decrypt_params,
+                    raise_on_error,
+                    decrypt=True,
+                    executor=executor,
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         # Fail-fast disabled, let's aggregate errors under "_errors" key so they can handle gracefully
         if not raise_on_error:
@@ -523,28 +742,42 @@ class SSMProvider(BaseProvider):
         self,
         batch: dict[str, dict],
         raise_on_error: bool,
+        executor: ThreadPoolExecutor | None = None,
     ) -> tuple[dict, list]:
         response: dict[str, Any] = {}
         errors: list[str] = []
 
-        # Decided for single-thread as it outperforms in 128M and 1G + reduce timeout risk
+        # Single-thread by default, as it outperforms in 128M and 1G + reduce timeout risk
         # see: https://github.com/aws-powertools/powertools-lambda-python/issues/1040#issuecomment-1299954613
-        for parameter, options in batch.items():
-            try:
-                response[parameter] = self.get(parameter, options["max_age"], options["transform"], options["decrypt"])
-            except GetParameterError:
-                if raise_on_error:
-                    raise
+        get_parameter = partial(self._get_parameter_by_name_with_options, raise_on_error=raise_on_error)
+        for parameter, value, failed in _map_in_order(get_parameter, batch.items(), executor):
+            if failed:
                 errors.append(parameter)
                 continue
+            response[parameter] = value
 
         return response, errors
 
+    def _get_parameter_by_name_with_options(
+        self,
+        parameter_options: tuple[str, dict],
+        raise_on_error: bool,
+    ) -> tuple[str, Any, bool]:
+        """Get a single parameter with its options, returning whether it failed instead of raising when allowed"""
+        parameter, options = parameter_options
+        try:
+            return parameter, self.get(parameter, options["max_age"], options["transform"], options["decrypt"]), False
+        except GetParameterError:
+            if raise_on_error:
+                raise
+            return parameter, None, True
+
     def _get_parameters_batch_by_name(
         self,
         batch: dict[str, dict],
         raise_on_error: bool = True,
         decrypt: bool = False,
+        executor: ThreadPoolExecutor | None = None,
     ) -> tuple[dict, list]:
         """Slice batch and fetch parameters using GetParameters by max permitted"""
         errors: list[str] = []
@@ -555,7 +788,13 @@ class SSMProvider(BaseProvider):
             return cached_params, errors
 
         # Slice batch by max permitted GetParameters call
-        batch_ret, errors = self._get_parameters_by_name_in_chunks(batch, cached_params, raise_on_error, decrypt)
+        batch_ret, errors = self._get_parameters_by_name_in_chunks(
+            batch,
+            cached_params,
+            raise_on_error,
+            decrypt,
+            executor,
+        )
 
         return {**cached_params, **batch_ret}, errors
 
@@ -575,6 +814,7 @@ class SSMProvider(BaseProvider):
         cache: dict[str, Any],
         raise_on_error: bool,
         decrypt: bool = False,
+        executor: ThreadPoolExecutor | None = None,
     ) -> tuple[dict, list]:
         """Take out differences from cache and batch, slice it and fetch from SSM"""
         response: dict[str, Any] = {}
@@ -582,13 +822,10 @@ class SSMProvider(BaseProvider):
 
         diff = {key: value for key, value in batch.items() if key not in cache}
 
-        for chunk in slice_dictionary(data=diff, chunk_size=self._MAX_GET_PARAMETERS_ITEM):
-            response, possible_errors = self._get_parameters_by_name(
-                parameters=chunk,
-                raise_on_error=raise_on_error,
-                decrypt=decrypt,
-            )
-            response.update(response)
+        get_chunk = partial(self._get_parameters_by_name, raise_on_error=raise_on_error, decrypt=decrypt)
+        chunks = slice_dictionary(data=diff, chunk_size=self._MAX_GET_PARAMETERS_ITEM)
+        for chunk_response, possible_errors in _map_in_order(get_chunk, chunks, executor):
+            response.update(chunk_response)
             errors.extend(possible_errors)
 
         return response, errors
@@ -654,7 +891,12 @@ class SSMProvider(BaseProvider):
 
             # NOTE: If transform is set, we do it before caching to reduce number of operations
             if transform:
-                value = transform_value(name, value, transform, raise_on_error)  # type: ignore
+                value = transform_value(  # type: ignore[assignment]
+                    key=name,
+                    value=value,
+                    transform=transform,
+                    raise_on_transform_error=raise_on_error,
+                )
 
             _cache_key = (name, options["transform"])
             self.add_to_cache(key=_cache_key, value=value, max_age=options["max_age"])
@@ -735,6 +977,42 @@ class SSMProvider(BaseProvider):
             )
 
 
+def _split_path(path: str) -> list[str]:
+    """Segments of a hierarchical parameter name, e.g. ["app", "db", "host"] for "/app/db/host" """
+    return [segment for segment in path.split("/") if segment]
+
+
+def _get_sub_path(parameters: dict[str, str], sub_path: str, recursive: bool) -> dict[str, str]:
+    """Parameters of a hierarchy under one of its sub-paths, by name relative to it"""
+    prefix = f"{sub_path}/" if sub_path else ""
+    values = {}
+    for name, value in parameters.items():
+        if not name.startswith(prefix):
+            continue
+
+        relative_name = name[len(prefix) :]
+        if relative_name and (recursive or "/" not in relative_name):
+            values[relative_name] = value
+
+    return values
+
+
+def _map_in_order(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    executor: ThreadPoolExecutor | None,
+) -> Iterator:
+    """
+    Results of a function applied to each item in order, one at a time or concurrently with an executor.
+
+    The first exception is raised when its result is reached, cancelling calls that haven't started yet.
+    """
+    if executor is None:
+        return map(function, items)
+
+    return executor.map(function, items)
+
+
 @overload
 def get_parameter(
     name: str,
@@ -1079,6 +1357,7 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, str]: ...
 
 
@@ -1089,6 +1368,7 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, bytes]: ...
 
 
@@ -1099,6 +1379,7 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, dict[str, Any]]: ...
 
 
@@ -1109,6 +1390,7 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, str] | dict[str, dict]: ...
 
 
@@ -1118,6 +1400,7 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    max_concurrency: int | None = None,
 ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
     """
     Retrieve multiple parameter values by name from AWS Systems Manager (SSM) Parameter Store
@@ -1134,6 +1417,9 @@ def get_parameters_by_name(
         Maximum age of the cached value
     raise_on_error: bool, optional
         Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+    max_concurrency: int, optional
+        Maximum number of concurrent calls to SSM, e.g. to load many parameters at cold start.
+        Parameters are fetched one call at a time by default
 
     Example
     -------
@@ -1167,7 +1453,7 @@ def get_parameters_by_name(
         a given name.
     """
 
-    # NOTE: Decided against using multi-thread due to single-thread outperforming in 128M and 1G + timeout risk
+    # NOTE: Single-thread by default, as it outperforms multi-thread in 128M and 1G + timeout risk
     # see: https://github.com/aws-powertools/powertools-lambda-python/issues/1040#issuecomment-1299954613
 
     # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
@@ -1189,4 +1475,5 @@ def get_parameters_by_name(
         transform=transform,
         decrypt=decrypt,
         raise_on_error=raise_on_error,
+        max_concurrency=max_concurrency,
     )
@@ -1,3 +1,5 @@
+from aws_lambda_powertools.utilities.streaming.config import BlockCacheConfig
 from aws_lambda_powertools.utilities.streaming.s3_object import S3Object
+from aws_lambda_powertools.utilities.streaming.s3_object_writer import S3ObjectWriter
 
-__all__ = ["S3Object"]
+__all__ = ["BlockCacheConfig", "S3Object", "S3ObjectWriter"]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.utilities.streaming._s3_seekable_io import _S3SeekableIO
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+
+    from aws_lambda_powertools.utilities.streaming.config import BlockCacheConfig
+
+logger = logging.getLogger(__name__)
+
+# Chunk size when iterating over the stream, the same as boto3's StreamingBody
+ITER_CHUNK_SIZE = 1024
+
+
+class _S3BlockCacheIO(_S3SeekableIO):
+    """
+    _S3BlockCacheIO reads an S3 object in fixed-size blocks fetched with ranged GET requests, instead of a single
+    stream. Blocks are kept in a LRU cache bounded in size, so seeking back to a block already read doesn't send a
+    new request. When blocks are read sequentially, the next blocks are fetched ahead on a thread pool.
+
+    Parameters
+    ----------
+    bucket: str
+        The S3 bucket
+    key: str
+        The S3 key
+    block_cache: BlockCacheConfig
+        Size of blocks and of the cache, and read-ahead settings
+    version_id: str, optional
+        A version ID of the object, when the S3 bucket is versioned
+    boto3_client: boto3 S3 Client, optional
+        An optional boto3 S3 client. If missing, a new one will be created.
+    sdk_options: dict, optional
+        Dictionary of options that will be passed to the S3 Client get_object API call
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        block_cache: BlockCacheConfig,
+        version_id: str | None = None,
+        boto3_client: S3Client | None = None,
+        **sdk_options,
+    ):
+        super().__init__(bucket=bucket, key=key, version_id=version_id, boto3_client=boto3_client, **sdk_options)
+
+        self._block_size = block_cache.block_size
+        self._max_blocks = block_cache.max_blocks
+        # Read ahead must leave room in the cache for the block being read
+        self._read_ahead_blocks = min(block_cache.read_ahead_blocks, self._max_blocks - 1)
+        self._max_workers = block_cache.max_workers
+
+        # Blocks read, in least to most recently used order
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        # Blocks being fetched ahead of time
+        self._pending_blocks: dict[int, Future[bytes]] = {}
+        self._last_block_index = -1
+        self._executor: ThreadPoolExecutor | None = None
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self._position + size)
+
+        chunks: list[memoryview] = []
+        while self._position < end:
+            index, offset = divmod(self._position, self._block_size)
+            chunk = memoryview(self._get_block(index))[offset : offset + end - self._position]
+            if not chunk:  # the object is shorter than expected
+                break
+            chunks.append(chunk)
+            self._position += len(chunk)
+
+        return b"".join(chunks)
+
+    def readline(self, size: int | None = None) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self._position + size)
+
+        chunks: list[memoryview] = []
+        while self._position < end:
+            index, offset = divmod(self._position, self._block_size)
+            block = self._get_block(index)
+            chunk_end = min(len(block), offset + end - self._position)
+            newline = block.find(b"\n", offset, chunk_end)
+            chunk = memoryview(block)[offset : chunk_end if newline == -1 else newline + 1]
+            if not chunk:  # the object is shorter than expected
+                break
+            chunks.append(chunk)
+            self._position += len(chunk)
+            if newline != -1:
+                break
+
+        return b"".join(chunks)
+
+    def readlines(self, hint: int = -1) -> list[bytes]:
+        lines: list[bytes] = []
+        total_size = 0
+        while line := self.readline():
+            lines.append(line)
+            total_size += len(line)
+            if 0 < hint <= total_size:
+                break
+
+        return lines
+
+    def __next__(self):
+        chunk = self.read(ITER_CHUNK_SIZE)
+        if chunk:
+            return chunk
+        raise StopIteration()
+
+    def __iter__(self):
+        return self
+
+    def close(self) -> None:
+        for future in self._pending_blocks.values():
+            future.cancel()
+        self._pending_blocks.clear()
+        self._blocks.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        self._closed = True
+
+    def _get_block(self, index: int) -> bytes:
+        """
+        Returns a block from the cache, waiting for it if it's being read ahead, or fetching it otherwise
+        """
+        block = self._blocks.get(index)
+        future: Future[bytes] | None = None
+        if block is not None:
+            self._blocks.move_to_end(index)
+        else:
+            future = self._pending_blocks.pop(index, None)
+
+        # Read ahead only when reading sequentially, not when seeking around, e.g. in a zip file.
+        # Next blocks are requested before waiting for this one, keeping room for it in the cache
+        if index == self._last_block_index + 1:
+            self._read_ahead(index, reserved_blocks=0 if block is not None else 1)
+        self._last_block_index = index
+
+        if block is None:
+            block = future.result() if future is not None else self._fetch_block(index)
+            self._blocks[index] = block
+            self._evict_blocks()
+
+        return block
+
+    def _fetch_block(self, index: int) -> bytes:
+        start = index * self._block_size
+        end = min(start + self._block_size, self.size) - 1
+        logger.debug(f"Fetching block {index} at bytes={start}-{end}")
+        response = self.s3_client.get_object(Range=f"bytes={start}-{end}", **self._sdk_options)
+        return response["Body"].read()
+
+    def _read_ahead(self, index: int, reserved_blocks: int) -> None:
+        last_index = (self.size - 1) // self._block_size
+        read_ahead = range(index + 1, min(index + self._read_ahead_blocks, last_index) + 1)
+
+        # Blocks read ahead from a previous position won't be read anymore, don't keep them in memory
+        for stale_index in [pending for pending in self._pending_blocks if pending not in read_ahead]:
+            self._pending_blocks.pop(stale_index).cancel()
+
+        for next_index in read_ahead:
+            if next_index in self._blocks or next_index in self._pending_blocks:
+                continue
+            self._pending_blocks[next_index] = self._get_executor().submit(self._fetch_block, next_index)
+            self._evict_blocks(reserved_blocks)
+
+    def _evict_blocks(self, reserved_blocks: int = 0) -> None:
+        while self._blocks and len(self._blocks) + len(self._pending_blocks) + reserved_blocks > self._max_blocks:
+            self._blocks.popitem(last=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="powertools-streaming",
+            )
+
+        return self._executor
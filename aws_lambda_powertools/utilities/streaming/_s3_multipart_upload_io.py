@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import io
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, TYPE_CHECKING, Any, Iterable, Sequence, TypeVar
+
+import boto3
+
+from aws_lambda_powertools.shared import user_agent
+from aws_lambda_powertools.utilities.streaming.constants import MESSAGE_STREAM_NOT_READABLE
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import CompletedPartTypeDef
+
+    _CData = TypeVar("_CData")
+
+logger = logging.getLogger(__name__)
+
+# S3 multipart upload limits: https://docs.aws.amazon.com/AmazonS3/latest/userguide/qfacts.html
+MIN_PART_SIZE = 5 * 1024 * 1024  # 5 MiB, except for the last part
+MAX_PARTS = 10_000
+DEFAULT_PART_SIZE = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Options that must be sent on every request of a multipart upload, not only when it's created
+PART_SDK_OPTIONS = (
+    "SSECustomerAlgorithm",
+    "SSECustomerKey",
+    "SSECustomerKeyMD5",
+    "RequestPayer",
+    "ExpectedBucketOwner",
+)
+
+
+class _S3MultipartUploadIO(IO[bytes]):
+    """
+    _S3MultipartUploadIO writes an S3 object as a stream, buffering data into parts uploaded with a multipart upload.
+
+    Up to `max_concurrency` parts are uploaded concurrently while the next part is being buffered, so memory stays
+    bounded to `part_size * (max_concurrency + 1)` however large the object is. Objects smaller than a part are
+    uploaded with a single PutObject request when the stream is closed.
+
+    If an upload fails, or the stream is aborted, the multipart upload is aborted so no parts are left behind.
+
+    Parameters
+    ----------
+    bucket: str
+        The S3 bucket
+    key: str
+        The S3 key
+    boto3_client: boto3 S3 Client, optional
+        An optional boto3 S3 client. If missing, a new one will be created.
+    part_size: int, optional
+        Size of each part, in bytes. Defaults to 8 MiB, and must be at least 5 MiB
+    max_concurrency: int, optional
+        Maximum number of parts uploaded concurrently. Defaults to 4
+    sdk_options: dict, optional
+        Dictionary of options that will be passed to the S3 Client create_multipart_upload or put_object API call
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        boto3_client: S3Client | None = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **sdk_options,
+    ):
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        self.bucket = bucket
+        self.key = key
+
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+
+        # Holds the number of bytes written to the stream
+        self._position = 0
+
+        # Stores the closed state of the stream
+        self._closed: bool = False
+
+        self._s3_client = boto3_client
+        self._has_user_agent = False
+
+        self._sdk_options = sdk_options
+        self._sdk_options["Bucket"] = bucket
+        self._sdk_options["Key"] = key
+        self._part_sdk_options = {
+            option: value
+            for option, value in self._sdk_options.items()
+            if option in PART_SDK_OPTIONS or option in ("Bucket", "Key")
+        }
+
+        # Part being buffered, allocated once at its full size to avoid copies while growing
+        self._buffer = bytearray(part_size)
+        self._buffer_size = 0
+
+        self._upload_id: str | None = None
+        self._part_number = 0
+        self._completed_parts: list[CompletedPartTypeDef] = []
+        self._pending_parts: set[Future[CompletedPartTypeDef]] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def s3_client(self) -> S3Client:
+        """
+        Returns a boto3 S3 client
+        """
+        if self._s3_client is None:
+            self._s3_client = boto3.client("s3")
+        if not self._has_user_agent:
+            user_agent.register_feature_to_client(client=self._s3_client, feature="streaming")
+            self._has_user_agent = True
+        return self._s3_client
+
+    @property
+    def upload_id(self) -> str | None:
+        """
+        Returns the ID of the multipart upload, once the first part is uploaded
+        """
+        return self._upload_id
+
+    def write(self, data: bytes | bytearray | memoryview | Sequence[Any] | mmap | _CData) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+        view = memoryview(data).cast("B")  # type: ignore[arg-type]
+        size = len(view)
+
+        while view:
+            chunk_size = min(len(view), self._part_size - self._buffer_size)
+            self._buffer[self._buffer_size : self._buffer_size + chunk_size] = view[:chunk_size]
+            self._buffer_size += chunk_size
+            view = view[chunk_size:]
+
+            if self._buffer_size == self._part_size:
+                self._upload_buffer()
+
+        self._position += size
+        return size
+
+    def writelines(
+        self,
+        data: Iterable[bytes | bytearray | memoryview | Sequence[Any] | mmap | _CData],
+    ) -> None:
+        for line in data:
+            self.write(line)
+
+    def flush(self) -> None:
+        # Parts can't be smaller than 5 MiB, so buffered data is only uploaded once a part is full, or on close
+        pass
+
+    def close(self) -> None:
+        """
+        Uploads the remaining data and completes the upload, aborting it on failure
+        """
+        if self._closed:
+            return
+
+        try:
+            if self._upload_id is None:
+                logger.debug(f"Uploading {self._buffer_size} bytes with a single request")
+                del self._buffer[self._buffer_size :]
+                self.s3_client.put_object(Body=self._buffer, **self._sdk_options)  # type: ignore[arg-type]
+            else:
+                if self._buffer_size:
+                    self._upload_buffer()
+                self._wait_for_parts(max_pending=0)
+
+                logger.debug(f"Completing multipart upload {self._upload_id} with {self._part_number} parts")
+                self.s3_client.complete_multipart_upload(
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": sorted(self._completed_parts, key=lambda part: part["PartNumber"])},
+                    **self._part_sdk_options,
+                )
+        except BaseException:
+            self.abort()
+            raise
+
+        self._release()
+
+    def abort(self) -> None:
+        """
+        Discards the data written, aborting the multipart upload if one was started
+        """
+        if self._closed:
+            return
+
+        # Parts still being uploaded would be kept by S3 if they completed after aborting the upload
+        for future in self._pending_parts:
+            future.cancel()
+        wait(self._pending_parts)
+        self._pending_parts.clear()
+
+        if self._upload_id is not None:
+            logger.debug(f"Aborting multipart upload {self._upload_id}")
+            self.s3_client.abort_multipart_upload(UploadId=self._upload_id, **self._part_sdk_options)
+
+        self._release()
+
+    def _release(self) -> None:
+        self._buffer = bytearray()
+        self._buffer_size = 0
+        self._completed_parts.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        self._closed = True
+
+    def _upload_buffer(self) -> None:
+        try:
+            # Waits for a slot before handing the buffer over, so at most max_concurrency parts are held in memory
+            self._wait_for_parts(max_pending=self._max_concurrency - 1)
+
+            if self._part_number == MAX_PARTS:
+                raise ValueError(f"objects can't have more than {MAX_PARTS} parts, increase part_size")
+
+            if self._upload_id is None:
+                self._upload_id = self.s3_client.create_multipart_upload(**self._sdk_options)["UploadId"]
+                logger.debug(f"Started multipart upload {self._upload_id}")
+        except BaseException:
+            self.abort()
+            raise
+
+        self._part_number += 1
+        part, self._buffer = self._buffer, bytearray(self._part_size)
+        del part[self._buffer_size :]
+        self._buffer_size = 0
+
+        self._pending_parts.add(
+            self._get_executor().submit(self._upload_part, self._upload_id, self._part_number, part),
+        )
+
+    def _upload_part(self, upload_id: str, part_number: int, part: bytearray) -> CompletedPartTypeDef:
+        logger.debug(f"Uploading part {part_number} of {len(part)} bytes")
+        response = self.s3_client.upload_part(
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=part,  # type: ignore[arg-type]
+            **self._part_sdk_options,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def _wait_for_parts(self, max_pending: int) -> None:
+        """
+        Waits until at most `max_pending` parts are being uploaded, raising the first upload error
+        """
+        while len(self._pending_parts) > max_pending:
+            done, self._pending_parts = wait(self._pending_parts, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._completed_parts.append(future.result())
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency,
+                thread_name_prefix="powertools-streaming",
+            )
+
+        return self._executor
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        raise io.UnsupportedOperation("seek")
+
+    def seekable(self) -> bool:
+        return False
+
+    def readable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def fileno(self) -> int:
+        raise NotImplementedError("this stream is not backed by a file descriptor")
+
+    def isatty(self) -> bool:
+        return False
+
+    def truncate(self, size: int | None = 0) -> int:
+        raise io.UnsupportedOperation("truncate")
+
+    def read(self, size: int = -1) -> bytes:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def readline(self, size: int | None = -1) -> bytes:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def readlines(self, hint: int = -1) -> list[bytes]:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def __next__(self):
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def __iter__(self):
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import IO, TYPE_CHECKING, Any, Iterable, Sequence, TypeVar, cast
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Sequence, TypeVar, cast
 
 import boto3
 
@@ -56,8 +56,8 @@ class _S3SeekableIO(IO[bytes]):
         # Stores the closed state of the stream
         self._closed: bool = False
 
-        # Caches the size of the object
-        self._size: int | None = None
+        # Caches the metadata of the object, retrieved with a HEAD request
+        self._head_object: dict[str, Any] | None = None
 
         self._s3_client = boto3_client
         self._raw_stream: PowertoolsStreamingBody | None = None
@@ -81,15 +81,22 @@ class _S3SeekableIO(IO[bytes]):
             self._has_user_agent = True
         return self._s3_client
 
+    @property
+    def head_object(self) -> dict[str, Any]:
+        """
+        Retrieves the metadata of the S3 object, with a single HEAD request
+        """
+        if self._head_object is None:
+            logger.debug("Getting metadata of S3 object")
+            self._head_object = cast(Dict[str, Any], self.s3_client.head_object(**self._sdk_options))
+        return self._head_object
+
     @property
     def size(self) -> int:
         """
         Retrieves the size of the S3 object
         """
-        if self._size is None:
-            logger.debug("Getting size of S3 object")
-            self._size = self.s3_client.head_object(**self._sdk_options).get("ContentLength", 0)
-        return self._size
+        return self.head_object.get("ContentLength", 0)
 
     @property
     def raw_stream(self) -> PowertoolsStreamingBody:
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_MAX_CACHE_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+
+class BlockCacheConfig:
+    """
+    Block cache configuration for S3Object.
+
+    The object is read in fixed-size blocks, aligned to the block size, each fetched with a ranged GET request.
+    Blocks are kept in memory up to `max_cache_size`, evicting the least recently used ones, so repeated reads
+    and seeks (e.g. a zip central directory, or a parquet footer) don't send new requests.
+
+    When reading sequentially, the next `read_ahead_blocks` blocks are fetched concurrently on a thread pool of
+    `max_workers` threads, while the current block is being consumed.
+
+    Parameters
+    ----------
+    block_size: int
+        Size of each block, in bytes. Defaults to 8 MiB
+    max_cache_size: int
+        Maximum size of blocks kept in memory, including blocks being read ahead, in bytes. Defaults to 64 MiB
+    read_ahead_blocks: int
+        Number of blocks to fetch ahead when reading sequentially, 0 to disable read-ahead. Defaults to 2
+    max_workers: int
+        Maximum number of blocks fetched concurrently when reading ahead. Defaults to 4
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import BlockCacheConfig, S3Object
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key", block_cache=BlockCacheConfig(block_size=1024 * 1024))
+    """
+
+    def __init__(
+        self,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        read_ahead_blocks: int = 2,
+        max_workers: int = 4,
+    ):
+        if block_size < 1:
+            raise ValueError("block_size must be greater than 0")
+        if max_cache_size < block_size:
+            raise ValueError("max_cache_size must be greater than or equal to block_size")
+        if read_ahead_blocks < 0:
+            raise ValueError("read_ahead_blocks must not be negative")
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.block_size = block_size
+        self.max_cache_size = max_cache_size
+        self.read_ahead_blocks = read_ahead_blocks
+        self.max_workers = max_workers
+
+    @property
+    def max_blocks(self) -> int:
+        """Maximum number of blocks kept in memory"""
+        return self.max_cache_size // self.block_size
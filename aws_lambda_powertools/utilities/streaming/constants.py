@@ -1 +1,2 @@
 MESSAGE_STREAM_NOT_WRITABLE = "this stream is not writable"
+MESSAGE_STREAM_NOT_READABLE = "this stream is not readable"
@@ -3,11 +3,13 @@ from __future__ import annotations
 import io
 from typing import IO, TYPE_CHECKING, Any, Iterable, Literal, Sequence, TypeVar, cast, overload
 
+from aws_lambda_powertools.utilities.streaming._s3_block_cache_io import _S3BlockCacheIO
 from aws_lambda_powertools.utilities.streaming._s3_seekable_io import _S3SeekableIO
 from aws_lambda_powertools.utilities.streaming.constants import MESSAGE_STREAM_NOT_WRITABLE
 from aws_lambda_powertools.utilities.streaming.transformations import (
     CsvTransform,
     GzipTransform,
+    get_decompression_transform,
 )
 from aws_lambda_powertools.utilities.streaming.types import T
 
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
 
     from mypy_boto3_s3.client import S3Client
 
+    from aws_lambda_powertools.utilities.streaming.config import BlockCacheConfig
     from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
 
     _CData = TypeVar("_CData")
@@ -42,6 +45,12 @@ class S3Object(IO[bytes]):
         Enables the Gunzip data transformation
     is_csv: bool, optional
         Enables the CSV data transformation
+    auto_decompress: bool, optional
+        Enables the decompression transformation matching the key extension (.gz, .bz2, .xz, .zst), or otherwise
+        the Content-Encoding or Content-Type of the object, applied before any other transformation
+    block_cache: BlockCacheConfig, optional
+        Reads the object in blocks kept in memory, fetching the next blocks concurrently when reading sequentially,
+        instead of a single stream re-opened on every seek
     sdk_options: dict, optional
         Dictionary of options that will be passed to the S3 Client get_object API call
 
@@ -55,6 +64,14 @@ class S3Object(IO[bytes]):
         >>> line: bytes = S3Object(bucket="bucket", key="key").readline()
         >>>
         >>> print(line)
+
+    **Reads a zip file, seeking around without re-opening a stream to S3 each time:**
+
+        >>> from aws_lambda_powertools.utilities.streaming import BlockCacheConfig, S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import ZipTransform
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key", block_cache=BlockCacheConfig(block_size=1024 * 1024))
+        >>> zip_reader = s3object.transform(ZipTransform())
     """
 
     def __init__(
@@ -65,20 +82,36 @@ class S3Object(IO[bytes]):
         boto3_client: S3Client | None = None,
         is_gzip: bool | None = False,
         is_csv: bool | None = False,
+        auto_decompress: bool | None = False,
+        block_cache: BlockCacheConfig | None = None,
         **sdk_options,
     ):
+        if is_gzip and auto_decompress:
+            raise ValueError("is_gzip and auto_decompress can't be used together")
+
         self.bucket = bucket
         self.key = key
         self.version_id = version_id
 
         # The underlying seekable IO, where all the magic happens
-        self.raw_stream = _S3SeekableIO(
-            bucket=bucket,
-            key=key,
-            version_id=version_id,
-            boto3_client=boto3_client,
-            **sdk_options,
-        )
+        self.raw_stream: _S3SeekableIO
+        if block_cache is None:
+            self.raw_stream = _S3SeekableIO(
+                bucket=bucket,
+                key=key,
+                version_id=version_id,
+                boto3_client=boto3_client,
+                **sdk_options,
+            )
+        else:
+            self.raw_stream = _S3BlockCacheIO(
+                bucket=bucket,
+                key=key,
+                block_cache=block_cache,
+                version_id=version_id,
+                boto3_client=boto3_client,
+                **sdk_options,
+            )
 
         # Stores the list of data transformations
         self._data_transformations: list[BaseTransform] = []
@@ -86,6 +119,7 @@ class S3Object(IO[bytes]):
             self._data_transformations.append(GzipTransform())
         if is_csv:
             self._data_transformations.append(CsvTransform())
+        self._auto_decompress = auto_decompress
 
         # Stores the cached transformed stream
         self._transformed_stream: IO[bytes] | None = None
@@ -110,16 +144,39 @@ class S3Object(IO[bytes]):
             # delegated directly to the raw_stream.
             transformed_stream = self.raw_stream
 
+            # Decompression comes first, so other transformations read decompressed data
+            data_transformations = self._data_transformations
+            if self._auto_decompress:
+                decompression = self._get_decompression_transform()
+                if decompression is not None:
+                    data_transformations = [decompression, *data_transformations]
+
             # Now we apply each transformation in order
             # e.g: when self._data_transformations is [transform_1, transform_2], then
             # transformed_stream is the equivalent of doing transform_2(transform_1(...(raw_stream)))
-            for transformation in self._data_transformations:
+            for transformation in data_transformations:
                 transformed_stream = transformation.transform(transformed_stream)
 
             self._transformed_stream = transformed_stream
 
         return self._transformed_stream
 
+    def _get_decompression_transform(self) -> BaseTransform | None:
+        """
+        Detects the compression of the object from its key, only sending a HEAD request when the key has no
+        known extension
+        """
+        decompression = get_decompression_transform(self.key)
+        if decompression is None:
+            head_object = self.raw_stream.head_object
+            decompression = get_decompression_transform(
+                self.key,
+                content_type=head_object.get("ContentType"),
+                content_encoding=head_object.get("ContentEncoding"),
+            )
+
+        return decompression
+
     @overload
     def transform(self, transformations: BaseTransform[T] | Sequence[BaseTransform[T]], in_place: Literal[True]) -> T:
         pass
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import io
+from typing import IO, TYPE_CHECKING, Any, Iterable, Sequence, TypeVar
+
+from aws_lambda_powertools.utilities.streaming._s3_multipart_upload_io import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    _S3MultipartUploadIO,
+)
+from aws_lambda_powertools.utilities.streaming.constants import MESSAGE_STREAM_NOT_READABLE
+from aws_lambda_powertools.utilities.streaming.transformations import GzipTransform
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+    from mypy_boto3_s3.client import S3Client
+
+    from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+    _CData = TypeVar("_CData")
+
+
+class S3ObjectWriter(IO[bytes]):
+    """
+    Streamable S3 Object writer.
+
+    S3ObjectWriter implements the IO[bytes], backed by a S3 multipart upload. Data is buffered into parts of
+    `part_size` bytes, uploaded concurrently while you keep writing. Memory stays bounded to
+    `part_size * (max_concurrency + 1)`, however large the object is.
+
+    The object is only created when the writer is closed. When used as a context manager, an exception aborts the
+    upload instead, leaving no object nor incomplete multipart upload behind.
+
+    Parameters
+    ----------
+    bucket: str
+        The S3 bucket
+    key: str
+        The S3 key
+    boto3_client: S3Client, optional
+        An optional boto3 S3 client. If missing, a new one will be created.
+    is_gzip: bool, optional
+        Compresses data written with gzip
+    part_size: int, optional
+        Size of each part, in bytes. Defaults to 8 MiB, and must be at least 5 MiB
+    max_concurrency: int, optional
+        Maximum number of parts uploaded concurrently. Defaults to 4
+    sdk_options: dict, optional
+        Dictionary of options that will be passed to the S3 Client create_multipart_upload or put_object API call
+
+    Example
+    -------
+
+    **Writes a gzip compressed object, line by line:**
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3ObjectWriter
+        >>>
+        >>> with S3ObjectWriter(bucket="bucket", key="key.gz", is_gzip=True) as writer:
+        >>>     for i in range(1_000_000):
+        >>>         writer.write(f"line {i}\\n".encode())
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        boto3_client: S3Client | None = None,
+        is_gzip: bool | None = False,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **sdk_options,
+    ):
+        self.bucket = bucket
+        self.key = key
+
+        # The underlying multipart upload, buffering and uploading parts
+        self.raw_stream = _S3MultipartUploadIO(
+            bucket=bucket,
+            key=key,
+            boto3_client=boto3_client,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+            **sdk_options,
+        )
+
+        # Stores the list of data transformations, applied to data before it's uploaded
+        self._data_transformations: list[BaseTransform] = []
+        if is_gzip:
+            self._data_transformations.append(GzipTransform())
+
+        # Stores the cached transformed stream
+        self._transformed_stream: IO[bytes] | None = None
+
+    @property
+    def transformed_stream(self) -> IO[bytes]:
+        """
+        Returns a IO[bytes] stream with all the data transformations applied in order
+        """
+        if self._transformed_stream is None:
+            # Data written to the transformed stream flows through every transformation, down to the raw stream
+            transformed_stream: IO[bytes] = self.raw_stream
+            for transformation in self._data_transformations:
+                transformed_stream = transformation.transform(transformed_stream)
+
+            self._transformed_stream = transformed_stream
+
+        return self._transformed_stream
+
+    def abort(self) -> None:
+        """
+        Discards the data written, aborting the multipart upload if one was started
+        """
+        self.raw_stream.abort()
+
+        # Transformations may flush data on close, e.g. the gzip trailer, which can't be written anymore
+        if self._transformed_stream is not None and self._transformed_stream is not self.raw_stream:
+            try:
+                self._transformed_stream.close()
+            except ValueError:
+                pass
+
+    def close(self) -> None:
+        # Transformations are closed first, flushing any data they buffer (e.g. the gzip trailer) to the raw stream
+        try:
+            if self._transformed_stream is not None and self._transformed_stream is not self.raw_stream:
+                self._transformed_stream.close()
+        except BaseException:
+            self.raw_stream.abort()
+            raise
+
+        self.raw_stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data: bytes | bytearray | memoryview | Sequence[Any] | mmap | _CData) -> int:
+        return self.transformed_stream.write(data)  # type: ignore[arg-type]
+
+    def writelines(
+        self,
+        data: Iterable[bytes | bytearray | memoryview | Sequence[Any] | mmap | _CData],
+    ) -> None:
+        self.transformed_stream.writelines(data)  # type: ignore[arg-type]
+
+    def flush(self) -> None:
+        self.transformed_stream.flush()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        raise io.UnsupportedOperation("seek")
+
+    def seekable(self) -> bool:
+        return False
+
+    def readable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.transformed_stream.tell()
+
+    @property
+    def closed(self) -> bool:
+        return self.raw_stream.closed
+
+    def fileno(self) -> int:
+        raise NotImplementedError("this stream is not backed by a file descriptor")
+
+    def isatty(self) -> bool:
+        return False
+
+    def truncate(self, size: int | None = 0) -> int:
+        raise io.UnsupportedOperation("truncate")
+
+    def read(self, size: int = -1) -> bytes:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def readline(self, size: int | None = -1) -> bytes:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def readlines(self, hint: int = -1) -> list[bytes]:
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def __next__(self):
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
+
+    def __iter__(self):
+        raise NotImplementedError(MESSAGE_STREAM_NOT_READABLE)
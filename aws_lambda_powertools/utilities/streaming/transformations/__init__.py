@@ -1,6 +1,21 @@
 from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+from aws_lambda_powertools.utilities.streaming.transformations.bz2 import Bz2Transform
+from aws_lambda_powertools.utilities.streaming.transformations.compression import get_decompression_transform
 from aws_lambda_powertools.utilities.streaming.transformations.csv import CsvTransform
 from aws_lambda_powertools.utilities.streaming.transformations.gzip import GzipTransform
+from aws_lambda_powertools.utilities.streaming.transformations.lzma import LzmaTransform
+from aws_lambda_powertools.utilities.streaming.transformations.ndjson import NdjsonTransform
 from aws_lambda_powertools.utilities.streaming.transformations.zip import ZipTransform
+from aws_lambda_powertools.utilities.streaming.transformations.zstd import ZstdTransform
 
-__all__ = ["BaseTransform", "GzipTransform", "ZipTransform", "CsvTransform"]
+__all__ = [
+    "BaseTransform",
+    "GzipTransform",
+    "ZipTransform",
+    "CsvTransform",
+    "NdjsonTransform",
+    "Bz2Transform",
+    "LzmaTransform",
+    "ZstdTransform",
+    "get_decompression_transform",
+]
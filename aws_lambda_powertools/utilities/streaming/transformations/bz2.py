@@ -0,0 +1,31 @@
+from bz2 import BZ2File
+from typing import IO
+
+from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+
+class Bz2Transform(BaseTransform):
+    """
+    Bzip2 data transform.
+
+    Returns a bz2.BZ2File that reads data from the input stream:
+    https://docs.python.org/3/library/bz2.html#bz2.BZ2File
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import Bz2Transform
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key.bz2")
+        >>> reader = s3object.transform(Bz2Transform())
+        >>> for line in reader:
+        >>>   print(line)
+
+    When the input stream is write-only, data written is compressed instead.
+    """
+
+    def transform(self, input_stream: IO[bytes]) -> BZ2File:
+        if input_stream.readable():
+            return BZ2File(input_stream, mode="rb", **self.transform_options)
+        return BZ2File(input_stream, mode="wb", **self.transform_options)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from aws_lambda_powertools.utilities.streaming.transformations.bz2 import Bz2Transform
+from aws_lambda_powertools.utilities.streaming.transformations.gzip import GzipTransform
+from aws_lambda_powertools.utilities.streaming.transformations.lzma import LzmaTransform
+from aws_lambda_powertools.utilities.streaming.transformations.zstd import ZstdTransform
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+# Decompression transformations, by file extension
+EXTENSION_TRANSFORMS: dict[str, Callable[[], BaseTransform]] = {
+    ".gz": GzipTransform,
+    ".gzip": GzipTransform,
+    ".bz2": Bz2Transform,
+    ".xz": LzmaTransform,
+    ".lzma": LzmaTransform,
+    ".zst": ZstdTransform,
+    ".zstd": ZstdTransform,
+}
+
+# Decompression transformations, by Content-Type or Content-Encoding
+MEDIA_TYPE_TRANSFORMS: dict[str, Callable[[], BaseTransform]] = {
+    "gzip": GzipTransform,
+    "x-gzip": GzipTransform,
+    "application/gzip": GzipTransform,
+    "application/x-gzip": GzipTransform,
+    "bzip2": Bz2Transform,
+    "application/x-bzip2": Bz2Transform,
+    "xz": LzmaTransform,
+    "application/x-xz": LzmaTransform,
+    "application/x-lzma": LzmaTransform,
+    "zstd": ZstdTransform,
+    "application/zstd": ZstdTransform,
+}
+
+
+def get_decompression_transform(
+    key: str,
+    content_type: str | None = None,
+    content_encoding: str | None = None,
+) -> BaseTransform | None:
+    """
+    Returns the transformation decompressing an object, based on its key extension, or otherwise on its
+    Content-Encoding or Content-Type.
+
+    Parameters
+    ----------
+    key: str
+        The S3 key, or file name
+    content_type: str, optional
+        The Content-Type of the object, e.g. "application/x-bzip2"
+    content_encoding: str, optional
+        The Content-Encoding of the object, e.g. "zstd"
+
+    Returns
+    -------
+    BaseTransform, optional
+        A new decompression transformation, or None if the object doesn't look compressed
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import (
+        >>>     CsvTransform,
+        >>>     get_decompression_transform,
+        >>> )
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="data.csv.zst")
+        >>> decompression = get_decompression_transform(s3object.key)
+        >>> csv_reader = s3object.transform([decompression, CsvTransform()] if decompression else [CsvTransform()])
+    """
+    _, dot, extension = key.rpartition(".")
+    transform = EXTENSION_TRANSFORMS.get(f".{extension.lower()}") if dot else None
+
+    # Media types may have parameters, e.g. "application/gzip; charset=binary"
+    for media_type in (content_encoding, content_type):
+        if transform is None and media_type:
+            transform = MEDIA_TYPE_TRANSFORMS.get(media_type.split(";")[0].strip().lower())
+
+    return transform() if transform is not None else None
@@ -22,7 +22,15 @@ class GzipTransform(BaseTransform):
         >>> for line in reader:
         >>>   print(line)
 
+    When the input stream is write-only, such as a S3ObjectWriter, data written is compressed instead.
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3ObjectWriter
+        >>>
+        >>> with S3ObjectWriter(bucket="bucket", key="key.gz", is_gzip=True) as writer:
+        >>>   writer.write(b"hello world")
+
     """
 
     def transform(self, input_stream: IO[bytes]) -> GzipFile:
-        return GzipFile(fileobj=input_stream, mode="rb", **self.transform_options)
+        mode = "rb" if input_stream.readable() else "wb"
+        return GzipFile(fileobj=input_stream, mode=mode, **self.transform_options)
@@ -0,0 +1,35 @@
+from lzma import LZMAFile
+from typing import IO
+
+from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+
+class LzmaTransform(BaseTransform):
+    """
+    LZMA data transform, for .xz and legacy .lzma files.
+
+    Returns a lzma.LZMAFile that reads data from the input stream:
+    https://docs.python.org/3/library/lzma.html#lzma.LZMAFile
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import LzmaTransform
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key.xz")
+        >>> reader = s3object.transform(LzmaTransform())
+        >>> for line in reader:
+        >>>   print(line)
+
+    Additional options passed on the constructor, will be passed to the lzma.LZMAFile constructor. For instance,
+    to bound memory used to decompress untrusted data:
+
+        >>> reader = s3object.transform(LzmaTransform(memlimit=64 * 1024 * 1024))
+
+    When the input stream is write-only, data written is compressed instead.
+    """
+
+    def transform(self, input_stream: IO[bytes]) -> LZMAFile:
+        mode = "rb" if input_stream.readable() else "wb"
+        return LZMAFile(input_stream, mode=mode, **self.transform_options)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+# Size of each read from the input stream. Lines are split from chunks, instead of read one by one
+DEFAULT_CHUNK_SIZE = 256 * 1024  # 256 KiB
+
+
+class NdjsonReader(Iterable[Any]):
+    """
+    Iterator over the records of a newline-delimited JSON stream.
+
+    The input stream is read in chunks of `chunk_size` bytes, split into lines and deserialized one chunk at a time,
+    so memory stays bounded to a chunk, plus a batch of records, regardless of the size of the stream.
+
+    Parameters
+    ----------
+    input_stream: IO[bytes]
+        The stream of newline-delimited JSON to read
+    batch_size: int, optional
+        Yields lists of up to `batch_size` records, instead of a record at a time
+    deserializer: Callable[[bytes], Any], optional
+        Function deserializing each line, received as bytes. Defaults to the standard library `json` decoder
+    chunk_size: int, optional
+        Size of each read from the input stream, in bytes. Defaults to 256 KiB
+    """
+
+    def __init__(
+        self,
+        input_stream: IO[bytes],
+        batch_size: int | None = None,
+        deserializer: Callable[[bytes], Any] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+
+        self.input_stream = input_stream
+        self.batch_size = batch_size
+        self.deserializer = deserializer
+        self.chunk_size = chunk_size
+
+        self._decoder = json.JSONDecoder()
+
+        self._records: Iterator[Any] = self._read_records() if batch_size is None else self._read_batches(batch_size)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Iterating over the generator directly saves a method call per record
+        return self._records
+
+    def __next__(self) -> Any:
+        return next(self._records)
+
+    def _read_chunks(self) -> Iterator[list[Any]]:
+        """
+        Yields the records deserialized from each chunk of the input stream
+        """
+        # Data read since the last complete line, usually the start of a line spanning two chunks
+        pending: list[bytes] = []
+
+        while True:
+            chunk = self.input_stream.read(self.chunk_size)
+            if not chunk:
+                break
+
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                pending.append(chunk)
+                continue
+
+            pending.append(chunk[:end])
+            yield self._deserialize_lines(b"".join(pending))
+            pending = [chunk[end:]]
+
+        remainder = b"".join(pending)
+        if remainder:
+            yield self._deserialize_lines(remainder)
+
+    def _deserialize_lines(self, data: bytes) -> list[Any]:
+        # Blank lines, including a trailing newline, are not records
+        if self.deserializer is None:
+            # Decoding a chunk at once is cheaper than decoding each line within json.loads
+            return [self._decoder.decode(line) for line in data.decode("utf-8").split("\n") if line.strip()]
+
+        return [self.deserializer(line) for line in data.split(b"\n") if line.strip()]
+
+    def _read_records(self) -> Iterator[Any]:
+        for records in self._read_chunks():
+            yield from records
+
+    def _read_batches(self, batch_size: int) -> Iterator[list[Any]]:
+        batch: list[Any] = []
+
+        for records in self._read_chunks():
+            batch.extend(records)
+            if len(batch) < batch_size:
+                continue
+
+            for start in range(0, len(batch) - batch_size + 1, batch_size):
+                yield batch[start : start + batch_size]
+            batch = batch[len(batch) - len(batch) % batch_size :]
+
+        if batch:
+            yield batch
+
+
+class NdjsonTransform(BaseTransform):
+    """
+    NDJSON (JSON Lines) data transform.
+
+    Returns a NdjsonReader that yields each line of the input stream deserialized as JSON, reading the stream
+    in chunks to keep memory constant however large the stream is. Blank lines are skipped.
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import NdjsonTransform
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key")
+        >>> for record in s3object.transform(NdjsonTransform()):
+        >>>   print(record)
+
+    Use `batch_size` to receive lists of records instead, e.g. to write them in bulk.
+
+        >>> for records in s3object.transform(NdjsonTransform(batch_size=500)):
+        >>>   print(len(records))
+
+    Use `deserializer` to parse each line, received as bytes, with a faster JSON library.
+
+        >>> import orjson
+        >>>
+        >>> for record in s3object.transform(NdjsonTransform(deserializer=orjson.loads)):
+        >>>   print(record)
+
+    Additional options passed on the constructor will be passed to the NdjsonReader constructor.
+    """
+
+    def transform(self, input_stream: IO[bytes]) -> NdjsonReader:
+        return NdjsonReader(input_stream=input_stream, **self.transform_options)
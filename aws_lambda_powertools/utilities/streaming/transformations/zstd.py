@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import io
+from typing import IO, cast
+
+from aws_lambda_powertools.shared.lazy_import import LazyLoader
+from aws_lambda_powertools.utilities.streaming.transformations.base import BaseTransform
+
+# zstandard is an optional dependency, only imported once the transformation is used
+zstandard = LazyLoader("zstandard", globals(), "zstandard")
+
+
+class ZstdTransform(BaseTransform):
+    """
+    Zstandard data transform. Requires the `zstandard` package.
+
+    Returns a io.BufferedReader that decompresses data from the input stream as it's read, frame by frame:
+    https://python-zstandard.readthedocs.io/en/latest/decompressor.html#stream-reader-api
+
+    Example
+    -------
+
+        >>> from aws_lambda_powertools.utilities.streaming import S3Object
+        >>> from aws_lambda_powertools.utilities.streaming.transformations import ZstdTransform
+        >>>
+        >>> s3object = S3Object(bucket="bucket", key="key.zst")
+        >>> reader = s3object.transform(ZstdTransform())
+        >>> for line in reader:
+        >>>   print(line)
+
+    Additional options passed on the constructor, will be passed to the zstandard.ZstdDecompressor constructor.
+    Memory used is bounded to the decompression window, which you can limit for untrusted data:
+
+        >>> reader = s3object.transform(ZstdTransform(max_window_size=8 * 1024 * 1024))
+
+    When the input stream is write-only, data written is compressed instead, and options are passed to the
+    zstandard.ZstdCompressor constructor.
+    """
+
+    def transform(self, input_stream: IO[bytes]) -> IO[bytes]:
+        if not input_stream.readable():
+            compressor = zstandard.ZstdCompressor(**self.transform_options)
+            return compressor.stream_writer(input_stream, closefd=False)
+
+        decompressor = zstandard.ZstdDecompressor(**self.transform_options)
+        reader = decompressor.stream_reader(input_stream, read_across_frames=True, closefd=False)
+
+        # zstandard readers don't implement readline, which line iteration and other transformations rely on
+        return cast(IO[bytes], io.BufferedReader(reader))
@@ -2,6 +2,7 @@
 Simple validator to enforce incoming/outgoing event conforms with JSON Schema
 """
 
+from .base import precompile_schema
 from .exceptions import (
     InvalidEnvelopeExpressionError,
     InvalidSchemaFormatError,
@@ -12,6 +13,7 @@ from .validator import validate, validator
 __all__ = [
     "validate",
     "validator",
+    "precompile_schema",
     "InvalidSchemaFormatError",
     "SchemaValidationError",
     "InvalidEnvelopeExpressionError",
@@ -1,13 +1,92 @@
 from __future__ import annotations
 
+import json
 import logging
+from functools import partial, update_wrapper
+from typing import Any, Callable, Hashable
 
 import fastjsonschema  # type: ignore
 
+from aws_lambda_powertools.shared.cache_dict import LRUDict
 from aws_lambda_powertools.utilities.validation.exceptions import InvalidSchemaFormatError, SchemaValidationError
 
 logger = logging.getLogger(__name__)
 
+# Compiled validators keyed by schema content, formats, handlers and provider options
+CACHE_COMPILED_VALIDATOR = LRUDict(max_items=128)
+# Validators explicitly compiled ahead of time; never evicted
+PRECOMPILED_VALIDATOR: dict[Hashable, Callable] = {}
+
+
+def precompile_schema(
+    schema: dict,
+    formats: dict | None = None,
+    handlers: dict | None = None,
+    provider_options: dict | None = None,
+    validate_function: Callable | None = None,
+) -> Callable:
+    """Compile a JSON Schema ahead of time, e.g. at import time, so invocations don't compile it
+
+    Validators compiled on demand are kept in a bounded cache. Precompiled validators are kept for the lifetime
+    of the process instead, and used by `validate` and `@validator` whenever the same schema, formats, handlers
+    and provider options are used.
+
+    Parameters
+    ----------
+    schema : dict
+        JSON Schema to compile
+    formats: dict
+        Custom formats containing a key (e.g. int64) and a value expressed as regex or callback returning bool
+    handlers: Dict
+        Custom methods to retrieve remote schemes, keyed off of URI scheme
+    provider_options: Dict
+        Arguments that will be passed directly to the underlying compile call, in this case fastjsonchema.compile.
+        For all supported arguments see: https://horejsek.github.io/python-fastjsonschema/#fastjsonschema.compile
+    validate_function: Callable, optional
+        Validation function generated at build time with `fastjsonschema.compile_to_code`, used instead of
+        compiling the schema. Custom formats are bound to it, if any.
+
+    Returns
+    -------
+    Callable
+        The compiled validation function
+
+    Raises
+    ------
+    InvalidSchemaFormatError
+        When JSON schema provided is invalid
+
+    Example
+    -------
+
+    **Precompile schema at import time**
+
+        from aws_lambda_powertools.utilities.validation import precompile_schema, validator
+
+        precompile_schema(schema=INPUT)
+
+        @validator(inbound_schema=INPUT)
+        def handler(event, context):
+            return event
+    """
+    formats = formats or {}
+    handlers = handlers or {}
+    provider_options = provider_options or {}
+
+    cache_key = _build_cache_key(schema, formats, handlers, provider_options)
+    if cache_key is None:
+        raise InvalidSchemaFormatError(
+            f"Schema received: {schema}, Formats: {formats}. Error: schema or options are not hashable",
+        )
+
+    if validate_function is None:
+        validate_function = _compile_schema(schema, formats, handlers, provider_options)
+    elif formats:
+        validate_function = update_wrapper(partial(validate_function, custom_formats=formats), validate_function)
+
+    PRECOMPILED_VALIDATOR[cache_key] = validate_function
+    return validate_function
+
 
 def validate_data_against_schema(
     data: dict | str,
@@ -49,13 +128,8 @@ def validate_data_against_schema(
         formats = formats or {}
         handlers = handlers or {}
         provider_options = provider_options or {}
-        return fastjsonschema.validate(
-            definition=schema,
-            data=data,
-            formats=formats,
-            handlers=handlers,
-            **provider_options,
-        )
+        validate_function = _get_validate_function(schema, formats, handlers, provider_options)
+        return validate_function(data)
     except (TypeError, AttributeError, fastjsonschema.JsonSchemaDefinitionException) as e:
         raise InvalidSchemaFormatError(f"Schema received: {schema}, Formats: {formats}. Error: {e}")
     except fastjsonschema.JsonSchemaValueException as e:
@@ -70,3 +144,46 @@ def validate_data_against_schema(
             rule=e.rule,
             rule_definition=e.rule_definition,
         )
+
+
+def _get_validate_function(schema: dict, formats: dict, handlers: dict, provider_options: dict) -> Callable:
+    """Return a compiled validation function, compiling and caching it on first use"""
+    cache_key = _build_cache_key(schema, formats, handlers, provider_options)
+    if cache_key is None:
+        logger.debug("Schema or options can't be used as cache key, compiling schema without caching it")
+        return _compile_schema(schema, formats, handlers, provider_options)
+
+    validate_function = PRECOMPILED_VALIDATOR.get(cache_key) or CACHE_COMPILED_VALIDATOR.get(cache_key)
+    if validate_function is None:
+        logger.debug("Compiling schema and caching validation function")
+        validate_function = _compile_schema(schema, formats, handlers, provider_options)
+        CACHE_COMPILED_VALIDATOR[cache_key] = validate_function
+
+    return validate_function
+
+
+def _compile_schema(schema: dict, formats: dict, handlers: dict, provider_options: dict) -> Callable:
+    try:
+        return fastjsonschema.compile(definition=schema, formats=formats, handlers=handlers, **provider_options)
+    except (TypeError, AttributeError, fastjsonschema.JsonSchemaDefinitionException) as e:
+        raise InvalidSchemaFormatError(f"Schema received: {schema}, Formats: {formats}. Error: {e}")
+
+
+def _build_cache_key(schema: Any, formats: dict, handlers: dict, provider_options: dict) -> Hashable | None:
+    """Build a cache key from schema content and options, or None when any of them can't be hashed
+
+    Schemas are keyed by content rather than identity, so a schema mutated after its first use is compiled again.
+    """
+    try:
+        schema_key = json.dumps(schema, sort_keys=True)
+        cache_key = (
+            schema_key,
+            frozenset(formats.items()),
+            frozenset(handlers.items()),
+            frozenset(provider_options.items()),
+        )
+        hash(cache_key)
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+    return cache_key
@@ -0,0 +1,27 @@
+import httpx  # external dependency
+
+from aws_lambda_powertools.utilities.batch import (
+    AsyncBatchProcessor,
+    EventType,
+    async_process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# At most 20 requests in flight, and 100 new requests every second
+processor = AsyncBatchProcessor(event_type=EventType.SQS, max_concurrency=20, max_records_per_second=100)
+client = httpx.AsyncClient(limits=httpx.Limits(max_connections=20))
+
+
+async def async_record_handler(record: SQSRecord):
+    ret = await client.post("https://httpbin.org/post", content=record.body)
+    return ret.status_code
+
+
+def lambda_handler(event, context: LambdaContext):
+    return async_process_partial_response(
+        event=event,
+        record_handler=async_record_handler,
+        processor=processor,
+        context=context,
+    )
@@ -0,0 +1,36 @@
+import os
+
+import boto3
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.utilities.batch import (
+    EventType,
+    ThreadedBatchProcessor,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=10)
+tracer = Tracer()
+logger = Logger()
+
+table = boto3.resource("dynamodb").Table(os.getenv("TABLE_NAME", "orders"))
+
+
+@tracer.capture_method
+def record_handler(record: SQSRecord):
+    # Blocking call: other records are processed by other threads while we wait for DynamoDB
+    table.put_item(Item=record.json_body)
+    logger.info("Order saved", extra={"message_id": record.message_id})
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def lambda_handler(event, context: LambdaContext):
+    return process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=processor,
+        context=context,
+    )
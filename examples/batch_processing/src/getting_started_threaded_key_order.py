@@ -0,0 +1,36 @@
+import os
+
+import boto3
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.utilities.batch import (
+    EventType,
+    ThreadedBatchProcessor,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import KinesisStreamRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+processor = ThreadedBatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=10, preserve_key_order=True)
+tracer = Tracer()
+logger = Logger()
+
+table = boto3.resource("dynamodb").Table(os.getenv("TABLE_NAME", "accounts"))
+
+
+@tracer.capture_method
+def record_handler(record: KinesisStreamRecord):
+    # Updates for the same account (partition key) are applied one at a time, in order
+    table.put_item(Item=record.kinesis.data_as_json())
+    logger.info("Account updated", extra={"partition_key": record.kinesis.partition_key})
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def lambda_handler(event, context: LambdaContext):
+    return process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=processor,
+        context=context,
+    )
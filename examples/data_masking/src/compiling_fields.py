@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.data_masking import DataMasking
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+data_masker = DataMasking()
+
+# parsed once during cold start, and reused for every record
+masking_plan = data_masker.compile(fields=["email", "address.street", "company_address"])
+
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context: LambdaContext) -> list[dict]:
+    records: list[dict] = event.get("Records", [])
+
+    return [data_masker.erase(record, fields=masking_plan) for record in records]
@@ -0,0 +1,27 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+app = APIGatewayRestResolver(enable_compiled_routing=True)
+
+
+@app.get("/todos")
+def get_todos():
+    return {"todos": []}
+
+
+@app.get("/todos/<todo_id>")
+def get_todo_by_id(todo_id: str):  # routes are looked up in a trie; no longer one regex per route
+    return {"todo_id": todo_id}
+
+
+@app.get("/files/<file_id>.json")
+def get_file(file_id: str):  # custom patterns within a path segment are still matched using regex
+    return {"file_id": file_id}
+
+
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
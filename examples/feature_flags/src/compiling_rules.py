@@ -0,0 +1,18 @@
+from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app_config = AppConfigStore(environment="dev", application="product-catalogue", name="features", max_age=300)
+
+feature_flags = FeatureFlags(store=app_config, enable_compiled_rules=True)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    """
+    Rules are validated and compiled once per configuration version, then reused across invocations.
+    """
+
+    ctx = {"tenant_id": event.get("tenant_id", ""), "tier": event.get("tier", "standard")}
+
+    all_features: list[str] = feature_flags.get_enabled_features(context=ctx)
+
+    return {"enabled_features": all_features}
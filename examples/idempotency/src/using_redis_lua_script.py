@@ -0,0 +1,21 @@
+import os
+
+from redis import Redis
+
+from aws_lambda_powertools.utilities.idempotency import (
+    idempotent,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import (
+    RedisCachePersistenceLayer,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+redis_endpoint = os.getenv("REDIS_CLUSTER_ENDPOINT", "localhost")
+client = Redis(host=redis_endpoint, port=6379, socket_connect_timeout=5, socket_timeout=5)
+
+persistence_layer = RedisCachePersistenceLayer(client=client, enable_lua_script=True)
+
+
+@idempotent(persistence_store=persistence_layer)
+def lambda_handler(event: dict, context: LambdaContext):
+    return {"message": "success", "statusCode": 200}
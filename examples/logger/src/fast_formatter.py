@@ -0,0 +1,13 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.formatters.fast import LambdaPowertoolsFastFormatter
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger(service="payment", logger_formatter=LambdaPowertoolsFastFormatter())
+
+
+@logger.inject_lambda_context
+def lambda_handler(event: dict, context: LambdaContext) -> str:
+    for order in event.get("orders", []):
+        logger.info("Collecting payment", order_id=order["id"])
+
+    return "hello world"
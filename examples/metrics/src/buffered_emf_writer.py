@@ -0,0 +1,13 @@
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+emf_writer = EMFWriter()
+metrics = Metrics(emf_writer=emf_writer)
+
+
+@metrics.log_metrics  # writes all buffered EMF blobs at once
+def lambda_handler(event: dict, context: LambdaContext):
+    for record in event.get("Records", []):
+        metrics.add_metric(name=f"Processed{record['eventSource']}", unit=MetricUnit.Count, value=1)
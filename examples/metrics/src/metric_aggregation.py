@@ -0,0 +1,11 @@
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricAggregation, MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+metrics = Metrics(metric_aggregation=MetricAggregation.StatisticSet)
+
+
+@metrics.log_metrics  # emits a single Min/Max/Sum/Count for PayloadSize
+def lambda_handler(event: dict, context: LambdaContext):
+    for record in event.get("Records", []):
+        metrics.add_metric(name="PayloadSize", unit=MetricUnit.Bytes, value=len(record["body"]))
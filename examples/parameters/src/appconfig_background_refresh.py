@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# Polls each configuration in a background thread, at the interval returned by AppConfig
+appconf_provider = parameters.AppConfigProvider(environment="dev", application="comments", background_refresh=True)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Served from cache, while the configuration is polled in the background.
+    # The same dict is returned as long as the configuration is unchanged
+    config: Any = appconf_provider.get("config", transform="json", max_age=30)
+
+    return {"page_size": config["page_size"], "statusCode": 200}
@@ -0,0 +1,27 @@
+from typing import Any
+
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+metrics = Metrics()
+
+# Keep up to 500 secrets, using up to 4 MiB, evicting the least recently used ones
+secrets_provider = parameters.SecretsProvider(
+    cache=parameters.ParameterCache(max_entries=500, max_bytes=4 * 1024 * 1024),
+)
+
+
+@metrics.log_metrics
+def lambda_handler(event: dict, context: LambdaContext):
+    tenant_id = event["tenant_id"]
+
+    # Each tenant has its own secret, so this reads many different secrets over time
+    credentials: Any = secrets_provider.get(f"tenants/{tenant_id}/credentials", transform="json")
+
+    # hits, misses, evictions and others since the provider was created
+    for name, value in secrets_provider.stats.as_dict().items():
+        metrics.add_metric(name=f"SecretsCache_{name}", unit=MetricUnit.Count, value=value)
+
+    return {"username": credentials["username"], "statusCode": 200}
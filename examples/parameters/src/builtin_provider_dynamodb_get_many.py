@@ -0,0 +1,18 @@
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+dynamodb_provider = parameters.DynamoDBProvider(table_name="TenantConfigTable")
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    tenant_ids: list = event["tenant_ids"]
+
+    # One BatchGetItem call per 100 tenants, instead of one GetItem call per tenant
+    configs: Any = dynamodb_provider.get_many(tenant_ids, transform="json", raise_on_error=False)
+
+    # Tenants without a config item
+    missing = configs.pop("_errors")
+
+    return {"configs": configs, "missing": missing, "statusCode": 200}
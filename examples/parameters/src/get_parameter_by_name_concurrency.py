@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aws_lambda_powertools.utilities.parameters.ssm import get_parameters_by_name
+
+# e.g. the configuration of each of 200 tenants
+parameters: dict[str, Any] = {f"/develop/service/tenants/{tenant}/config": {} for tenant in range(200)}
+
+# Loaded at cold start with up to 8 concurrent calls to SSM, instead of one call after the other
+tenants_config: dict[str, Any] = get_parameters_by_name(parameters=parameters, transform="json", max_concurrency=8)
+
+
+def handler(event, context):
+    tenant_config = tenants_config[f"/develop/service/tenants/{event['tenant_id']}/config"]
+    return {"config": tenant_config}
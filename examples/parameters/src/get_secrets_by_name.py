@@ -0,0 +1,20 @@
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+TENANTS = ["tenant-a", "tenant-b", "tenant-c"]
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Up to 20 secrets are fetched per BatchGetSecretValue call
+    secrets: Any = parameters.get_secrets_by_name(
+        secrets={f"tenants/{tenant}/credentials": {} for tenant in TENANTS},
+        transform="json",
+        raise_on_error=False,
+    )
+
+    # Secrets that couldn't be fetched
+    failed = secrets.pop("_errors")
+
+    return {"tenants": len(secrets), "failed": failed, "statusCode": 200}
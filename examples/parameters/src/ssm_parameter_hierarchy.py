@@ -0,0 +1,17 @@
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+ssm_provider = parameters.SSMProvider()
+
+# Fetch each branch of a large hierarchy concurrently during the init phase
+ssm_provider.get_multiple_by_paths(["/app/db", "/app/api", "/app/features"], max_concurrency=3)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Served from the parameters already fetched under /app/db, without calling SSM again
+    replica: Any = ssm_provider.get_multiple("/app/db/replica")
+    features: Any = ssm_provider.get_multiple("/app/features", transform="json")
+
+    return {"replica_host": replica["host"], "features": features, "statusCode": 200}
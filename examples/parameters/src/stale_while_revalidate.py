@@ -0,0 +1,28 @@
+from typing import Any
+
+import requests
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+# Serve expired values for up to 5 minutes while they're refreshed in the background,
+# and spread the expiry of parameters cached together by up to 10% of their max_age
+ssm_provider = parameters.SSMProvider(stale_while_revalidate=300, max_age_jitter=0.1)
+
+# Fetch parameters concurrently during the init phase, so invocations are served from cache
+ssm_provider.prefetch(["/lambda-powertools/endpoint_comments", "/lambda-powertools/feature_flags"], max_age=60)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    endpoint_comments: Any = ssm_provider.get("/lambda-powertools/endpoint_comments", max_age=60)
+
+    # the value of this parameter is https://jsonplaceholder.typicode.com/comments/
+    comments: requests.Response = requests.get(endpoint_comments)
+
+    # hits, misses, stale_serves, refreshes and refresh_errors since the provider was created
+    logger.info("Parameters cache usage", extra=ssm_provider.stats.as_dict())
+
+    return {"comments": comments.json()[:10], "statusCode": 200}
@@ -0,0 +1,11 @@
+from typing import Dict
+
+from aws_lambda_powertools.utilities.streaming import S3Object
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def lambda_handler(event: Dict[str, str], context: LambdaContext):
+    # e.g. "data.csv.zst", "data.csv.bz2", "data.csv.xz", or "data.csv.gz"
+    s3 = S3Object(bucket=event["bucket"], key=event["key"], auto_decompress=True, is_csv=True)
+    for row in s3:
+        print(row)
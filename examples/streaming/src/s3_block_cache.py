@@ -0,0 +1,16 @@
+from typing import Dict
+
+from aws_lambda_powertools.utilities.streaming import BlockCacheConfig, S3Object
+from aws_lambda_powertools.utilities.streaming.transformations import ZipTransform
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+block_cache = BlockCacheConfig(block_size=1024 * 1024, max_cache_size=32 * 1024 * 1024, read_ahead_blocks=4)
+
+
+def lambda_handler(event: Dict[str, str], context: LambdaContext):
+    s3 = S3Object(bucket=event["bucket"], key=event["key"], block_cache=block_cache)
+    zip_reader = s3.transform(ZipTransform())
+
+    # zipfile seeks to each member and back to the central directory: blocks already read are served from memory
+    for name in zip_reader.namelist():
+        print(name, len(zip_reader.read(name)))
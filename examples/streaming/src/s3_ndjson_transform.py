@@ -0,0 +1,13 @@
+from typing import Dict
+
+from aws_lambda_powertools.utilities.streaming import S3Object
+from aws_lambda_powertools.utilities.streaming.transformations import NdjsonTransform
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def lambda_handler(event: Dict[str, str], context: LambdaContext):
+    s3 = S3Object(bucket=event["bucket"], key=event["key"], is_gzip=True)
+
+    # each line is deserialized as you iterate, yielding lists of up to 500 records
+    for records in s3.transform(NdjsonTransform(batch_size=500)):
+        print(f"Writing {len(records)} records in bulk")
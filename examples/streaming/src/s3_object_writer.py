@@ -0,0 +1,14 @@
+import json
+from typing import Dict
+
+from aws_lambda_powertools.utilities.streaming import S3Object, S3ObjectWriter
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def lambda_handler(event: Dict[str, str], context: LambdaContext):
+    s3 = S3Object(bucket=event["bucket"], key=event["key"], is_gzip=True, is_csv=True)
+
+    # parts are uploaded while rows are still being read, and the object is created once the writer is closed
+    with S3ObjectWriter(bucket=event["bucket"], key=f"{event['key']}.ndjson.gz", is_gzip=True) as writer:
+        for row in s3:
+            writer.write(json.dumps(row).encode() + b"\n")
@@ -0,0 +1,13 @@
+import getting_started_validator_decorator_schema as schemas
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from aws_lambda_powertools.utilities.validation import precompile_schema, validator
+
+# compiled during the init phase, so no invocation pays for schema compilation
+precompile_schema(schema=schemas.INPUT)
+precompile_schema(schema=schemas.OUTPUT)
+
+
+@validator(inbound_schema=schemas.INPUT, outbound_schema=schemas.OUTPUT)
+def lambda_handler(event, context: LambdaContext) -> dict:
+    return {"body": {"user_id": event.get("user_id")}, "statusCode": 200}
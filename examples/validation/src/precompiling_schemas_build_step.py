@@ -0,0 +1,8 @@
+from pathlib import Path
+
+import fastjsonschema
+import getting_started_validator_decorator_schema as schemas
+
+# run as part of your build, e.g. `python precompiling_schemas_build_step.py`
+# the validation function is named after the schema $id, e.g. `validate_http___example_com_example_json`
+Path("input_schema_validator.py").write_text(fastjsonschema.compile_to_code(schemas.INPUT))
@@ -0,0 +1,16 @@
+import getting_started_validator_decorator_schema as schemas
+import input_schema_validator  # generated at build time
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from aws_lambda_powertools.utilities.validation import precompile_schema, validator
+
+# no compilation happens during cold start either
+precompile_schema(
+    schema=schemas.INPUT,
+    validate_function=input_schema_validator.validate_http___example_com_example_json,
+)
+
+
+@validator(inbound_schema=schemas.INPUT)
+def lambda_handler(event, context: LambdaContext) -> dict:
+    return event
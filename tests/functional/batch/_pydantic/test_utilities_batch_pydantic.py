@@ -11,7 +11,9 @@ from aws_lambda_powertools.utilities.batch import (
     BatchProcessor,
     EventType,
     SqsFifoPartialProcessor,
+    ThreadedBatchProcessor,
     batch_processor,
+    process_partial_response,
 )
 from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import (
     DynamoDBRecord,
@@ -639,3 +641,65 @@ def test_async_batch_processor_kinesis_context_parser_model_with_partial_validat
             {"itemIdentifier": malformed_record["kinesis"]["sequenceNumber"]},
         ],
     }
+
+
+def test_threaded_batch_processor_preserve_key_order_short_circuits_poison_pills(
+    kinesis_record_handler_model: Callable,
+    kinesis_event_factory,
+    order_event_factory,
+):
+    # GIVEN a failing record, followed by a record failing model validation with the same partition key
+    failed_record = kinesis_event_factory(order_event_factory({"type": "fail"}))
+    malformed_record = kinesis_event_factory(order_event_factory({"type": "success"}))
+    malformed_record["eventSourceARN"] = None
+    other_key_record = kinesis_event_factory(order_event_factory({"type": "success"}))
+    other_key_record["kinesis"]["partitionKey"] = "2"
+    records = [failed_record, malformed_record, other_key_record]
+
+    # WHEN processing records in order of partition key
+    processor = ThreadedBatchProcessor(
+        event_type=EventType.KinesisDataStreams,
+        model=OrderKinesisRecord,
+        preserve_key_order=True,
+    )
+    response = process_partial_response(
+        event={"Records": records},
+        record_handler=kinesis_record_handler_model,
+        processor=processor,
+    )
+
+    # THEN the record failing model validation is short-circuited, and reported as a partial failure
+    assert response == {
+        "batchItemFailures": [
+            {"itemIdentifier": failed_record["kinesis"]["sequenceNumber"]},
+            {"itemIdentifier": malformed_record["kinesis"]["sequenceNumber"]},
+        ],
+    }
+
+
+def test_sqs_fifo_batch_processor_concurrent_groups_short_circuit_poison_pills(
+    sqs_event_fifo_factory,
+    record_handler_model: Callable,
+    order_event_factory,
+):
+    # GIVEN a failing record, followed by a record failing model validation in the same message group
+    failed_record = sqs_event_fifo_factory(order_event_factory({"type": "fail"}), "1")
+    malformed_record = sqs_event_fifo_factory('{"poison": "pill"}', "1")
+    other_group_record = sqs_event_fifo_factory(order_event_factory({"type": "success"}), "2")
+    records = [failed_record, malformed_record, other_group_record]
+
+    # WHEN processing message groups concurrently
+    processor = SqsFifoPartialProcessor(model=OrderSqs, skip_group_on_error=True, max_concurrent_groups=2)
+    response = process_partial_response(
+        event={"Records": records},
+        record_handler=record_handler_model,
+        processor=processor,
+    )
+
+    # THEN the record failing model validation is short-circuited, and reported as a partial failure
+    assert response == {
+        "batchItemFailures": [
+            {"itemIdentifier": failed_record["messageId"]},
+            {"itemIdentifier": malformed_record["messageId"]},
+        ],
+    }
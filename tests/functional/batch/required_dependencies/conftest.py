@@ -0,0 +1,162 @@
+import json
+import uuid
+from random import randint
+from typing import Any, Awaitable, Callable, Dict
+
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import (
+    DynamoDBRecord,
+)
+from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import (
+    KinesisStreamRecord,
+)
+from tests.functional.utils import b64_to_str, str_to_b64
+
+
+@pytest.fixture(scope="module")
+def sqs_event_fifo_factory() -> Callable:
+    def factory(body: str, message_group_id: str = ""):
+        return {
+            "messageId": f"{uuid.uuid4()}",
+            "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a",
+            "body": body,
+            "attributes": {
+                "ApproximateReceiveCount": "1",
+                "SentTimestamp": "1703675223472",
+                "SequenceNumber": "18882884930918384133",
+                "MessageGroupId": message_group_id,
+                "SenderId": "SenderId",
+                "MessageDeduplicationId": "1eea03c3f7e782c7bdc2f2a917f40389314733ff39f5ab16219580c0109ade98",
+                "ApproximateFirstReceiveTimestamp": "1703675223484",
+            },
+            "messageAttributes": {},
+            "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+            "eventSource": "aws:sqs",
+            "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+            "awsRegion": "us-east-1",
+        }
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def sqs_event_factory() -> Callable:
+    def factory(body: str):
+        return {
+            "messageId": f"{uuid.uuid4()}",
+            "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a",
+            "body": body,
+            "attributes": {
+                "ApproximateReceiveCount": "1",
+                "SentTimestamp": "1545082649183",
+                "SenderId": "SenderId",
+                "ApproximateFirstReceiveTimestamp": "1545082649185",
+            },
+            "messageAttributes": {},
+            "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+            "eventSource": "aws:sqs",
+            "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+            "awsRegion": "us-east-1",
+        }
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def kinesis_event_factory() -> Callable:
+    def factory(body: str):
+        seq = "".join(str(randint(0, 9)) for _ in range(52))
+        return {
+            "kinesis": {
+                "kinesisSchemaVersion": "1.0",
+                "partitionKey": "1",
+                "sequenceNumber": seq,
+                "data": str_to_b64(body),
+                "approximateArrivalTimestamp": 1545084650.987,
+            },
+            "eventSource": "aws:kinesis",
+            "eventVersion": "1.0",
+            "eventID": f"shardId-000000000006:{seq}",
+            "eventName": "aws:kinesis:record",
+            "invokeIdentityArn": "arn:aws:iam::123456789012:role/lambda-role",
+            "awsRegion": "us-east-2",
+            "eventSourceARN": "arn:aws:kinesis:us-east-2:123456789012:stream/lambda-stream",
+        }
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def dynamodb_event_factory() -> Callable:
+    def factory(body: str):
+        seq = "".join(str(randint(0, 9)) for _ in range(10))
+        return {
+            "eventID": "1",
+            "eventVersion": "1.0",
+            "dynamodb": {
+                "Keys": {"Id": {"N": "101"}},
+                "NewImage": {"Message": {"S": body}},
+                "StreamViewType": "NEW_AND_OLD_IMAGES",
+                "SequenceNumber": seq,
+                "SizeBytes": 26,
+            },
+            "awsRegion": "us-west-2",
+            "eventName": "INSERT",
+            "eventSourceARN": "eventsource_arn",
+            "eventSource": "aws:dynamodb",
+        }
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def record_handler() -> Callable:
+    def handler(record):
+        body = record["body"]
+        if "fail" in body:
+            raise Exception("Failed to process record.")
+        return body
+
+    return handler
+
+
+@pytest.fixture(scope="module")
+def async_record_handler() -> Callable[..., Awaitable[Any]]:
+    async def handler(record):
+        body = record["body"]
+        if "fail" in body:
+            raise Exception("Failed to process record.")
+        return body
+
+    return handler
+
+
+@pytest.fixture(scope="module")
+def kinesis_record_handler() -> Callable:
+    def handler(record: KinesisStreamRecord):
+        body = b64_to_str(record.kinesis.data)
+        if "fail" in body:
+            raise Exception("Failed to process record.")
+        return body
+
+    return handler
+
+
+@pytest.fixture(scope="module")
+def dynamodb_record_handler() -> Callable:
+    def handler(record: DynamoDBRecord):
+        body = record.dynamodb.new_image.get("Message")
+        if "fail" in body:
+            raise ValueError("Failed to process record.")
+        return body
+
+    return handler
+
+
+@pytest.fixture(scope="module")
+def order_event_factory() -> Callable:
+    def factory(item: Dict) -> str:
+        return json.dumps({"item": item})
+
+    return factory
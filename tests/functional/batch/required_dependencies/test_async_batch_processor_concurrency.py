@@ -0,0 +1,81 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    AsyncBatchProcessor,
+    EventType,
+    async_process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+
+
+def test_async_batch_processor_bounds_concurrency(sqs_event_factory):
+    # GIVEN a handler tracking how many records are processed at the same time
+    running = 0
+    max_running = 0
+
+    async def record_handler(record: SQSRecord):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    # WHEN processing a batch with at most 5 records at a time
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_concurrency=5)
+    event = {"Records": [sqs_event_factory("success") for _ in range(50)]}
+    response = async_process_partial_response(event=event, record_handler=record_handler, processor=processor)
+
+    # THEN records are processed concurrently, up to max_concurrency at a time
+    assert response == {"batchItemFailures": []}
+    assert max_running == 5
+
+
+def test_async_batch_processor_bounded_keeps_results_order(sqs_event_factory, async_record_handler):
+    # GIVEN records completing in a random order, some of them failing
+    records = [sqs_event_factory("fail" if i % 4 == 0 else f"success-{i}") for i in range(40)]
+
+    async def record_handler(record: SQSRecord):
+        await asyncio.sleep(random.random() / 100)
+        return await async_record_handler(record)
+
+    # WHEN processing them with bounded concurrency
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_concurrency=8)
+    with processor(records, record_handler) as batch:
+        processed_messages = batch.async_process()
+
+    # THEN results keep the order of records, and failures are reported
+    assert [message[2]["messageId"] for message in processed_messages] == [record["messageId"] for record in records]
+    assert sorted(failure["itemIdentifier"] for failure in processor.response()["batchItemFailures"]) == sorted(
+        record["messageId"] for record in records if record["body"] == "fail"
+    )
+
+
+def test_async_batch_processor_rate_limit(sqs_event_factory):
+    # GIVEN a handler recording when each record starts
+    started = []
+
+    async def record_handler(record: SQSRecord):
+        started.append(time.perf_counter())
+
+    # WHEN processing a batch with at most 100 records per second
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_records_per_second=100)
+    event = {"Records": [sqs_event_factory("success") for _ in range(11)]}
+    async_process_partial_response(event=event, record_handler=record_handler, processor=processor)
+
+    # THEN records are started evenly spaced, without bursts
+    assert started[-1] - started[0] >= 0.09
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"max_concurrency": 0}, {"max_records_per_second": 0}, {"max_records_per_second": -1}],
+)
+def test_async_batch_processor_invalid_limits(options):
+    # GIVEN/WHEN invalid limits
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        AsyncBatchProcessor(event_type=EventType.SQS, **options)
@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    AsyncBatchProcessor,
+    BatchProcessor,
+    EventType,
+    ThreadedBatchProcessor,
+    async_process_partial_response,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.batch.exceptions import DeadlineCircuitBreakerError
+from tests.functional.utils import b64_to_str
+
+
+class LambdaContext:
+    """Lambda context timing out after `timeout_ms` milliseconds"""
+
+    def __init__(self, timeout_ms: int):
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return int((self._deadline - time.monotonic()) * 1000)
+
+
+def test_batch_processor_stops_before_timeout(sqs_event_factory):
+    # GIVEN records taking 20ms each, and an invocation timing out in 200ms, keeping a 100ms margin
+    event = {"Records": [sqs_event_factory(f"success-{i}") for i in range(10)]}
+    processed = []
+
+    def record_handler(record):
+        time.sleep(0.02)
+        processed.append(record.message_id)
+
+    # WHEN processing the batch with a time budget
+    processor = BatchProcessor(event_type=EventType.SQS, remaining_time_margin_ms=100)
+    result = process_partial_response(event, record_handler, processor, LambdaContext(timeout_ms=200))
+
+    # THEN records that can't complete before the margin are reported as failed items, without being processed
+    unprocessed = [record["messageId"] for record in event["Records"] if record["messageId"] not in processed]
+    assert 1 <= len(processed) < 5
+    assert result == {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in unprocessed]}
+    assert processed == [record["messageId"] for record in event["Records"]][: len(processed)]
+    assert {exception[0] for exception in processor.exceptions} == {DeadlineCircuitBreakerError}
+
+
+def test_batch_processor_deadline_respects_stream_checkpoint(kinesis_event_factory):
+    # GIVEN a Kinesis batch with a failing record, in an invocation running out of time
+    event = {"Records": [kinesis_event_factory("fail" if i == 1 else f"success-{i}") for i in range(10)]}
+
+    def record_handler(record):
+        time.sleep(0.02)
+        if b64_to_str(record.kinesis.data) == "fail":
+            raise ValueError("Failed to process record.")
+
+    # WHEN processing the batch with a time budget
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, remaining_time_margin_ms=100)
+    result = process_partial_response(event, record_handler, processor, LambdaContext(timeout_ms=200))
+
+    # THEN the failed record comes first, followed by every record left unprocessed, so Lambda checkpoints at it
+    failures = [failure["itemIdentifier"] for failure in result["batchItemFailures"]]
+    sequence_numbers = [record["kinesis"]["sequenceNumber"] for record in event["Records"]]
+    assert failures == [sequence_numbers[1]] + sequence_numbers[len(processor.success_messages) + 1 :]
+
+
+def test_batch_processor_records_latency(sqs_event_factory):
+    # GIVEN records taking at least 5ms each
+    def record_handler(record):
+        time.sleep(0.005)
+
+    # WHEN processing a batch
+    processor = BatchProcessor(event_type=EventType.SQS)
+    process_partial_response({"Records": [sqs_event_factory("success")] * 4}, record_handler, processor)
+
+    # THEN latency of record handlers is available once processed
+    assert processor.record_latency.count == 4
+    assert 5 <= processor.record_latency.mean_ms <= processor.record_latency.max_ms
+    assert processor.record_latency.total_ms >= 20
+
+
+def test_threaded_batch_processor_stops_scheduling_before_timeout(sqs_event_factory):
+    # GIVEN records taking 20ms each on 2 workers, and an invocation timing out in 200ms, keeping a 100ms margin
+    event = {"Records": [sqs_event_factory(f"success-{i}") for i in range(20)]}
+
+    def record_handler(record):
+        time.sleep(0.02)
+
+    # WHEN processing the batch with a time budget
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=2, remaining_time_margin_ms=100)
+    result = process_partial_response(event, record_handler, processor, LambdaContext(timeout_ms=200))
+
+    # THEN records not started in time are reported as failed items, in the order of the batch
+    processed = len(processor.success_messages)
+    assert 2 <= processed < 10
+    assert result == {
+        "batchItemFailures": [{"itemIdentifier": record["messageId"]} for record in event["Records"][processed:]],
+    }
+
+
+def test_async_batch_processor_stops_before_timeout(sqs_event_factory):
+    # GIVEN async records taking 20ms each, processed one at a time
+    event = {"Records": [sqs_event_factory(f"success-{i}") for i in range(10)]}
+
+    async def record_handler(record):
+        await asyncio.sleep(0.02)
+
+    # WHEN processing the batch with a time budget
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_concurrency=1, remaining_time_margin_ms=100)
+    result = async_process_partial_response(event, record_handler, processor, LambdaContext(timeout_ms=200))
+
+    # THEN records that can't complete before the margin are reported as failed items
+    processed = len(processor.success_messages)
+    assert 1 <= processed < 5
+    assert len(result["batchItemFailures"]) == 10 - processed
+
+
+def test_batch_processor_without_lambda_context_ignores_deadline(sqs_event_factory):
+    # GIVEN a processor with a time budget, used without a Lambda context
+    processor = BatchProcessor(event_type=EventType.SQS, remaining_time_margin_ms=60_000)
+
+    # WHEN processing a batch
+    result = process_partial_response({"Records": [sqs_event_factory("success")]}, lambda record: None, processor)
+
+    # THEN every record is processed
+    assert result == {"batchItemFailures": []}
+
+
+def test_batch_processor_invalid_remaining_time_margin():
+    # GIVEN/WHEN a negative time margin
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        BatchProcessor(event_type=EventType.SQS, remaining_time_margin_ms=-1)
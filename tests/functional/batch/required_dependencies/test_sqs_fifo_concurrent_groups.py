@@ -0,0 +1,100 @@
+import random
+import threading
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    SqsFifoPartialProcessor,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.batch.exceptions import SQSFifoMessageGroupCircuitBreakerError
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+
+
+def test_sqs_fifo_concurrent_groups_keeps_order_within_groups(sqs_event_fifo_factory):
+    # GIVEN a batch interleaving records from 5 message groups
+    records = [sqs_event_fifo_factory(f"{group}-{i}", str(group)) for i in range(4) for group in range(5)]
+    processed: dict = {}
+    lock = threading.Lock()
+
+    def record_handler(record: SQSRecord):
+        time.sleep(random.random() / 100)
+        with lock:
+            processed.setdefault(record.attributes.message_group_id, []).append(record.body)
+
+    # WHEN processing message groups concurrently
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=5)
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN records from each group are processed in order, and results keep the order of the batch
+    assert result == {"batchItemFailures": []}
+    assert processed == {str(group): [f"{group}-{i}" for i in range(4)] for group in range(5)}
+    assert [message["messageId"] for message in processor.success_messages] == [
+        record["messageId"] for record in records
+    ]
+
+
+def test_sqs_fifo_concurrent_groups_reports_same_failures_as_sequential(sqs_event_fifo_factory):
+    # GIVEN a batch where records from groups 1 and 3 fail, some of them without a message group
+    bodies = ["success", "fail", "success", "success", "fail", "success", "fail", "success"]
+    groups = ["1", "1", "2", "1", "3", "3", "", ""]
+    records = [sqs_event_fifo_factory(body, group) for body, group in zip(bodies, groups)]
+
+    def record_handler(record: SQSRecord):
+        if record.body == "fail":
+            raise ValueError("Failed to process record.")
+
+    # WHEN processing the batch sequentially and concurrently
+    sequential_processor = SqsFifoPartialProcessor(skip_group_on_error=True)
+    sequential = process_partial_response({"Records": records}, record_handler, sequential_processor)
+    concurrent_processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=4)
+    concurrent = process_partial_response({"Records": records}, record_handler, concurrent_processor)
+
+    # THEN the remaining records of failed groups are short-circuited, and the same failures are reported
+    assert sequential == {
+        "batchItemFailures": [{"itemIdentifier": records[index]["messageId"]} for index in (1, 3, 4, 5, 6)],
+    }
+    assert concurrent == sequential
+    assert [exception[0] for exception in concurrent_processor.exceptions] == [
+        exception[0] for exception in sequential_processor.exceptions
+    ]
+    assert concurrent_processor.exceptions[1][0] is SQSFifoMessageGroupCircuitBreakerError
+
+
+def test_sqs_fifo_concurrent_groups_processes_groups_at_the_same_time(sqs_event_fifo_factory):
+    # GIVEN a handler tracking how many groups are processed at the same time
+    lock = threading.Lock()
+    running: set = set()
+    max_running = 0
+
+    def record_handler(record: SQSRecord):
+        nonlocal max_running
+        group_id = record.attributes.message_group_id
+        with lock:
+            assert group_id not in running
+            running.add(group_id)
+            max_running = max(max_running, len(running))
+        time.sleep(0.005)
+        with lock:
+            running.discard(group_id)
+
+    # WHEN processing 8 message groups, with at most 4 at a time
+    records = [sqs_event_fifo_factory("success", str(i % 8)) for i in range(24)]
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=4)
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN groups are processed concurrently, up to max_concurrent_groups, never running a group twice at once
+    assert result == {"batchItemFailures": []}
+    assert 1 < max_running <= 4
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"skip_group_on_error": True, "max_concurrent_groups": 0}, {"max_concurrent_groups": 4}],
+)
+def test_sqs_fifo_concurrent_groups_invalid_options(options):
+    # GIVEN/WHEN an invalid number of groups, or concurrent groups short-circuiting the entire batch
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        SqsFifoPartialProcessor(**options)
@@ -0,0 +1,187 @@
+import contextvars
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from aws_lambda_powertools.metrics import Metrics
+from aws_lambda_powertools.utilities.batch import (
+    BatchProcessor,
+    EventType,
+    ThreadedBatchProcessor,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from tests.functional.utils import b64_to_str
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_threaded_batch_processor_keeps_records_order(sqs_event_factory):
+    # GIVEN records completing in a random order, some of them failing
+    records = [sqs_event_factory("fail" if i % 3 == 0 else f"success-{i}") for i in range(30)]
+
+    def record_handler(record: SQSRecord):
+        time.sleep(random.random() / 100)
+        if record.body == "fail":
+            raise ValueError("Failed to process record.")
+        return record.body
+
+    # WHEN processing them concurrently
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=8)
+    with processor(records, record_handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN results, successes, and failures keep the order of records in the batch
+    assert [message[2]["messageId"] for message in processed_messages] == [record["messageId"] for record in records]
+    failed = [record["messageId"] for record in records if record["body"] == "fail"]
+    assert [message.message_id for message in processor.fail_messages] == failed
+    assert [message["messageId"] for message in processor.success_messages] == [
+        record["messageId"] for record in records if record["body"] != "fail"
+    ]
+    assert processor.response() == {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed]}
+
+
+@pytest.mark.parametrize("event_type", [EventType.KinesisDataStreams, EventType.DynamoDBStreams])
+def test_threaded_batch_processor_reports_same_checkpoints_as_batch_processor(
+    event_type,
+    kinesis_event_factory,
+    dynamodb_event_factory,
+):
+    # GIVEN a stream batch with failures in the middle
+    factory = kinesis_event_factory if event_type is EventType.KinesisDataStreams else dynamodb_event_factory
+    event = {"Records": [factory("fail" if i in (3, 7) else f"success-{i}") for i in range(10)]}
+
+    def record_handler(record):
+        if event_type is EventType.KinesisDataStreams:
+            body = b64_to_str(record.kinesis.data)
+        else:
+            body = record.dynamodb.new_image.get("Message")
+
+        # later records complete first
+        time.sleep(0.001 * (10 - int(body.split("-")[-1]) if "success" in body else 0))
+        if body == "fail":
+            raise ValueError("Failed to process record.")
+
+    # WHEN processing the batch sequentially and concurrently
+    sequential = process_partial_response(event, record_handler, BatchProcessor(event_type=event_type))
+    concurrent = process_partial_response(event, record_handler, ThreadedBatchProcessor(event_type=event_type))
+
+    # THEN failures are reported in the same order, so Lambda checkpoints at the same record
+    assert len(sequential["batchItemFailures"]) == 2
+    assert concurrent == sequential
+
+
+def test_threaded_batch_processor_bounds_concurrency(sqs_event_factory):
+    # GIVEN a handler tracking how many records are processed at the same time
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def record_handler(record):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+
+    # WHEN processing a batch with at most 4 workers
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=4)
+    process_partial_response({"Records": [sqs_event_factory("success") for _ in range(20)]}, record_handler, processor)
+
+    # THEN records are processed concurrently, up to max_workers at a time
+    assert 1 < max_running <= 4
+
+
+def test_threaded_batch_processor_injects_lambda_context_and_context_variables(sqs_event_factory):
+    # GIVEN a context variable set by the function processing the batch
+    request_id.set("52fdfc07")
+
+    class LambdaContext:
+        aws_request_id = "52fdfc07"
+
+    def record_handler(record, lambda_context):
+        return lambda_context.aws_request_id, request_id.get()
+
+    # WHEN processing records in worker threads
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=2)
+    with processor([sqs_event_factory("success")] * 4, record_handler, lambda_context=LambdaContext()) as batch:
+        processed_messages = batch.process()
+
+    # THEN handlers receive the Lambda context, and see context variables
+    assert {message[1] for message in processed_messages} == {("52fdfc07", "52fdfc07")}
+
+
+def test_threaded_batch_processor_with_metrics(capsys, sqs_event_factory):
+    # GIVEN a handler adding metrics from worker threads
+    metrics = Metrics(namespace="batch", service="orders")
+
+    def record_handler(record):
+        metrics.add_metric(name="processed", unit="Count", value=1)
+
+    # WHEN processing a batch concurrently
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=8)
+    process_partial_response({"Records": [sqs_event_factory("success") for _ in range(50)]}, record_handler, processor)
+    metrics.flush_metrics()
+
+    # THEN no metric value is lost
+    output = json.loads(capsys.readouterr().out.strip())
+    assert len(output["processed"]) == 50
+
+
+def test_threaded_batch_processor_reuses_worker_threads(sqs_event_factory):
+    # GIVEN a processor used across invocations
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=2)
+
+    def record_handler(record):
+        return threading.current_thread().name
+
+    # WHEN processing two batches
+    first = process_partial_response({"Records": [sqs_event_factory("a")] * 4}, record_handler, processor)
+    with processor([sqs_event_factory("b")] * 4, record_handler) as batch:
+        thread_names = {message[1] for message in batch.process()}
+
+    # THEN worker threads are reused, instead of created for every batch
+    assert first == {"batchItemFailures": []}
+    assert len(thread_names) <= 2
+    assert all(name.startswith("powertools-batch") for name in thread_names)
+
+
+def test_threaded_batch_processor_invalid_max_workers():
+    # GIVEN/WHEN an invalid number of workers
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=0)
+
+
+def test_threaded_batch_processor_propagates_xray_trace_entity(monkeypatch, sqs_event_factory):
+    # GIVEN a function traced with X-Ray in Lambda
+    from aws_xray_sdk import global_sdk_config
+    from aws_xray_sdk.core import xray_recorder
+    from aws_xray_sdk.core.context import Context
+
+    monkeypatch.setenv("LAMBDA_TASK_ROOT", "/var/task")
+    # a context of its own, as other tests may leave the recorder with a Lambda context discarding new segments
+    monkeypatch.setattr(xray_recorder, "context", Context())
+    sdk_enabled = global_sdk_config.sdk_enabled()
+    global_sdk_config.set_sdk_enabled(True)
+    segment = xray_recorder.begin_segment("batch")
+
+    def record_handler(record):
+        return xray_recorder.context.get_trace_entity()
+
+    # WHEN processing records in worker threads
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=2)
+    try:
+        with processor([sqs_event_factory("success")] * 4, record_handler) as batch:
+            processed_messages = batch.process()
+    finally:
+        xray_recorder.context.clear_trace_entities()
+        global_sdk_config.set_sdk_enabled(sdk_enabled)
+
+    # THEN record handlers see the trace entity of the function, so their subsegments are kept
+    assert all(message[1] is segment for message in processed_messages)
@@ -0,0 +1,184 @@
+import random
+import threading
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    EventType,
+    ThreadedBatchProcessor,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.batch.exceptions import PartitionKeyCircuitBreakerError
+from tests.functional.utils import b64_to_str, str_to_b64
+
+# Sequence numbers are decimal strings, whose length varies in DynamoDB Streams
+FIRST_SEQUENCE_NUMBER = 9_990
+
+
+def kinesis_record(sequence_number: int, partition_key: str, body: str) -> dict:
+    return {
+        "kinesis": {
+            "kinesisSchemaVersion": "1.0",
+            "partitionKey": partition_key,
+            "sequenceNumber": str(sequence_number),
+            "data": str_to_b64(body),
+            "approximateArrivalTimestamp": 1545084650.987,
+        },
+        "eventSource": "aws:kinesis",
+        "eventID": f"shardId-000000000006:{sequence_number}",
+        "eventName": "aws:kinesis:record",
+        "eventSourceARN": "arn:aws:kinesis:us-east-2:123456789012:stream/lambda-stream",
+    }
+
+
+def dynamodb_record(sequence_number: int, partition_key: str, body: str) -> dict:
+    key_attributes = [("Id", {"S": partition_key}), ("Sk", {"N": "1"})]
+    return {
+        "eventID": str(sequence_number),
+        "eventName": "MODIFY",
+        "dynamodb": {
+            # composite primary key, with attributes in either order
+            "Keys": dict(key_attributes if sequence_number % 2 else key_attributes[::-1]),
+            "NewImage": {"Message": {"S": body}},
+            "StreamViewType": "NEW_AND_OLD_IMAGES",
+            "SequenceNumber": str(sequence_number),
+            "SizeBytes": 26,
+        },
+        "eventSource": "aws:dynamodb",
+    }
+
+
+def get_record_fields(record, event_type: EventType):
+    """Sequence number, partition key, and body of a record"""
+    if event_type is EventType.KinesisDataStreams:
+        return int(record.kinesis.sequence_number), record.kinesis.partition_key, b64_to_str(record.kinesis.data)
+
+    return int(record.dynamodb.sequence_number), record.dynamodb.keys["Id"], record.dynamodb.new_image["Message"]
+
+
+@pytest.mark.parametrize("event_type", [EventType.KinesisDataStreams, EventType.DynamoDBStreams])
+@pytest.mark.parametrize("seed", range(25))
+def test_preserve_key_order_ordering_and_checkpoint_properties(event_type, seed):
+    # GIVEN a random shard batch, spreading records over a few partition keys, some of them failing
+    rng = random.Random(seed)
+    batch_size = rng.randint(1, 40)
+    keys = [f"key-{i}" for i in range(rng.randint(1, 8))]
+    failure_rate = rng.choice([0, 0.05, 0.2, 0.5])
+    build_record = kinesis_record if event_type is EventType.KinesisDataStreams else dynamodb_record
+    batch = [
+        (FIRST_SEQUENCE_NUMBER + i, rng.choice(keys), "fail" if rng.random() < failure_rate else "success")
+        for i in range(batch_size)
+    ]
+    records = [build_record(*fields) for fields in batch]
+
+    processed: list = []
+    lock = threading.Lock()
+
+    def record_handler(record):
+        sequence_number, key, body = get_record_fields(record, event_type)
+        time.sleep(rng.random() / 1000)
+        with lock:
+            processed.append((key, sequence_number))
+        if body == "fail":
+            raise ValueError("Failed to process record.")
+
+    # WHEN processing records concurrently, preserving the order of partition keys
+    processor = ThreadedBatchProcessor(
+        event_type=event_type,
+        max_workers=4,
+        preserve_key_order=True,
+        raise_on_entire_batch_failure=False,
+    )
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN records sharing a key are processed in order, and none after the first failure for that key
+    failed_keys: set = set()
+    expected_processed: dict = {key: [] for key in keys}
+    expected_failures = []
+    for sequence_number, key, body in batch:
+        if key not in failed_keys:
+            expected_processed[key].append(sequence_number)
+        if key in failed_keys or body == "fail":
+            failed_keys.add(key)
+            expected_failures.append(str(sequence_number))
+
+    for key in keys:
+        assert [seq for processed_key, seq in processed if processed_key == key] == expected_processed[key]
+
+    # THEN failures are reported in sequence order, the checkpoint being the lowest failed sequence number,
+    # and every record before the checkpoint was processed successfully
+    reported = [failure["itemIdentifier"] for failure in result["batchItemFailures"]]
+    assert reported == expected_failures
+    assert reported == sorted(reported, key=int)
+    checkpoint = min((int(sequence_number) for sequence_number in reported), default=None)
+    processed_sequence_numbers = {sequence_number for _, sequence_number in processed}
+    for sequence_number, _, body in batch:
+        if checkpoint is None or sequence_number < checkpoint:
+            assert body == "success" and sequence_number in processed_sequence_numbers
+
+
+@pytest.mark.parametrize("event_type", [EventType.KinesisDataStreams, EventType.DynamoDBStreams])
+def test_preserve_key_order_short_circuits_failed_keys(event_type):
+    # GIVEN a batch where the first record of key "a" fails
+    build_record = kinesis_record if event_type is EventType.KinesisDataStreams else dynamodb_record
+    records = [
+        build_record(1, "a", "fail"),
+        build_record(2, "b", "success"),
+        build_record(3, "a", "success"),
+        build_record(4, "b", "success"),
+    ]
+    processed = []
+
+    def record_handler(record):
+        sequence_number, _, body = get_record_fields(record, event_type)
+        processed.append(sequence_number)
+        if body == "fail":
+            raise ValueError("Failed to process record.")
+
+    # WHEN processing records preserving the order of partition keys
+    processor = ThreadedBatchProcessor(event_type=event_type, max_workers=2, preserve_key_order=True)
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN the remaining records of key "a" are reported as failed without being processed
+    assert sorted(processed) == [1, 2, 4]
+    assert result == {"batchItemFailures": [{"itemIdentifier": "1"}, {"itemIdentifier": "3"}]}
+    assert processor.exceptions[1][0] is PartitionKeyCircuitBreakerError
+
+
+def test_preserve_key_order_processes_keys_at_the_same_time():
+    # GIVEN a handler tracking which partition keys are processed at the same time
+    lock = threading.Lock()
+    running: set = set()
+    max_running = 0
+
+    def record_handler(record):
+        nonlocal max_running
+        key = record.kinesis.partition_key
+        with lock:
+            assert key not in running
+            running.add(key)
+            max_running = max(max_running, len(running))
+        time.sleep(0.005)
+        with lock:
+            running.discard(key)
+
+    # WHEN processing 8 partition keys, with at most 4 workers
+    records = [kinesis_record(i, str(i % 8), "success") for i in range(24)]
+    processor = ThreadedBatchProcessor(
+        event_type=EventType.KinesisDataStreams,
+        max_workers=4,
+        preserve_key_order=True,
+    )
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN keys are processed concurrently, never processing two records of the same key at once
+    assert result == {"batchItemFailures": []}
+    assert 1 < max_running <= 4
+
+
+def test_preserve_key_order_not_supported_for_sqs():
+    # GIVEN/WHEN preserving key order of a SQS batch
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        ThreadedBatchProcessor(event_type=EventType.SQS, preserve_key_order=True)
@@ -0,0 +1,198 @@
+from copy import deepcopy
+
+import pytest
+
+from aws_lambda_powertools.event_handler.api_gateway import (
+    APIGatewayHttpResolver,
+    APIGatewayRestResolver,
+    Response,
+    Router,
+)
+from tests.functional.utils import load_event
+
+LOAD_GW_EVENT = load_event("apiGatewayProxyEvent.json")
+LOAD_GW_EVENT_V2 = load_event("apiGatewayProxyV2Event_GET.json")
+
+
+def rest_event(path: str, method: str = "GET") -> dict:
+    event = deepcopy(LOAD_GW_EVENT)
+    event["path"] = path
+    event["httpMethod"] = method
+    event["requestContext"]["stage"] = "$default"
+    return event
+
+
+def http_event(path: str, method: str = "GET") -> dict:
+    event = deepcopy(LOAD_GW_EVENT_V2)
+    event["rawPath"] = path
+    event["requestContext"]["http"]["path"] = path
+    event["requestContext"]["http"]["method"] = method
+    event["requestContext"]["stage"] = "$default"
+    return event
+
+
+def register_routes(app):
+    @app.get("/users")
+    def list_users():
+        return Response(200, body="list_users")
+
+    @app.get("/users/<user_id>")
+    def get_user(user_id: str):
+        return Response(200, body=f"get_user:{user_id}")
+
+    @app.get("/users/me")
+    def get_me():
+        return Response(200, body="get_me")
+
+    @app.get("/users/<user_id>/orders/<order_id>")
+    def get_order(user_id: str, order_id: str):
+        return Response(200, body=f"get_order:{user_id}:{order_id}")
+
+    @app.get("/<resource>/<resource_id>/orders/latest")
+    def get_latest_order(resource: str, resource_id: str):
+        return Response(200, body=f"get_latest_order:{resource}:{resource_id}")
+
+    @app.get("/files/<file_id>.json")
+    def get_file(file_id: str):
+        return Response(200, body=f"get_file:{file_id}")
+
+    @app.post("/users/<user_id>")
+    def update_user(user_id: str):
+        return Response(200, body=f"update_user:{user_id}")
+
+    @app.get("/status/.+")
+    def catch_status():
+        return Response(200, body="catch_status")
+
+    @app.get("/")
+    def root():
+        return Response(200, body="root")
+
+
+PATHS = [
+    "/",
+    "/users",
+    "/users/",
+    "/users/me",
+    "/users/123",
+    "/users/123/",
+    "/users/123/orders/456",
+    "/users/123/orders/latest",
+    "/accounts/123/orders/latest",
+    "/users//orders/456",
+    "/files/readme.json",
+    "/files/readme.txt",
+    "/status/healthy/deep",
+    "/unknown",
+    "/users/123/orders",
+]
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("method", ["GET", "POST", "DELETE"])
+def test_compiled_routing_matches_sequential_routing_rest(path, method):
+    # GIVEN two identical REST API resolvers, one with compiled routing enabled
+    sequential_app = APIGatewayRestResolver()
+    compiled_app = APIGatewayRestResolver(enable_compiled_routing=True)
+    register_routes(sequential_app)
+    register_routes(compiled_app)
+
+    # WHEN resolving the same event
+    expected = sequential_app(rest_event(path, method), {})
+    result = compiled_app(rest_event(path, method), {})
+
+    # THEN both resolvers pick the same route
+    assert result["statusCode"] == expected["statusCode"]
+    assert result["body"] == expected["body"]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_compiled_routing_matches_sequential_routing_http(path):
+    # GIVEN two identical HTTP API resolvers, one with compiled routing enabled
+    sequential_app = APIGatewayHttpResolver()
+    compiled_app = APIGatewayHttpResolver(enable_compiled_routing=True)
+    register_routes(sequential_app)
+    register_routes(compiled_app)
+
+    # WHEN resolving the same event
+    expected = sequential_app(http_event(path), {})
+    result = compiled_app(http_event(path), {})
+
+    # THEN both resolvers pick the same route, including trailing slash handling
+    assert result["statusCode"] == expected["statusCode"]
+    assert result["body"] == expected["body"]
+
+
+def test_compiled_routing_static_route_wins_over_dynamic_route():
+    # GIVEN a dynamic route registered before a more specific static route
+    app = APIGatewayRestResolver(enable_compiled_routing=True)
+
+    @app.get("/studies/<study_id>")
+    def get_study(study_id: str):
+        return Response(200, body=study_id)
+
+    @app.get("/studies/fetch")
+    def fetch_studies():
+        return Response(200, body="fetch")
+
+    # WHEN resolving the static path
+    result = app(rest_event("/studies/fetch"), {})
+
+    # THEN the static route is prioritized
+    assert result["body"] == "fetch"
+
+
+def test_compiled_routing_dynamic_routes_keep_registration_order():
+    # GIVEN two dynamic routes matching the same path
+    app = APIGatewayRestResolver(enable_compiled_routing=True)
+
+    @app.get("/<tenant>/items")
+    def tenant_items(tenant: str):
+        return Response(200, body=f"tenant:{tenant}")
+
+    @app.get("/<category>/<item_id>")
+    def category_item(category: str, item_id: str):
+        return Response(200, body=f"category:{category}:{item_id}")
+
+    # WHEN resolving a path matched by both
+    result = app(rest_event("/acme/items"), {})
+
+    # THEN the first registered route wins, same as sequential routing
+    assert result["body"] == "tenant:acme"
+
+
+def test_compiled_routing_include_router_with_prefix():
+    # GIVEN a router included with a prefix
+    app = APIGatewayRestResolver(enable_compiled_routing=True)
+    router = Router()
+
+    @router.get("/<todo_id>")
+    def get_todo(todo_id: str):
+        return Response(200, body=f"todo:{todo_id}")
+
+    @router.get("/")
+    def list_todos():
+        return Response(200, body="todos")
+
+    app.include_router(router, prefix="/todos")
+
+    # WHEN resolving paths for the included routes
+    # THEN routes are found through the prefixed rule
+    assert app(rest_event("/todos/1"), {})["body"] == "todo:1"
+    assert app(rest_event("/todos"), {})["body"] == "todos"
+    assert app(rest_event("/1"), {})["statusCode"] == 404
+
+
+def test_compiled_routing_method_not_registered():
+    # GIVEN a route registered for GET only
+    app = APIGatewayRestResolver(enable_compiled_routing=True)
+
+    @app.get("/todos")
+    def list_todos():
+        return Response(200, body="todos")
+
+    # WHEN resolving a POST request to the same path
+    result = app(rest_event("/todos", "POST"), {})
+
+    # THEN a 404 is returned
+    assert result["statusCode"] == 404
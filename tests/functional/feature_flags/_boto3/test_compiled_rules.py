@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+import pytest
+
+from aws_lambda_powertools.utilities.feature_flags import (
+    ConfigurationStoreError,
+    FeatureFlags,
+    RuleAction,
+    SchemaValidator,
+    StoreProvider,
+)
+from aws_lambda_powertools.utilities.feature_flags.exceptions import SchemaValidationError
+
+
+class InMemoryStore(StoreProvider):
+    def __init__(self, config: dict[str, Any]):
+        self.config = config
+        self.fail = False
+
+    @property
+    def get_raw_configuration(self) -> dict[str, Any]:
+        return self.config
+
+    def get_configuration(self) -> dict[str, Any]:
+        if self.fail:
+            raise ConfigurationStoreError("store unavailable")
+        return self.config
+
+
+def condition(action: RuleAction, key: str, value: Any) -> dict:
+    return {"action": action.value, "key": key, "value": value}
+
+
+SCHEMA = {
+    "premium": {
+        "default": False,
+        "rules": {
+            "tenant allow list": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.IN, "tenant_id", ["a", "b", "c"])],
+            },
+            "tier equals premium": {
+                "when_match": True,
+                "conditions": [
+                    condition(RuleAction.EQUALS, "tier", "premium"),
+                    condition(RuleAction.KEY_GREATER_THAN_VALUE, "age", 18),
+                ],
+            },
+        },
+    },
+    "blocked": {
+        "default": True,
+        "rules": {
+            "tenant deny list": {
+                "when_match": False,
+                "conditions": [condition(RuleAction.KEY_NOT_IN_VALUE, "tenant_id", ["a", "b"])],
+            },
+        },
+    },
+    "groups": {
+        "default": False,
+        "rules": {
+            "any admin group": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.ANY_IN_VALUE, "groups", ["admin", "owner"])],
+            },
+            "all known groups": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.ALL_IN_VALUE, "groups", ["dev", "ops", "qa"])],
+            },
+        },
+    },
+    "no_beta_groups": {
+        "default": False,
+        "rules": {
+            "no beta group": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.NONE_IN_VALUE, "groups", ["beta", "alpha"])],
+            },
+        },
+    },
+    "substring": {
+        "default": False,
+        "rules": {
+            "tier substring": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.KEY_IN_VALUE, "tier", "premium-plus")],
+            },
+            "tags contain": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.VALUE_IN_KEY, "tags", "vip")],
+            },
+        },
+    },
+    "unhashable_values": {
+        "default": False,
+        "rules": {
+            "nested lists": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.IN, "pair", [["a", 1], ["b", 2]])],
+            },
+        },
+    },
+    "rollout": {
+        "default": False,
+        "rules": {
+            "modulo": {
+                "when_match": True,
+                "conditions": [condition(RuleAction.MODULO_RANGE, "user_id", {"BASE": 10, "START": 0, "END": 4})],
+            },
+        },
+    },
+    "weekdays": {
+        "default": False,
+        "rules": {
+            "every day": {
+                "when_match": True,
+                "conditions": [
+                    condition(
+                        RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK,
+                        "CURRENT_DAY_OF_WEEK",
+                        {
+                            "DAYS": ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"],
+                        },
+                    ),
+                ],
+            },
+        },
+    },
+    "always_on": {"default": True},
+    "always_off": {"default": False},
+    "non_boolean": {
+        "default": {"group": "control"},
+        "boolean_type": False,
+        "rules": {
+            "experiment": {
+                "when_match": {"group": "treatment"},
+                "conditions": [condition(RuleAction.STARTSWITH, "tenant_id", "exp-")],
+            },
+        },
+    },
+}
+
+CONTEXTS = [
+    {},
+    {"tenant_id": "a"},
+    {"tenant_id": "d"},
+    {"tenant_id": "exp-1"},
+    {"tenant_id": 1},
+    {"tenant_id": ["a"]},
+    {"tier": "premium", "age": 21},
+    {"tier": "premium", "age": 17},
+    {"tier": "premium", "age": "21"},
+    {"tier": "plus"},
+    {"groups": ["admin"]},
+    {"groups": ["dev", "qa"]},
+    {"groups": ["dev", "beta"]},
+    {"groups": []},
+    {"groups": "admin"},
+    {"groups": [["admin"]]},
+    {"tags": ["vip", "new"]},
+    {"tags": "no-vip"},
+    {"pair": ["a", 1]},
+    {"pair": ["a", 2]},
+    {"user_id": 3},
+    {"user_id": 7},
+    {"user_id": "3"},
+]
+
+
+@pytest.mark.parametrize("context", CONTEXTS)
+def test_compiled_rules_match_interpreted_rules(context):
+    # GIVEN two feature flags instances for the same schema, one with compiled rules enabled
+    interpreted = FeatureFlags(store=InMemoryStore(deepcopy(SCHEMA)))
+    compiled = FeatureFlags(store=InMemoryStore(deepcopy(SCHEMA)), enable_compiled_rules=True)
+
+    # WHEN evaluating every feature, and getting all enabled features
+    # THEN both produce the same results
+    for name in SCHEMA:
+        expected = interpreted.evaluate(name=name, context=context, default="missing")
+        assert compiled.evaluate(name=name, context=context, default="missing") == expected
+
+    assert compiled.get_enabled_features(context=context) == interpreted.get_enabled_features(context=context)
+
+
+def test_compiled_rules_missing_feature_returns_default():
+    # GIVEN compiled rules
+    feature_flags = FeatureFlags(store=InMemoryStore(deepcopy(SCHEMA)), enable_compiled_rules=True)
+
+    # WHEN evaluating a feature not in the schema
+    # THEN the default provided is returned
+    assert feature_flags.evaluate(name="unknown", context={}, default="fallback") == "fallback"
+
+
+def test_compiled_rules_store_error_returns_default():
+    # GIVEN a store failing to fetch the configuration
+    store = InMemoryStore(deepcopy(SCHEMA))
+    store.fail = True
+    feature_flags = FeatureFlags(store=store, enable_compiled_rules=True)
+
+    # WHEN evaluating features
+    # THEN defaults are returned
+    assert feature_flags.evaluate(name="always_on", default=False) is False
+    assert feature_flags.get_enabled_features() == []
+
+
+def test_compiled_rules_validate_and_compile_once_per_configuration_version(mocker):
+    # GIVEN compiled rules and a store returning a new, but identical, configuration object on every fetch
+    store = InMemoryStore(deepcopy(SCHEMA))
+    mocker.patch.object(store, "get_configuration", side_effect=lambda: deepcopy(SCHEMA))
+    validate_spy = mocker.spy(SchemaValidator, "validate")
+    feature_flags = FeatureFlags(store=store, enable_compiled_rules=True)
+
+    # WHEN evaluating flags several times
+    for _ in range(5):
+        feature_flags.evaluate(name="premium", context={"tenant_id": "a"}, default=False)
+        feature_flags.get_enabled_features(context={"tenant_id": "a"})
+
+    # THEN the schema is only validated once
+    assert validate_spy.call_count == 1
+
+
+def test_compiled_rules_recompile_when_configuration_changes():
+    # GIVEN compiled rules evaluated against the current configuration
+    store = InMemoryStore(deepcopy(SCHEMA))
+    feature_flags = FeatureFlags(store=store, enable_compiled_rules=True)
+    assert feature_flags.evaluate(name="premium", context={"tenant_id": "z"}, default=False) is False
+
+    # WHEN the store returns a new configuration
+    new_schema = deepcopy(SCHEMA)
+    new_schema["premium"]["rules"]["tenant allow list"]["conditions"][0]["value"].append("z")
+    store.config = new_schema
+
+    # THEN rules are compiled again from the new configuration
+    assert feature_flags.evaluate(name="premium", context={"tenant_id": "z"}, default=False) is True
+
+
+def test_compiled_rules_invalid_schema_raises_on_every_evaluation():
+    # GIVEN an invalid schema
+    store = InMemoryStore({"my_feature": {"rules": {}}})
+    feature_flags = FeatureFlags(store=store, enable_compiled_rules=True)
+
+    # WHEN evaluating the feature more than once
+    # THEN the schema validation error is raised every time, since invalid schemas aren't cached
+    for _ in range(2):
+        with pytest.raises(SchemaValidationError):
+            feature_flags.evaluate(name="my_feature", default=False)
+
+
+def test_compiled_rules_use_validation_exception_handler():
+    # GIVEN compiled rules with a validation exception handler registered
+    feature_flags = FeatureFlags(store=InMemoryStore(deepcopy(SCHEMA)), enable_compiled_rules=True)
+
+    @feature_flags.validation_exception_handler(ValueError)
+    def handle_value_error(exc):
+        raise TypeError("re-raised") from exc
+
+    # WHEN a list comparator receives a context value that isn't a list
+    # THEN the registered exception handler is invoked
+    with pytest.raises(TypeError, match="re-raised"):
+        feature_flags.evaluate(name="groups", context={"groups": "admin"}, default=False)
@@ -0,0 +1,262 @@
+import datetime
+import json
+from typing import Optional
+
+import pytest
+from botocore import stub
+
+from aws_lambda_powertools.utilities.batch import EventType, process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import (
+    DynamoDBPersistenceLayer,
+    IdempotencyConfig,
+    IdempotentBatchProcessor,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence import dynamodb
+from tests.functional.idempotency._boto3.conftest import TABLE_NAME
+from tests.functional.idempotency.utils import hash_idempotency_key
+
+FUNCTION_NAME = f"test-func.{__name__}.record_handler"
+
+
+@pytest.fixture(autouse=True)
+def sequential_put_item_requests(monkeypatch):
+    # stubbed responses are returned in the order requests are sent, so records are claimed one at a time
+    monkeypatch.setattr(dynamodb, "MAX_CONCURRENT_PUT_ITEM_REQUESTS", 1)
+
+
+def record_handler(record: SQSRecord):
+    return {"processed": record.body}
+
+
+def sqs_record(message_id: str, body: str = "") -> dict:
+    return {
+        "messageId": message_id,
+        "receiptHandle": "MessageReceiptHandle",
+        "body": body or f"body-{message_id}",
+        "attributes": {},
+        "messageAttributes": {},
+        "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+        "awsRegion": "us-east-1",
+    }
+
+
+def idempotency_key(message_id: str) -> str:
+    return f"{FUNCTION_NAME}#{hash_idempotency_key(message_id)}"
+
+
+def existing_item(message_id: str, status: str, timestamp_future: str, response: Optional[dict] = None) -> dict:
+    item = {
+        "id": {"S": idempotency_key(message_id)},
+        "expiration": {"N": timestamp_future},
+        "status": {"S": status},
+    }
+    if response is not None:
+        item["data"] = {"S": json.dumps(response)}
+    if status == "INPROGRESS":
+        in_progress_expiry = int((datetime.datetime.now() + datetime.timedelta(seconds=60)).timestamp() * 1000)
+        item["in_progress_expiration"] = {"N": str(in_progress_expiry)}
+
+    return item
+
+
+def build_processor(
+    persistence_store: DynamoDBPersistenceLayer,
+    event_key_jmespath: str = "messageId",
+) -> IdempotentBatchProcessor:
+    return IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=IdempotencyConfig(event_key_jmespath=event_key_jmespath, use_local_cache=False),
+        raise_on_entire_batch_failure=False,
+    )
+
+
+def test_batch_saves_new_records_with_a_request_each(persistence_store, lambda_context):
+    # GIVEN a batch of records never processed before
+    event = {"Records": [sqs_record("1"), sqs_record("2")]}
+    stubber = stub.Stubber(persistence_store.client)
+    for _ in event["Records"]:
+        stubber.add_response("put_item", {})
+    for _ in event["Records"]:
+        stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch idempotently
+    response = process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=build_processor(persistence_store),
+        context=lambda_context,
+    )
+
+    # THEN each record is saved with a single conditional write, without retrieving existing records first
+    assert response == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_batch_processes_duplicate_records_once(persistence_store, lambda_context):
+    # GIVEN a batch where the same message was delivered twice
+    event = {"Records": [sqs_record("1", body="same"), sqs_record("2", body="same"), sqs_record("3")]}
+    stubber = stub.Stubber(persistence_store.client)
+    for _ in range(2):
+        stubber.add_response("put_item", {})
+    for _ in range(2):
+        stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch, with idempotency keys taken from the message body
+    processor = build_processor(persistence_store, event_key_jmespath="body")
+    with processor(records=event["Records"], handler=record_handler, lambda_context=lambda_context):
+        results = processor.process()
+
+    # THEN the duplicate is neither saved nor processed again, and succeeds with the first record
+    assert [(status, result) for status, result, _ in results] == [
+        ("success", {"processed": "same"}),
+        ("success", {"processed": "same"}),
+        ("success", {"processed": "body-3"}),
+    ]
+    assert processor.response() == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_batch_skips_completed_records_returned_by_failed_writes(persistence_store, lambda_context, timestamp_future):
+    # GIVEN a batch where the first record was already processed, and the second one is new
+    event = {"Records": [sqs_record("1"), sqs_record("2")]}
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_client_error(
+        "put_item",
+        "ConditionalCheckFailedException",
+        modeled_fields={"Item": existing_item("1", "COMPLETED", timestamp_future, {"processed": "body-1"})},
+    )
+    stubber.add_response("put_item", {})
+    stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch idempotently
+    processor = build_processor(persistence_store)
+    with processor(records=event["Records"], handler=record_handler, lambda_context=lambda_context):
+        results = processor.process()
+
+    # THEN the existing record is returned by its failed write, and only the new record is processed
+    assert [(status, result) for status, result, _ in results] == [
+        ("success", {"processed": "body-1"}),
+        ("success", {"processed": "body-2"}),
+    ]
+    assert processor.response() == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_batch_reports_records_in_progress_as_failures(persistence_store, lambda_context, timestamp_future):
+    # GIVEN a batch where the first record is being processed elsewhere
+    event = {"Records": [sqs_record("1"), sqs_record("2")]}
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_client_error(
+        "put_item",
+        "ConditionalCheckFailedException",
+        modeled_fields={"Item": existing_item("1", "INPROGRESS", timestamp_future)},
+    )
+    stubber.add_response("put_item", {})
+    stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch idempotently
+    response = process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=build_processor(persistence_store),
+        context=lambda_context,
+    )
+
+    # THEN the record in progress is reported as a batch item failure, to be retried later
+    assert response == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_batch_retrieves_existing_records_in_bulk_when_failed_writes_dont_return_them(
+    persistence_store,
+    lambda_context,
+    timestamp_future,
+):
+    # GIVEN a boto3 version not returning the existing record when a conditional write fails
+    persistence_store.return_value_on_condition = {}
+    # AND a batch where the first two records were already processed, and the third one is new
+    event = {"Records": [sqs_record("1"), sqs_record("2"), sqs_record("3")]}
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_client_error("put_item", "ConditionalCheckFailedException")
+    stubber.add_client_error("put_item", "ConditionalCheckFailedException")
+    stubber.add_response("put_item", {})
+    stubber.add_response(
+        "batch_get_item",
+        {
+            "Responses": {
+                TABLE_NAME: [
+                    existing_item("1", "COMPLETED", timestamp_future, {"processed": "body-1"}),
+                    existing_item("2", "COMPLETED", timestamp_future, {"processed": "body-2"}),
+                ],
+            },
+        },
+        {
+            "RequestItems": {
+                TABLE_NAME: {
+                    "Keys": [{"id": {"S": idempotency_key("1")}}, {"id": {"S": idempotency_key("2")}}],
+                    "ConsistentRead": True,
+                },
+            },
+        },
+    )
+    stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch idempotently
+    response = process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=build_processor(persistence_store),
+        context=lambda_context,
+    )
+
+    # THEN existing records are retrieved with a single request, instead of a GetItem each
+    assert response == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_batch_retrieves_records_one_by_one_when_bulk_retrieval_fails(
+    persistence_store,
+    lambda_context,
+    timestamp_future,
+):
+    # GIVEN a boto3 version not returning the existing record when a conditional write fails
+    persistence_store.return_value_on_condition = {}
+    # AND BatchGetItem isn't allowed for the function
+    event = {"Records": [sqs_record("1"), sqs_record("2")]}
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_client_error("put_item", "ConditionalCheckFailedException")
+    stubber.add_response("put_item", {})
+    stubber.add_client_error("batch_get_item", "AccessDeniedException")
+    stubber.add_response(
+        "get_item",
+        {"Item": existing_item("1", "COMPLETED", timestamp_future, {"processed": "body-1"})},
+    )
+    stubber.add_response("update_item", {})
+    stubber.activate()
+
+    # WHEN processing the batch idempotently
+    response = process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=build_processor(persistence_store),
+        context=lambda_context,
+    )
+
+    # THEN the existing record is retrieved on its own, and the new record is processed
+    assert response == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
@@ -0,0 +1,173 @@
+from unittest import mock
+
+import fakeredis
+import pytest
+import redis
+
+from aws_lambda_powertools.utilities.batch import EventType, process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig, IdempotentBatchProcessor
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import RedisCachePersistenceLayer
+
+processed_records = []
+
+
+def record_handler(record: SQSRecord):
+    if record.body == "fail":
+        raise ValueError("failed to process record")
+
+    processed_records.append(record.message_id)
+    return {"processed": record.body}
+
+
+@pytest.fixture(autouse=True)
+def clear_processed_records():
+    processed_records.clear()
+
+
+@pytest.fixture
+def lambda_context():
+    class LambdaContext:
+        def get_remaining_time_in_millis(self) -> int:
+            return 60_000
+
+    return LambdaContext()
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def round_trips():
+    """Count requests sent to Redis, where a pipeline is sent with a single request"""
+    calls = []
+    send_packed_command = redis.connection.AbstractConnection.send_packed_command
+
+    def counting_send_packed_command(self, *args, **kwargs):
+        calls.append(args)
+        return send_packed_command(self, *args, **kwargs)
+
+    with mock.patch.object(redis.connection.AbstractConnection, "send_packed_command", counting_send_packed_command):
+        yield calls
+
+
+def sqs_record(message_id: str, body: str = "") -> dict:
+    return {
+        "messageId": message_id,
+        "receiptHandle": "MessageReceiptHandle",
+        "body": body or f"body-{message_id}",
+        "attributes": {},
+        "messageAttributes": {},
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+        "awsRegion": "us-east-1",
+    }
+
+
+def process_batch(
+    persistence_layer: RedisCachePersistenceLayer,
+    records: list,
+    lambda_context,
+    event_key_jmespath: str = "messageId",
+) -> dict:
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_layer,
+        config=IdempotencyConfig(event_key_jmespath=event_key_jmespath),
+        raise_on_entire_batch_failure=False,
+    )
+    return process_partial_response(
+        event={"Records": records},
+        record_handler=record_handler,
+        processor=processor,
+        context=lambda_context,
+    )
+
+
+@pytest.mark.parametrize("enable_lua_script", [True, False])
+def test_batch_processes_completed_records_once(redis_client, enable_lua_script, lambda_context):
+    # GIVEN a batch already processed
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client, enable_lua_script=enable_lua_script)
+    process_batch(persistence_layer, [sqs_record("1"), sqs_record("2")], lambda_context)
+
+    # WHEN the batch is delivered again, with a new record
+    response = process_batch(persistence_layer, [sqs_record("1"), sqs_record("2"), sqs_record("3")], lambda_context)
+
+    # THEN only the new record is processed
+    assert response == {"batchItemFailures": []}
+    assert processed_records == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("enable_lua_script", [True, False])
+def test_batch_processes_duplicate_records_once(redis_client, enable_lua_script, lambda_context):
+    # GIVEN a batch where the same message was delivered twice
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client, enable_lua_script=enable_lua_script)
+    records = [sqs_record("1", body="same"), sqs_record("2", body="same"), sqs_record("3")]
+
+    # WHEN processing the batch, with idempotency keys taken from the message body
+    response = process_batch(persistence_layer, records, lambda_context, event_key_jmespath="body")
+
+    # THEN the duplicate isn't processed again, and succeeds with the first record
+    assert response == {"batchItemFailures": []}
+    assert processed_records == ["1", "3"]
+
+
+def test_batch_reports_duplicates_of_failed_records_as_failures(redis_client, lambda_context):
+    # GIVEN a batch where a message failing processing was delivered twice
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client)
+    records = [sqs_record("1", body="fail"), sqs_record("2", body="fail"), sqs_record("3")]
+
+    # WHEN processing the batch, with idempotency keys taken from the message body
+    response = process_batch(persistence_layer, records, lambda_context, event_key_jmespath="body")
+
+    # THEN the duplicate fails along with the first record, to be retried later
+    assert response == {"batchItemFailures": [{"itemIdentifier": "1"}, {"itemIdentifier": "2"}]}
+    assert processed_records == ["3"]
+
+
+def test_batch_reports_records_in_progress_as_failures(redis_client, lambda_context):
+    # GIVEN a record being processed by another invocation
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client)
+    persistence_layer.configure(
+        IdempotencyConfig(event_key_jmespath="messageId"),
+        function_name=f"{__name__}.record_handler",
+    )
+    persistence_layer.save_inprogress(data=sqs_record("1"), remaining_time_in_millis=60_000)
+
+    # WHEN processing a batch including that record
+    response = process_batch(persistence_layer, [sqs_record("1"), sqs_record("2")], lambda_context)
+
+    # THEN the record in progress is reported as a failure, to be retried later
+    assert response == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+    assert processed_records == ["2"]
+
+
+def test_batch_deletes_records_failing_processing(redis_client, lambda_context):
+    # GIVEN a batch where a record fails processing
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client)
+    response = process_batch(persistence_layer, [sqs_record("1", body="fail"), sqs_record("2")], lambda_context)
+    assert response == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+
+    # WHEN the failed record is retried
+    response = process_batch(persistence_layer, [sqs_record("1")], lambda_context)
+
+    # THEN it is processed again, as its idempotency record was deleted
+    assert response == {"batchItemFailures": []}
+    assert processed_records == ["2", "1"]
+
+
+def test_batch_claims_records_in_a_single_round_trip(redis_client, round_trips, lambda_context):
+    # GIVEN a batch of new records
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client)
+    records = [sqs_record(str(i)) for i in range(10)]
+    redis_client.ping()  # connects to Redis beforehand
+    round_trips.clear()
+
+    # WHEN processing the batch
+    response = process_batch(persistence_layer, records, lambda_context)
+
+    # THEN records are claimed with a single round trip, and each result saved with another
+    assert response == {"batchItemFailures": []}
+    assert len(round_trips) == 1 + len(records)
@@ -0,0 +1,210 @@
+import datetime
+import json
+from unittest import mock
+
+import fakeredis
+import pytest
+import redis
+
+from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig
+from aws_lambda_powertools.utilities.idempotency.exceptions import (
+    IdempotencyItemAlreadyExistsError,
+    IdempotencyPersistenceConfigError,
+    IdempotencyValidationError,
+)
+from aws_lambda_powertools.utilities.idempotency.idempotency import idempotent_function
+from aws_lambda_powertools.utilities.idempotency.persistence.base import STATUS_CONSTANTS
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import RedisCachePersistenceLayer
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def round_trips():
+    """Count requests sent to Redis, where a pipeline is sent with a single request"""
+    calls = []
+    send_packed_command = redis.connection.AbstractConnection.send_packed_command
+
+    def counting_send_packed_command(self, *args, **kwargs):
+        calls.append(args)
+        return send_packed_command(self, *args, **kwargs)
+
+    with mock.patch.object(redis.connection.AbstractConnection, "send_packed_command", counting_send_packed_command):
+        yield calls
+
+
+def configure(persistence_layer: RedisCachePersistenceLayer, **config) -> RedisCachePersistenceLayer:
+    persistence_layer.configure(IdempotencyConfig(**config), function_name="record_handler")
+    return persistence_layer
+
+
+def test_lua_script_saves_in_progress_record(redis_client):
+    # GIVEN a persistence layer using the Lua script
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True))
+
+    # WHEN saving an in progress record
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+
+    # THEN the record is saved with a TTL
+    (key,) = redis_client.keys()
+    assert json.loads(redis_client.get(key))["status"] == STATUS_CONSTANTS["INPROGRESS"]
+    assert 0 < redis_client.ttl(key) <= 3600
+
+
+def test_lua_script_returns_existing_record_in_a_single_round_trip(redis_client, round_trips):
+    # GIVEN an in progress record already saved
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True))
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+    round_trips.clear()
+
+    # WHEN saving the same record again
+    with pytest.raises(IdempotencyItemAlreadyExistsError) as exc_info:
+        persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+
+    # THEN the existing record is returned with the error, using a single round trip
+    assert exc_info.value.old_data_record.status == STATUS_CONSTANTS["INPROGRESS"]
+    assert len(round_trips) == 1
+
+
+def test_set_and_get_use_two_round_trips_without_lua_script(redis_client, round_trips):
+    # GIVEN an in progress record already saved, with a persistence layer not using the Lua script
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client))
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+    round_trips.clear()
+
+    # WHEN saving the same record again
+    with pytest.raises(IdempotencyItemAlreadyExistsError) as exc_info:
+        persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+
+    # THEN the existing record is still returned with the error, after a SET and a GET
+    assert exc_info.value.old_data_record.status == STATUS_CONSTANTS["INPROGRESS"]
+    assert len(round_trips) == 2
+
+
+def test_lua_script_overwrites_orphan_record(redis_client):
+    # GIVEN an in progress record whose in progress expiry has passed
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True))
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=-1000)
+
+    # WHEN saving the same record again
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+
+    # THEN the orphan record is overwritten after acquiring the lock
+    key = next(key for key in redis_client.keys() if not key.endswith(":lock"))
+    in_progress_expiry = json.loads(redis_client.get(key))["in_progress_expiration"]
+    assert in_progress_expiry > int(datetime.datetime.now().timestamp() * 1000)
+    assert redis_client.exists(f"{key}:lock")
+
+
+def test_lua_script_validates_payload_of_existing_record(redis_client):
+    # GIVEN payload validation, and a record saved for a payload with the same idempotency key
+    persistence_layer = configure(
+        RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True),
+        event_key_jmespath="id",
+        payload_validation_jmespath="amount",
+    )
+    persistence_layer.save_inprogress(data={"id": 1, "amount": 10}, remaining_time_in_millis=1000)
+
+    # WHEN saving a record for a different payload with the same idempotency key
+    # THEN a validation error is raised
+    with pytest.raises(IdempotencyValidationError):
+        persistence_layer.save_inprogress(data={"id": 1, "amount": 20}, remaining_time_in_millis=1000)
+
+
+def test_idempotent_function_with_lua_script(redis_client):
+    # GIVEN an idempotent function using the Lua script
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True)
+    calls = []
+
+    @idempotent_function(persistence_store=persistence_layer, data_keyword_argument="record")
+    def record_handler(record):
+        calls.append(record)
+        return {"processed": record["id"]}
+
+    # WHEN calling the function twice with the same record
+    first_result = record_handler(record={"id": 1})
+    second_result = record_handler(record={"id": 1})
+
+    # THEN the function is only executed once, and the saved response is returned
+    assert first_result == second_result == {"processed": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("enable_lua_script", [True, False])
+def test_save_inprogress_many(redis_client, enable_lua_script):
+    # GIVEN a completed record, and a record in progress
+    persistence_layer = configure(
+        RedisCachePersistenceLayer(client=redis_client, enable_lua_script=enable_lua_script),
+    )
+    persistence_layer.save_inprogress(data={"id": 1}, remaining_time_in_millis=1000)
+    persistence_layer.save_success(data={"id": 1}, result={"processed": 1})
+    persistence_layer.save_inprogress(data={"id": 2}, remaining_time_in_millis=1000)
+
+    # WHEN saving in progress records for a batch, including both records and a duplicate
+    results = persistence_layer.save_inprogress_many(
+        data=[{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 3}],
+        remaining_time_in_millis=1000,
+    )
+
+    # THEN new records are saved, and errors include the existing records
+    completed, in_progress, new, other_new, duplicate = results
+    assert isinstance(completed, IdempotencyItemAlreadyExistsError)
+    assert completed.old_data_record.status == STATUS_CONSTANTS["COMPLETED"]
+    assert completed.old_data_record.response_json_as_dict() == {"processed": 1}
+    assert isinstance(in_progress, IdempotencyItemAlreadyExistsError)
+    assert in_progress.old_data_record.status == STATUS_CONSTANTS["INPROGRESS"]
+    assert new is None
+    assert other_new is None
+    assert isinstance(duplicate, IdempotencyItemAlreadyExistsError)
+
+
+def test_save_inprogress_many_uses_a_single_round_trip(redis_client, round_trips):
+    # GIVEN a persistence layer using the Lua script, after the script is loaded
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True))
+    persistence_layer.save_inprogress_many(data=[{"id": 0}], remaining_time_in_millis=1000)
+    round_trips.clear()
+
+    # WHEN saving in progress records for a batch
+    results = persistence_layer.save_inprogress_many(
+        data=[{"id": i} for i in range(1, 101)],
+        remaining_time_in_millis=1000,
+    )
+
+    # THEN all records are saved with a single round trip
+    assert results == [None] * 100
+    assert len(round_trips) == 1
+
+
+def test_save_inprogress_many_loads_script_again_when_missing(redis_client):
+    # GIVEN a persistence layer using the Lua script, and Redis script cache emptied after loading it
+    persistence_layer = configure(RedisCachePersistenceLayer(client=redis_client, enable_lua_script=True))
+    persistence_layer.save_inprogress_many(data=[{"id": 0}], remaining_time_in_millis=1000)
+    redis_client.script_flush()
+
+    # WHEN saving in progress records for a batch
+    results = persistence_layer.save_inprogress_many(data=[{"id": 1}, {"id": 2}], remaining_time_in_millis=1000)
+
+    # THEN the script is loaded again and records are saved
+    assert results == [None, None]
+    assert len(redis_client.keys()) == 3
+
+
+def test_lua_script_requires_client_supporting_scripts():
+    # GIVEN a client only implementing RedisClientProtocol
+    class ProtocolOnlyClient:
+        def get(self, name):
+            return None
+
+        def set(self, name, value, ex=None, px=None, nx=False):  # noqa: A003
+            return True
+
+        def delete(self, keys):
+            return None
+
+    # WHEN enabling the Lua script
+    # THEN a configuration error is raised
+    with pytest.raises(IdempotencyPersistenceConfigError):
+        RedisCachePersistenceLayer(client=ProtocolOnlyClient(), enable_lua_script=True)
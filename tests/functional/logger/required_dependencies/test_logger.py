@@ -1096,6 +1096,16 @@ def test_logger_add_remove_filter(stdout, service_name):
     assert log[1]["api_key"] != "REDACTED"
 
 
+def test_logger_is_enabled_for(stdout, service_name):
+    # GIVEN Logger is initialized with INFO level
+    logger = Logger(service=service_name, stream=stdout, level="INFO")
+
+    # WHEN checking whether levels are enabled
+    # THEN the level of the underlying logger is honoured
+    assert logger.isEnabledFor(logging.INFO)
+    assert not logger.isEnabledFor(logging.DEBUG)
+
+
 def test_logger_json_unicode(stdout, service_name):
     # GIVEN Logger is initialized
     logger = Logger(service=service_name, stream=stdout)
@@ -0,0 +1,187 @@
+import io
+import json
+import logging
+import random
+import string
+from decimal import Decimal
+
+import pytest
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.formatter import LambdaPowertoolsFormatter
+from aws_lambda_powertools.logging.formatters.fast import LambdaPowertoolsFastFormatter
+
+
+@pytest.fixture
+def stdout():
+    return io.StringIO()
+
+
+@pytest.fixture
+def service_name():
+    chars = string.ascii_letters + string.digits
+    return "".join(random.SystemRandom().choice(chars) for _ in range(15))
+
+
+def make_record(msg, args=None, extra=None, exc_info=None, level=logging.INFO) -> logging.LogRecord:
+    return logging.getLogger("fast_formatter").makeRecord(
+        name="fast_formatter",
+        level=level,
+        fn="handler.py",
+        lno=42,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+        func="lambda_handler",
+        extra=extra,
+    )
+
+
+def capture_multiple_logging_statements_output(stdout):
+    return [json.loads(line.strip()) for line in stdout.getvalue().split("\n") if line]
+
+
+FORMATTER_OPTIONS = [
+    {},
+    {"service": "payment", "sampling_rate": 0.1},
+    {"log_record_order": ["message", "level", "timestamp"]},
+    {"log_record_order": ["timestamp", "level"], "xray_trace_id": None},
+    {"log_record_order": ["xray_trace_id", "message"], "service": "payment"},
+    {"use_rfc3339": True, "utc": True},
+    {"datefmt": "%Y-%m-%dT%H:%M:%S.%F%z"},
+    {"datefmt": "%H:%M:%S.%f", "use_datetime_directive": True},
+    {"process": "%(process)d", "custom": "%(process)d", "tags": ["a", "b"], "owner": {"team": "x"}},
+    {"timestamp": "%(asctime)s - %(levelname)s"},
+    {"location": None, "level": ""},
+]
+
+RECORDS = [
+    lambda: make_record("plain message"),
+    lambda: make_record('{"json": "message"}'),
+    lambda: make_record("formatted %s %d", args=("message", 1)),
+    lambda: make_record({"dict": "message", "nested": {"values": [1, 2.5, None, True]}}),
+    lambda: make_record(None),
+    lambda: make_record(["list", "message"]),
+    lambda: make_record("unicode ✓ message"),
+    lambda: make_record("extras", extra={"order_id": 1, "customer": {"name": "Ünïcødé"}, "skipped": None}),
+    lambda: make_record("not serializable", extra={"amount": Decimal("1.5"), "items": {1, 2}}),
+    lambda: make_record("override structure key", extra={"level": "custom"}),
+    lambda: make_record("override exception", extra={"exception": "custom"}),
+]
+
+
+@pytest.mark.parametrize("options", FORMATTER_OPTIONS)
+@pytest.mark.parametrize("record_factory", RECORDS)
+def test_fast_formatter_matches_default_formatter(monkeypatch, options, record_factory):
+    # GIVEN the default and fast formatters configured with the same options
+    monkeypatch.setenv("_X_AMZN_TRACE_ID", "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=557abcec3ee5a047;Sampled=1")
+    default_formatter = LambdaPowertoolsFormatter(**options)
+    fast_formatter = LambdaPowertoolsFastFormatter(decode_json_message=True, **options)
+
+    # WHEN formatting the same record
+    record = record_factory()
+    expected = default_formatter.format(record)
+    result = fast_formatter.format(record)
+
+    # THEN both produce exactly the same JSON line
+    assert result == expected
+
+
+def test_fast_formatter_matches_default_formatter_with_exception():
+    # GIVEN the default and fast formatters
+    default_formatter = LambdaPowertoolsFormatter()
+    fast_formatter = LambdaPowertoolsFastFormatter()
+
+    # WHEN formatting a record with exception info
+    try:
+        raise ValueError("something went wrong")
+    except ValueError as exc:
+        record = make_record("failure", exc_info=(type(exc), exc, exc.__traceback__), level=logging.ERROR)
+
+    # THEN both produce the same output
+    assert fast_formatter.format(record) == default_formatter.format(record)
+
+
+def test_fast_formatter_skips_json_message_decoding_by_default():
+    # GIVEN a fast formatter with default options
+    formatter = LambdaPowertoolsFastFormatter()
+
+    # WHEN formatting a message containing a JSON string
+    log = json.loads(formatter.format(make_record('{"json": "message"}')))
+
+    # THEN the message is kept as a string
+    assert log["message"] == '{"json": "message"}'
+
+
+def test_fast_formatter_caches_timestamp_per_millisecond(mocker):
+    # GIVEN a fast formatter
+    formatter = LambdaPowertoolsFastFormatter()
+    format_time_spy = mocker.spy(LambdaPowertoolsFormatter, "formatTime")
+
+    # WHEN formatting records created within the same millisecond, and a record created later
+    first_record = make_record("first")
+    second_record = make_record("second")
+    second_record.created, second_record.msecs = first_record.created, first_record.msecs
+    third_record = make_record("third")
+    third_record.created, third_record.msecs = first_record.created + 1, first_record.msecs
+
+    first_log = json.loads(formatter.format(first_record))
+    second_log = json.loads(formatter.format(second_record))
+    json.loads(formatter.format(third_record))
+
+    # THEN the timestamp is only formatted once per millisecond
+    assert first_log["timestamp"] == second_log["timestamp"]
+    assert format_time_spy.call_count == 2
+
+
+def test_fast_formatter_with_logger_updates_keys(stdout, service_name):
+    # GIVEN a Logger using the fast formatter
+    logger = Logger(service=service_name, stream=stdout, logger_formatter=LambdaPowertoolsFastFormatter())
+
+    # WHEN appending, removing, and clearing keys between log statements
+    logger.append_keys(order_id="123")
+    logger.info("with order id")
+    logger.remove_keys(["order_id"])
+    logger.info("without order id", extra={"customer_id": "456"})
+    logger.append_keys(order_id="789")
+    logger.structure_logs()
+    logger.info("after clearing state")
+
+    # THEN every log statement reflects the keys set at that time
+    with_order_id, without_order_id, after_clear = capture_multiple_logging_statements_output(stdout)
+    assert with_order_id["order_id"] == "123"
+    assert with_order_id["service"] == service_name
+    assert "order_id" not in without_order_id
+    assert without_order_id["customer_id"] == "456"
+    assert "order_id" not in after_clear
+    assert after_clear["service"] == service_name
+
+
+def test_fast_formatter_with_mutable_appended_key(stdout, service_name):
+    # GIVEN a Logger using the fast formatter, with a dict appended as a key
+    logger = Logger(service=service_name, stream=stdout, logger_formatter=LambdaPowertoolsFastFormatter())
+    order = {"status": "pending"}
+    logger.append_keys(order=order)
+
+    # WHEN the dict is updated in place between log statements
+    logger.info("first")
+    order["status"] = "paid"
+    logger.info("second")
+
+    # THEN the current value is logged every time
+    first, second = capture_multiple_logging_statements_output(stdout)
+    assert first["order"] == {"status": "pending"}
+    assert second["order"] == {"status": "paid"}
+
+
+def test_logger_skips_disabled_log_levels(stdout, service_name, mocker):
+    # GIVEN a Logger with INFO log level
+    logger = Logger(service=service_name, stream=stdout, level="INFO")
+    debug_spy = mocker.spy(logger._logger, "debug")
+
+    # WHEN logging a debug statement
+    logger.debug("skipped", key="value")
+
+    # THEN the call returns before reaching the std logger
+    debug_spy.assert_not_called()
+    assert stdout.getvalue() == ""
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from aws_lambda_powertools.metrics import MetricAggregation, Metrics
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+
+
+def capture_metrics_output_multiple_emf_objects(capsys):
+    return [json.loads(line.strip()) for line in capsys.readouterr().out.split("\n") if line]
+
+
+def test_metric_aggregation_values_and_counts(capsys, namespace, service):
+    # GIVEN a provider aggregating values and counts
+    provider = AmazonCloudWatchEMFProvider(
+        namespace=namespace,
+        service=service,
+        metric_aggregation=MetricAggregation.Values,
+    )
+
+    # WHEN adding repeated values to the same metric
+    for i in range(1000):
+        provider.add_metric(name="latency", unit="Milliseconds", value=i % 3)
+    provider.flush_metrics()
+
+    # THEN distinct values are emitted with how many times each was added, in a single EMF document
+    (output,) = capture_metrics_output_multiple_emf_objects(capsys)
+    assert output["latency"] == {"Values": [0.0, 1.0, 2.0], "Counts": [334, 333, 333]}
+    assert output["_aws"]["CloudWatchMetrics"][0]["Metrics"] == [{"Name": "latency", "Unit": "Milliseconds"}]
+
+
+def test_metric_aggregation_values_flushes_at_maximum_distinct_values(capsys, namespace):
+    # GIVEN a provider aggregating values and counts
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, metric_aggregation="Values")
+
+    # WHEN adding more distinct values than a single EMF document supports
+    for i in range(150):
+        provider.add_metric(name="latency", unit="Milliseconds", value=i)
+    provider.flush_metrics()
+
+    # THEN a new EMF document is emitted every 100 distinct values
+    first, second = capture_metrics_output_multiple_emf_objects(capsys)
+    assert first["latency"]["Values"] == [float(i) for i in range(100)]
+    assert first["latency"]["Counts"] == [1] * 100
+    assert second["latency"]["Values"] == [float(i) for i in range(100, 150)]
+
+
+def test_metric_aggregation_statistic_set(capsys, namespace, service):
+    # GIVEN Metrics aggregating values into a statistic set
+    metrics = Metrics(namespace=namespace, service=service, metric_aggregation=MetricAggregation.StatisticSet)
+
+    # WHEN the decorated handler adds many values to the same metric
+    @metrics.log_metrics
+    def lambda_handler(evt, ctx):
+        for i in range(1, 501):
+            metrics.add_metric(name="payload_size", unit="Bytes", value=i)
+
+    lambda_handler({}, {})
+
+    # THEN only their minimum, maximum, sum, and count are emitted
+    (output,) = capture_metrics_output_multiple_emf_objects(capsys)
+    assert output["payload_size"] == {"Min": 1.0, "Max": 500.0, "Sum": 125250.0, "Count": 500}
+
+
+def test_metric_aggregation_folds_values_added_before_aggregating(capsys, namespace):
+    # GIVEN a metric set with values added by a provider without aggregation
+    metric_set: dict = {}
+    AmazonCloudWatchEMFProvider(namespace=namespace, metric_set=metric_set).add_metric(
+        name="latency",
+        unit="Milliseconds",
+        value=5,
+    )
+
+    # WHEN a provider aggregating values adds to the same metric
+    provider = AmazonCloudWatchEMFProvider(
+        namespace=namespace,
+        metric_set=metric_set,
+        metric_aggregation=MetricAggregation.StatisticSet,
+    )
+    provider.add_metric(name="latency", unit="Milliseconds", value=1)
+    provider.flush_metrics()
+
+    # THEN values added earlier are part of the aggregate
+    (output,) = capture_metrics_output_multiple_emf_objects(capsys)
+    assert output["latency"] == {"Min": 1.0, "Max": 5.0, "Sum": 6.0, "Count": 2}
+
+
+def test_metric_aggregation_invalid_value(namespace):
+    # GIVEN an unknown aggregation
+    # WHEN creating a provider
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        AmazonCloudWatchEMFProvider(namespace=namespace, metric_aggregation="Percentiles")
@@ -0,0 +1,152 @@
+import io
+import json
+import os
+import warnings
+
+import pytest
+
+from aws_lambda_powertools.metrics import Metrics, SchemaValidationError
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
+
+
+def capture_emf_documents(output: str) -> list:
+    return [json.loads(line) for line in output.split("\n") if line]
+
+
+def test_emf_writer_buffers_documents_until_flush(namespace, service):
+    # GIVEN a provider with an EMF writer using an in-memory sink
+    sink = io.StringIO()
+    emf_writer = EMFWriter(sink=sink)
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, service=service, emf_writer=emf_writer)
+
+    # WHEN adding more than 100 metrics, which serializes the metric set before flushing
+    for i in range(250):
+        provider.add_metric(name=f"metric_{i}", unit="Count", value=1)
+
+    # THEN metric sets are buffered instead of being written
+    assert sink.getvalue() == ""
+    assert emf_writer.pending_blobs == 2
+
+    # WHEN flushing metrics
+    provider.flush_metrics()
+
+    # THEN all documents are written with a single write, one document per line
+    documents = capture_emf_documents(sink.getvalue())
+    assert len(documents) == 3
+    assert sum(len(document["_aws"]["CloudWatchMetrics"][0]["Metrics"]) for document in documents) == 250
+    assert emf_writer.writes == 1
+    assert emf_writer.blobs_emitted == 3
+    assert emf_writer.bytes_emitted == len(sink.getvalue())
+    assert emf_writer.pending_blobs == 0
+
+
+def test_emf_writer_output_matches_unbuffered_output(capsys, namespace, service):
+    # GIVEN providers with and without an EMF writer, both writing to stdout
+    def emit_metrics(provider: AmazonCloudWatchEMFProvider) -> list:
+        provider.set_timestamp(1_700_000_000_000)
+        provider.add_dimension(name="operation", value="checkout")
+        for i in range(150):
+            provider.add_metric(name=f"metric_{i % 120}", unit="Count", value=i)
+        provider.flush_metrics()
+        return capture_emf_documents(capsys.readouterr().out)
+
+    # WHEN emitting the same metrics
+    unbuffered_documents = emit_metrics(AmazonCloudWatchEMFProvider(namespace=namespace, service=service))
+    buffered_documents = emit_metrics(
+        AmazonCloudWatchEMFProvider(namespace=namespace, service=service, emf_writer=EMFWriter()),
+    )
+
+    # THEN the same EMF documents are emitted
+    assert len(unbuffered_documents) == 2
+    assert buffered_documents == unbuffered_documents
+
+
+def test_emf_writer_writes_when_buffer_is_full(namespace):
+    # GIVEN an EMF writer with a small buffer
+    sink = io.StringIO()
+    emf_writer = EMFWriter(sink=sink, max_buffer_bytes=1024)
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, emf_writer=emf_writer)
+
+    # WHEN buffering documents exceeding the buffer size
+    for i in range(500):
+        provider.add_metric(name=f"metric_{i}", unit="Count", value=1)
+
+    # THEN documents are written in batches that don't exceed the buffer size, unless a single document does
+    assert emf_writer.writes > 0
+    assert emf_writer.blobs_emitted + emf_writer.pending_blobs == 5
+
+
+def test_emf_writer_flushes_buffered_documents_with_empty_metric_set(namespace):
+    # GIVEN exactly 100 metrics buffered, which leaves the metric set empty
+    sink = io.StringIO()
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, emf_writer=EMFWriter(sink=sink))
+    for i in range(100):
+        provider.add_metric(name=f"metric_{i}", unit="Count", value=1)
+
+    # WHEN flushing metrics
+    with warnings.catch_warnings(record=True):
+        provider.flush_metrics()
+
+    # THEN the buffered document is still written
+    assert len(capture_emf_documents(sink.getvalue())) == 1
+
+
+def test_emf_writer_flushes_buffered_documents_when_raising_on_empty_metrics(namespace):
+    # GIVEN exactly 100 metrics buffered, which leaves the metric set empty
+    sink = io.StringIO()
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, emf_writer=EMFWriter(sink=sink))
+    for i in range(100):
+        provider.add_metric(name=f"metric_{i}", unit="Count", value=1)
+
+    # WHEN flushing metrics with raise_on_empty_metrics
+    with pytest.raises(SchemaValidationError):
+        provider.flush_metrics(raise_on_empty_metrics=True)
+
+    # THEN the buffered document is written before raising
+    assert len(capture_emf_documents(sink.getvalue())) == 1
+
+
+def test_emf_writer_with_file_descriptor_sink(tmp_path, namespace):
+    # GIVEN an EMF writer using a file descriptor
+    path = tmp_path / "emf.log"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    provider = AmazonCloudWatchEMFProvider(namespace=namespace, emf_writer=EMFWriter(sink=fd))
+
+    # WHEN flushing metrics
+    provider.add_metric(name="metric", unit="Count", value=1)
+    provider.flush_metrics()
+    os.close(fd)
+
+    # THEN documents are written to the file descriptor
+    documents = capture_emf_documents(path.read_text())
+    assert documents[0]["metric"] == [1.0]
+
+
+def test_emf_writer_warns_on_documents_exceeding_maximum_event_size(namespace):
+    # GIVEN an EMF writer
+    emf_writer = EMFWriter(sink=io.StringIO())
+
+    # WHEN writing a document larger than the CloudWatch Logs maximum event size
+    # THEN a warning is raised
+    with pytest.warns(UserWarning, match="exceeds the CloudWatch Logs maximum event size"):
+        emf_writer.write({"large_metadata": "x" * 300_000})
+
+
+def test_metrics_with_emf_writer_log_metrics(namespace, service):
+    # GIVEN Metrics with an EMF writer
+    sink = io.StringIO()
+    metrics = Metrics(namespace=namespace, service=service, emf_writer=EMFWriter(sink=sink))
+
+    # WHEN the decorated handler adds more than 100 metrics
+    @metrics.log_metrics
+    def lambda_handler(evt, ctx):
+        for i in range(101):
+            metrics.add_metric(name=f"metric_{i}", unit="Count", value=1)
+
+    lambda_handler({}, {})
+
+    # THEN all metric sets are written when the handler finishes
+    documents = capture_emf_documents(sink.getvalue())
+    assert len(documents) == 2
+    assert documents[1]["metric_100"] == [1.0]
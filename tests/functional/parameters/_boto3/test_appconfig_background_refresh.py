@@ -0,0 +1,314 @@
+import json
+from concurrent.futures import wait
+from datetime import datetime, timedelta
+from io import BytesIO
+from typing import List, Optional
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+from botocore.response import StreamingBody
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+
+CONFIG_NAME = "features"
+FEATURES = {"beta": {"default": False}}
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_get_latest_configuration_response(body: bytes, token: str, poll_interval: Optional[int] = None) -> dict:
+    response = {
+        "Configuration": StreamingBody(BytesIO(body), len(body)),
+        "NextPollConfigurationToken": token,
+        "ContentType": "application/json",
+    }
+    if poll_interval is not None:
+        response["NextPollIntervalInSeconds"] = poll_interval
+    return response
+
+
+def stub_polls(provider: parameters.AppConfigProvider, bodies: List[bytes], poll_interval: int = 60) -> stub.Stubber:
+    """Stubs a configuration session, then a poll returning each body in turn"""
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "token-0"})
+    for i, body in enumerate(bodies):
+        stubber.add_response(
+            "get_latest_configuration",
+            build_get_latest_configuration_response(body, f"token-{i + 1}", poll_interval),
+            {"ConfigurationToken": f"token-{i}"},
+        )
+    stubber.activate()
+    return stubber
+
+
+def run_scheduled_poll(provider: parameters.AppConfigProvider, key: tuple):
+    """Runs the poll scheduled for a configuration right away, and waits for it"""
+    timer = provider._poll_timers[key]
+    timer.cancel()
+    timer.function(*timer.args)
+    with provider._refresh_lock:
+        futures = list(provider._pending_refreshes.values())
+    wait(futures)
+
+
+def test_appconfig_provider_keeps_transformed_value_when_unchanged(config):
+    # GIVEN a configuration that doesn't change between polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode(), b""])
+
+    try:
+        # WHEN polling it again, as JSON
+        first = provider.get(CONFIG_NAME, transform="json")
+        second = provider.get(CONFIG_NAME, transform="json", force_fetch=True)
+
+        # THEN the very same object is returned, without transforming it again
+        stubber.assert_no_pending_responses()
+        assert first == FEATURES
+        assert second is first
+    finally:
+        stubber.deactivate()
+
+
+def test_appconfig_provider_transforms_changed_value(config):
+    # GIVEN a configuration that changes between polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    changed = {"beta": {"default": True}}
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode(), json.dumps(changed).encode(), b""])
+
+    try:
+        # WHEN polling it again, as JSON
+        provider.get(CONFIG_NAME, transform="json")
+        second = provider.get(CONFIG_NAME, transform="json", force_fetch=True)
+        third = provider.get(CONFIG_NAME, transform="json", force_fetch=True)
+
+        # THEN the new configuration is returned, then kept while unchanged
+        assert second == changed
+        assert third is second
+    finally:
+        stubber.deactivate()
+
+
+def test_appconfig_provider_background_refresh_honours_poll_interval(config):
+    # GIVEN a provider refreshing configurations in the background, and AppConfig asking to poll every 30 seconds
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode(), b""], poll_interval=30)
+    key = provider._build_cache_key(name=CONFIG_NAME, transform="json")
+
+    try:
+        # WHEN getting the configuration with a max_age shorter than the poll interval
+        first = provider.get(CONFIG_NAME, transform="json", max_age=5)
+
+        # THEN the next poll is scheduled after the poll interval, and the value is cached until it's missed
+        assert provider._poll_timers[key].interval == 30
+        assert provider.store[key].ttl > datetime.now() + timedelta(seconds=55)
+
+        # WHEN the scheduled poll runs
+        run_scheduled_poll(provider, key)
+
+        # THEN the unchanged configuration is kept, and served from cache
+        stubber.assert_no_pending_responses()
+        assert provider.get(CONFIG_NAME, transform="json", max_age=5) is first
+        assert provider.stats.refreshes == 1
+        assert provider.stats.misses == 1
+        assert provider._poll_timers[key].is_alive()
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_background_refresh_reschedules_failed_poll(config):
+    # GIVEN a provider refreshing configurations in the background
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode()], poll_interval=30)
+    stubber.add_client_error("get_latest_configuration", service_error_code="ThrottlingException")
+    key = provider._build_cache_key(name=CONFIG_NAME, transform="json")
+
+    try:
+        first = provider.get(CONFIG_NAME, transform="json")
+        timer = provider._poll_timers[key]
+
+        # WHEN the scheduled poll fails
+        run_scheduled_poll(provider, key)
+
+        # THEN the cached configuration is kept, and polled again on the next interval
+        assert provider.stats.refresh_errors == 1
+        assert provider.get(CONFIG_NAME, transform="json") is first
+        assert provider._poll_timers[key] is not timer
+        assert provider._poll_timers[key].interval == 30
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_background_refresh_stops_after_failed_polls(config):
+    # GIVEN a provider refreshing a configuration in the background, and AppConfig failing every poll
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode()], poll_interval=30)
+    for _ in range(provider.MAX_FAILED_POLLS):
+        stubber.add_client_error("get_latest_configuration", service_error_code="ThrottlingException")
+    key = provider._build_cache_key(name=CONFIG_NAME, transform="json")
+
+    try:
+        provider.get(CONFIG_NAME, transform="json")
+
+        # WHEN the configuration keeps being read, but its scheduled polls fail
+        for _ in range(provider.MAX_FAILED_POLLS):
+            provider.get(CONFIG_NAME, transform="json")
+            run_scheduled_poll(provider, key)
+
+        # THEN it's no longer polled after the maximum number of failed polls
+        stubber.assert_no_pending_responses()
+        assert provider.stats.refresh_errors == provider.MAX_FAILED_POLLS
+        assert key not in provider._poll_timers
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_background_refresh_stops_when_not_read(config):
+    # GIVEN a provider refreshing a configuration in the background
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode(), b""], poll_interval=30)
+    key = provider._build_cache_key(name=CONFIG_NAME, transform="json")
+
+    try:
+        provider.get(CONFIG_NAME, transform="json")
+        run_scheduled_poll(provider, key)
+        timer = provider._poll_timers[key]
+
+        # WHEN the next poll is due, without the configuration being read since the last one
+        run_scheduled_poll(provider, key)
+
+        # THEN it isn't polled anymore
+        stubber.assert_no_pending_responses()
+        assert provider.stats.refreshes == 1
+        timer.join(timeout=1)
+        assert key not in provider._poll_timers
+        assert not timer.is_alive()
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_background_refresh_respects_max_age_zero(config):
+    # GIVEN a provider refreshing configurations in the background
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode(), b""], poll_interval=30)
+    key = provider._build_cache_key(name=CONFIG_NAME, transform="json")
+
+    try:
+        # WHEN getting a configuration that mustn't be cached
+        provider.get(CONFIG_NAME, transform="json", max_age=0)
+        provider.get(CONFIG_NAME, transform="json", max_age=0)
+
+        # THEN it's polled on every get, and neither cached nor polled in the background
+        stubber.assert_no_pending_responses()
+        assert key not in provider.store
+        assert provider._poll_timers == {}
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_stop_background_refresh(config):
+    # GIVEN a provider with a poll scheduled
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode()])
+
+    try:
+        first = provider.get(CONFIG_NAME)
+        timer = provider._poll_timers[provider._build_cache_key(name=CONFIG_NAME)]
+
+        # WHEN stopping the background refresh
+        provider.stop_background_refresh()
+
+        # THEN the poll is cancelled, and the cached configuration is still served
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+        assert provider._poll_timers == {}
+        assert provider.get(CONFIG_NAME) is first
+    finally:
+        provider.clear_cache()
+        stubber.deactivate()
+
+
+def test_appconfig_provider_clear_cache_cancels_polls(config):
+    # GIVEN a provider with a poll scheduled
+    provider = parameters.AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=config,
+        background_refresh=True,
+    )
+    stubber = stub_polls(provider, [json.dumps(FEATURES).encode()])
+
+    try:
+        provider.get(CONFIG_NAME)
+        timer = provider._poll_timers[provider._build_cache_key(name=CONFIG_NAME)]
+
+        # WHEN clearing the cache
+        provider.clear_cache()
+
+        # THEN the poll is cancelled
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+        assert provider._poll_timers == {}
+    finally:
+        stubber.deactivate()
+
+
+def test_feature_flags_unchanged_configuration_not_validated_again(mocker, config):
+    # GIVEN feature flags backed by an AppConfig configuration that doesn't change between polls, polled every time
+    store = AppConfigStore(environment="dev", application="myapp", name=CONFIG_NAME, max_age=0, boto_config=config)
+    stubber = stub_polls(store._conf_store, [json.dumps(FEATURES).encode(), b""])
+    validate = mocker.patch(
+        "aws_lambda_powertools.utilities.feature_flags.feature_flags.schema.SchemaValidator.validate",
+    )
+    feature_flags = FeatureFlags(store=store)
+
+    try:
+        # WHEN getting the configuration on each poll
+        first = feature_flags.get_configuration()
+        second = feature_flags.get_configuration()
+
+        # THEN it's only validated once
+        stubber.assert_no_pending_responses()
+        assert second is first
+        validate.assert_called_once()
+    finally:
+        stubber.deactivate()
@@ -0,0 +1,169 @@
+import json
+from typing import List
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+
+TABLE_NAME = "TEST_TABLE"
+PROJECTION = {"ProjectionExpression": "#key, #value", "ExpressionAttributeNames": {"#key": "id", "#value": "value"}}
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_items(names: List[str]) -> List[dict]:
+    return [{"id": {"S": name}, "value": {"S": json.dumps({"tenant": name})}} for name in names]
+
+
+def build_request_items(names: List[str], **options) -> dict:
+    return {"RequestItems": {TABLE_NAME: {**options, **PROJECTION, "Keys": [{"id": name} for name in names]}}}
+
+
+def test_dynamodb_provider_get_many_in_chunks(config):
+    # GIVEN 150 tenant items, one of them already cached
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+    names = [f"tenant-{i}" for i in range(150)]
+    provider.add_to_cache(key=provider._build_cache_key(name=names[0]), value='{"tenant": "cached"}', max_age=60)
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: build_items(names[1:101])}},
+        build_request_items(names[1:101], ConsistentRead=True),
+    )
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: build_items(names[101:])}},
+        build_request_items(names[101:], ConsistentRead=True),
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting them all as JSON
+        values = provider.get_many(names, transform="json", ConsistentRead=True)
+
+        # THEN items not cached are fetched by chunks of 100 keys, projecting only their value
+        stubber.assert_no_pending_responses()
+        assert values[names[0]] == {"tenant": "cached"}
+        assert all(values[name] == {"tenant": name} for name in names[1:])
+        assert provider.stats.hits == 1
+        assert provider.stats.misses == 149
+    finally:
+        stubber.deactivate()
+
+
+def test_dynamodb_provider_get_many_caches_raw_values(config):
+    # GIVEN a provider
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: build_items(["a", "b"])}})
+    stubber.activate()
+
+    try:
+        # WHEN getting items as JSON
+        values = provider.get_many(["a", "b", "a"], transform="json")
+
+        # THEN each value is cached as is, and transformed from cache when retrieved again
+        assert values == {"a": {"tenant": "a"}, "b": {"tenant": "b"}}
+        assert set(provider.store) == {("a", None, False), ("b", None, False)}
+        assert provider.get("a") == '{"tenant": "a"}'
+        assert provider.get("b", transform="json") == {"tenant": "b"}
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_dynamodb_provider_get_many_retries_unprocessed_keys(config):
+    # GIVEN DynamoDB not processing some keys at first
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+    provider._BATCH_GET_ITEM_BACKOFF_SECS = 0.001
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    stubber.add_response(
+        "batch_get_item",
+        {
+            "Responses": {TABLE_NAME: build_items(["a"])},
+            "UnprocessedKeys": {TABLE_NAME: {"Keys": [{"id": {"S": "b"}}], **PROJECTION}},
+        },
+        build_request_items(["a", "b"]),
+    )
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: build_items(["b"])}},
+        build_request_items(["b"]),
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting items
+        values = provider.get_many(["a", "b"])
+
+        # THEN unprocessed keys are retried
+        stubber.assert_no_pending_responses()
+        assert list(values) == ["a", "b"]
+    finally:
+        stubber.deactivate()
+
+
+def test_dynamodb_provider_get_many_gives_up_on_unprocessed_keys(config):
+    # GIVEN DynamoDB never processing a key
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+    provider._BATCH_GET_ITEM_BACKOFF_SECS = 0.001
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    for _ in range(provider._MAX_BATCH_GET_ITEM_RETRIES + 1):
+        stubber.add_response(
+            "batch_get_item",
+            {"Responses": {}, "UnprocessedKeys": {TABLE_NAME: {"Keys": [{"id": {"S": "a"}}], **PROJECTION}}},
+        )
+    stubber.activate()
+
+    try:
+        # WHEN getting it
+        # THEN a GetParameterError is raised once retries are exhausted
+        with pytest.raises(parameters.GetParameterError, match="'a'"):
+            provider.get_many(["a"])
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_dynamodb_provider_get_many_graceful_errors(config):
+    # GIVEN an item that doesn't exist
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: build_items(["a"])}})
+    stubber.activate()
+
+    try:
+        # WHEN getting it along with another item, without failing fast
+        values = provider.get_many(["a", "missing"], raise_on_error=False)
+
+        # THEN it's aggregated under "_errors"
+        assert values == {"_errors": ["missing"], "a": '{"tenant": "a"}'}
+    finally:
+        stubber.deactivate()
+
+
+def test_dynamodb_provider_get_many_raise_on_error(config):
+    # GIVEN a request failing altogether
+    provider = parameters.DynamoDBProvider(TABLE_NAME, boto_config=config)
+
+    stubber = stub.Stubber(provider.table.meta.client)
+    stubber.add_client_error("batch_get_item", service_error_code="ResourceNotFoundException")
+    stubber.activate()
+
+    try:
+        # WHEN getting items
+        # THEN a GetParameterError is raised
+        with pytest.raises(parameters.GetParameterError):
+            provider.get_many(["a", "b"])
+    finally:
+        stubber.deactivate()
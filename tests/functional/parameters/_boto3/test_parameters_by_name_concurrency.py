@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_parameter(name: str, value: str) -> dict:
+    return {
+        "Name": name,
+        "Type": "String",
+        "Value": value,
+        "Version": 1,
+        "LastModifiedDate": datetime(2015, 1, 1),
+        "ARN": f"arn:aws:ssm:us-east-2:111122223333:parameter/{name.lstrip('/')}",
+    }
+
+
+class SlowSSMCalls:
+    """Replaces SSM calls of a client with slow in-memory ones, tracking how many run at once"""
+
+    def __init__(self, client, invalid_parameters: Optional[List[str]] = None, latency: float = 0.01):
+        self.invalid_parameters = invalid_parameters or []
+        self.latency = latency
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        client.get_parameters = self.get_parameters
+        client.get_parameter = self.get_parameter
+
+    def _call(self, operation: str):
+        with self._lock:
+            self.calls.append(operation)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+    def get_parameters(self, Names: List[str], **kwargs) -> dict:
+        self._call("get_parameters")
+        return {
+            "Parameters": [
+                build_parameter(name, f"value{name}") for name in Names if name not in self.invalid_parameters
+            ],
+            "InvalidParameters": [name for name in Names if name in self.invalid_parameters],
+        }
+
+    def get_parameter(self, Name: str, **kwargs) -> dict:
+        self._call("get_parameter")
+        if Name in self.invalid_parameters:
+            raise ValueError(f"Parameter {Name} not found")
+        return {"Parameter": build_parameter(Name, f"value{Name}")}
+
+
+def test_get_parameters_by_name_fetches_chunks_concurrently(config):
+    # GIVEN 35 parameters, fetched by chunks of 10
+    provider = parameters.SSMProvider(boto_config=config)
+    ssm = SlowSSMCalls(provider.client)
+    params = {f"/app/param-{i}": {} for i in range(35)}
+
+    # WHEN getting them with up to 4 concurrent calls
+    values = provider.get_parameters_by_name(parameters=params, max_concurrency=4)
+
+    # THEN chunks are fetched concurrently, and every parameter is returned and cached
+    assert values == {name: f"value{name}" for name in params}
+    assert ssm.calls == ["get_parameters"] * 4
+    assert ssm.max_in_flight > 1
+    assert all(provider.has_not_expired_in_cache((name, None)) for name in params)
+
+
+def test_get_parameters_by_name_fetches_decrypt_parameters_concurrently(config):
+    # GIVEN parameters requiring decryption, and others that don't
+    provider = parameters.SSMProvider(boto_config=config)
+    ssm = SlowSSMCalls(provider.client)
+    params = {**{f"/app/secret-{i}": {"decrypt": True} for i in range(6)}, "/app/param": {}}
+
+    # WHEN getting them with up to 3 concurrent calls
+    values = provider.get_parameters_by_name(parameters=params, max_concurrency=3)
+
+    # THEN parameters requiring decryption are fetched concurrently, one by one
+    assert values == {name: f"value{name}" for name in params}
+    assert ssm.calls.count("get_parameter") == 6
+    assert ssm.max_in_flight == 3
+
+
+@pytest.mark.parametrize("max_concurrency", [None, 1, 4])
+def test_get_parameters_by_name_aggregates_errors_in_order(config, max_concurrency):
+    # GIVEN invalid parameters across chunks, with and without decryption
+    invalid_parameters = ["/app/param-3", "/app/param-17", "/app/secret-1", "/app/param-24"]
+    provider = parameters.SSMProvider(boto_config=config)
+    SlowSSMCalls(provider.client, invalid_parameters=invalid_parameters, latency=0)
+    params = {
+        **{f"/app/param-{i}": {} for i in range(25)},
+        **{f"/app/secret-{i}": {"decrypt": True} for i in range(3)},
+    }
+
+    # WHEN getting them without failing fast
+    values = provider.get_parameters_by_name(parameters=params, raise_on_error=False, max_concurrency=max_concurrency)
+
+    # THEN errors are aggregated the same way whatever the concurrency
+    assert values["_errors"] == ["/app/secret-1", "/app/param-3", "/app/param-17", "/app/param-24"]
+    assert len(values) == len(params) - len(invalid_parameters) + 1
+
+
+def test_get_parameters_by_name_concurrent_raise_on_error(config):
+    # GIVEN an invalid parameter in the last chunk
+    provider = parameters.SSMProvider(boto_config=config)
+    SlowSSMCalls(provider.client, invalid_parameters=["/app/param-24"])
+    params = {f"/app/param-{i}": {} for i in range(25)}
+
+    # WHEN getting parameters concurrently, failing fast
+    # THEN a GetParameterError is raised
+    with pytest.raises(parameters.GetParameterError, match="/app/param-24"):
+        provider.get_parameters_by_name(parameters=params, max_concurrency=4)
+
+
+def test_get_parameters_by_name_invalid_max_concurrency(config):
+    # GIVEN/WHEN an invalid max_concurrency
+    # THEN a ValueError is raised
+    provider = parameters.SSMProvider(boto_config=config)
+    with pytest.raises(ValueError):
+        provider.get_parameters_by_name(parameters={"/app/a": {}}, max_concurrency=0)
+
+
+def test_get_parameters_by_name_transforms_batch(config):
+    # GIVEN JSON parameters fetched by GetParameters
+    provider = parameters.SSMProvider(boto_config=config)
+    provider.client.get_parameters = lambda Names, **kwargs: {
+        "Parameters": [build_parameter(name, '{"enabled": true}') for name in Names],
+        "InvalidParameters": [],
+    }
+
+    # WHEN getting them as JSON
+    values = provider.get_parameters_by_name(parameters={"/app/a": {}, "/app/b": {}}, transform="json")
+
+    # THEN each value is transformed, and cached transformed
+    assert values == {"/app/a": {"enabled": True}, "/app/b": {"enabled": True}}
+    assert provider.store[("/app/a", "json")].value == {"enabled": True}
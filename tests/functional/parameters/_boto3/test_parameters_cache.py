@@ -0,0 +1,208 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.parameters import ParameterCache
+from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue, estimate_size
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_get_secret_value_response(name: str, value: str) -> dict:
+    return {
+        "ARN": f"arn:aws:secretsmanager:us-east-1:132456789012:secret/{name}",
+        "Name": name,
+        "VersionId": "7a9155b8-2dc9-466e-b4f6-5bc46516c84d",
+        "SecretString": value,
+        "CreatedDate": datetime(2015, 1, 1),
+    }
+
+
+def fresh(value) -> ExpirableValue:
+    return ExpirableValue(value, datetime.now() + timedelta(seconds=60))
+
+
+def test_parameter_cache_evicts_least_recently_used_entries():
+    # GIVEN a cache of up to 2 values
+    cache = ParameterCache(max_entries=2)
+    cache[("a", None, False)] = fresh("a")
+    cache[("b", None, False)] = fresh("b")
+
+    # WHEN reading the oldest value, then caching a third one
+    assert cache[("a", None, False)].value == "a"
+    cache[("c", None, False)] = fresh("c")
+
+    # THEN the least recently used value is evicted
+    assert list(cache) == [("a", None, False), ("c", None, False)]
+    assert cache.stats.evictions == 1
+
+
+def test_parameter_cache_evicts_entries_over_max_bytes():
+    # GIVEN a cache holding up to about 3 values of 1 KiB
+    value = "x" * 1024
+    cache = ParameterCache(max_bytes=estimate_size(value) * 3)
+
+    # WHEN caching 5 values
+    for i in range(5):
+        cache[(f"param-{i}", None, False)] = fresh(value)
+
+    # THEN the oldest values are evicted to stay within the memory budget
+    assert len(cache) == 3
+    assert cache.size_bytes <= cache.max_bytes
+    assert cache.stats.evictions == 2
+
+
+def test_parameter_cache_does_not_keep_value_larger_than_max_bytes():
+    # GIVEN a cache of up to 1 KiB
+    cache = ParameterCache(max_bytes=1024)
+
+    # WHEN caching a larger value
+    cache[("large", None, False)] = fresh("x" * 4096)
+
+    # THEN it's not kept
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_parameter_cache_sweep():
+    # GIVEN a cache with an expired and a fresh value
+    cache = ParameterCache()
+    cache[("expired", None, False)] = ExpirableValue("expired", datetime.now() - timedelta(seconds=1))
+    cache[("fresh", None, False)] = fresh("fresh")
+
+    # WHEN sweeping expired values
+    removed = cache.sweep()
+
+    # THEN only the expired value is removed
+    assert removed == 1
+    assert list(cache) == [("fresh", None, False)]
+    assert cache.stats.expirations == 1
+
+
+@pytest.mark.parametrize("options", [{"max_entries": 0}, {"max_bytes": 0}])
+def test_parameter_cache_invalid_limits(options):
+    # GIVEN/WHEN invalid limits
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        ParameterCache(**options)
+
+
+def test_secrets_provider_with_bounded_cache(config):
+    # GIVEN a provider caching up to 2 secrets
+    provider = parameters.SecretsProvider(boto_config=config, cache=ParameterCache(max_entries=2))
+
+    stubber = stub.Stubber(provider.client)
+    for tenant in ("a", "b", "c"):
+        stubber.add_response("get_secret_value", build_get_secret_value_response(tenant, f"secret-{tenant}"))
+    stubber.activate()
+
+    try:
+        # WHEN getting a secret for each of 3 tenants
+        for tenant in ("a", "b", "c"):
+            assert provider.get(tenant) == f"secret-{tenant}"
+
+        # THEN only the 2 most recent secrets are kept
+        stubber.assert_no_pending_responses()
+        assert len(provider.store) == 2
+        assert provider.stats.misses == 3
+        assert provider.stats.evictions == 1
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_shares_raw_value_across_transforms(config):
+    # GIVEN a provider, and a JSON secret
+    provider = parameters.SecretsProvider(boto_config=config)
+    secret = json.dumps({"username": "admin"})
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("get_secret_value", build_get_secret_value_response("db", secret))
+    stubber.activate()
+
+    try:
+        # WHEN getting the secret as JSON, then as is
+        value = provider.get("db", transform="json")
+        raw_value = provider.get("db")
+
+        # THEN the secret is retrieved only once, and cached both as is and as JSON
+        stubber.assert_no_pending_responses()
+        assert value == {"username": "admin"}
+        assert raw_value == secret
+        assert set(provider.store) == {("db", None, False), ("db", "json", False)}
+        assert provider.stats.hits == 1
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_transforms_cached_raw_value(config):
+    # GIVEN a provider, and a parameter already cached as is
+    provider = parameters.SSMProvider(boto_config=config)
+    provider.add_to_cache(key=provider._build_cache_key(name="/app/config"), value='{"a": 1}', max_age=60)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.activate()
+
+    try:
+        # WHEN getting it as JSON
+        value = provider.get("/app/config", transform="json")
+
+        # THEN the cached raw value is transformed, and the transformed value expires along with it
+        assert value == {"a": 1}
+        assert provider.stats.hits == 1
+        assert provider.store[("/app/config", "json", False)].ttl == provider.store[("/app/config", None, False)].ttl
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_multiple_shares_raw_values_across_transforms(config):
+    # GIVEN a provider, and parameters under a path
+    provider = parameters.SSMProvider(boto_config=config)
+    response = {
+        "Parameters": [
+            {
+                "Name": "/app/config.json",
+                "Type": "String",
+                "Value": '{"a": 1}',
+                "Version": 1,
+                "LastModifiedDate": datetime(2015, 1, 1),
+                "ARN": "arn:aws:ssm:us-east-2:111122223333:parameter/app/config.json",
+            },
+        ],
+    }
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("get_parameters_by_path", response)
+    stubber.activate()
+
+    try:
+        # WHEN getting them with auto transform, then as is
+        values = provider.get_multiple("/app", transform="auto")
+        raw_values = provider.get_multiple("/app")
+
+        # THEN they're retrieved only once, and raw values aren't modified by the transform
+        stubber.assert_no_pending_responses()
+        assert values == {"config.json": {"a": 1}}
+        assert raw_values == {"config.json": '{"a": 1}'}
+    finally:
+        stubber.deactivate()
+
+
+def test_provider_sweeps_expired_values(config):
+    # GIVEN a provider with an expired value, due to be swept
+    provider = parameters.SSMProvider(boto_config=config)
+    provider.store[("expired", None, False)] = ExpirableValue("expired", datetime.now() - timedelta(seconds=1))
+    provider._next_sweep = datetime.now()
+
+    # WHEN caching another value
+    provider.add_to_cache(key=("fresh", None, False), value="fresh", max_age=60)
+
+    # THEN the expired value is removed
+    assert list(provider.store) == [("fresh", None, False)]
+    assert provider.stats.expirations == 1
@@ -0,0 +1,232 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider, ExpirableValue
+
+HIERARCHY = {
+    "/app/db/host": "db.internal",
+    "/app/db/port": "5432",
+    "/app/db/replica/host": "replica.internal",
+    "/app/api/url": "https://api.internal",
+    "/app/flags": '{"beta": true}',
+}
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_parameter(name: str, value: str) -> dict:
+    return {
+        "Name": name,
+        "Type": "String",
+        "Value": value,
+        "Version": 1,
+        "LastModifiedDate": datetime(2015, 1, 1),
+        "ARN": f"arn:aws:ssm:us-east-2:111122223333:parameter/{name.lstrip('/')}",
+    }
+
+
+def build_get_parameters_by_path_response(path: str, recursive: bool = True) -> dict:
+    depth = path.rstrip("/").count("/")
+    return {
+        "Parameters": [
+            build_parameter(name, value)
+            for name, value in HIERARCHY.items()
+            if name.startswith(f"{path}/") and (recursive or name.count("/") == depth + 1)
+        ],
+    }
+
+
+def expire(provider: BaseProvider, key: tuple):
+    """Makes a cached value expire a second ago"""
+    provider.store[key] = ExpirableValue(provider.store[key].value, datetime.now() - timedelta(seconds=1))
+
+
+class SlowGetParametersByPath:
+    """Replaces the paginator of a client with a slow in-memory one, tracking how many paths are fetched at once"""
+
+    def __init__(self, client, latency: float = 0.01):
+        self.latency = latency
+        self.paths: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        client.get_paginator = lambda operation: self
+
+    def paginate(self, Path: str, Recursive: bool, **kwargs) -> List[dict]:
+        with self._lock:
+            self.paths.append(Path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        return [build_get_parameters_by_path_response(Path, Recursive)]
+
+
+def test_ssm_provider_get_multiple_serves_sub_paths_of_hierarchy(config):
+    # GIVEN parameters fetched recursively under /app
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+    provider.get_multiple("/app", recursive=True)
+
+    # WHEN getting parameters under sub-paths
+    # THEN they're served relative to each sub-path, recursively or not, without fetching them
+    assert provider.get_multiple("/app/db", recursive=True) == {
+        "host": "db.internal",
+        "port": "5432",
+        "replica/host": "replica.internal",
+    }
+    assert provider.get_multiple("/app/db") == {"host": "db.internal", "port": "5432"}
+    assert provider.get_multiple("/app/db/replica/") == {"host": "replica.internal"}
+    assert provider.get_multiple("/app/missing") == {}
+    assert paths.paths == ["/app"]
+
+
+def test_ssm_provider_get_multiple_serves_closest_hierarchy(monkeypatch, config):
+    # GIVEN parameters fetched recursively under /app, then under /app/db once changed
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+    provider.get_multiple("/app", recursive=True)
+    monkeypatch.setitem(HIERARCHY, "/app/db/host", "new-db.internal")
+    provider.get_multiple("/app/db", recursive=True, force_fetch=True)
+
+    # WHEN getting parameters under /app/db, and once /app/db expired
+    values = provider.get_multiple("/app/db/replica", recursive=True)
+    db_values = provider.get_multiple("/app/db", recursive=True)
+    expire(provider, provider._build_hierarchy_key("/app/db", decrypt=False))
+    expired_db_values = provider.get_multiple("/app/db/", recursive=False)
+
+    # THEN the closest hierarchy that hasn't expired serves them
+    assert paths.paths == ["/app", "/app/db"]
+    assert values == {"host": "replica.internal"}
+    assert db_values["host"] == "new-db.internal"
+    assert expired_db_values == {"host": "db.internal", "port": "5432"}
+
+
+def test_ssm_provider_hierarchy_is_bounded_by_cache(config):
+    # GIVEN a provider whose cache can't hold the parameters of a hierarchy
+    provider = parameters.SSMProvider(boto_config=config, cache=parameters.ParameterCache(max_bytes=64))
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+
+    # WHEN getting parameters under /app recursively, then under /app/db
+    provider.get_multiple("/app", recursive=True)
+    provider.get_multiple("/app/db")
+
+    # THEN the hierarchy is evicted like other cached values, and /app/db is fetched
+    assert paths.paths == ["/app", "/app/db"]
+    assert provider.stats.evictions > 0
+    assert provider.store.size_bytes <= 64
+
+
+def test_ssm_provider_get_multiple_serves_sub_path_from_ancestor(config):
+    # GIVEN a provider
+    provider = parameters.SSMProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameters_by_path",
+        build_get_parameters_by_path_response("/app"),
+        {"Path": "/app", "Recursive": True, "WithDecryption": False},
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting parameters under /app recursively, then under /app/db
+        provider.get_multiple("/app", recursive=True)
+        values = provider.get_multiple("/app/db")
+        flags = provider.get_multiple("/app", transform="json")
+
+        # THEN the sub-paths are served from memory, without fetching them again
+        stubber.assert_no_pending_responses()
+        assert values == {"host": "db.internal", "port": "5432"}
+        assert flags == {"flags": {"beta": True}}
+        assert provider.stats.misses == 1
+        assert provider.stats.hits == 2
+    finally:
+        stubber.deactivate()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"decrypt": True}, {"force_fetch": True}, {"max_age": 0}, {"ParameterFilters": [{"Key": "Type"}]}],
+)
+def test_ssm_provider_get_multiple_fetches_sub_path(config, options):
+    # GIVEN parameters fetched recursively under /app
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+    provider.get_multiple("/app", recursive=True)
+
+    # WHEN getting parameters under /app/db with options the fetched parameters can't serve
+    provider.get_multiple("/app/db", **options)
+
+    # THEN they're fetched
+    assert paths.paths == ["/app", "/app/db"]
+
+
+def test_ssm_provider_get_multiple_non_recursive_fetch_is_not_indexed(config):
+    # GIVEN parameters fetched right under /app only
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+    provider.get_multiple("/app")
+
+    # WHEN getting parameters under /app/db
+    provider.get_multiple("/app/db")
+
+    # THEN they're fetched, as parameters under /app/db weren't
+    assert paths.paths == ["/app", "/app/db"]
+
+
+def test_ssm_provider_clear_cache_clears_path_index(config):
+    # GIVEN parameters fetched recursively under /app
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client, latency=0)
+    provider.get_multiple("/app", recursive=True)
+
+    # WHEN clearing the cache
+    provider.clear_cache()
+    provider.get_multiple("/app/db")
+
+    # THEN sub-paths are fetched again
+    assert paths.paths == ["/app", "/app/db"]
+
+
+def test_ssm_provider_get_multiple_by_paths_fetches_branches_concurrently(config):
+    # GIVEN a provider
+    provider = parameters.SSMProvider(boto_config=config)
+    paths = SlowGetParametersByPath(provider.client)
+
+    # WHEN getting the branches of a hierarchy, and a path under one of them, with up to 3 concurrent calls
+    values: Dict[str, dict] = provider.get_multiple_by_paths(
+        ["/app/db", "/app/api", "/app/db/replica", "/app/flags"],
+        max_concurrency=3,
+    )
+
+    # THEN branches are fetched concurrently, and the path under one of them is served from memory
+    assert sorted(paths.paths) == ["/app/api", "/app/db", "/app/flags"]
+    assert paths.max_in_flight > 1
+    assert values == {
+        "/app/db": {"host": "db.internal", "port": "5432", "replica/host": "replica.internal"},
+        "/app/api": {"url": "https://api.internal"},
+        "/app/db/replica": {"host": "replica.internal"},
+        "/app/flags": {},
+    }
+
+
+def test_ssm_provider_get_multiple_by_paths_invalid_max_concurrency(config):
+    # GIVEN/WHEN an invalid max_concurrency
+    # THEN a ValueError is raised
+    provider = parameters.SSMProvider(boto_config=config)
+    with pytest.raises(ValueError):
+        provider.get_multiple_by_paths(["/app"], max_concurrency=0)
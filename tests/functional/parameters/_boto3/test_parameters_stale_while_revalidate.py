@@ -0,0 +1,276 @@
+import threading
+from concurrent.futures import wait
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider, ExpirableValue
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_get_parameter_response(name: str, value: str) -> dict:
+    return {
+        "Parameter": {
+            "Name": name,
+            "Type": "String",
+            "Value": value,
+            "Version": 1,
+            "LastModifiedDate": datetime(2015, 1, 1),
+            "ARN": f"arn:aws:ssm:us-east-2:111122223333:parameter/{name.lstrip('/')}",
+        },
+    }
+
+
+def expire(provider: BaseProvider, key: tuple, seconds_ago: int = 1):
+    """Makes a cached value expire a few seconds ago"""
+    provider.store[key] = ExpirableValue(provider.store[key].value, datetime.now() - timedelta(seconds=seconds_ago))
+
+
+def wait_for_refreshes(provider: BaseProvider):
+    with provider._refresh_lock:
+        futures = list(provider._pending_refreshes.values())
+    wait(futures)
+
+
+def test_ssm_provider_get_serves_stale_value_while_refreshing(config):
+    # GIVEN a provider serving stale values for up to 60 seconds, and an expired cached value
+    provider = parameters.SSMProvider(boto_config=config, stale_while_revalidate=60)
+    key = provider._build_cache_key(name="/app/param")
+    provider.add_to_cache(key=key, value="stale", max_age=60)
+    expire(provider, key)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameter",
+        build_get_parameter_response("/app/param", "fresh"),
+        {"Name": "/app/param", "WithDecryption": False},
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting the parameter
+        value = provider.get("/app/param")
+        wait_for_refreshes(provider)
+
+        # THEN the stale value is returned at once, and refreshed in the background
+        assert value == "stale"
+        stubber.assert_no_pending_responses()
+        assert provider.get("/app/param") == "fresh"
+        assert provider.stats.as_dict() == {
+            "hits": 1,
+            "misses": 0,
+            "stale_serves": 1,
+            "refreshes": 1,
+            "refresh_errors": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_fetches_value_older_than_stale_window(config):
+    # GIVEN a provider serving stale values for up to 60 seconds, and a value expired 2 minutes ago
+    provider = parameters.SSMProvider(boto_config=config, stale_while_revalidate=60)
+    key = provider._build_cache_key(name="/app/param")
+    provider.add_to_cache(key=key, value="stale", max_age=60)
+    expire(provider, key, seconds_ago=120)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("get_parameter", build_get_parameter_response("/app/param", "fresh"))
+    stubber.activate()
+
+    try:
+        # WHEN getting the parameter
+        value = provider.get("/app/param")
+
+        # THEN it's fetched synchronously, as it's too old to be served
+        assert value == "fresh"
+        assert provider.stats.misses == 1
+        assert provider.stats.stale_serves == 0
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_keeps_stale_value_when_refresh_fails(config):
+    # GIVEN a provider serving stale values, and an expired cached value
+    provider = parameters.SSMProvider(boto_config=config, stale_while_revalidate=60)
+    key = provider._build_cache_key(name="/app/param")
+    provider.add_to_cache(key=key, value="stale", max_age=60)
+    expire(provider, key)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_client_error("get_parameter", service_error_code="ThrottlingException")
+    stubber.activate()
+
+    try:
+        # WHEN the background refresh fails
+        value = provider.get("/app/param")
+        wait_for_refreshes(provider)
+
+        # THEN the error isn't raised, and the stale value is kept to be served again
+        assert value == "stale"
+        assert provider.stats.refresh_errors == 1
+        assert provider.stats.refreshes == 0
+        assert provider.can_serve_stale(key)
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_force_fetch_ignores_stale_value(config):
+    # GIVEN a provider serving stale values, and an expired cached value
+    provider = parameters.SSMProvider(boto_config=config, stale_while_revalidate=60)
+    key = provider._build_cache_key(name="/app/param")
+    provider.add_to_cache(key=key, value="stale", max_age=60)
+    expire(provider, key)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("get_parameter", build_get_parameter_response("/app/param", "fresh"))
+    stubber.activate()
+
+    try:
+        # WHEN forcing a fetch
+        # THEN the fresh value is returned
+        assert provider.get("/app/param", force_fetch=True) == "fresh"
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_multiple_serves_stale_values_while_refreshing(config):
+    # GIVEN a provider serving stale values, and expired values cached for a path
+    provider = parameters.SSMProvider(boto_config=config, stale_while_revalidate=60)
+    key = provider._build_cache_key(name="/app", is_nested=True)
+    provider.add_to_cache(key=key, value={"param": "stale"}, max_age=60)
+    expire(provider, key)
+
+    stubber = stub.Stubber(provider.client)
+    response = {"Parameters": [build_get_parameter_response("/app/param", "fresh")["Parameter"]]}
+    stubber.add_response("get_parameters_by_path", response)
+    stubber.activate()
+
+    try:
+        # WHEN getting the parameters of the path
+        values = provider.get_multiple("/app")
+        wait_for_refreshes(provider)
+
+        # THEN the stale values are returned at once, and refreshed in the background
+        assert values == {"param": "stale"}
+        assert provider.get_multiple("/app") == {"param": "fresh"}
+    finally:
+        stubber.deactivate()
+
+
+def test_base_provider_refreshes_stale_value_once():
+    # GIVEN a provider with a slow refresh of an expired value
+    refreshing = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            calls.append(name)
+            refreshing.set()
+            release.wait(timeout=5)
+            return "fresh"
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider(stale_while_revalidate=60)
+    key = provider._build_cache_key(name="param")
+    provider.add_to_cache(key=key, value="stale", max_age=60)
+    expire(provider, key)
+
+    # WHEN getting the value several times while it's being refreshed
+    assert provider.get("param") == "stale"
+    refreshing.wait(timeout=5)
+    assert provider.get("param") == "stale"
+    assert provider.get("param") == "stale"
+    release.set()
+    wait_for_refreshes(provider)
+
+    # THEN it's refreshed only once
+    assert calls == ["param"]
+    assert provider.stats.stale_serves == 3
+    assert provider.get("param") == "fresh"
+
+
+def test_base_provider_max_age_jitter():
+    # GIVEN a provider shortening the expiry of values by up to half of their max_age
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            raise NotImplementedError()
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider(max_age_jitter=0.5)
+    start = datetime.now()
+
+    # WHEN caching values at the same time
+    for i in range(50):
+        provider.add_to_cache(key=(f"param-{i}", None, False), value="value", max_age=100)
+
+    # THEN they expire at different times, between half and all of their max_age
+    expiries = [cached.ttl for cached in provider.store.values()]
+    assert len(set(expiries)) > 1
+    assert all(start + timedelta(seconds=50) <= ttl <= datetime.now() + timedelta(seconds=100) for ttl in expiries)
+
+
+@pytest.mark.parametrize("options", [{"stale_while_revalidate": -1}, {"max_age_jitter": 1}, {"max_age_jitter": -0.1}])
+def test_provider_invalid_refresh_options(config, options):
+    # GIVEN/WHEN invalid options
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        parameters.SSMProvider(boto_config=config, **options)
+
+
+def test_ssm_provider_prefetch(config):
+    # GIVEN a provider
+    provider = parameters.SSMProvider(boto_config=config)
+    names = ["/app/a", "/app/b", "/app/c"]
+
+    stubber = stub.Stubber(provider.client)
+    for _ in names:
+        # parameters are fetched concurrently, in any order
+        stubber.add_response("get_parameter", build_get_parameter_response("/app/any", '{"enabled": true}'))
+    stubber.activate()
+
+    try:
+        # WHEN prefetching parameters, e.g. during the init phase
+        values = provider.prefetch(names, transform="json", decrypt=True)
+
+        # THEN they're all fetched, and served from cache afterwards
+        assert values == {name: {"enabled": True} for name in names}
+        stubber.assert_no_pending_responses()
+        assert provider.get("/app/a", transform="json", decrypt=True) == {"enabled": True}
+        assert provider.stats.misses == 3
+        assert provider.stats.hits == 1
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_prefetch_error(config):
+    # GIVEN a parameter that doesn't exist
+    provider = parameters.SSMProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_client_error("get_parameter", service_error_code="ParameterNotFound")
+    stubber.activate()
+
+    try:
+        # WHEN prefetching it
+        # THEN a GetParameterError is raised
+        with pytest.raises(parameters.GetParameterError):
+            provider.prefetch(["/app/missing"])
+    finally:
+        stubber.deactivate()
@@ -0,0 +1,244 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def build_secret_value(name: str, value: str) -> dict:
+    return {
+        "ARN": f"arn:aws:secretsmanager:us-east-1:132456789012:secret:{name}-AbCdEf",
+        "Name": name,
+        "VersionId": "7a9155b8-2dc9-466e-b4f6-5bc46516c84d",
+        "SecretString": value,
+        "VersionStages": ["AWSCURRENT"],
+        "CreatedDate": datetime(2015, 1, 1),
+    }
+
+
+def build_batch_get_secret_value_response(
+    names: List[str],
+    errors: Optional[List[str]] = None,
+    next_token: Optional[str] = None,
+) -> dict:
+    response = {
+        "SecretValues": [build_secret_value(name, json.dumps({"tenant": name})) for name in names],
+        "Errors": [
+            {"SecretId": name, "ErrorCode": "ResourceNotFoundException", "Message": "Secret not found"}
+            for name in errors or []
+        ],
+    }
+    if next_token:
+        response["NextToken"] = next_token
+    return response
+
+
+def test_secrets_provider_get_secrets_by_name_in_batches(config):
+    # GIVEN 25 tenant secrets, one of them already cached
+    provider = parameters.SecretsProvider(boto_config=config)
+    names = [f"tenants/{i}" for i in range(25)]
+    provider.add_to_cache(key=provider._build_cache_key(name=names[0]), value='{"tenant": "cached"}', max_age=60)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(names[1:21]),
+        {"SecretIdList": names[1:21]},
+    )
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(names[21:]),
+        {"SecretIdList": names[21:]},
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting them all as JSON
+        values = provider.get_secrets_by_name({name: {} for name in names}, transform="json")
+
+        # THEN secrets not cached are fetched by batches of 20, and transformed
+        stubber.assert_no_pending_responses()
+        assert values[names[0]] == {"tenant": "cached"}
+        assert all(values[name] == {"tenant": name} for name in names[1:])
+        assert provider.stats.hits == 1
+        assert provider.stats.misses == 24
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_secrets_by_name_caches_raw_values(config):
+    # GIVEN a provider
+    provider = parameters.SecretsProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("batch_get_secret_value", build_batch_get_secret_value_response(["a", "b"]))
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets by name, with a transform overridden for one of them
+        values = provider.get_secrets_by_name({"a": {}, "b": {"transform": "json"}})
+
+        # THEN each secret is cached as is, and transformed from cache when retrieved with a transform
+        assert values == {"a": '{"tenant": "a"}', "b": {"tenant": "b"}}
+        assert set(provider.store) == {("a", None, False), ("b", None, False)}
+        assert provider.get("a", transform="json") == {"tenant": "a"}
+        assert provider.get("b") == '{"tenant": "b"}'
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_secrets_by_name_follows_next_token(config):
+    # GIVEN results split across pages
+    provider = parameters.SecretsProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(["a"], next_token="token"),
+        {"SecretIdList": ["a", "b"]},
+    )
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(["b"]),
+        {"SecretIdList": ["a", "b"], "NextToken": "token"},
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets by name
+        values = provider.get_secrets_by_name({"a": {}, "b": {}})
+
+        # THEN every page is retrieved
+        stubber.assert_no_pending_responses()
+        assert list(values) == ["a", "b"]
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_secrets_by_name_raise_on_error(config):
+    # GIVEN a secret that doesn't exist
+    provider = parameters.SecretsProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("batch_get_secret_value", build_batch_get_secret_value_response(["a"], errors=["missing"]))
+    stubber.activate()
+
+    try:
+        # WHEN getting it along with another secret
+        # THEN a GetParameterError is raised
+        with pytest.raises(parameters.GetParameterError, match="missing"):
+            provider.get_secrets_by_name({"a": {}, "missing": {}})
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_secrets_by_name_graceful_errors(config):
+    # GIVEN a secret that doesn't exist, and a batch failing altogether
+    provider = parameters.SecretsProvider(boto_config=config)
+    names = [f"tenants/{i}" for i in range(22)]
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(names[1:20], errors=names[:1]),
+    )
+    stubber.add_client_error("batch_get_secret_value", service_error_code="ThrottlingException")
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets without failing fast
+        values = provider.get_secrets_by_name({name: {} for name in names}, raise_on_error=False)
+
+        # THEN secrets that failed are aggregated under "_errors"
+        stubber.assert_no_pending_responses()
+        assert values["_errors"] == [names[0], *names[20:]]
+        assert len(values) == 20
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_secrets_by_name_errors_key_reserved(config):
+    # GIVEN/WHEN a secret named "_errors" in graceful error mode
+    # THEN a GetParameterError is raised
+    provider = parameters.SecretsProvider(boto_config=config)
+    with pytest.raises(parameters.GetParameterError, match="_errors"):
+        provider.get_secrets_by_name({"_errors": {}}, raise_on_error=False)
+
+
+def test_secrets_provider_get_multiple_by_prefix(config):
+    # GIVEN tenant secrets with a tag
+    provider = parameters.SecretsProvider(boto_config=config)
+    tag_filter = {"Key": "tag-key", "Values": ["tenant"]}
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(["tenants/a"], next_token="token"),
+        {"Filters": [{"Key": "name", "Values": ["tenants/"]}, tag_filter]},
+    )
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(["tenants/b"]),
+        {"Filters": [{"Key": "name", "Values": ["tenants/"]}, tag_filter], "NextToken": "token"},
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets by name prefix and tag, as JSON
+        values = provider.get_multiple("tenants/", transform="json", Filters=[tag_filter])
+
+        # THEN every page is retrieved, and each secret is also cached on its own
+        stubber.assert_no_pending_responses()
+        assert values == {"tenants/a": {"tenant": "tenants/a"}, "tenants/b": {"tenant": "tenants/b"}}
+        assert provider.get("tenants/b", transform="json") == {"tenant": "tenants/b"}
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_multiple_errors(config):
+    # GIVEN a secret matching the prefix that can't be retrieved
+    provider = parameters.SecretsProvider(boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "batch_get_secret_value",
+        build_batch_get_secret_value_response(["tenants/a"], errors=["tenants/b"]),
+    )
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets by prefix
+        # THEN a GetParameterError is raised
+        with pytest.raises(parameters.GetParameterError, match="tenants/b"):
+            provider.get_multiple("tenants/")
+    finally:
+        stubber.deactivate()
+
+
+def test_get_secrets_by_name_default_provider(monkeypatch, config):
+    # GIVEN the default provider
+    provider = parameters.SecretsProvider(boto_config=config)
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "secrets", provider)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("batch_get_secret_value", build_batch_get_secret_value_response(["a"]))
+    stubber.activate()
+
+    try:
+        # WHEN getting secrets with the high-level function
+        values = parameters.get_secrets_by_name({"a": {}}, transform="json")
+
+        # THEN they're retrieved with the default provider
+        assert values == {"a": {"tenant": "a"}}
+    finally:
+        stubber.deactivate()
@@ -0,0 +1,158 @@
+import bz2
+import io
+import lzma
+
+import pytest
+from botocore.response import StreamingBody
+
+from aws_lambda_powertools.utilities.streaming import S3Object, S3ObjectWriter
+from aws_lambda_powertools.utilities.streaming.transformations import (
+    Bz2Transform,
+    CsvTransform,
+    GzipTransform,
+    LzmaTransform,
+    ZstdTransform,
+    get_decompression_transform,
+)
+
+CSV_PAYLOAD = b"id,name\n" + b"".join(f"{i},name-{i}\n".encode() for i in range(5000))
+
+
+def zstd_compress(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    # two frames, as written by tools appending to or parallelizing compression
+    middle = len(data) // 2
+    return zstandard.ZstdCompressor().compress(data[:middle]) + zstandard.ZstdCompressor().compress(data[middle:])
+
+
+class FakeS3Client:
+    """Serves an in-memory object, recording HEAD requests"""
+
+    def __init__(self, payload: bytes, **metadata):
+        self.payload = payload
+        self.metadata = metadata
+        self.head_requests = 0
+
+    def head_object(self, **kwargs):
+        self.head_requests += 1
+        return {"ContentLength": len(self.payload), **self.metadata}
+
+    def get_object(self, Range: str, **kwargs):
+        start = int(Range[len("bytes=") :].split("-")[0])
+        body = self.payload[start:]
+        return {"Body": StreamingBody(io.BytesIO(body), len(body))}
+
+
+COMPRESSIONS = [
+    pytest.param(Bz2Transform, bz2.compress, id="bz2"),
+    pytest.param(LzmaTransform, lzma.compress, id="xz"),
+    pytest.param(ZstdTransform, zstd_compress, id="zstd"),
+]
+
+
+@pytest.mark.parametrize("transform, compress", COMPRESSIONS)
+def test_decompression_transform_composes_with_csv(transform, compress):
+    # GIVEN a compressed CSV object
+    s3_object = S3Object(bucket="bucket", key="key", boto3_client=FakeS3Client(compress(CSV_PAYLOAD)))
+
+    # WHEN decompressing and deserializing it
+    rows = list(s3_object.transform([transform(), CsvTransform()]))
+
+    # THEN every row is read
+    assert len(rows) == 5000
+    assert rows[-1] == {"id": "4999", "name": "name-4999"}
+
+
+@pytest.mark.parametrize("transform, compress", COMPRESSIONS)
+def test_decompression_transform_reads_lines(transform, compress):
+    # GIVEN a compressed object
+    stream = io.BytesIO(compress(CSV_PAYLOAD))
+
+    # WHEN iterating over its lines
+    reader = transform().transform(stream)
+
+    # THEN lines are decompressed as they're read
+    assert reader.readline() == b"id,name\n"
+    assert b"".join(reader) == CSV_PAYLOAD[len(b"id,name\n") :]
+
+
+@pytest.mark.parametrize("transform, compress", COMPRESSIONS)
+def test_compression_transform_on_write_only_stream(transform, compress):
+    # GIVEN a write-only stream
+    client = FakeS3Client(b"")
+    client.put_object = lambda Body, **kwargs: setattr(client, "payload", bytes(Body))
+    compress(b"")  # skips when the compression library is missing
+    writer = S3ObjectWriter(bucket="bucket", key="key", boto3_client=client)
+
+    # WHEN writing through the transformation
+    compressed_writer = transform().transform(writer.raw_stream)
+    compressed_writer.write(CSV_PAYLOAD)
+    compressed_writer.close()
+    writer.close()
+
+    # THEN data is compressed
+    assert transform().transform(io.BytesIO(client.payload)).read() == CSV_PAYLOAD
+
+
+@pytest.mark.parametrize(
+    "key, metadata, expected",
+    [
+        ("data.csv.gz", {}, GzipTransform),
+        ("data.csv.BZ2", {}, Bz2Transform),
+        ("data.xz", {}, LzmaTransform),
+        ("data.lzma", {}, LzmaTransform),
+        ("data.zst", {}, ZstdTransform),
+        ("data", {"content_encoding": "zstd"}, ZstdTransform),
+        ("data", {"content_type": "application/x-bzip2"}, Bz2Transform),
+        ("data", {"content_type": "application/gzip; charset=binary"}, GzipTransform),
+        ("data.json", {"content_type": "application/json"}, type(None)),
+        ("data", {}, type(None)),
+    ],
+)
+def test_get_decompression_transform(key, metadata, expected):
+    # GIVEN/WHEN detecting the compression of an object
+    # THEN the matching transformation is returned
+    assert type(get_decompression_transform(key, **metadata)) is expected
+
+
+def test_s3_object_auto_decompress_from_extension():
+    # GIVEN a bzip2 object
+    client = FakeS3Client(bz2.compress(CSV_PAYLOAD))
+
+    # WHEN reading it with auto decompression
+    s3_object = S3Object(bucket="bucket", key="data.csv.bz2", boto3_client=client, auto_decompress=True, is_csv=True)
+    rows = list(s3_object)
+
+    # THEN it's decompressed before being deserialized, without a HEAD request
+    assert len(rows) == 5000
+    assert client.head_requests == 0
+
+
+def test_s3_object_auto_decompress_from_content_type():
+    # GIVEN a xz object without extension
+    client = FakeS3Client(lzma.compress(CSV_PAYLOAD), ContentType="application/x-xz")
+
+    # WHEN reading it with auto decompression
+    s3_object = S3Object(bucket="bucket", key="data", boto3_client=client, auto_decompress=True)
+
+    # THEN it's decompressed based on its Content-Type
+    assert s3_object.read() == CSV_PAYLOAD
+    assert client.head_requests == 1
+
+
+def test_s3_object_auto_decompress_uncompressed_object():
+    # GIVEN an uncompressed object
+    client = FakeS3Client(CSV_PAYLOAD, ContentType="text/csv")
+
+    # WHEN reading it with auto decompression
+    s3_object = S3Object(bucket="bucket", key="data.csv", boto3_client=client, auto_decompress=True)
+
+    # THEN it's read as is
+    assert s3_object.read() == CSV_PAYLOAD
+
+
+def test_s3_object_auto_decompress_with_is_gzip():
+    # GIVEN/WHEN both auto decompression and gzip decompression
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        S3Object(bucket="bucket", key="data.gz", is_gzip=True, auto_decompress=True)
@@ -0,0 +1,110 @@
+import gzip
+import io
+import json
+import random
+from decimal import Decimal
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming.transformations import GzipTransform, NdjsonTransform
+from aws_lambda_powertools.utilities.streaming.transformations.ndjson import NdjsonReader
+
+
+def ndjson(records: list) -> bytes:
+    return b"".join(json.dumps(record).encode() + b"\n" for record in records)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 256 * 1024])
+def test_ndjson_transform_yields_records(chunk_size):
+    # GIVEN records with unicode content, whose lines span chunks
+    records = [{"id": i, "message": f"héllo {'ü' * (i % 13)}", "tags": ["a"] * (i % 3)} for i in range(200)]
+
+    # WHEN reading the stream
+    reader = NdjsonTransform(chunk_size=chunk_size).transform(io.BytesIO(ndjson(records)))
+
+    # THEN every record is yielded in order
+    assert list(reader) == records
+
+
+def test_ndjson_transform_skips_blank_lines():
+    # GIVEN a stream with blank lines, CRLF line endings, and no trailing newline
+    data = b'{"id": 1}\r\n\n   \n{"id": 2}\n\n{"id": 3}'
+
+    # WHEN reading it
+    reader = NdjsonTransform(chunk_size=4).transform(io.BytesIO(data))
+
+    # THEN only records are yielded
+    assert list(reader) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ndjson_transform_batches(seed):
+    # GIVEN a random number of records, read in random chunks
+    rng = random.Random(seed)
+    records = [{"id": i} for i in range(rng.randint(0, 300))]
+    batch_size = rng.randint(1, 50)
+
+    # WHEN reading them in batches
+    reader = NdjsonTransform(batch_size=batch_size, chunk_size=rng.randint(1, 512)).transform(
+        io.BytesIO(ndjson(records)),
+    )
+    batches = list(reader)
+
+    # THEN every batch is full except the last one, and records are yielded in order
+    assert all(len(batch) == batch_size for batch in batches[:-1])
+    assert all(0 < len(batch) <= batch_size for batch in batches[-1:])
+    assert [record for batch in batches for record in batch] == records
+
+
+def test_ndjson_transform_custom_deserializer():
+    # GIVEN a deserializer parsing floats as Decimal
+    def deserializer(line: bytes):
+        return json.loads(line, parse_float=Decimal)
+
+    # WHEN reading records
+    reader = NdjsonTransform(deserializer=deserializer).transform(io.BytesIO(b'{"price": 1.1}\n'))
+
+    # THEN each line is deserialized with it
+    assert list(reader) == [{"price": Decimal("1.1")}]
+
+
+def test_ndjson_transform_composes_with_gzip():
+    # GIVEN a gzip compressed NDJSON stream
+    records = [{"id": i} for i in range(1000)]
+    stream = io.BytesIO(gzip.compress(ndjson(records)))
+
+    # WHEN decompressing and deserializing it
+    reader = NdjsonTransform().transform(GzipTransform().transform(stream))
+
+    # THEN records are yielded
+    assert list(reader) == records
+
+
+def test_ndjson_transform_reads_incrementally():
+    # GIVEN a large stream
+    stream = io.BytesIO(ndjson([{"id": i} for i in range(100_000)]))
+
+    # WHEN reading the first record
+    reader = NdjsonTransform(chunk_size=1024).transform(stream)
+
+    # THEN only the first chunk was read
+    assert next(reader) == {"id": 0}
+    assert stream.tell() == 1024
+
+
+def test_ndjson_transform_invalid_line():
+    # GIVEN a stream with an invalid line
+    reader = NdjsonTransform().transform(io.BytesIO(b'{"id": 1}\nnot json\n'))
+
+    # WHEN reading it
+    # THEN the deserializer error is raised
+    with pytest.raises(json.JSONDecodeError):
+        list(reader)
+
+
+@pytest.mark.parametrize("options", [{"batch_size": 0}, {"chunk_size": 0}])
+def test_ndjson_reader_invalid_options(options):
+    # GIVEN/WHEN invalid options
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        NdjsonReader(io.BytesIO(), **options)
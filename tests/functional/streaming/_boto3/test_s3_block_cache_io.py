@@ -0,0 +1,196 @@
+import gzip
+import io
+import threading
+import zipfile
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming import BlockCacheConfig, S3Object
+from aws_lambda_powertools.utilities.streaming._s3_block_cache_io import _S3BlockCacheIO
+from aws_lambda_powertools.utilities.streaming.transformations import GzipTransform, ZipTransform
+
+
+class FakeS3Client:
+    """Serves byte ranges of an in-memory object, recording ranges requested from any thread"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.ranges: list = []
+        self._lock = threading.Lock()
+
+    def head_object(self, **kwargs):
+        return {"ContentLength": len(self.payload)}
+
+    def get_object(self, Range: str, **kwargs):
+        start, end = (int(position) for position in Range[len("bytes=") :].split("-"))
+        with self._lock:
+            self.ranges.append((start, end))
+        return {"Body": io.BytesIO(self.payload[start : end + 1])}
+
+
+PAYLOAD = bytes(range(256)) * 40  # 10240 bytes
+
+
+def build_stream(payload: bytes = PAYLOAD, **config) -> _S3BlockCacheIO:
+    options = {"block_size": 1024, "max_cache_size": 4096, "read_ahead_blocks": 0, "max_workers": 2, **config}
+    return _S3BlockCacheIO(
+        bucket="bucket",
+        key="key",
+        block_cache=BlockCacheConfig(**options),
+        boto3_client=FakeS3Client(payload),
+    )
+
+
+def test_block_cache_reads_aligned_blocks():
+    # GIVEN a stream reading blocks of 1KiB
+    s3_stream = build_stream()
+
+    # WHEN reading across block boundaries
+    s3_stream.seek(1000)
+    data = s3_stream.read(100)
+
+    # THEN the data is read from the two aligned blocks containing it
+    assert data == PAYLOAD[1000:1100]
+    assert s3_stream.tell() == 1100
+    assert s3_stream.s3_client.ranges == [(0, 1023), (1024, 2047)]
+
+
+def test_block_cache_serves_repeated_seeks_from_memory():
+    # GIVEN a stream where the last block was read
+    s3_stream = build_stream()
+    s3_stream.seek(-100, io.SEEK_END)
+    s3_stream.read()
+
+    # WHEN seeking back and forth to the same blocks, as zipfile does with the central directory
+    for _ in range(10):
+        s3_stream.seek(-50, io.SEEK_END)
+        assert s3_stream.read(10) == PAYLOAD[-50:-40]
+        s3_stream.seek(0)
+        assert s3_stream.read(10) == PAYLOAD[:10]
+
+    # THEN each block is fetched once
+    assert s3_stream.s3_client.ranges == [(9216, 10239), (0, 1023)]
+
+
+def test_block_cache_evicts_least_recently_used_blocks():
+    # GIVEN a cache holding up to 4 blocks
+    s3_stream = build_stream(max_cache_size=4096)
+
+    # WHEN reading the whole object, then the first and last blocks again
+    assert s3_stream.read() == PAYLOAD
+    s3_stream.seek(0)
+    s3_stream.read(1)
+    s3_stream.seek(-1, io.SEEK_END)
+    s3_stream.read(1)
+
+    # THEN the first block was evicted and fetched again, while the last block was still cached
+    assert len(s3_stream.s3_client.ranges) == 11
+    assert s3_stream.s3_client.ranges[-1] == (0, 1023)
+    assert len(s3_stream._blocks) <= 4
+
+
+def test_block_cache_reads_ahead_when_reading_sequentially():
+    # GIVEN a stream reading 2 blocks ahead
+    s3_stream = build_stream(read_ahead_blocks=2)
+
+    # WHEN reading the first block
+    s3_stream.read(10)
+
+    # THEN the next two blocks are fetched ahead, and served without new requests
+    for future in s3_stream._pending_blocks.values():
+        future.result()
+    assert sorted(s3_stream.s3_client.ranges) == [(0, 1023), (1024, 2047), (2048, 3071)]
+    assert s3_stream.read(2048) == PAYLOAD[10:2058]
+    for future in s3_stream._pending_blocks.values():
+        future.result()
+    assert (3072, 4095) in s3_stream.s3_client.ranges
+
+
+def test_block_cache_reads_whole_object_with_read_ahead():
+    # GIVEN a stream reading ahead as many blocks as the cache can hold
+    s3_stream = build_stream(read_ahead_blocks=8, max_cache_size=2048)
+
+    # WHEN reading the whole object
+    data = s3_stream.read()
+
+    # THEN every block is fetched once, and memory stays bounded to the cache size
+    assert data == PAYLOAD
+    assert sorted(s3_stream.s3_client.ranges) == [(start, start + 1023) for start in range(0, len(PAYLOAD), 1024)]
+    assert len(s3_stream._blocks) + len(s3_stream._pending_blocks) <= 2
+
+
+def test_block_cache_readline_and_iteration():
+    # GIVEN an object with lines spanning blocks
+    payload = b"".join(f"line {i} {'x' * (i * 37 % 1500)}\n".encode() for i in range(20))
+    s3_stream = build_stream(payload=payload, read_ahead_blocks=2)
+
+    # WHEN reading lines, then iterating over the rest
+    first_line = s3_stream.readline()
+    limited = s3_stream.readline(3)
+    lines = s3_stream.readlines()
+
+    # THEN lines are split the same way as a local file
+    expected = io.BytesIO(payload)
+    assert first_line == expected.readline()
+    assert limited == expected.readline(3)
+    assert lines == expected.readlines()
+    s3_stream.seek(0)
+    assert b"".join(s3_stream) == payload
+
+
+def test_s3_object_with_block_cache_reads_zip_files():
+    # GIVEN a zip file with a few members
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, mode="w") as zip_file:
+        for i in range(5):
+            zip_file.writestr(f"file-{i}.txt", f"content {i}\n" * 200)
+    client = FakeS3Client(payload.getvalue())
+
+    # WHEN reading every member through a block cache large enough for the whole file
+    s3_object = S3Object(
+        bucket="bucket",
+        key="key",
+        boto3_client=client,
+        block_cache=BlockCacheConfig(block_size=1024, max_cache_size=64 * 1024),
+    )
+    zip_reader = s3_object.transform(ZipTransform())
+    contents = [zip_reader.read(name) for name in zip_reader.namelist()]
+
+    # THEN members are read, fetching each block once however many times zipfile seeks
+    assert contents == [f"content {i}\n".encode() * 200 for i in range(5)]
+    assert len(client.ranges) == len(set(client.ranges))
+
+
+def test_s3_object_with_block_cache_composes_with_transforms():
+    # GIVEN a gzip object
+    payload = b"hello world\n" * 1000
+    client = FakeS3Client(gzip.compress(payload))
+
+    # WHEN decompressing it through a block cache
+    s3_object = S3Object(bucket="bucket", key="key", boto3_client=client, block_cache=BlockCacheConfig(block_size=256))
+    data = s3_object.transform(GzipTransform()).read()
+
+    # THEN the object is read as usual
+    assert data == payload
+
+
+def test_block_cache_empty_object():
+    # GIVEN an empty object
+    s3_stream = build_stream(payload=b"")
+
+    # WHEN reading it
+    # THEN nothing is fetched
+    assert s3_stream.read() == b""
+    assert s3_stream.readline() == b""
+    assert s3_stream.s3_client.ranges == []
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"block_size": 0}, {"block_size": 2048, "max_cache_size": 1024}, {"read_ahead_blocks": -1}, {"max_workers": 0}],
+)
+def test_block_cache_config_invalid_options(options):
+    # GIVEN/WHEN invalid block cache options
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        BlockCacheConfig(**options)
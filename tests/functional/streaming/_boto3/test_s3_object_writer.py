@@ -0,0 +1,184 @@
+import gzip
+import threading
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming import S3ObjectWriter
+from aws_lambda_powertools.utilities.streaming._s3_multipart_upload_io import MIN_PART_SIZE
+
+PART_SIZE = MIN_PART_SIZE
+
+
+class FakeS3Client:
+    """Records uploads made from any thread, optionally failing one of the parts"""
+
+    def __init__(self, upload_delay: float = 0, failing_part: int = 0):
+        self.upload_delay = upload_delay
+        self.failing_part = failing_part
+        self.calls: list = []
+        self.parts: dict = {}
+        self.objects: dict = {}
+        self.running_uploads = 0
+        self.max_running_uploads = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Body, **kwargs):
+        self.calls.append(("put_object", kwargs))
+        self.objects[kwargs["Key"]] = bytes(Body)
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create_multipart_upload", kwargs))
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, PartNumber, Body, **kwargs):
+        with self._lock:
+            self.calls.append(("upload_part", kwargs))
+            self.running_uploads += 1
+            self.max_running_uploads = max(self.max_running_uploads, self.running_uploads)
+        time.sleep(self.upload_delay)
+        with self._lock:
+            self.running_uploads -= 1
+        if PartNumber == self.failing_part:
+            raise ConnectionError("Failed to upload part.")
+        self.parts[PartNumber] = bytes(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.calls.append(("complete_multipart_upload", kwargs))
+        assert [part["ETag"] for part in MultipartUpload["Parts"]] == [f"etag-{n}" for n in sorted(self.parts)]
+        self.objects[kwargs["Key"]] = b"".join(self.parts[n] for n in sorted(self.parts))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort_multipart_upload", kwargs))
+
+    def operations(self) -> list:
+        return [operation for operation, _ in self.calls]
+
+
+def test_s3_object_writer_small_object_uses_put_object():
+    # GIVEN a writer
+    client = FakeS3Client()
+
+    # WHEN writing less than a part
+    with S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, ContentType="text/plain") as writer:
+        writer.write(b"hello ")
+        writer.writelines([b"world", b"\n"])
+
+    # THEN the object is uploaded with a single request
+    assert client.objects == {"key": b"hello world\n"}
+    assert client.calls == [("put_object", {"Bucket": "bucket", "Key": "key", "ContentType": "text/plain"})]
+    assert writer.closed
+
+
+def test_s3_object_writer_uploads_parts():
+    # GIVEN an object spanning a few parts, written in chunks not aligned to parts
+    payload = bytes(range(256)) * (PART_SIZE * 5 // 2 // 256)
+    client = FakeS3Client()
+
+    # WHEN writing it
+    with S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, part_size=PART_SIZE) as writer:
+        for start in range(0, len(payload), 1_000_000):
+            writer.write(payload[start : start + 1_000_000])
+
+    # THEN full parts are uploaded, followed by the remaining data, and the upload is completed
+    assert client.objects["key"] == payload
+    assert [len(part) for _, part in sorted(client.parts.items())] == [
+        PART_SIZE,
+        PART_SIZE,
+        len(payload) - 2 * PART_SIZE,
+    ]
+    assert client.operations() == ["create_multipart_upload"] + ["upload_part"] * 3 + ["complete_multipart_upload"]
+    assert writer.tell() == len(payload)
+
+
+def test_s3_object_writer_bounds_concurrent_uploads():
+    # GIVEN slow part uploads, with at most 2 uploads at a time
+    client = FakeS3Client(upload_delay=0.02)
+    part = b"x" * PART_SIZE
+
+    # WHEN writing many parts
+    with S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, part_size=PART_SIZE, max_concurrency=2) as w:
+        for _ in range(8):
+            w.write(part)
+            # THEN parts held in memory never exceed the parts being uploaded, plus the one being buffered
+            assert len(w.raw_stream._pending_parts) <= 2
+
+    # THEN parts are uploaded concurrently, within the limit
+    assert client.max_running_uploads == 2
+    assert len(client.parts) == 8
+
+
+def test_s3_object_writer_gzip():
+    # GIVEN a gzip writer
+    client = FakeS3Client()
+    payload = b"".join(f"line {i}\n".encode() for i in range(100_000))
+
+    # WHEN writing lines
+    with S3ObjectWriter(bucket="bucket", key="key.gz", boto3_client=client, is_gzip=True) as writer:
+        for line in payload.splitlines(keepends=True):
+            writer.write(line)
+
+    # THEN the uploaded object is compressed
+    assert gzip.decompress(client.objects["key.gz"]) == payload
+
+
+def test_s3_object_writer_aborts_when_part_upload_fails():
+    # GIVEN a part failing to upload
+    client = FakeS3Client(failing_part=2)
+    writer = S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, part_size=PART_SIZE, max_concurrency=1)
+
+    # WHEN writing the object
+    # THEN the upload error is raised, and the multipart upload is aborted
+    with pytest.raises(ConnectionError):
+        for _ in range(4):
+            writer.write(b"x" * PART_SIZE)
+        writer.close()
+
+    assert client.operations()[-1] == "abort_multipart_upload"
+    assert "complete_multipart_upload" not in client.operations()
+    assert writer.closed
+
+
+@pytest.mark.parametrize("size", [10, PART_SIZE * 2])
+def test_s3_object_writer_aborts_on_exception(size):
+    # GIVEN a writer used as a context manager
+    client = FakeS3Client()
+
+    # WHEN an exception is raised while writing
+    with pytest.raises(RuntimeError):
+        with S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, part_size=PART_SIZE, is_gzip=True) as w:
+            w.write(b"x" * size)
+            raise RuntimeError("Failed to transform data.")
+
+    # THEN no object is created, and any multipart upload is aborted
+    assert client.objects == {}
+    assert "complete_multipart_upload" not in client.operations()
+    assert "put_object" not in client.operations()
+    if client.parts:
+        assert client.operations()[-1] == "abort_multipart_upload"
+
+
+def test_s3_object_writer_forwards_sdk_options_to_parts():
+    # GIVEN a writer using a customer provided encryption key
+    client = FakeS3Client()
+    sdk_options = {"SSECustomerAlgorithm": "AES256", "SSECustomerKey": "key", "ContentType": "text/plain"}
+
+    # WHEN uploading a multipart object
+    with S3ObjectWriter(bucket="bucket", key="key", boto3_client=client, part_size=PART_SIZE, **sdk_options) as w:
+        w.write(b"x" * (PART_SIZE + 1))
+
+    # THEN every request has the encryption key, but only the upload is created with the object options
+    create_options, part_options, _, complete_options = (options for _, options in client.calls)
+    assert create_options["ContentType"] == "text/plain"
+    for options in (part_options, complete_options):
+        assert options["SSECustomerKey"] == "key"
+        assert "ContentType" not in options
+
+
+@pytest.mark.parametrize("options", [{"part_size": MIN_PART_SIZE - 1}, {"max_concurrency": 0}])
+def test_s3_object_writer_invalid_options(options):
+    # GIVEN/WHEN invalid multipart upload options
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError):
+        S3ObjectWriter(bucket="bucket", key="key", **options)
@@ -1,5 +1,6 @@
 import re
 
+import fastjsonschema
 import jmespath
 import pytest
 from jmespath import functions
@@ -7,9 +8,20 @@ from jmespath import functions
 from aws_lambda_powertools.utilities.validation import (
     envelopes,
     exceptions,
+    precompile_schema,
     validate,
     validator,
 )
+from aws_lambda_powertools.utilities.validation.base import CACHE_COMPILED_VALIDATOR, PRECOMPILED_VALIDATOR
+
+
+@pytest.fixture
+def clear_validator_cache():
+    CACHE_COMPILED_VALIDATOR.clear()
+    PRECOMPILED_VALIDATOR.clear()
+    yield
+    CACHE_COMPILED_VALIDATOR.clear()
+    PRECOMPILED_VALIDATOR.clear()
 
 
 def test_validate_raw_event(schema, raw_event):
@@ -194,3 +206,108 @@ def test_validate_date_time_format(schema_datetime_format):
     invalid_datetime = {"message": "2021-06-29T14"}
     with pytest.raises(exceptions.SchemaValidationError, match="data.message must be date-time"):
         validate(event=invalid_datetime, schema=schema_datetime_format)
+
+
+def test_validate_compiles_schema_once(mocker, clear_validator_cache, schema, raw_event):
+    # GIVEN a spy on the schema compilation
+    compile_spy = mocker.spy(fastjsonschema, "compile")
+
+    # WHEN validating multiple events against the same schema
+    for _ in range(3):
+        validate(event=raw_event, schema=schema)
+
+    # THEN the schema is compiled only once
+    assert compile_spy.call_count == 1
+
+
+def test_validate_compiles_schema_again_when_content_changes(mocker, clear_validator_cache, schema, raw_event):
+    # GIVEN a schema already validated once
+    compile_spy = mocker.spy(fastjsonschema, "compile")
+    validate(event=raw_event, schema=schema)
+
+    # WHEN the schema is mutated in place
+    schema["required"].append("missing_field")
+
+    # THEN it is compiled again and the updated schema is enforced
+    with pytest.raises(exceptions.SchemaValidationError, match="missing_field"):
+        validate(event=raw_event, schema=schema)
+    assert compile_spy.call_count == 2
+
+
+def test_validate_caches_schema_per_formats(mocker, clear_validator_cache, schema_datetime_format):
+    # GIVEN a spy on the schema compilation
+    compile_spy = mocker.spy(fastjsonschema, "compile")
+    raw_event = {"message": "2021-06-29T14:46:06.804Z"}
+
+    # WHEN validating the same schema with and without custom formats
+    validate(event=raw_event, schema=schema_datetime_format)
+    with pytest.raises(exceptions.SchemaValidationError):
+        validate(event=raw_event, schema=schema_datetime_format, formats={"date-time": r"^never$"})
+
+    # THEN a validator is compiled for each combination
+    assert compile_spy.call_count == 2
+
+
+def test_validator_decorator_compiles_schemas_once(
+    mocker,
+    clear_validator_cache,
+    schema,
+    schema_response,
+    raw_event,
+    raw_response,
+):
+    # GIVEN a spy on the schema compilation and a handler validating inbound and outbound data
+    compile_spy = mocker.spy(fastjsonschema, "compile")
+
+    @validator(inbound_schema=schema, outbound_schema=schema_response)
+    def lambda_handler(evt, context):
+        return raw_response
+
+    # WHEN the handler is invoked multiple times
+    for _ in range(3):
+        lambda_handler(raw_event, {})
+
+    # THEN each schema is compiled only once
+    assert compile_spy.call_count == 2
+
+
+def test_precompile_schema(mocker, clear_validator_cache, schema, raw_event):
+    # GIVEN a schema precompiled ahead of time
+    precompile_schema(schema=schema)
+    compile_spy = mocker.spy(fastjsonschema, "compile")
+
+    # WHEN validating an event
+    validate(event=raw_event, schema=schema)
+
+    # THEN the precompiled validator is used, even if the cache is cleared
+    CACHE_COMPILED_VALIDATOR.clear()
+    validate(event=raw_event, schema=schema)
+    assert compile_spy.call_count == 0
+
+
+def test_precompile_schema_with_generated_code(clear_validator_cache, schema):
+    # GIVEN a validation function generated at build time
+    generated_code = fastjsonschema.compile_to_code(schema)
+    generated_module: dict = {}
+    exec(generated_code, generated_module)  # noqa: S102 # simulates importing a generated module
+
+    validate_function = next(
+        value for name, value in generated_module.items() if name.startswith("validate") and callable(value)
+    )
+
+    # WHEN registering it
+    precompile_schema(schema=schema, validate_function=validate_function)
+
+    # THEN it is used to validate data against the schema
+    with pytest.raises(exceptions.SchemaValidationError, match="data must contain"):
+        validate(event={"message": "hello"}, schema=schema)
+
+
+def test_precompile_invalid_schema(clear_validator_cache):
+    # GIVEN an invalid schema
+    schema = {"type": "invalid_type"}
+
+    # WHEN precompiling it
+    # THEN an InvalidSchemaFormatError is raised
+    with pytest.raises(exceptions.InvalidSchemaFormatError):
+        precompile_schema(schema=schema)
@@ -1,9 +1,11 @@
 import importlib
+import time
 from types import ModuleType
 
 import pytest
 
 from aws_lambda_powertools.utilities.data_masking.base import DataMasking
+from aws_lambda_powertools.utilities.data_masking.plan import CACHE_MASKING_PLAN
 
 DATA_MASKING_PACKAGE = "aws_lambda_powertools.utilities.data_masking"
 DATA_MASKING_INIT_SLA: float = 0.002
@@ -67,3 +69,56 @@ def test_data_masking_encrypt_with_json_blob(benchmark):
     stat = benchmark.stats.stats.max
     if stat > DATA_MASKING_NESTED_ENCRYPT_SLA:
         pytest.fail(f"High level imports should be below {DATA_MASKING_NESTED_ENCRYPT_SLA}s: {stat}")
+
+
+# parsing field expressions is expensive; the uncached baseline uses a smaller batch and is compared per record
+DATA_MASKING_BATCH_SIZE: int = 1_000
+DATA_MASKING_UNCACHED_BATCH_SIZE: int = 10
+DATA_MASKING_COMPILED_PLAN_SPEEDUP: float = 10.0
+batch_fields = ["email", "address.street", "address.zip", "job_history.company.company_address"]
+
+
+def erase_batch(fields, batch_size: int = DATA_MASKING_BATCH_SIZE):
+    data_masker = DataMasking()
+    for _ in range(batch_size):
+        data_masker.erase(json_blob, fields)
+
+
+def erase_batch_without_plan_cache(batch_size: int = DATA_MASKING_UNCACHED_BATCH_SIZE):
+    data_masker = DataMasking()
+    for _ in range(batch_size):
+        # simulates parsing field expressions on every call
+        CACHE_MASKING_PLAN.clear()
+        data_masker.erase(json_blob, batch_fields)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="data_masking_batch", disable_gc=True, warmup=False)
+def test_data_masking_erase_batch_without_plan_cache(benchmark):
+    benchmark.pedantic(erase_batch_without_plan_cache)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="data_masking_batch", disable_gc=True, warmup=False)
+def test_data_masking_erase_batch_with_compiled_plan(benchmark):
+    plan = DataMasking().compile(fields=batch_fields)
+    benchmark.pedantic(erase_batch, args=(plan,))
+
+
+@pytest.mark.perf
+def test_data_masking_compiled_plan_speedup():
+    # GIVEN records erased with and without a compiled masking plan
+    plan = DataMasking().compile(fields=batch_fields)
+
+    start = time.perf_counter()
+    erase_batch_without_plan_cache()
+    uncached_per_record = (time.perf_counter() - start) / DATA_MASKING_UNCACHED_BATCH_SIZE
+
+    start = time.perf_counter()
+    erase_batch(plan)
+    compiled_per_record = (time.perf_counter() - start) / DATA_MASKING_BATCH_SIZE
+
+    # THEN the compiled plan should be significantly faster per record
+    speedup = uncached_per_record / compiled_per_record
+    if speedup < DATA_MASKING_COMPILED_PLAN_SPEEDUP:
+        pytest.fail(f"Compiled masking plan should be {DATA_MASKING_COMPILED_PLAN_SPEEDUP}x faster: {speedup:.2f}x")
@@ -0,0 +1,92 @@
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
+from tests.functional.utils import load_event
+
+ROUTE_COUNTS = [10, 100, 500, 2000]
+LOOKUP_ITERATIONS = 1_000
+
+# compiled lookup cost must remain (roughly) flat as routes grow; adjusted for noisy CI machines
+COMPILED_ROUTING_GROWTH_SLA: float = 3.0
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_app(route_count: int, enable_compiled_routing: bool) -> APIGatewayRestResolver:
+    app = APIGatewayRestResolver(enable_compiled_routing=enable_compiled_routing)
+
+    def handler(**kwargs):
+        return Response(status_code=200, body="ok")
+
+    # half static and half dynamic routes, resembling a monolithic API
+    for i in range(route_count // 2):
+        app.get(f"/service_{i}/items")(handler)
+        app.get(f"/service_{i}/items/<item_id>")(handler)
+
+    return app
+
+
+def build_event(path: str) -> dict:
+    event = deepcopy(load_event("apiGatewayProxyEvent.json"))
+    event["path"] = path
+    event["httpMethod"] = "GET"
+    event["requestContext"]["stage"] = "$default"
+    return event
+
+
+def lookup_elapsed(app: APIGatewayRestResolver, event: dict) -> float:
+    with timing() as t:
+        for _ in range(LOOKUP_ITERATIONS):
+            app(event, {})
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="event_handler", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("route_count", ROUTE_COUNTS)
+@pytest.mark.parametrize("enable_compiled_routing", [False, True], ids=["sequential", "compiled"])
+def test_route_lookup_not_found(benchmark, route_count, enable_compiled_routing):
+    # GIVEN a resolver with many routes and a path that doesn't match any of them (worst case)
+    app = build_app(route_count, enable_compiled_routing)
+    event = build_event("/unknown/items/123")
+
+    # WHEN resolving the event
+    # THEN we record the lookup cost for comparison between routing engines
+    benchmark(app, event, {})
+
+
+@pytest.mark.perf
+def test_compiled_routing_lookup_cost_is_flat():
+    # GIVEN resolvers with 10 and 2000 routes using compiled routing
+    small_app = build_app(ROUTE_COUNTS[0], enable_compiled_routing=True)
+    large_app = build_app(ROUTE_COUNTS[-1], enable_compiled_routing=True)
+
+    # WHEN resolving the last registered dynamic route, and a path not matching any route
+    for path in (f"/service_{ROUTE_COUNTS[0] // 2 - 1}/items/123", "/unknown/items/123"):
+        event = build_event(path)
+        small_elapsed = lookup_elapsed(small_app, event)
+        large_elapsed = lookup_elapsed(large_app, event)
+
+        # THEN the lookup cost doesn't grow with the number of registered routes
+        growth = large_elapsed / small_elapsed
+        if growth > COMPILED_ROUTING_GROWTH_SLA:
+            pytest.fail(f"Compiled routing lookup should be flat; grew {growth:.2f}x from 10 to 2000 routes")
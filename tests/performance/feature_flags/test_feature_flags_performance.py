@@ -0,0 +1,104 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.feature_flags import FeatureFlags, RuleAction, StoreProvider
+
+FEATURE_COUNT = 100
+EVALUATIONS = 200
+
+# compiled rules skip schema validation and use set lookups; adjusted for noisy CI machines
+COMPILED_RULES_SPEEDUP_SLA: float = 3.0
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class InMemoryStore(StoreProvider):
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+
+    @property
+    def get_raw_configuration(self) -> Dict[str, Any]:
+        return self.config
+
+    def get_configuration(self) -> Dict[str, Any]:
+        return self.config
+
+
+def build_schema(feature_count: int) -> Dict[str, Any]:
+    tenants = [f"tenant-{i}" for i in range(500)]
+    return {
+        f"feature_{i}": {
+            "default": False,
+            "rules": {
+                "tenant allow list": {
+                    "when_match": True,
+                    "conditions": [{"action": RuleAction.IN.value, "key": "tenant_id", "value": tenants}],
+                },
+                "premium tier in region": {
+                    "when_match": True,
+                    "conditions": [
+                        {"action": RuleAction.EQUALS.value, "key": "tier", "value": "premium"},
+                        {"action": RuleAction.ANY_IN_VALUE.value, "key": "regions", "value": ["eu-west-1"]},
+                    ],
+                },
+            },
+        }
+        for i in range(feature_count)
+    }
+
+
+def get_enabled_features_elapsed(feature_flags: FeatureFlags, context: dict) -> float:
+    with timing() as t:
+        for _ in range(EVALUATIONS):
+            feature_flags.get_enabled_features(context=context)
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="feature_flags", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("enable_compiled_rules", [False, True], ids=["interpreted", "compiled"])
+def test_get_enabled_features(benchmark, enable_compiled_rules):
+    # GIVEN a schema with many features, each with membership and multi-condition rules
+    feature_flags = FeatureFlags(
+        store=InMemoryStore(build_schema(FEATURE_COUNT)),
+        enable_compiled_rules=enable_compiled_rules,
+    )
+
+    # WHEN getting all enabled features for a context that doesn't match the allow list
+    # THEN we record the evaluation cost for comparison between rule engines
+    benchmark(feature_flags.get_enabled_features, context={"tenant_id": "unknown", "tier": "premium"})
+
+
+@pytest.mark.perf
+def test_compiled_rules_are_faster_than_interpreted_rules():
+    # GIVEN the same schema evaluated by interpreted and compiled rules
+    config = build_schema(FEATURE_COUNT)
+    interpreted = FeatureFlags(store=InMemoryStore(config))
+    compiled = FeatureFlags(store=InMemoryStore(config), enable_compiled_rules=True)
+    context = {"tenant_id": "unknown", "tier": "premium", "regions": ["us-east-1"]}
+
+    # WHEN getting all enabled features repeatedly
+    interpreted_elapsed = get_enabled_features_elapsed(interpreted, context)
+    compiled_elapsed = get_enabled_features_elapsed(compiled, context)
+
+    # THEN compiled rules are significantly faster
+    speedup = interpreted_elapsed / compiled_elapsed
+    if speedup < COMPILED_RULES_SPEEDUP_SLA:
+        pytest.fail(f"Compiled rules should be at least {COMPILED_RULES_SPEEDUP_SLA}x faster; got {speedup:.2f}x")
@@ -0,0 +1,120 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.logging.formatter import LambdaPowertoolsFormatter
+from aws_lambda_powertools.logging.formatters.fast import LambdaPowertoolsFastFormatter
+
+RECORD_COUNT = 20_000
+
+# fast formatter records/sec compared to the default formatter; adjusted for noisy CI machines
+FAST_FORMATTER_SPEEDUP_SLA: float = 1.5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_formatter(formatter_class):
+    formatter = formatter_class()
+    formatter.append_keys(service="payment", sampling_rate=None, cold_start=False, function_name="payment")
+    return formatter
+
+
+def build_record() -> logging.LogRecord:
+    return logging.getLogger("payment").makeRecord(
+        name="payment",
+        level=logging.INFO,
+        fn="handler.py",
+        lno=42,
+        msg="Collecting payment",
+        args=None,
+        exc_info=None,
+        func="lambda_handler",
+        extra={"order_id": "1234", "amount": 10.5},
+    )
+
+
+def records_per_second(formatter: LambdaPowertoolsFormatter) -> float:
+    record = build_record()
+
+    with timing() as t:
+        for _ in range(RECORD_COUNT):
+            formatter.format(record)
+
+    return RECORD_COUNT / t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="logger", disable_gc=True, warmup=False)
+@pytest.mark.parametrize(
+    "formatter_class",
+    [LambdaPowertoolsFormatter, LambdaPowertoolsFastFormatter],
+    ids=["default", "fast"],
+)
+def test_logger_info_throughput(benchmark, formatter_class):
+    # GIVEN a Logger writing to a null device
+    with Path(os.devnull).open("w") as devnull:
+        logger = Logger(
+            service=f"perf_{formatter_class.__name__}",
+            stream=devnull,
+            logger_formatter=build_formatter(formatter_class),
+        )
+
+        # WHEN logging statements with extra keys
+        # THEN we record the end-to-end cost for comparison between formatters
+        benchmark(logger.info, "Collecting payment", order_id="1234", amount=10.5)
+
+
+@pytest.mark.perf
+def test_fast_formatter_records_per_second():
+    # GIVEN the default and fast formatters with the same keys
+    default_formatter = build_formatter(LambdaPowertoolsFormatter)
+    fast_formatter = build_formatter(LambdaPowertoolsFastFormatter)
+
+    # WHEN formatting the same record many times
+    default_throughput = records_per_second(default_formatter)
+    fast_throughput = records_per_second(fast_formatter)
+
+    # THEN the fast formatter formats more records per second
+    speedup = fast_throughput / default_throughput
+    if speedup < FAST_FORMATTER_SPEEDUP_SLA:
+        pytest.fail(
+            f"Fast formatter should be at least {FAST_FORMATTER_SPEEDUP_SLA}x faster; "
+            f"got {fast_throughput:,.0f} vs {default_throughput:,.0f} records/sec ({speedup:.2f}x)",
+        )
+
+
+@pytest.mark.perf
+def test_disabled_log_level_is_cheaper_than_formatting():
+    # GIVEN a Logger with INFO log level
+    with Path(os.devnull).open("w") as devnull:
+        logger = Logger(service="perf_disabled_level", stream=devnull, level="INFO")
+
+        # WHEN logging debug statements with extra keys
+        with timing() as t:
+            for _ in range(RECORD_COUNT):
+                logger.debug("Collecting payment", order_id="1234", amount=10.5)
+        elapsed = t()
+
+    # THEN discarded statements cost well under a microsecond each on average; adjusted for noisy CI machines
+    per_call = elapsed / RECORD_COUNT
+    if per_call > 0.000_002:
+        pytest.fail(f"Disabled log level should be close to zero-cost; took {per_call * 1e6:.2f}us per call")
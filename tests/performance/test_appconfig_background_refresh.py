@@ -0,0 +1,132 @@
+import json
+import time
+from concurrent.futures import wait
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Generator
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities.parameters import AppConfigProvider
+
+# Round trip of each AppConfig call, injected in the stubbed client
+API_LATENCY_SECS = 0.05
+POLLS = 50
+FEATURES = {f"feature_{i}": {"default": False, "rules": {"tier": {"when_match": True}}} for i in range(2000)}
+
+# polling an unchanged configuration must be at least 5x faster than polling a changed one, as it isn't parsed again
+UNCHANGED_POLL_SPEEDUP_SLA: float = 5
+# getting a configuration while it's polled in the background must not wait for AppConfig
+BACKGROUND_POLL_GET_SLA: float = API_LATENCY_SECS / 10
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_provider(changed: bool, latency: float = 0, background_refresh: bool = False) -> AppConfigProvider:
+    """AppConfigProvider whose client returns the configuration on each poll if changed, or an empty one otherwise"""
+    provider = AppConfigProvider(
+        environment="dev",
+        application="myapp",
+        boto_config=Config(region_name="us-east-1"),
+        background_refresh=background_refresh,
+    )
+    body = json.dumps(FEATURES).encode()
+    polls = []
+
+    def start_configuration_session(**kwargs) -> dict:
+        return {"InitialConfigurationToken": "token"}
+
+    def get_latest_configuration(ConfigurationToken: str) -> dict:
+        if latency:
+            time.sleep(latency)
+        # a copy, as a configuration read from a response is a new object
+        configuration = bytes(bytearray(body)) if changed or not polls else b""
+        polls.append(ConfigurationToken)
+        return {
+            "Configuration": BytesIO(configuration),
+            "NextPollConfigurationToken": "token",
+            "NextPollIntervalInSeconds": 60,
+        }
+
+    provider.client.start_configuration_session = start_configuration_session
+    provider.client.get_latest_configuration = get_latest_configuration
+    return provider
+
+
+@pytest.mark.perf
+def test_unchanged_configuration_poll_speedup():
+    # GIVEN a large configuration, changing or not between polls
+    changed_provider = build_provider(changed=True)
+    unchanged_provider = build_provider(changed=False)
+
+    # WHEN polling it repeatedly
+    with timing() as t:
+        for _ in range(POLLS):
+            changed_provider.get("features", transform="json", force_fetch=True)
+    changed_elapsed = t()
+
+    with timing() as t:
+        for _ in range(POLLS):
+            unchanged_provider.get("features", transform="json", force_fetch=True)
+    unchanged_elapsed = t()
+
+    # THEN the unchanged configuration isn't parsed again
+    speedup = changed_elapsed / unchanged_elapsed
+    if speedup < UNCHANGED_POLL_SPEEDUP_SLA:
+        pytest.fail(
+            f"Polling an unchanged configuration should be {UNCHANGED_POLL_SPEEDUP_SLA}x faster: {speedup:.2f}x",
+        )
+
+
+@pytest.mark.perf
+def test_get_during_background_poll():
+    # GIVEN a provider polling a configuration in the background
+    provider = build_provider(changed=False, latency=API_LATENCY_SECS, background_refresh=True)
+    provider.get("features", transform="json")
+    key = provider._build_cache_key(name="features", transform="json")
+
+    try:
+        # WHEN the scheduled poll starts
+        timer = provider._poll_timers[key]
+        timer.cancel()
+        timer.function(*timer.args)
+
+        with timing() as t:
+            provider.get("features", transform="json")
+        elapsed = t()
+
+        # THEN the configuration is served without waiting for it
+        if elapsed > BACKGROUND_POLL_GET_SLA:
+            pytest.fail(f"Getting a configuration during a poll should take {BACKGROUND_POLL_GET_SLA}s: {elapsed}")
+
+        with provider._refresh_lock:
+            futures = list(provider._pending_refreshes.values())
+        wait(futures)
+        assert provider.stats.refreshes == 1
+    finally:
+        provider.clear_cache()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="appconfig_background_refresh")
+def test_unchanged_configuration_poll_benchmark(benchmark):
+    provider = build_provider(changed=False)
+    provider.get("features", transform="json")
+
+    value = benchmark(provider.get, "features", transform="json", force_fetch=True)
+
+    assert len(value) == len(FEATURES)
@@ -0,0 +1,111 @@
+import asyncio
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Generator, List, Optional, Tuple
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import AsyncBatchProcessor, EventType
+
+MAX_CONCURRENCY = 100
+SLA_RECORD_COUNT = 10_000
+
+# bounded concurrency must use at least 5x less memory than starting every record at once,
+# and must not be slower; adjusted for noisy CI machines
+BOUNDED_MEMORY_REDUCTION_SLA: float = 5
+BOUNDED_SLOWDOWN_SLA: float = 1.0
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_records(count: int) -> List[dict]:
+    return [{"messageId": str(i), "body": f"body-{i}", "attributes": {}, "messageAttributes": {}} for i in range(count)]
+
+
+async def record_handler(record):
+    await asyncio.sleep(0)  # yields to the event loop, as awaiting a downstream call would
+    return record.body
+
+
+def process(records: List[dict], max_concurrency: Optional[int]) -> List[tuple]:
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_concurrency=max_concurrency)
+    with processor(records, record_handler):
+        return processor.async_process()
+
+
+def process_peak_memory(records: List[dict], max_concurrency: Optional[int]) -> Tuple[int, List[tuple]]:
+    tracemalloc.start()
+    try:
+        results = process(records, max_concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, results
+
+
+def process_elapsed(records: List[dict], max_concurrency: Optional[int]) -> float:
+    with timing() as t:
+        process(records, max_concurrency)
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch_async_concurrency", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("record_count", [1_000, 10_000, 100_000])
+@pytest.mark.parametrize("max_concurrency", [None, MAX_CONCURRENCY], ids=["unbounded", "bounded"])
+def test_async_batch_processor_throughput(benchmark, record_count, max_concurrency):
+    # GIVEN batches of growing size
+    records = build_records(record_count)
+
+    # WHEN processing every record at once, or with bounded concurrency
+    # THEN we record the cost for comparison
+    benchmark.pedantic(process, args=(records, max_concurrency), rounds=1, iterations=1)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("record_count", [1_000, 10_000, 100_000])
+def test_async_batch_processor_bounded_peak_memory(record_count):
+    # GIVEN batches of growing size
+    records = build_records(record_count)
+
+    # WHEN processing every record at once, and with bounded concurrency
+    unbounded_peak, unbounded_results = process_peak_memory(records, None)
+    bounded_peak, bounded_results = process_peak_memory(records, MAX_CONCURRENCY)
+
+    # THEN results are the same, using a fraction of the memory
+    assert bounded_results == unbounded_results
+
+    reduction = unbounded_peak / bounded_peak
+    if reduction < BOUNDED_MEMORY_REDUCTION_SLA:
+        pytest.fail(f"Bounded concurrency should use at least 5x less memory; got {reduction:.2f}x less")
+
+
+@pytest.mark.perf
+def test_async_batch_processor_bounded_is_not_slower():
+    # GIVEN a large batch
+    records = build_records(SLA_RECORD_COUNT)
+
+    # WHEN processing every record at once, and with bounded concurrency
+    unbounded_elapsed = min(process_elapsed(records, None) for _ in range(3))
+    bounded_elapsed = min(process_elapsed(records, MAX_CONCURRENCY) for _ in range(3))
+
+    # THEN bounded concurrency is at least as fast, as it schedules far fewer tasks at once
+    slowdown = bounded_elapsed / unbounded_elapsed
+    if slowdown > BOUNDED_SLOWDOWN_SLA:
+        pytest.fail(f"Bounded concurrency should not be slower than unbounded; got {slowdown:.2f}x slower")
@@ -0,0 +1,100 @@
+import gc
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response
+
+BATCH_SIZE = 100
+# simulated work for every record
+RECORD_LATENCY_SECONDS = 0.01
+TIMEOUT_MS = 300
+REMAINING_TIME_MARGIN_MS = 50
+
+# checking the remaining time and timing record handlers must add less than 20% to a batch of no-op records
+DEADLINE_OVERHEAD_SLA: float = 1.2
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class LambdaContext:
+    def __init__(self, timeout_ms: int):
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return int((self._deadline - time.monotonic()) * 1000)
+
+
+def sqs_event(batch_size: int = BATCH_SIZE) -> dict:
+    return {
+        "Records": [
+            {"messageId": str(i), "body": f"body-{i}", "attributes": {}, "messageAttributes": {}}
+            for i in range(batch_size)
+        ],
+    }
+
+
+@pytest.mark.perf
+def test_batch_processor_returns_before_timeout():
+    # GIVEN a batch needing 1s of work, in an invocation timing out in 300ms
+    def record_handler(record):
+        time.sleep(RECORD_LATENCY_SECONDS)
+
+    processor = BatchProcessor(event_type=EventType.SQS, remaining_time_margin_ms=REMAINING_TIME_MARGIN_MS)
+
+    # WHEN processing the batch with a time budget
+    with timing() as t:
+        result = process_partial_response(sqs_event(), record_handler, processor, LambdaContext(TIMEOUT_MS))
+        elapsed_ms = t() * 1000
+
+    # THEN a partial response is returned before the margin, instead of the whole batch timing out
+    assert 0 < len(result["batchItemFailures"]) < BATCH_SIZE
+    if elapsed_ms > TIMEOUT_MS - REMAINING_TIME_MARGIN_MS:
+        pytest.fail(f"Processing should stop {REMAINING_TIME_MARGIN_MS}ms before timing out; took {elapsed_ms:.0f}ms")
+
+
+@pytest.mark.perf
+def test_batch_processor_deadline_overhead():
+    # GIVEN a large batch of no-op records
+    event = sqs_event(batch_size=10_000)
+
+    def record_handler(record):
+        return None
+
+    # WHEN processing it with and without a time budget, keeping the fastest of a few runs to reduce noise
+    without_deadline = with_deadline = float("inf")
+    gc.disable()
+    try:
+        for _ in range(10):
+            with timing() as t:
+                process_partial_response(event, record_handler, BatchProcessor(event_type=EventType.SQS))
+                without_deadline = min(without_deadline, t())
+
+            processor = BatchProcessor(event_type=EventType.SQS, remaining_time_margin_ms=REMAINING_TIME_MARGIN_MS)
+            with timing() as t:
+                result = process_partial_response(event, record_handler, processor, LambdaContext(timeout_ms=60_000))
+                with_deadline = min(with_deadline, t())
+    finally:
+        gc.enable()
+
+    # THEN every record is processed, at a small cost
+    assert result == {"batchItemFailures": []}
+
+    overhead = with_deadline / without_deadline
+    if overhead > DEADLINE_OVERHEAD_SLA:
+        pytest.fail(f"Time budget should add less than 20% to batch processing; got {overhead:.2f}x")
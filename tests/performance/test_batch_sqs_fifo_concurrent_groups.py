@@ -0,0 +1,87 @@
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import SqsFifoPartialProcessor, process_partial_response
+
+BATCH_SIZE = 10
+MESSAGE_GROUPS = 10
+# simulated I/O latency for every record, e.g. a call to an AWS service
+RECORD_LATENCY_SECONDS = 0.02
+
+# processing 10 message groups of 1 record concurrently must be at least 5x faster than one after another
+CONCURRENT_GROUPS_SPEEDUP_SLA: float = 5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def sqs_fifo_event(message_groups: int) -> dict:
+    return {
+        "Records": [
+            {
+                "messageId": str(i),
+                "body": f"body-{i}",
+                "attributes": {"MessageGroupId": str(i % message_groups)},
+                "messageAttributes": {},
+            }
+            for i in range(BATCH_SIZE)
+        ],
+    }
+
+
+def record_handler(record):
+    time.sleep(RECORD_LATENCY_SECONDS)
+    return record.body
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch_sqs_fifo_concurrent_groups", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("message_groups", [1, 2, 5, MESSAGE_GROUPS])
+def test_sqs_fifo_concurrent_groups_latency(benchmark, message_groups):
+    # GIVEN a 10 records batch spread over a growing number of message groups
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=MESSAGE_GROUPS)
+    event = sqs_fifo_event(message_groups)
+
+    # WHEN processing message groups concurrently
+    # THEN we record the cost for comparison
+    benchmark.pedantic(process_partial_response, args=(event, record_handler, processor), rounds=3, iterations=1)
+
+
+@pytest.mark.perf
+def test_sqs_fifo_concurrent_groups_is_faster_than_sequential():
+    # GIVEN a batch where every record belongs to a different message group
+    event = sqs_fifo_event(MESSAGE_GROUPS)
+
+    # WHEN processing records one after another, and message groups concurrently
+    with timing() as t:
+        sequential = process_partial_response(event, record_handler, SqsFifoPartialProcessor(skip_group_on_error=True))
+        sequential_elapsed = t()
+
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_concurrent_groups=MESSAGE_GROUPS)
+    with timing() as t:
+        concurrent = process_partial_response(event, record_handler, processor)
+        concurrent_elapsed = t()
+
+    # THEN the result is the same, and latency is divided by the number of message groups
+    assert concurrent == sequential == {"batchItemFailures": []}
+
+    speedup = sequential_elapsed / concurrent_elapsed
+    if speedup < CONCURRENT_GROUPS_SPEEDUP_SLA:
+        pytest.fail(
+            f"Processing {MESSAGE_GROUPS} message groups concurrently should be at least 5x faster; got {speedup:.2f}x",
+        )
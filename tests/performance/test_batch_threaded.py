@@ -0,0 +1,123 @@
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    BatchProcessor,
+    EventType,
+    ThreadedBatchProcessor,
+    process_partial_response,
+)
+
+BATCH_SIZE = 100
+MAX_WORKERS = 10
+# simulated I/O latency for every record, e.g. a call to an AWS service
+RECORD_LATENCY_SECONDS = 0.01
+
+# processing records on 10 threads must be at least 5x faster than one after another
+THREADED_SPEEDUP_SLA: float = 5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def sqs_event() -> dict:
+    return {
+        "Records": [
+            {"messageId": str(i), "body": f"body-{i}", "attributes": {}, "messageAttributes": {}}
+            for i in range(BATCH_SIZE)
+        ],
+    }
+
+
+def record_handler(record):
+    time.sleep(RECORD_LATENCY_SECONDS)
+    return record.body
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch_threaded", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("max_workers", [1, 4, MAX_WORKERS, 32])
+def test_threaded_batch_processor_throughput(benchmark, max_workers):
+    # GIVEN a batch of records spending most of their time waiting on I/O
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=max_workers)
+    event = sqs_event()
+
+    # WHEN processing them with a growing number of workers
+    # THEN we record the cost for comparison
+    benchmark.pedantic(process_partial_response, args=(event, record_handler, processor), rounds=3, iterations=1)
+
+
+@pytest.mark.perf
+def test_threaded_batch_processor_is_faster_than_sequential():
+    # GIVEN a batch of records spending most of their time waiting on I/O
+    event = sqs_event()
+
+    # WHEN processing them one after another, and on a thread pool
+    with timing() as t:
+        sequential = process_partial_response(event, record_handler, BatchProcessor(event_type=EventType.SQS))
+        sequential_elapsed = t()
+
+    processor = ThreadedBatchProcessor(event_type=EventType.SQS, max_workers=MAX_WORKERS)
+    with timing() as t:
+        threaded = process_partial_response(event, record_handler, processor)
+        threaded_elapsed = t()
+
+    # THEN the result is the same, and waiting on I/O overlaps across records
+    assert threaded == sequential == {"batchItemFailures": []}
+
+    speedup = sequential_elapsed / threaded_elapsed
+    if speedup < THREADED_SPEEDUP_SLA:
+        pytest.fail(f"Processing records on {MAX_WORKERS} threads should be at least 5x faster; got {speedup:.2f}x")
+
+
+@pytest.mark.perf
+def test_threaded_batch_processor_preserving_key_order_is_faster_than_sequential():
+    # GIVEN a Kinesis batch spreading records over as many partition keys as workers
+    event = {
+        "Records": [
+            {"kinesis": {"partitionKey": str(i % MAX_WORKERS), "sequenceNumber": str(i), "data": ""}}
+            for i in range(BATCH_SIZE)
+        ],
+    }
+
+    def kinesis_record_handler(record):
+        time.sleep(RECORD_LATENCY_SECONDS)
+
+    # WHEN processing them one after another, and one partition key per thread
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams)
+    with timing() as t:
+        sequential = process_partial_response(event, kinesis_record_handler, processor)
+        sequential_elapsed = t()
+
+    processor = ThreadedBatchProcessor(
+        event_type=EventType.KinesisDataStreams,
+        max_workers=MAX_WORKERS,
+        preserve_key_order=True,
+    )
+    with timing() as t:
+        threaded = process_partial_response(event, kinesis_record_handler, processor)
+        threaded_elapsed = t()
+
+    # THEN the result is the same, and partition keys are processed concurrently
+    assert threaded == sequential == {"batchItemFailures": []}
+
+    speedup = sequential_elapsed / threaded_elapsed
+    if speedup < THREADED_SPEEDUP_SLA:
+        pytest.fail(
+            f"Processing {MAX_WORKERS} partition keys on threads should be at least 5x faster; got {speedup:.2f}x",
+        )
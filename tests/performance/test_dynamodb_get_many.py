@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities.parameters import DynamoDBProvider
+
+# Round trip of each DynamoDB call, injected in the stubbed resource
+API_LATENCY_SECS = 0.01
+TENANTS = 150
+
+# fetching 150 items by chunks of 100 keys must be at least 20x faster than fetching them one by one
+BATCH_SPEEDUP_SLA: float = 20
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_provider() -> DynamoDBProvider:
+    """DynamoDBProvider whose resource answers after API_LATENCY_SECS"""
+    provider = DynamoDBProvider("TenantConfigTable", boto_config=Config(region_name="us-east-1"))
+
+    def get_item(Key: dict) -> dict:
+        time.sleep(API_LATENCY_SECS)
+        return {"Item": {"id": Key["id"], "value": "value"}}
+
+    def batch_get_item(RequestItems: dict) -> dict:
+        time.sleep(API_LATENCY_SECS)
+        return {
+            "Responses": {
+                table: [{"id": key["id"], "value": "value"} for key in request["Keys"]]
+                for table, request in RequestItems.items()
+            },
+        }
+
+    provider.table.get_item = get_item
+    provider.resource.batch_get_item = batch_get_item
+    return provider
+
+
+@pytest.mark.perf
+def test_get_many_batch_speedup():
+    # GIVEN a config item per tenant
+    names = [f"tenant-{i}" for i in range(TENANTS)]
+    one_by_one_provider = build_provider()
+    batch_provider = build_provider()
+
+    # WHEN loading them one by one, then by chunks
+    with timing() as t:
+        for name in names:
+            one_by_one_provider.get(name)
+    one_by_one_elapsed = t()
+
+    with timing() as t:
+        values = batch_provider.get_many(names)
+    batch_elapsed = t()
+
+    # THEN round trips are saved
+    assert len(values) == TENANTS
+    speedup = one_by_one_elapsed / batch_elapsed
+    if speedup < BATCH_SPEEDUP_SLA:
+        pytest.fail(f"Fetching items by chunks should be {BATCH_SPEEDUP_SLA}x faster: {speedup:.2f}x")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="dynamodb_get_many")
+def test_get_many_cached_benchmark(benchmark):
+    names = [f"tenant-{i}" for i in range(TENANTS)]
+    provider = build_provider()
+    provider.get_many(names)
+
+    values = benchmark(provider.get_many, names)
+
+    assert len(values) == TENANTS
@@ -0,0 +1,210 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator, List
+from unittest import mock
+
+import fakeredis
+import pytest
+import redis
+from botocore.exceptions import ClientError
+
+from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response
+from aws_lambda_powertools.utilities.idempotency import (
+    IdempotencyConfig,
+    IdempotentBatchProcessor,
+    idempotent_function,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.base import BasePersistenceLayer
+from aws_lambda_powertools.utilities.idempotency.persistence.dynamodb import DynamoDBPersistenceLayer
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import RedisCachePersistenceLayer
+
+BATCH_SIZE = 100
+# simulated network latency for every request sent to Redis
+ROUND_TRIP_LATENCY_SECONDS = 0.001
+# simulated latency of every request sent to DynamoDB
+DYNAMODB_LATENCY_SECONDS = 0.005
+
+# processing a redelivered batch must be at least 5x faster when claiming records in bulk
+REDELIVERED_BATCH_SPEEDUP_SLA: float = 5
+# claiming a redelivered batch must be at least 3x faster with concurrent DynamoDB conditional writes
+DYNAMODB_REDELIVERED_BATCH_SPEEDUP_SLA: float = 3
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+@contextmanager
+def network_latency() -> Generator[List, None, None]:
+    """Count requests sent to Redis, where a pipeline is sent with a single request, adding latency to each"""
+    round_trips: List = []
+    send_packed_command = redis.connection.AbstractConnection.send_packed_command
+
+    def slow_send_packed_command(self, *args, **kwargs):
+        round_trips.append(args)
+        time.sleep(ROUND_TRIP_LATENCY_SECONDS)
+        return send_packed_command(self, *args, **kwargs)
+
+    with mock.patch.object(redis.connection.AbstractConnection, "send_packed_command", slow_send_packed_command):
+        yield round_trips
+
+
+class FakeDynamoDBClient:
+    """In-memory idempotency table, adding latency to every request, and counting requests sent at the same time"""
+
+    def __init__(self):
+        self.items: Dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @contextmanager
+    def request(self) -> Generator:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(DYNAMODB_LATENCY_SECONDS)
+        yield
+        with self.lock:
+            self.in_flight -= 1
+
+    def put_item(self, Item: dict, **kwargs) -> dict:
+        with self.request(), self.lock:
+            existing = self.items.get(Item["id"]["S"])
+            if existing is None:
+                self.items[Item["id"]["S"]] = Item
+                return {}
+
+        error = {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}, "Item": existing}
+        raise ClientError(error, "PutItem")
+
+    def update_item(self, Key: dict, ExpressionAttributeNames: dict, ExpressionAttributeValues: dict, **kwargs) -> dict:
+        with self.request(), self.lock:
+            item = self.items[Key["id"]["S"]]
+            for name, attribute in ExpressionAttributeNames.items():
+                item[attribute] = ExpressionAttributeValues[name.replace("#", ":", 1)]
+        return {}
+
+
+class LambdaContext:
+    def get_remaining_time_in_millis(self) -> int:
+        return 60_000
+
+
+def sqs_event() -> dict:
+    return {
+        "Records": [
+            {"messageId": str(i), "body": f"body-{i}", "attributes": {}, "messageAttributes": {}}
+            for i in range(BATCH_SIZE)
+        ],
+    }
+
+
+def build_persistence_layer() -> RedisCachePersistenceLayer:
+    client = fakeredis.FakeRedis(decode_responses=True)
+    client.ping()  # connects to Redis beforehand
+    return RedisCachePersistenceLayer(client=client)
+
+
+def process_with_idempotent_function(persistence_layer: BasePersistenceLayer) -> dict:
+    config = IdempotencyConfig(event_key_jmespath="messageId", use_local_cache=False)
+    config.register_lambda_context(LambdaContext())
+
+    @idempotent_function(data_keyword_argument="record", persistence_store=persistence_layer, config=config)
+    def record_handler(record: dict):
+        return {"processed": record["body"]}
+
+    def handler(record):
+        return record_handler(record=record.raw_event)
+
+    processor = BatchProcessor(event_type=EventType.SQS)
+    return process_partial_response(event=sqs_event(), record_handler=handler, processor=processor)
+
+
+def process_with_idempotent_batch_processor(persistence_layer: BasePersistenceLayer) -> dict:
+    def record_handler(record):
+        return {"processed": record.body}
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_layer,
+        config=IdempotencyConfig(event_key_jmespath="messageId", use_local_cache=False),
+    )
+    return process_partial_response(
+        event=sqs_event(),
+        record_handler=record_handler,
+        processor=processor,
+        context=LambdaContext(),
+    )
+
+
+@pytest.mark.perf
+def test_redelivered_batch_is_claimed_in_bulk():
+    # GIVEN a batch already processed, with one record at a time and in bulk
+    per_record = build_persistence_layer()
+    bulk = build_persistence_layer()
+    process_with_idempotent_function(per_record)
+    process_with_idempotent_batch_processor(bulk)
+
+    # WHEN the same batch is delivered again
+    with network_latency() as per_record_round_trips, timing() as t:
+        assert process_with_idempotent_function(per_record) == {"batchItemFailures": []}
+        per_record_elapsed = t()
+
+    with network_latency() as bulk_round_trips, timing() as t:
+        assert process_with_idempotent_batch_processor(bulk) == {"batchItemFailures": []}
+        bulk_elapsed = t()
+
+    # THEN completed records are found with a single round trip, instead of a SET and a GET for each record
+    assert len(per_record_round_trips) == 2 * BATCH_SIZE
+    assert len(bulk_round_trips) == 1
+
+    speedup = per_record_elapsed / bulk_elapsed
+    if speedup < REDELIVERED_BATCH_SPEEDUP_SLA:
+        pytest.fail(
+            f"Processing a redelivered batch should be at least {REDELIVERED_BATCH_SPEEDUP_SLA}x faster; "
+            f"got {speedup:.2f}x",
+        )
+
+
+@pytest.mark.perf
+def test_redelivered_batch_is_claimed_concurrently_on_dynamodb():
+    # GIVEN a batch already processed, with one record at a time and in bulk
+    per_record_client = FakeDynamoDBClient()
+    bulk_client = FakeDynamoDBClient()
+    per_record = DynamoDBPersistenceLayer(table_name="idempotency", boto3_client=per_record_client)
+    bulk = DynamoDBPersistenceLayer(table_name="idempotency", boto3_client=bulk_client)
+    process_with_idempotent_function(per_record)
+    process_with_idempotent_batch_processor(bulk)
+
+    # WHEN the same batch is delivered again
+    with timing() as t:
+        assert process_with_idempotent_function(per_record) == {"batchItemFailures": []}
+        per_record_elapsed = t()
+
+    with timing() as t:
+        assert process_with_idempotent_batch_processor(bulk) == {"batchItemFailures": []}
+        bulk_elapsed = t()
+
+    # THEN completed records are found with concurrent conditional writes, instead of one after another
+    assert per_record_client.max_in_flight == 1
+    assert bulk_client.max_in_flight > 1
+
+    speedup = per_record_elapsed / bulk_elapsed
+    if speedup < DYNAMODB_REDELIVERED_BATCH_SPEEDUP_SLA:
+        pytest.fail(
+            f"Processing a redelivered batch on DynamoDB should be at least {DYNAMODB_REDELIVERED_BATCH_SPEEDUP_SLA}x "
+            f"faster; got {speedup:.2f}x",
+        )
@@ -0,0 +1,113 @@
+import time
+from contextlib import contextmanager
+from typing import Generator, List
+from unittest import mock
+
+import fakeredis
+import pytest
+import redis
+
+from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import RedisCachePersistenceLayer
+
+BATCH_SIZE = 100
+# simulated network latency for every request sent to Redis
+ROUND_TRIP_LATENCY_SECONDS = 0.001
+
+# claiming a batch in a pipeline must be at least 2.5x faster than one record at a time;
+# fakeredis runs commands and scripts in-process, so this includes their execution time on top of the latency saved
+BATCH_SPEEDUP_SLA: float = 2.5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+@contextmanager
+def network_latency() -> Generator[List, None, None]:
+    """Count requests sent to Redis, where a pipeline is sent with a single request, adding latency to each"""
+    round_trips: List = []
+    send_packed_command = redis.connection.AbstractConnection.send_packed_command
+
+    def slow_send_packed_command(self, *args, **kwargs):
+        round_trips.append(args)
+        time.sleep(ROUND_TRIP_LATENCY_SECONDS)
+        return send_packed_command(self, *args, **kwargs)
+
+    with mock.patch.object(redis.connection.AbstractConnection, "send_packed_command", slow_send_packed_command):
+        yield round_trips
+
+
+def build_persistence_layer(enable_lua_script: bool) -> RedisCachePersistenceLayer:
+    persistence_layer = RedisCachePersistenceLayer(
+        client=fakeredis.FakeRedis(decode_responses=True),
+        enable_lua_script=enable_lua_script,
+    )
+    persistence_layer.configure(IdempotencyConfig(), function_name="record_handler")
+
+    # connects, and loads the Lua script when enabled
+    persistence_layer.save_inprogress_many(data=[{"id": -1}], remaining_time_in_millis=1000)
+    return persistence_layer
+
+
+def claim_existing_records(persistence_layer: RedisCachePersistenceLayer, batch: List[dict]) -> None:
+    for record in batch:
+        try:
+            persistence_layer.save_inprogress(data=record, remaining_time_in_millis=1000)
+        except Exception:
+            pass
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("enable_lua_script", [False, True], ids=["set_get", "lua_script"])
+def test_claim_existing_record_round_trips(enable_lua_script):
+    # GIVEN records already in progress
+    persistence_layer = build_persistence_layer(enable_lua_script=enable_lua_script)
+    batch = [{"id": i} for i in range(BATCH_SIZE)]
+    persistence_layer.save_inprogress_many(data=batch, remaining_time_in_millis=1000)
+
+    # WHEN claiming each of them again
+    with network_latency() as round_trips:
+        claim_existing_records(persistence_layer, batch)
+
+    # THEN the Lua script saves a round trip for every record
+    expected_round_trips_per_record = 1 if enable_lua_script else 2
+    assert len(round_trips) == expected_round_trips_per_record * BATCH_SIZE
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("enable_lua_script", [False, True], ids=["set_get", "lua_script"])
+def test_save_inprogress_many_is_faster_than_one_at_a_time(enable_lua_script):
+    # GIVEN a batch of new records
+    batch = [{"id": i} for i in range(BATCH_SIZE)]
+    one_at_a_time = build_persistence_layer(enable_lua_script=enable_lua_script)
+    pipelined = build_persistence_layer(enable_lua_script=enable_lua_script)
+
+    # WHEN claiming all records, one at a time and in a pipeline
+    with network_latency() as one_at_a_time_round_trips, timing() as t:
+        for record in batch:
+            one_at_a_time.save_inprogress(data=record, remaining_time_in_millis=1000)
+        one_at_a_time_elapsed = t()
+
+    with network_latency() as pipelined_round_trips, timing() as t:
+        assert pipelined.save_inprogress_many(data=batch, remaining_time_in_millis=1000) == [None] * BATCH_SIZE
+        pipelined_elapsed = t()
+
+    # THEN the whole batch is claimed with a single round trip
+    assert len(one_at_a_time_round_trips) == BATCH_SIZE
+    assert len(pipelined_round_trips) == 1
+
+    speedup = one_at_a_time_elapsed / pipelined_elapsed
+    if speedup < BATCH_SPEEDUP_SLA:
+        pytest.fail(f"Claiming a batch should be at least {BATCH_SPEEDUP_SLA}x faster; got {speedup:.2f}x")
@@ -0,0 +1,134 @@
+import io
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from typing import Generator, Optional
+
+import pytest
+
+from aws_lambda_powertools.metrics import MetricAggregation
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.aggregation import build_metric_aggregate
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.constants import MAX_METRICS
+
+VALUE_COUNT = 50_000
+VALUES = [float(i % 50) for i in range(VALUE_COUNT)]
+
+# aggregating must emit at least 10x less EMF output, serialize at least 10x faster,
+# and not make adding metrics slower; adjusted for noisy CI machines
+AGGREGATION_LOG_VOLUME_REDUCTION_SLA: float = 10
+AGGREGATION_SERIALIZATION_SPEEDUP_SLA: float = 10
+AGGREGATION_SLOWDOWN_SLA: float = 1.2
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def emit_metric(metric_aggregation: Optional[MetricAggregation]) -> str:
+    output = io.StringIO()
+    provider = AmazonCloudWatchEMFProvider(namespace="perf", service="perf", metric_aggregation=metric_aggregation)
+
+    # the same metric emitted for every record, as in a batch handler
+    with redirect_stdout(output):
+        for i in range(VALUE_COUNT):
+            provider.add_metric(name="latency", unit="Milliseconds", value=VALUES[i])
+        provider.flush_metrics()
+
+    return output.getvalue()
+
+
+def emit_metric_elapsed(metric_aggregation: Optional[MetricAggregation]) -> float:
+    with timing() as t:
+        emit_metric(metric_aggregation)
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="metrics_aggregation", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("metric_aggregation", [None, MetricAggregation.Values, MetricAggregation.StatisticSet])
+def test_emit_repeated_metric(benchmark, metric_aggregation):
+    # GIVEN a provider keeping every value, or aggregating them
+    # WHEN adding the same metric many times and flushing
+    # THEN we record the cost for comparison between strategies
+    benchmark.pedantic(emit_metric, args=(metric_aggregation,), rounds=3, iterations=1)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("metric_aggregation", [MetricAggregation.Values, MetricAggregation.StatisticSet])
+def test_metric_aggregation_reduces_log_volume_and_memory(metric_aggregation):
+    # GIVEN the same metric emitted with and without aggregation
+    tracemalloc.start()
+    raw_output = emit_metric(None)
+    _, raw_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    aggregated_output = emit_metric(metric_aggregation)
+    _, aggregated_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # THEN aggregating emits a fraction of the EMF output, using less memory
+    reduction = len(raw_output) / len(aggregated_output)
+    if reduction < AGGREGATION_LOG_VOLUME_REDUCTION_SLA:
+        pytest.fail(f"Metric aggregation should emit at least 10x less EMF output; got {reduction:.2f}x less")
+
+    assert aggregated_peak < raw_peak
+
+
+def serialize_metric_elapsed(metric_aggregation: Optional[MetricAggregation]) -> float:
+    provider = AmazonCloudWatchEMFProvider(namespace="perf", service="perf")
+
+    if metric_aggregation is None:
+        # every value is kept, so a metric set is serialized every 100 values
+        metric_sets = [
+            {"latency": {"Unit": "Milliseconds", "Value": VALUES[start : start + MAX_METRICS]}}
+            for start in range(0, VALUE_COUNT, MAX_METRICS)
+        ]
+    else:
+        metric_sets = [
+            {"latency": {"Unit": "Milliseconds", "Value": build_metric_aggregate(metric_aggregation, VALUES)}},
+        ]
+
+    with timing() as t:
+        for metric_set in metric_sets:
+            json.dumps(provider.serialize_metric_set(metrics=metric_set))
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("metric_aggregation", [MetricAggregation.Values, MetricAggregation.StatisticSet])
+def test_metric_aggregation_serializes_faster_than_every_value(metric_aggregation):
+    # GIVEN the same values serialized as they are today, and aggregated
+    raw_elapsed = min(serialize_metric_elapsed(None) for _ in range(3))
+    aggregated_elapsed = min(serialize_metric_elapsed(metric_aggregation) for _ in range(3))
+
+    # THEN aggregating is faster than serializing a metric set every 100 values
+    speedup = raw_elapsed / aggregated_elapsed
+    if speedup < AGGREGATION_SERIALIZATION_SPEEDUP_SLA:
+        pytest.fail(f"Metric aggregation should serialize at least 10x faster; got {speedup:.2f}x")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("metric_aggregation", [MetricAggregation.Values, MetricAggregation.StatisticSet])
+def test_metric_aggregation_is_not_slower_than_keeping_every_value(metric_aggregation):
+    # GIVEN the same metric emitted with and without aggregation
+    raw_elapsed = min(emit_metric_elapsed(None) for _ in range(3))
+    aggregated_elapsed = min(emit_metric_elapsed(metric_aggregation) for _ in range(3))
+
+    # THEN adding and flushing metrics is at least as fast when aggregating
+    slowdown = aggregated_elapsed / raw_elapsed
+    if slowdown > AGGREGATION_SLOWDOWN_SLA:
+        pytest.fail(f"Metric aggregation should not be slower than keeping every value; got {slowdown:.2f}x slower")
@@ -0,0 +1,75 @@
+import os
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Generator, Optional
+
+import pytest
+
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.cloudwatch import AmazonCloudWatchEMFProvider
+from aws_lambda_powertools.metrics.provider.cloudwatch_emf.writer import EMFWriter
+
+METRIC_COUNTS = [1_000, 10_000, 100_000]
+
+# buffered writes must not be slower than printing each EMF blob; adjusted for noisy CI machines
+EMF_WRITER_SLOWDOWN_SLA: float = 1.5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def emit_metrics(metric_count: int, emf_writer: Optional[EMFWriter]) -> None:
+    provider = AmazonCloudWatchEMFProvider(namespace="perf", service="perf", emf_writer=emf_writer)
+    provider.add_dimension(name="operation", value="batch")
+
+    # a different metric for every record, as in a high cardinality batch handler (one EMF blob every 100 metrics)
+    for i in range(metric_count):
+        provider.add_metric(name=f"metric_{i % 100}", unit="Count", value=1)
+
+    provider.flush_metrics()
+
+
+def emit_metrics_elapsed(metric_count: int, buffered: bool) -> float:
+    # line buffered like Lambda's stdout, so every EMF blob printed is a write syscall
+    with Path(os.devnull).open("w", buffering=1) as devnull, redirect_stdout(devnull):
+        emf_writer = EMFWriter() if buffered else None
+        with timing() as t:
+            emit_metrics(metric_count, emf_writer)
+
+    return t()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="metrics_emf_writer", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("metric_count", METRIC_COUNTS)
+@pytest.mark.parametrize("buffered", [False, True], ids=["print", "emf_writer"])
+def test_emit_metrics(benchmark, metric_count, buffered):
+    # GIVEN a provider printing each EMF blob, or buffering them with an EMF writer
+    # WHEN adding many metrics and flushing
+    # THEN we record the cost for comparison between both strategies
+    benchmark.pedantic(emit_metrics_elapsed, args=(metric_count, buffered), rounds=3, iterations=1)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("metric_count", METRIC_COUNTS)
+def test_emf_writer_is_not_slower_than_printing(metric_count):
+    # GIVEN the same metrics emitted by printing each EMF blob, and buffering them with an EMF writer
+    printed_elapsed = min(emit_metrics_elapsed(metric_count, buffered=False) for _ in range(3))
+    buffered_elapsed = min(emit_metrics_elapsed(metric_count, buffered=True) for _ in range(3))
+
+    # THEN buffering is at least as fast as printing
+    slowdown = buffered_elapsed / printed_elapsed
+    if slowdown > EMF_WRITER_SLOWDOWN_SLA:
+        pytest.fail(f"EMF writer should not be slower than printing each blob; got {slowdown:.2f}x slower")
@@ -0,0 +1,83 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Generator, List, Optional
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities.parameters import SSMProvider
+
+# Round trip of each SSM call, injected in the stubbed client
+API_LATENCY_SECS = 0.02
+PARAMETERS_COUNT = 200
+MAX_CONCURRENCY = 8
+
+# fetching 20 chunks of parameters with 8 concurrent calls must be at least 3x faster than one call at a time
+CONCURRENCY_SPEEDUP_SLA: float = 3
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_provider() -> SSMProvider:
+    """SSMProvider whose client answers GetParameters after API_LATENCY_SECS"""
+    provider = SSMProvider(boto_config=Config(region_name="us-east-1"))
+
+    def get_parameters(Names: List[str], WithDecryption: Optional[bool] = None) -> dict:
+        time.sleep(API_LATENCY_SECS)
+        return {
+            "Parameters": [
+                {"Name": name, "Type": "String", "Value": "value", "Version": 1, "LastModifiedDate": datetime.now()}
+                for name in Names
+            ],
+            "InvalidParameters": [],
+        }
+
+    provider.client.get_parameters = get_parameters
+    return provider
+
+
+def load_parameters(max_concurrency: Optional[int]) -> float:
+    params = {f"/app/param-{i}": {} for i in range(PARAMETERS_COUNT)}
+    provider = build_provider()
+
+    with timing() as t:
+        values = provider.get_parameters_by_name(parameters=params, max_concurrency=max_concurrency)
+    elapsed = t()
+
+    assert len(values) == PARAMETERS_COUNT
+    return elapsed
+
+
+@pytest.mark.perf
+def test_get_parameters_by_name_concurrency_speedup():
+    # GIVEN 200 parameters, and a client with a round trip latency per call
+
+    # WHEN loading them one call at a time, then with concurrent calls
+    sequential_elapsed = load_parameters(max_concurrency=None)
+    concurrent_elapsed = load_parameters(max_concurrency=MAX_CONCURRENCY)
+
+    # THEN round trips overlap
+    speedup = sequential_elapsed / concurrent_elapsed
+    if speedup < CONCURRENCY_SPEEDUP_SLA:
+        pytest.fail(f"Concurrent calls should be {CONCURRENCY_SPEEDUP_SLA}x faster: {speedup:.2f}x")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="parameters_by_name")
+@pytest.mark.parametrize("max_concurrency", [None, 2, 8])
+def test_get_parameters_by_name_throughput(benchmark, max_concurrency):
+    benchmark.pedantic(load_parameters, args=(max_concurrency,), rounds=3)
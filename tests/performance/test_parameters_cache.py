@@ -0,0 +1,91 @@
+import gc
+import tracemalloc
+from typing import Dict
+
+import pytest
+
+from aws_lambda_powertools.utilities.parameters import ParameterCache
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider
+
+SECRET_SIZE = 4 * 1024
+TENANTS = 5_000
+MAX_CACHE_BYTES = 1024 * 1024
+
+# memory held by a bounded cache must stay within its budget, plus the bookkeeping of each entry
+MAX_MEMORY_OVERHEAD: float = 1.5
+
+
+class TenantSecretsProvider(BaseProvider):
+    """Provider returning a different secret for each tenant, counting API calls"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    def _get(self, name: str, **sdk_options) -> str:
+        self.calls += 1
+        return '{"tenant": "' + name + '", "key": "' + "x" * SECRET_SIZE + '"}'
+
+    def _get_multiple(self, path: str, **sdk_options) -> Dict[str, str]:
+        raise NotImplementedError()
+
+
+def cache_memory(provider: TenantSecretsProvider) -> int:
+    """Memory held by the provider cache after reading a secret for each tenant"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for tenant in range(TENANTS):
+            provider.get(f"tenants/{tenant}/api-key")
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+@pytest.mark.perf
+def test_bounded_cache_memory():
+    # GIVEN a provider whose cache is bounded to 1 MiB, and an unbounded one
+    bounded_provider = TenantSecretsProvider(cache=ParameterCache(max_bytes=MAX_CACHE_BYTES))
+    unbounded_provider = TenantSecretsProvider()
+
+    # WHEN reading a different secret for each of many tenants
+    bounded_memory = cache_memory(bounded_provider)
+    unbounded_memory = cache_memory(unbounded_provider)
+
+    # THEN only the bounded cache stays within its memory budget, evicting the least recently used secrets
+    assert unbounded_memory > TENANTS * SECRET_SIZE
+    if bounded_memory > MAX_CACHE_BYTES * MAX_MEMORY_OVERHEAD:
+        pytest.fail(f"Bounded cache should hold about {MAX_CACHE_BYTES} bytes: {bounded_memory}")
+    assert bounded_provider.stats.evictions > 0
+
+
+@pytest.mark.perf
+def test_raw_value_shared_across_transforms():
+    # GIVEN a provider
+    provider = TenantSecretsProvider()
+
+    # WHEN reading each secret as is, then as JSON
+    for tenant in range(100):
+        provider.get(f"tenants/{tenant}/api-key")
+        provider.get(f"tenants/{tenant}/api-key", transform="json")
+
+    # THEN each secret is retrieved once
+    assert provider.calls == 100
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="parameters_cache")
+@pytest.mark.parametrize("cache", [None, ParameterCache(max_entries=100)], ids=["unbounded", "bounded"])
+def test_cache_hit_throughput(benchmark, cache):
+    provider = TenantSecretsProvider(cache=cache)
+    names = [f"tenants/{tenant}/api-key" for tenant in range(100)]
+    provider.prefetch(names)
+
+    def get_all():
+        for name in names:
+            provider.get(name)
+
+    benchmark(get_all)
+    assert provider.calls == len(names)
@@ -0,0 +1,111 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Generator, Iterator
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities.parameters import SSMProvider
+
+# Round trip of each GetParametersByPath page, injected in the stubbed client
+API_LATENCY_SECS = 0.01
+BRANCHES = [f"/app/service-{i}" for i in range(8)]
+PARAMETERS_PER_BRANCH = 50
+PAGE_SIZE = 10
+
+# fetching 8 branches of 5 pages concurrently must be at least 4x faster than fetching their root page by page
+BRANCH_CONCURRENCY_SPEEDUP_SLA: float = 4
+# a sub-path of a fetched hierarchy must be served from memory, well below a single round trip
+SUB_PATH_MAX_LATENCY_SECS: float = API_LATENCY_SECS / 5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class SlowPaginator:
+    """GetParametersByPath paginator returning each page of a hierarchy after API_LATENCY_SECS"""
+
+    names = [f"{branch}/param-{i}" for branch in BRANCHES for i in range(PARAMETERS_PER_BRANCH)]
+
+    def paginate(self, Path: str, **kwargs) -> Iterator[dict]:
+        names = [name for name in self.names if name.startswith(f"{Path.rstrip('/')}/")]
+        for start in range(0, len(names), PAGE_SIZE):
+            time.sleep(API_LATENCY_SECS)
+            yield {
+                "Parameters": [
+                    {"Name": name, "Type": "String", "Value": "value", "Version": 1, "LastModifiedDate": datetime.now()}
+                    for name in names[start : start + PAGE_SIZE]
+                ],
+            }
+
+
+def build_provider() -> SSMProvider:
+    provider = SSMProvider(boto_config=Config(region_name="us-east-1"))
+    provider.client.get_paginator = lambda operation: SlowPaginator()
+    return provider
+
+
+@pytest.mark.perf
+def test_get_multiple_by_paths_branch_concurrency_speedup():
+    # GIVEN a hierarchy of 8 branches with 50 parameters each
+    sequential_provider = build_provider()
+    concurrent_provider = build_provider()
+
+    # WHEN fetching its root page by page, then its branches concurrently
+    with timing() as t:
+        root_values = sequential_provider.get_multiple("/app", recursive=True)
+    sequential_elapsed = t()
+
+    with timing() as t:
+        branch_values = concurrent_provider.get_multiple_by_paths(BRANCHES, max_concurrency=len(BRANCHES))
+    concurrent_elapsed = t()
+
+    # THEN pages of different branches are fetched at the same time
+    assert len(root_values) == sum(len(values) for values in branch_values.values())
+    speedup = sequential_elapsed / concurrent_elapsed
+    if speedup < BRANCH_CONCURRENCY_SPEEDUP_SLA:
+        pytest.fail(
+            f"Fetching branches concurrently should be {BRANCH_CONCURRENCY_SPEEDUP_SLA}x faster: {speedup:.2f}x",
+        )
+
+
+@pytest.mark.perf
+def test_get_multiple_sub_path_served_from_memory():
+    # GIVEN a hierarchy already fetched recursively
+    provider = build_provider()
+    provider.get_multiple("/app", recursive=True)
+
+    # WHEN getting each of its branches
+    with timing() as t:
+        for branch in BRANCHES:
+            assert len(provider.get_multiple(branch)) == PARAMETERS_PER_BRANCH
+    elapsed = t() / len(BRANCHES)
+
+    # THEN none of them is fetched again
+    assert provider.stats.misses == 1
+    if elapsed > SUB_PATH_MAX_LATENCY_SECS:
+        pytest.fail(f"Getting a sub-path should take less than {SUB_PATH_MAX_LATENCY_SECS}s: {elapsed}s")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="parameters_path_index")
+def test_get_multiple_sub_path_benchmark(benchmark):
+    provider = build_provider()
+    provider.get_multiple("/app", recursive=True)
+
+    values = benchmark(provider.get_multiple, "/app/service-3")
+
+    assert len(values) == PARAMETERS_PER_BRANCH
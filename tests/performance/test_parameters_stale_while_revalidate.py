@@ -0,0 +1,96 @@
+import time
+from concurrent.futures import wait
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Generator, List
+
+import pytest
+
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider, ExpirableValue
+
+API_LATENCY_SECS = 0.05
+INVOCATIONS = 20
+
+# serving an expired value must not wait for the API call, even on the invocation hitting the expiry
+STALE_SERVE_MAX_LATENCY_SECS: float = API_LATENCY_SECS / 5
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class SlowProvider(BaseProvider):
+    """Provider whose API calls take API_LATENCY_SECS"""
+
+    def _get(self, name: str, **sdk_options) -> str:
+        time.sleep(API_LATENCY_SECS)
+        return f"value-{time.perf_counter()}"
+
+    def _get_multiple(self, path: str, **sdk_options) -> Dict[str, str]:
+        raise NotImplementedError()
+
+
+def expired_get_latencies(provider: SlowProvider) -> List[float]:
+    """Latency of each invocation getting a parameter that has just expired"""
+    provider.get("param")
+    key = provider._build_cache_key(name="param")
+
+    latencies = []
+    for _ in range(INVOCATIONS):
+        provider.store[key] = ExpirableValue(provider.store[key].value, datetime.now() - timedelta(seconds=1))
+        with timing() as t:
+            provider.get("param")
+        latencies.append(t())
+
+        # the next invocation starts once the background refresh is done
+        with provider._refresh_lock:
+            refreshes = list(provider._pending_refreshes.values())
+        wait(refreshes)
+
+    return latencies
+
+
+@pytest.mark.perf
+def test_stale_while_revalidate_tail_latency():
+    # GIVEN a provider serving stale values, and another one fetching expired values synchronously
+    blocking_provider = SlowProvider()
+    stale_provider = SlowProvider(stale_while_revalidate=60)
+
+    # WHEN getting a parameter on invocations hitting its expiry
+    blocking_latencies = expired_get_latencies(blocking_provider)
+    stale_latencies = expired_get_latencies(stale_provider)
+
+    # THEN only the provider fetching synchronously waits for the API call
+    assert min(blocking_latencies) >= API_LATENCY_SECS
+    if max(stale_latencies) > STALE_SERVE_MAX_LATENCY_SECS:
+        pytest.fail(
+            f"Serving a stale value should take less than {STALE_SERVE_MAX_LATENCY_SECS}s: {max(stale_latencies)}",
+        )
+    assert stale_provider.stats.refreshes == INVOCATIONS
+
+
+@pytest.mark.perf
+def test_prefetch_fetches_concurrently():
+    # GIVEN a provider, and parameters to fetch during the init phase
+    provider = SlowProvider()
+    names = [f"param-{i}" for i in range(8)]
+
+    # WHEN prefetching them
+    with timing() as t:
+        provider.prefetch(names)
+    elapsed = t()
+
+    # THEN they're fetched concurrently, instead of one after the other
+    if elapsed > API_LATENCY_SECS * len(names) / 2:
+        pytest.fail(f"Prefetching {len(names)} parameters should be concurrent: {elapsed}s")
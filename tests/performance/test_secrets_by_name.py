@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Generator, List, Optional
+
+import pytest
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities.parameters import SecretsProvider
+
+# Round trip of each Secrets Manager call, injected in the stubbed client
+API_LATENCY_SECS = 0.02
+TENANTS = 40
+
+# fetching 40 secrets in batches of 20 must be at least 10x faster than fetching them one by one
+BATCH_SPEEDUP_SLA: float = 10
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+def build_secret_value(name: str) -> dict:
+    return {"ARN": f"arn:aws:secretsmanager:us-east-1:123456789012:secret:{name}", "Name": name, "SecretString": name}
+
+
+def build_provider() -> SecretsProvider:
+    """SecretsProvider whose client answers after API_LATENCY_SECS"""
+    provider = SecretsProvider(boto_config=Config(region_name="us-east-1"))
+
+    def get_secret_value(SecretId: str) -> dict:
+        time.sleep(API_LATENCY_SECS)
+        return {**build_secret_value(SecretId), "CreatedDate": datetime.now()}
+
+    def batch_get_secret_value(SecretIdList: List[str], NextToken: Optional[str] = None) -> dict:
+        time.sleep(API_LATENCY_SECS)
+        return {"SecretValues": [build_secret_value(name) for name in SecretIdList], "Errors": []}
+
+    provider.client.get_secret_value = get_secret_value
+    provider.client.batch_get_secret_value = batch_get_secret_value
+    return provider
+
+
+@pytest.mark.perf
+def test_get_secrets_by_name_batch_speedup():
+    # GIVEN a secret per tenant
+    names = [f"tenants/{i}/credentials" for i in range(TENANTS)]
+    one_by_one_provider = build_provider()
+    batch_provider = build_provider()
+
+    # WHEN loading them one by one, then in batches
+    with timing() as t:
+        for name in names:
+            one_by_one_provider.get(name)
+    one_by_one_elapsed = t()
+
+    with timing() as t:
+        values = batch_provider.get_secrets_by_name({name: {} for name in names})
+    batch_elapsed = t()
+
+    # THEN round trips are saved
+    assert len(values) == TENANTS
+    speedup = one_by_one_elapsed / batch_elapsed
+    if speedup < BATCH_SPEEDUP_SLA:
+        pytest.fail(f"Fetching secrets in batches should be {BATCH_SPEEDUP_SLA}x faster: {speedup:.2f}x")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="secrets_by_name")
+def test_get_secrets_by_name_cached_benchmark(benchmark):
+    names = {f"tenants/{i}/credentials": {} for i in range(TENANTS)}
+    provider = build_provider()
+    provider.get_secrets_by_name(names)
+
+    values = benchmark(provider.get_secrets_by_name, names, transform="auto")
+
+    assert len(values) == TENANTS
@@ -0,0 +1,154 @@
+import io
+import os
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from typing import Generator, List
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming import BlockCacheConfig, S3Object
+from aws_lambda_powertools.utilities.streaming.transformations import ZipTransform
+
+# simulated latency to first byte of every GET request, and bandwidth of a single connection
+REQUEST_LATENCY_SECONDS = 0.02
+CONNECTION_BYTES_PER_SECOND = 50 * 1024 * 1024
+
+OBJECT_SIZE = 16 * 1024 * 1024
+BLOCK_SIZE = 1024 * 1024
+MAX_WORKERS = 8
+
+# reading a large object with 8 blocks in flight must be at least 3x faster than a single stream
+READ_AHEAD_SPEEDUP_SLA: float = 3
+# reading every member of a zip file must send at least 10x fewer requests than re-opening a stream on every seek
+ZIP_REQUESTS_REDUCTION_SLA: float = 10
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class ThrottledBody(io.BytesIO):
+    """Response body downloaded at the bandwidth of a single connection"""
+
+    def read(self, size=-1):
+        data = super().read(size)
+        time.sleep(len(data) / CONNECTION_BYTES_PER_SECOND)
+        return data
+
+
+class FakeS3Client:
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.requests: List[str] = []
+        self._lock = threading.Lock()
+
+    def head_object(self, **kwargs):
+        return {"ContentLength": len(self.payload)}
+
+    def get_object(self, Range: str, **kwargs):
+        with self._lock:
+            self.requests.append(Range)
+        time.sleep(REQUEST_LATENCY_SECONDS)
+        start, _, end = Range[len("bytes=") :].partition("-")
+        return {"Body": ThrottledBody(self.payload[int(start) : int(end) + 1 if end else None])}
+
+
+def read_in_chunks(s3_object: S3Object) -> int:
+    """Consumes the object as a stream, returning its size"""
+    size = 0
+    for chunk in iter(lambda: s3_object.read(64 * 1024), b""):
+        size += len(chunk)
+    return size
+
+
+def zip_payload() -> bytes:
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, mode="w") as zip_file:
+        for i in range(100):
+            zip_file.writestr(f"file-{i}.txt", os.urandom(2048))
+    return payload.getvalue()
+
+
+@pytest.mark.perf
+def test_block_cache_read_ahead_is_faster_than_single_stream():
+    # GIVEN a large object
+    client = FakeS3Client(os.urandom(OBJECT_SIZE))
+    block_cache = BlockCacheConfig(
+        block_size=BLOCK_SIZE,
+        max_cache_size=(MAX_WORKERS + 1) * BLOCK_SIZE,
+        read_ahead_blocks=MAX_WORKERS,
+        max_workers=MAX_WORKERS,
+    )
+
+    # WHEN reading it with a single stream, and in blocks fetched ahead concurrently
+    with timing() as t:
+        streamed = read_in_chunks(S3Object(bucket="bucket", key="key", boto3_client=client))
+        single_stream_elapsed = t()
+
+    with timing() as t:
+        cached = read_in_chunks(S3Object(bucket="bucket", key="key", boto3_client=client, block_cache=block_cache))
+        read_ahead_elapsed = t()
+
+    # THEN the whole object is read, using the bandwidth of several connections
+    assert cached == streamed == OBJECT_SIZE
+
+    speedup = single_stream_elapsed / read_ahead_elapsed
+    if speedup < READ_AHEAD_SPEEDUP_SLA:
+        pytest.fail(f"Reading ahead should be at least {READ_AHEAD_SPEEDUP_SLA}x faster; got {speedup:.2f}x")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="streaming_zip", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("block_cache", [None, BlockCacheConfig(block_size=64 * 1024)], ids=["stream", "block_cache"])
+def test_zip_members_read(benchmark, block_cache):
+    # GIVEN a zip file with 100 members
+    client = FakeS3Client(zip_payload())
+
+    def read_members():
+        s3_object = S3Object(bucket="bucket", key="key", boto3_client=client, block_cache=block_cache)
+        zip_reader = s3_object.transform(ZipTransform())
+        return [zip_reader.read(name) for name in reversed(zip_reader.namelist())]
+
+    # WHEN reading every member, seeking backwards each time
+    # THEN we record the cost for comparison
+    benchmark.pedantic(read_members, rounds=3, iterations=1)
+
+
+@pytest.mark.perf
+def test_block_cache_serves_zip_seeks_from_memory():
+    # GIVEN a zip file with 100 members
+    client = FakeS3Client(zip_payload())
+
+    # WHEN reading every member backwards, re-opening a stream on every seek, and through a block cache
+    zip_reader = S3Object(bucket="bucket", key="key", boto3_client=client).transform(ZipTransform())
+    streamed = [zip_reader.read(name) for name in reversed(zip_reader.namelist())]
+    stream_requests = len(client.requests)
+
+    client.requests.clear()
+    block_cache = BlockCacheConfig(block_size=64 * 1024)
+    s3_object = S3Object(bucket="bucket", key="key", boto3_client=client, block_cache=block_cache)
+    zip_reader = s3_object.transform(ZipTransform())
+    cached = [zip_reader.read(name) for name in reversed(zip_reader.namelist())]
+    block_cache_requests = len(client.requests)
+
+    # THEN members are the same, and seeks are served from memory
+    assert cached == streamed
+
+    reduction = stream_requests / block_cache_requests
+    if reduction < ZIP_REQUESTS_REDUCTION_SLA:
+        pytest.fail(
+            f"Block cache should send at least {ZIP_REQUESTS_REDUCTION_SLA}x fewer requests; got {reduction:.2f}x",
+        )
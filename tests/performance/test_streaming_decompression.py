@@ -0,0 +1,81 @@
+import bz2
+import gzip
+import io
+import lzma
+import tracemalloc
+from functools import partial
+from typing import Callable, Type
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming.transformations import (
+    BaseTransform,
+    Bz2Transform,
+    GzipTransform,
+    LzmaTransform,
+    ZstdTransform,
+)
+
+CHUNK_SIZE = 64 * 1024
+PAYLOAD = b"".join(f"{i},name-{i},{i * 7 % 1000}\n".encode() for i in range(250_000))
+
+# memory held while decompressing must be bounded to the decompression window, whatever the size of the object
+MAX_MEMORY_GROWTH: float = 1.2
+MAX_MEMORY_BYTES = 16 * 1024 * 1024
+
+
+def zstd_compress(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)
+
+
+COMPRESSIONS = [
+    pytest.param(GzipTransform, gzip.compress, id="gzip"),
+    pytest.param(Bz2Transform, bz2.compress, id="bz2"),
+    # the fastest preset, as compressing is much slower than decompressing
+    pytest.param(LzmaTransform, partial(lzma.compress, preset=1), id="xz"),
+    pytest.param(ZstdTransform, zstd_compress, id="zstd"),
+]
+
+
+def decompress_in_chunks(transform: Type[BaseTransform], compressed: bytes) -> int:
+    """Consumes the decompressed stream in chunks, returning its size"""
+    reader = transform().transform(io.BytesIO(compressed))
+    size = 0
+    for chunk in iter(lambda: reader.read(CHUNK_SIZE), b""):
+        size += len(chunk)
+    return size
+
+
+def peak_memory(transform: Type[BaseTransform], compressed: bytes) -> int:
+    tracemalloc.start()
+    try:
+        decompress_in_chunks(transform, compressed)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("transform, compress", COMPRESSIONS)
+def test_decompression_memory_is_bounded(transform: Type[BaseTransform], compress: Callable[[bytes], bytes]):
+    # GIVEN a compressed object, and another one decompressing to 4 times more data
+    small_object = compress(PAYLOAD)
+    large_object = compress(PAYLOAD * 4)
+
+    # WHEN decompressing each object in chunks
+    small_peak = peak_memory(transform, small_object)
+    large_peak = peak_memory(transform, large_object)
+
+    # THEN memory is bounded to the decompression window, not to the size of the object
+    if large_peak > max(small_peak * MAX_MEMORY_GROWTH, CHUNK_SIZE * 4) or large_peak > MAX_MEMORY_BYTES:
+        pytest.fail(f"Decompressing 4x more data should use about the same memory: {small_peak} -> {large_peak}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="decompression")
+@pytest.mark.parametrize("transform, compress", COMPRESSIONS)
+def test_decompression_throughput(benchmark, transform: Type[BaseTransform], compress: Callable[[bytes], bytes]):
+    compressed = compress(PAYLOAD)
+    assert benchmark.pedantic(decompress_in_chunks, args=(transform, compressed), rounds=3) == len(PAYLOAD)
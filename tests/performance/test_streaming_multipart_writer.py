@@ -0,0 +1,124 @@
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.streaming import S3ObjectWriter
+
+# simulated latency of every UploadPart request, and bandwidth of a single connection
+REQUEST_LATENCY_SECONDS = 0.02
+CONNECTION_BYTES_PER_SECOND = 50 * 1024 * 1024
+
+PART_SIZE = 5 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# uploading a large object with 4 parts in flight must be at least 2.5x faster than one part at a time
+CONCURRENT_UPLOAD_SPEEDUP_SLA: float = 2.5
+# memory held while writing must stay within the parts in flight plus the one being buffered, whatever the object size
+MEMORY_SLACK_BYTES = 1024 * 1024
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+class FakeS3Client:
+    """Discards uploaded parts, simulating the time it takes to send them"""
+
+    def __init__(self, upload_delay: bool = True):
+        self.upload_delay = upload_delay
+        self.uploaded_bytes = 0
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, PartNumber, Body, **kwargs):
+        if self.upload_delay:
+            time.sleep(REQUEST_LATENCY_SECONDS + len(Body) / CONNECTION_BYTES_PER_SECOND)
+        with self._lock:
+            self.uploaded_bytes += len(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        pass
+
+
+def write_object(client: FakeS3Client, size: int, max_concurrency: int) -> None:
+    chunk = b"x" * CHUNK_SIZE
+    with S3ObjectWriter(
+        bucket="bucket",
+        key="key",
+        boto3_client=client,
+        part_size=PART_SIZE,
+        max_concurrency=max_concurrency,
+    ) as writer:
+        for _ in range(size // CHUNK_SIZE):
+            writer.write(chunk)
+
+
+@pytest.mark.perf
+def test_s3_object_writer_concurrent_uploads_speedup():
+    # GIVEN an object of 8 parts
+    object_size = 8 * PART_SIZE
+
+    # WHEN uploading it one part at a time, then 4 parts at a time
+    with timing() as t:
+        write_object(FakeS3Client(), object_size, max_concurrency=1)
+    sequential_elapsed = t()
+
+    client = FakeS3Client()
+    with timing() as t:
+        write_object(client, object_size, max_concurrency=4)
+    concurrent_elapsed = t()
+
+    # THEN concurrent uploads hide the latency and bandwidth of each request
+    assert client.uploaded_bytes == object_size
+    speedup = sequential_elapsed / concurrent_elapsed
+    if speedup < CONCURRENT_UPLOAD_SPEEDUP_SLA:
+        pytest.fail(f"Concurrent part uploads should be {CONCURRENT_UPLOAD_SPEEDUP_SLA}x faster: {speedup:.2f}x")
+
+
+@pytest.mark.perf
+def test_s3_object_writer_memory_is_bounded():
+    # GIVEN an object much larger than the memory budget of 2 parts in flight
+    object_size = 20 * PART_SIZE
+    max_concurrency = 2
+    client = FakeS3Client()
+
+    # WHEN writing it in chunks
+    tracemalloc.start()
+    try:
+        write_object(client, object_size, max_concurrency=max_concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # THEN memory stays bounded to the parts in flight, plus the one being buffered
+    assert client.uploaded_bytes == object_size
+    memory_budget = PART_SIZE * (max_concurrency + 1) + MEMORY_SLACK_BYTES
+    if peak > memory_budget:
+        pytest.fail(f"Writing {object_size} bytes should use at most {memory_budget} bytes: {peak}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="streaming")
+def test_s3_object_writer_write_throughput(benchmark):
+    # GIVEN an S3 client returning immediately
+    # WHEN buffering and handing over parts of a large object
+    # THEN writing is bound by memory copies only
+    benchmark(write_object, FakeS3Client(upload_delay=False), 8 * PART_SIZE, 4)
@@ -0,0 +1,156 @@
+import gc
+import io
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import IO, Callable, Generator
+
+import pytest
+from botocore.response import StreamingBody
+
+from aws_lambda_powertools.utilities.streaming.transformations import NdjsonTransform
+
+RECORDS_COUNT = 100_000
+RUNS = 3
+
+# reading records from an in-memory stream must be at least as fast as a readline and json.loads loop
+IN_MEMORY_SPEEDUP_SLA: float = 1
+# reading records from a S3 response body must be at least 3x faster than a readline and json.loads loop
+STREAMING_BODY_SPEEDUP_SLA: float = 3
+# memory held while reading must not grow with the size of the stream
+MAX_MEMORY_GROWTH: float = 1.2
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+@pytest.fixture(scope="module")
+def ndjson_payload() -> bytes:
+    return b"".join(
+        json.dumps({"id": i, "name": f"user-{i}", "tags": ["a", "b"], "score": i * 1.5}).encode() + b"\n"
+        for i in range(RECORDS_COUNT)
+    )
+
+
+def read_with_readline(stream: IO[bytes]) -> int:
+    count = 0
+    for line in iter(stream.readline, b""):
+        json.loads(line)
+        count += 1
+    return count
+
+
+def read_with_transform(stream: IO[bytes]) -> int:
+    count = 0
+    for _ in NdjsonTransform().transform(stream):
+        count += 1
+    return count
+
+
+def read_batches_with_transform(stream: IO[bytes]) -> int:
+    return sum(len(records) for records in NdjsonTransform(batch_size=1000).transform(stream))
+
+
+def best_elapsed(read: Callable[[IO[bytes]], int], build_stream: Callable[[], IO[bytes]]) -> float:
+    """Best of a few runs, without garbage collection pauses"""
+    elapsed = []
+    gc.disable()
+    try:
+        for _ in range(RUNS):
+            stream = build_stream()
+            with timing() as t:
+                assert read(stream) == RECORDS_COUNT
+            elapsed.append(t())
+            gc.collect()
+    finally:
+        gc.enable()
+    return min(elapsed)
+
+
+@pytest.mark.perf
+def test_ndjson_transform_in_memory_speedup(ndjson_payload):
+    # GIVEN a NDJSON stream in memory, e.g. decompressed from gzip
+    def build_stream():
+        return io.BytesIO(ndjson_payload)
+
+    # WHEN reading records with readline and json.loads, then with NdjsonTransform
+    readline_elapsed = best_elapsed(read_with_readline, build_stream)
+    transform_elapsed = best_elapsed(read_with_transform, build_stream)
+
+    # THEN decoding and splitting chunks at once is no slower than one line at a time
+    speedup = readline_elapsed / transform_elapsed
+    if speedup < IN_MEMORY_SPEEDUP_SLA:
+        pytest.fail(f"NdjsonTransform should be {IN_MEMORY_SPEEDUP_SLA}x faster than readline: {speedup:.2f}x")
+
+
+@pytest.mark.perf
+def test_ndjson_transform_streaming_body_speedup(ndjson_payload):
+    # GIVEN a NDJSON S3 response body
+    def build_stream():
+        return StreamingBody(io.BytesIO(ndjson_payload), len(ndjson_payload))
+
+    # WHEN reading records with readline and json.loads, then with NdjsonTransform
+    readline_elapsed = best_elapsed(read_with_readline, build_stream)
+    transform_elapsed = best_elapsed(read_with_transform, build_stream)
+
+    # THEN reading chunks avoids the byte by byte reads of readline on a response body
+    speedup = readline_elapsed / transform_elapsed
+    if speedup < STREAMING_BODY_SPEEDUP_SLA:
+        pytest.fail(f"NdjsonTransform should be {STREAMING_BODY_SPEEDUP_SLA}x faster than readline: {speedup:.2f}x")
+
+
+def peak_memory(stream: IO[bytes]) -> int:
+    """Peak memory allocated while reading every record of the stream, in batches"""
+    tracemalloc.start()
+    try:
+        read_batches_with_transform(stream)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.perf
+def test_ndjson_transform_memory_is_constant(ndjson_payload):
+    # GIVEN a NDJSON stream, and another one 8 times larger
+    small_stream = io.BytesIO(ndjson_payload)
+    large_stream = io.BytesIO(ndjson_payload * 8)
+
+    # WHEN reading every record of each stream, in batches
+    small_peak = peak_memory(small_stream)
+    large_peak = peak_memory(large_stream)
+
+    # THEN memory is bounded to a chunk and a batch of records, whatever the size of the stream
+    if large_peak > small_peak * MAX_MEMORY_GROWTH:
+        pytest.fail(f"Reading 8x more records should use about the same memory: {small_peak} -> {large_peak}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="ndjson")
+def test_ndjson_readline_throughput(benchmark, ndjson_payload):
+    benchmark.pedantic(read_with_readline, setup=lambda: ((io.BytesIO(ndjson_payload),), {}), rounds=RUNS)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="ndjson")
+def test_ndjson_transform_throughput(benchmark, ndjson_payload):
+    benchmark.pedantic(read_with_transform, setup=lambda: ((io.BytesIO(ndjson_payload),), {}), rounds=RUNS)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="ndjson")
+def test_ndjson_transform_batches_throughput(benchmark, ndjson_payload):
+    benchmark.pedantic(read_batches_with_transform, setup=lambda: ((io.BytesIO(ndjson_payload),), {}), rounds=RUNS)
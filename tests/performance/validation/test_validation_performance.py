@@ -0,0 +1,121 @@
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from aws_lambda_powertools.utilities.validation import validator
+from aws_lambda_powertools.utilities.validation.base import CACHE_COMPILED_VALIDATOR
+
+INVOCATIONS: int = 100
+# warm invocations must not pay schema compilation; adjusted for slower machines in CI too
+VALIDATION_CACHE_SPEEDUP: float = 5.0
+
+inbound_schema = {
+    "$schema": "http://json-schema.org/draft-07/schema",
+    "type": "object",
+    "required": ["order_id", "customer", "items"],
+    "properties": {
+        "order_id": {"type": "string", "pattern": "^[A-Z0-9-]+$"},
+        "customer": {
+            "type": "object",
+            "required": ["name", "email"],
+            "properties": {
+                "name": {"type": "string", "minLength": 1},
+                "email": {"type": "string", "format": "email"},
+                "tier": {"type": "string", "enum": ["basic", "gold", "platinum"], "default": "basic"},
+            },
+        },
+        "items": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["sku", "quantity"],
+                "properties": {
+                    "sku": {"type": "string"},
+                    "quantity": {"type": "integer", "minimum": 1},
+                    "price": {"type": "number", "minimum": 0},
+                },
+            },
+        },
+    },
+}
+
+outbound_schema = {
+    "$schema": "http://json-schema.org/draft-07/schema",
+    "type": "object",
+    "required": ["statusCode", "body"],
+    "properties": {
+        "statusCode": {"type": "integer", "enum": [200, 400, 500]},
+        "body": {"type": "string"},
+        "headers": {"type": "object", "additionalProperties": {"type": "string"}},
+    },
+}
+
+event = {
+    "order_id": "ORDER-123",
+    "customer": {"name": "John Doe", "email": "john@example.com"},
+    "items": [{"sku": f"SKU-{i}", "quantity": i + 1, "price": 9.99} for i in range(10)],
+}
+
+
+@contextmanager
+def timing() -> Generator:
+    """ "Generator to quickly time operations. It can add 5ms so take that into account in elapsed time
+
+    Examples
+    --------
+
+        with timing() as t:
+            print("something")
+        elapsed = t()
+    """
+    start = time.perf_counter()
+    yield lambda: time.perf_counter() - start  # gen as lambda to calculate elapsed time
+
+
+@validator(inbound_schema=inbound_schema)
+def inbound_handler(evt, context):
+    return evt
+
+
+@validator(outbound_schema=outbound_schema)
+def outbound_handler(evt, context):
+    return {"statusCode": 200, "body": "ok", "headers": {"Content-Type": "text/plain"}}
+
+
+def invoke(handler, clear_cache: bool):
+    for _ in range(INVOCATIONS):
+        if clear_cache:
+            # simulates compiling the schema on every invocation
+            CACHE_COMPILED_VALIDATOR.clear()
+        handler(event, {})
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="validation", disable_gc=True, warmup=False)
+@pytest.mark.parametrize("handler", [inbound_handler, outbound_handler], ids=["inbound", "outbound"])
+@pytest.mark.parametrize("clear_cache", [True, False], ids=["before", "after"])
+def test_validation_invocations(benchmark, handler, clear_cache):
+    CACHE_COMPILED_VALIDATOR.clear()
+    benchmark.pedantic(invoke, args=(handler, clear_cache))
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("handler", [inbound_handler, outbound_handler], ids=["inbound", "outbound"])
+def test_validation_cache_speedup(handler):
+    # GIVEN invocations compiling the schema every time
+    with timing() as t:
+        invoke(handler, clear_cache=True)
+    uncached_elapsed = t()
+
+    # WHEN invocations reuse the compiled schema
+    with timing() as t:
+        invoke(handler, clear_cache=False)
+    cached_elapsed = t()
+
+    # THEN warm invocations should be significantly faster
+    speedup = uncached_elapsed / cached_elapsed
+    if speedup < VALIDATION_CACHE_SPEEDUP:
+        pytest.fail(f"Cached schema validation should be {VALIDATION_CACHE_SPEEDUP}x faster: {speedup:.2f}x")
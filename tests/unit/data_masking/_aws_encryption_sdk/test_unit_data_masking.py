@@ -8,6 +8,7 @@ from aws_lambda_powertools.utilities.data_masking.exceptions import (
     DataMaskingFieldNotFoundError,
     DataMaskingUnsupportedTypeError,
 )
+from aws_lambda_powertools.utilities.data_masking.plan import MaskingPlan
 
 
 @pytest.fixture
@@ -205,3 +206,96 @@ def test_parsing_nonexistent_fields_warning_on_missing_field():
 
     # THEN the "erased" payload is the same of the original
     assert masked_json_string == data
+
+
+def test_erase_dict_with_compiled_plan(data_masker):
+    # GIVEN a dict data type and a compiled masking plan
+    data = {
+        "a": {
+            "1": {"None": "hello", "four": "world"},
+            "b": {"3": {"4": "goodbye", "e": "world"}},
+        },
+    }
+    plan = data_masker.compile(fields=["a.'1'.None", "a..'4'"])
+
+    # WHEN erase is called with the compiled plan
+    erased_data = data_masker.erase(data, fields=plan)
+
+    # THEN the result is the same as erasing with the list of fields
+    assert isinstance(plan, MaskingPlan)
+    assert erased_data == data_masker.erase(data, fields=["a.'1'.None", "a..'4'"])
+    assert erased_data["a"]["1"]["None"] == DATA_MASKING_STRING
+    assert erased_data["a"]["b"]["3"]["4"] == DATA_MASKING_STRING
+
+
+def test_erase_with_key_paths_does_not_mutate_original_data(data_masker):
+    # GIVEN a dict data type and plain key path fields
+    data = {"customer": {"email": "john@example.com", "address": {"street": "123 Main St", "city": "Anytown"}}}
+
+    # WHEN erase is called
+    erased_data = data_masker.erase(data, fields=["customer.email", "$.customer.address.street"])
+
+    # THEN only the specified fields are erased, in a copy of the data
+    assert erased_data == {
+        "customer": {"email": DATA_MASKING_STRING, "address": {"street": DATA_MASKING_STRING, "city": "Anytown"}},
+    }
+    assert data["customer"]["email"] == "john@example.com"
+    assert data["customer"]["address"]["street"] == "123 Main St"
+
+
+def test_erase_dict_with_non_string_keys(data_masker):
+    # GIVEN a dict data type with int keys
+    data = {1: {"secret": "password"}, "other": (1, 2)}
+
+    # WHEN erase is called
+    erased_data = data_masker.erase(data, fields=["'1'.secret"])
+
+    # THEN data is normalized through JSON as before
+    assert erased_data == {"1": {"secret": DATA_MASKING_STRING}, "other": [1, 2]}
+
+
+def test_erase_with_nested_fields_applied_in_order(data_masker):
+    # GIVEN a field nested under another field specified before it
+    data = {"a": {"b": "hello"}}
+
+    # WHEN erase is called
+    # THEN fields are applied in order, and the nested field is no longer found
+    with pytest.raises(DataMaskingFieldNotFoundError, match="a.b"):
+        data_masker.erase(data, fields=["a", "a.b"])
+
+
+def test_erase_with_missing_key_path_reports_first_missing_field():
+    # GIVEN plain key path fields where two of them do not exist
+    data_masker = DataMasking(raise_on_missing_field=False)
+    data = {"a": {"b": "hello"}, "c": "world"}
+
+    # WHEN erase is called
+    with pytest.warns(UserWarning) as record:
+        erased_data = data_masker.erase(data, fields=["x.y", "a.b", "c.d"])
+
+    # THEN existing fields are erased and missing fields are reported in order
+    assert erased_data == {"a": {"b": DATA_MASKING_STRING}, "c": "world"}
+    assert [str(warning.message).split(" not found")[0] for warning in record] == [
+        "Field or expression x.y",
+        "Field or expression c.d",
+    ]
+
+
+def test_compile_reuses_cached_plan(data_masker):
+    # GIVEN the same fields compiled twice
+    fields = ["customer.email", "customer.phone"]
+
+    # WHEN compiling them
+    plan = data_masker.compile(fields=fields)
+
+    # THEN the same compiled plan is returned from cache
+    assert data_masker.compile(fields=list(fields)) is plan
+
+
+def test_compile_with_empty_fields(data_masker):
+    # GIVEN an initialization of the DataMasking class
+
+    # WHEN attempting to compile an empty list of fields
+    # THEN the result is a ValueError
+    with pytest.raises(ValueError):
+        data_masker.compile(fields=[])
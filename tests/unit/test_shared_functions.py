@@ -16,6 +16,7 @@ from aws_lambda_powertools.shared.functions import (
     resolve_max_age,
     resolve_truthy_env_var_choice,
     sanitize_xray_segment_name,
+    slice_dictionary,
     strtobool,
 )
 from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
@@ -200,3 +201,15 @@ def test_sanitize_xray_segment_name_with_no_special_characters():
     # THEN the sanitized name remains the same as the original name
     expected_name = valid_name
     assert sanitized_name == expected_name
+
+
+def test_slice_dictionary():
+    # GIVEN a dictionary of 25 items
+    data = {f"key_{i}": i for i in range(25)}
+
+    # WHEN slicing it in chunks of 10 items
+    chunks = list(slice_dictionary(data=data, chunk_size=10))
+
+    # THEN each item is in exactly one chunk, in order
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert {key: value for chunk in chunks for key, value in chunk.items()} == data